@@ -36,7 +36,10 @@ from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResult,
 )
-from great_expectations.core.freshness_diagnostics import CheckpointFreshnessDiagnostics
+from great_expectations.core.freshness_diagnostics import (
+    CheckpointFreshnessDiagnostics,
+    freshness_cache,
+)
 from great_expectations.core.result_format import DEFAULT_RESULT_FORMAT, ResultFormatUnion
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.serdes import _IdentifierBundle
@@ -57,6 +60,9 @@ from great_expectations.exceptions.exceptions import (
     StoreBackendError,
 )
 from great_expectations.exceptions.resource_freshness import ResourceFreshnessAggregateError
+from great_expectations.execution_engine.materialized_tables_scope import (
+    materialized_tables_scope,
+)
 from great_expectations.render.renderer.renderer import Renderer
 
 if TYPE_CHECKING:
@@ -279,21 +285,25 @@ class Checkpoint(BaseModel):
         if not self.validation_definitions:
             raise CheckpointRunWithoutValidationDefinitionError()
 
-        diagnostics = self.is_fresh()
-        if not diagnostics.success:
-            # The checkpoint itself is not added but all children are - we can add it for the user
-            if not diagnostics.parent_added and diagnostics.children_added:
-                self._add_to_store()
-            else:
-                diagnostics.raise_for_error()
-
-        run_id = run_id or RunIdentifier(run_time=dt.datetime.now(dt.timezone.utc))
-        run_results = self._run_validation_definitions(
-            batch_parameters=batch_parameters,
-            expectation_parameters=expectation_parameters,
-            result_format=self.result_format,
-            run_id=run_id,
-        )
+        # Validation definitions, suites and datasources checked here are not checked again when
+        # each validation definition is run; tables materialized from queries are shared by the
+        # validation definitions of the run and dropped as it ends.
+        with freshness_cache(), materialized_tables_scope():
+            diagnostics = self.is_fresh()
+            if not diagnostics.success:
+                # The checkpoint itself is not added but all children are - we can add it
+                if not diagnostics.parent_added and diagnostics.children_added:
+                    self._add_to_store()
+                else:
+                    diagnostics.raise_for_error()
+
+            run_id = run_id or RunIdentifier(run_time=dt.datetime.now(dt.timezone.utc))
+            run_results = self._run_validation_definitions(
+                batch_parameters=batch_parameters,
+                expectation_parameters=expectation_parameters,
+                result_format=self.result_format,
+                run_id=run_id,
+            )
 
         checkpoint_result = self._construct_result(run_id=run_id, run_results=run_results)
         self._run_actions(checkpoint_result=checkpoint_result)
@@ -393,6 +403,10 @@ class Checkpoint(BaseModel):
         return priority_actions + secondary_actions
 
     def is_fresh(self) -> CheckpointFreshnessDiagnostics:
+        with freshness_cache():
+            return self._is_fresh()
+
+    def _is_fresh(self) -> CheckpointFreshnessDiagnostics:
         checkpoint_diagnostics = CheckpointFreshnessDiagnostics(
             errors=[] if self.id else [CheckpointNotAddedError(name=self.name)]
         )
@@ -1,6 +1,12 @@
 from __future__ import annotations
 
-from great_expectations.compatibility.not_imported import NotImported
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.compatibility.not_imported import (
+    NotImported,
+    OptionalImport,
+    lazy_optional_imports,
+)
 
 BOTO_NOT_IMPORTED = NotImported(
     "AWS S3 connection components are not installed, please 'pip install boto3 botocore'"
@@ -12,47 +18,28 @@ ATHENA_NOT_IMPORTED = NotImported(
     "AWS Athena connection component is not installed, please 'pip install pyathena[SQLAlchemy]>=2.0.0,<3'"  # noqa: E501
 )
 
-try:
+if TYPE_CHECKING:
     import boto3
-except ImportError:
-    boto3 = BOTO_NOT_IMPORTED
-
-try:
     import botocore
-except ImportError:
-    botocore = BOTO_NOT_IMPORTED
-
-try:
-    from botocore.client import Config
-except ImportError:
-    Config = BOTO_NOT_IMPORTED
-
-try:
-    from botocore import exceptions
-except ImportError:
-    exceptions = BOTO_NOT_IMPORTED
-
-try:
-    import sqlalchemy_redshift
-except ImportError:
-    sqlalchemy_redshift = REDSHIFT_NOT_IMPORTED
-
-try:
-    from sqlalchemy_redshift import dialect as redshiftdialect
-except (ImportError, AttributeError):
-    redshiftdialect = REDSHIFT_NOT_IMPORTED
-
-try:
     import pyathena  # type: ignore[import-not-found]
-except ImportError:
-    pyathena = ATHENA_NOT_IMPORTED
-
-try:
+    import sqlalchemy_redshift
+    from botocore import exceptions
+    from botocore.client import Config
     from pyathena import sqlalchemy_athena
-except (ImportError, AttributeError):
-    sqlalchemy_athena = ATHENA_NOT_IMPORTED
-
-try:
     from pyathena.sqlalchemy_athena import types as athenatypes  # type: ignore[import-not-found]
-except (ImportError, AttributeError):
-    athenatypes = ATHENA_NOT_IMPORTED
+    from sqlalchemy_redshift import dialect as redshiftdialect
+
+# Imported on first use, rather than along with great_expectations
+_OPTIONAL_IMPORTS: Dict[str, OptionalImport] = {
+    "boto3": OptionalImport("boto3", None, BOTO_NOT_IMPORTED),
+    "botocore": OptionalImport("botocore", None, BOTO_NOT_IMPORTED),
+    "Config": OptionalImport("botocore.client", "Config", BOTO_NOT_IMPORTED),
+    "exceptions": OptionalImport("botocore", "exceptions", BOTO_NOT_IMPORTED),
+    "sqlalchemy_redshift": OptionalImport("sqlalchemy_redshift", None, REDSHIFT_NOT_IMPORTED),
+    "redshiftdialect": OptionalImport("sqlalchemy_redshift", "dialect", REDSHIFT_NOT_IMPORTED),
+    "pyathena": OptionalImport("pyathena", None, ATHENA_NOT_IMPORTED),
+    "sqlalchemy_athena": OptionalImport("pyathena", "sqlalchemy_athena", ATHENA_NOT_IMPORTED),
+    "athenatypes": OptionalImport("pyathena.sqlalchemy_athena", "types", ATHENA_NOT_IMPORTED),
+}
+
+__getattr__ = lazy_optional_imports(__name__, _OPTIONAL_IMPORTS)
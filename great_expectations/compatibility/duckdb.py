@@ -0,0 +1,25 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict
+
+from great_expectations.compatibility.not_imported import (
+    NotImported,
+    OptionalImport,
+    lazy_optional_imports,
+)
+
+DUCKDB_NOT_IMPORTED = NotImported(
+    "duckdb connection components are not installed, please 'pip install duckdb duckdb-engine'"
+)
+
+if TYPE_CHECKING:
+    import duckdb
+    import duckdb_engine
+
+# Imported on first use, rather than along with great_expectations
+_OPTIONAL_IMPORTS: Dict[str, OptionalImport] = {
+    "duckdb": OptionalImport("duckdb", None, DUCKDB_NOT_IMPORTED),
+    "duckdb_engine": OptionalImport("duckdb_engine", None, DUCKDB_NOT_IMPORTED),
+}
+
+__getattr__ = lazy_optional_imports(__name__, _OPTIONAL_IMPORTS)
@@ -10,7 +10,11 @@ We also consolidate logic for warning based on version number in this module.
 
 from __future__ import annotations
 
-from typing import Any, Literal, NoReturn
+import importlib
+import importlib.util
+import sys
+import types
+from typing import Any, Callable, Dict, List, Literal, NamedTuple, NoReturn, Optional
 
 from packaging.version import Version
 
@@ -39,6 +43,101 @@ class NotImported:
         return False
 
 
+class DeferredModule(types.ModuleType):
+    """An installed optional library, imported when one of its attributes is first accessed."""
+
+    def __init__(self, name: str, not_imported: NotImported) -> None:
+        super().__init__(name)
+        self.__dict__["gx_not_imported"] = not_imported
+
+    def _import(self) -> types.ModuleType:
+        try:
+            return importlib.import_module(self.__name__)
+        except ImportError as e:
+            raise ModuleNotFoundError(self.__dict__["gx_not_imported"].gx_error_message) from e
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._import(), attr)
+
+    @override
+    def __setattr__(self, attr: str, value: Any) -> None:
+        setattr(self._import(), attr, value)
+
+    @override
+    def __delattr__(self, attr: str) -> None:
+        delattr(self._import(), attr)
+
+    @override
+    def __dir__(self) -> List[str]:
+        return dir(self._import())
+
+    @override
+    def __repr__(self) -> str:
+        return f"<deferred module {self.__name__!r}>"
+
+
+class OptionalImport(NamedTuple):
+    """A name of a compatibility module, imported from an optional library on first use."""
+
+    # Module the name is imported from
+    module: str
+    # Attribute of the module (None to import the module itself)
+    attribute: Optional[str]
+    # Value of the name if it does not import
+    not_imported: NotImported
+
+
+def lazy_optional_imports(
+    module_name: str, optional_imports: Dict[str, OptionalImport]
+) -> Callable[[str], Any]:
+    """Module "__getattr__()" (PEP 562) importing optional libraries on first use.
+
+    Importing optional libraries (e.g. sqlalchemy or boto3) takes long; compatibility modules
+    import them when one of their names is first accessed, not when the module is imported.
+    Names that do not import are "NotImported", as with "try: import ... except ImportError".
+    Names of installed modules are "DeferredModule"s, so that e.g. "sa.select" imports sqlalchemy
+    only when it runs, not when "sa" is imported at the top of a module.
+
+    Args:
+        module_name: Name of the compatibility module.
+        optional_imports: Where each name of the compatibility module is imported from.
+
+    Returns:
+        The "__getattr__()" function of the compatibility module.
+    """
+
+    def __getattr__(name: str) -> Any:
+        if name not in optional_imports:
+            raise AttributeError(f"module {module_name!r} has no attribute {name!r}")  # noqa: TRY003
+
+        optional_import = optional_imports[name]
+        value: Any
+        if optional_import.attribute is None and optional_import.module not in sys.modules:
+            if importlib.util.find_spec(optional_import.module.partition(".")[0]) is None:
+                value = optional_import.not_imported
+            else:
+                value = DeferredModule(optional_import.module, optional_import.not_imported)
+        else:
+            try:
+                value = importlib.import_module(optional_import.module)
+                if optional_import.attribute is not None:
+                    try:
+                        value = getattr(value, optional_import.attribute)
+                    except AttributeError:
+                        # e.g. "from sqlalchemy.dialects import sqlite" imports a submodule.
+                        value = importlib.import_module(
+                            f"{optional_import.module}.{optional_import.attribute}"
+                        )
+            except (ImportError, AttributeError):
+                value = optional_import.not_imported
+
+        # Later accesses find the name in the module, without calling "__getattr__()".
+        setattr(sys.modules[module_name], name, value)
+        return value
+
+    return __getattr__
+
+
 def is_version_greater_or_equal(version: str | Version, compare_version: str | Version) -> bool:
     """Check if the version is greater or equal to the compare_version.
 
@@ -1,90 +1,64 @@
 from __future__ import annotations
 
 import warnings
+from typing import TYPE_CHECKING, Any, Dict
 
-from great_expectations.compatibility.not_imported import NotImported
+from great_expectations.compatibility.not_imported import (
+    NotImported,
+    OptionalImport,
+    lazy_optional_imports,
+)
 
 SPARK_NOT_IMPORTED = NotImported("pyspark is not installed, please 'pip install pyspark'")
 
-with warnings.catch_warnings():
-    # DeprecationWarning: typing.io is deprecated, import directly from typing instead. typing.io will be removed in Python 3.12.  # noqa: E501
-    warnings.simplefilter(action="ignore", category=DeprecationWarning)
-    try:
-        import pyspark
-    except ImportError:
-        pyspark = SPARK_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from pyspark.sql import functions
-except (ImportError, AttributeError):
-    functions = SPARK_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from pyspark.sql import types
-except (ImportError, AttributeError):
-    types = SPARK_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
+if TYPE_CHECKING:
+    import pyspark
     from pyspark import SparkContext
-except ImportError:
-    SparkContext = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
+    from pyspark.errors import PySparkAttributeError
     from pyspark.ml.feature import Bucketizer
-except (ImportError, AttributeError):
-    Bucketizer = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
-    from pyspark.sql import Column
-except (ImportError, AttributeError):
-    Column = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
+    from pyspark.sql import (
+        Column,
+        DataFrame,
+        Row,
+        SparkSession,
+        SQLContext,
+        Window,
+        functions,
+        types,
+    )
     from pyspark.sql.connect.dataframe import DataFrame as ConnectDataFrame
-except (ImportError, AttributeError):
-    ConnectDataFrame = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
-    from pyspark.sql import DataFrame
-except (ImportError, AttributeError):
-    DataFrame = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
-    from pyspark.sql import Row
-except (ImportError, AttributeError):
-    Row = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
-    from pyspark.sql import SparkSession
-except (ImportError, AttributeError):
-    SparkSession = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
     from pyspark.sql.connect.session import SparkSession as SparkConnectSession
-except (ImportError, AttributeError):
-    SparkConnectSession = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
-    from pyspark.sql import SQLContext
-except (ImportError, AttributeError):
-    SQLContext = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
-    from pyspark.sql import Window
-except (ImportError, AttributeError):
-    Window = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
     from pyspark.sql.readwriter import DataFrameReader
-except (ImportError, AttributeError):
-    DataFrameReader = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
-
-try:
     from pyspark.sql.utils import AnalysisException
-except (ImportError, AttributeError):
-    AnalysisException = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
 
-try:
-    from pyspark.errors import PySparkAttributeError
-except (ImportError, AttributeError):
-    PySparkAttributeError = SPARK_NOT_IMPORTED  # type: ignore[assignment,misc]
+# Imported on first use, rather than along with great_expectations
+_OPTIONAL_IMPORTS: Dict[str, OptionalImport] = {
+    name: OptionalImport(module, attribute, SPARK_NOT_IMPORTED)
+    for name, (module, attribute) in {
+        "pyspark": ("pyspark", None),
+        "functions": ("pyspark.sql.functions", None),
+        "types": ("pyspark.sql.types", None),
+        "SparkContext": ("pyspark", "SparkContext"),
+        "Bucketizer": ("pyspark.ml.feature", "Bucketizer"),
+        "Column": ("pyspark.sql", "Column"),
+        "ConnectDataFrame": ("pyspark.sql.connect.dataframe", "DataFrame"),
+        "DataFrame": ("pyspark.sql", "DataFrame"),
+        "Row": ("pyspark.sql", "Row"),
+        "SparkSession": ("pyspark.sql", "SparkSession"),
+        "SparkConnectSession": ("pyspark.sql.connect.session", "SparkSession"),
+        "SQLContext": ("pyspark.sql", "SQLContext"),
+        "Window": ("pyspark.sql", "Window"),
+        "DataFrameReader": ("pyspark.sql.readwriter", "DataFrameReader"),
+        "AnalysisException": ("pyspark.sql.utils", "AnalysisException"),
+        "PySparkAttributeError": ("pyspark.errors", "PySparkAttributeError"),
+    }.items()
+}
+
+_getattr = lazy_optional_imports(__name__, _OPTIONAL_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    with warnings.catch_warnings():
+        # DeprecationWarning: typing.io is deprecated, import directly from typing instead. typing.io will be removed in Python 3.12.  # noqa: E501
+        warnings.simplefilter(action="ignore", category=DeprecationWarning)
+        return _getattr(name)
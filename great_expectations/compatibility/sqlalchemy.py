@@ -1,255 +1,129 @@
 from __future__ import annotations
 
-from great_expectations.compatibility.not_imported import NotImported
+from typing import TYPE_CHECKING, Any, Dict
+
+from great_expectations.compatibility.not_imported import (
+    NotImported,
+    OptionalImport,
+    lazy_optional_imports,
+)
 
 # GX optional imports
 SQLALCHEMY_NOT_IMPORTED = NotImported(
     "sqlalchemy is not installed, please 'pip install sqlalchemy'"
 )
 
-try:
+if TYPE_CHECKING:
     import sqlalchemy
-except ImportError:
-    sqlalchemy = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from sqlalchemy.sql.selectable import Subquery
-except (ImportError, AttributeError):
-    Subquery = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy import engine
-except ImportError:
-    engine = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from sqlalchemy import dialects
-except ImportError:
-    dialects = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from sqlalchemy import inspect
-except ImportError:
-    inspect = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from sqlalchemy.dialects import sqlite
-except (ImportError, AttributeError):
-    sqlite = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from sqlalchemy.dialects import registry
-except (ImportError, AttributeError):
-    registry = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from sqlalchemy.engine import Dialect
-except (ImportError, AttributeError):
-    Dialect = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.engine import Inspector
-except (ImportError, AttributeError):
-    Inspector = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.engine import reflection
-except (ImportError, AttributeError):
-    reflection = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from sqlalchemy.engine import Connection
-except (ImportError, AttributeError):
-    Connection = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.engine import Engine
-except (ImportError, AttributeError):
-    Engine = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.engine import Row
-except (ImportError, AttributeError):
-    Row = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.engine.row import RowProxy
-except (ImportError, AttributeError):
-    RowProxy = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.engine.row import LegacyRow  # type: ignore[attr-defined]
-except (ImportError, AttributeError):
-    LegacyRow = SQLALCHEMY_NOT_IMPORTED
-
-try:
+    from sqlalchemy import Table, dialects, engine, inspect
+    from sqlalchemy.dialects import registry, sqlite
+    from sqlalchemy.engine import Connection, Dialect, Engine, Inspector, Row, reflection, url
+    from sqlalchemy.engine.cursor import (
+        CursorResult,
+        LegacyCursorResult,  # type: ignore[attr-defined]
+    )
     from sqlalchemy.engine.default import DefaultDialect
-except (ImportError, AttributeError):
-    DefaultDialect = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.engine import url
+    from sqlalchemy.engine.row import (
+        LegacyRow,  # type: ignore[attr-defined]
+        RowProxy,
+    )
     from sqlalchemy.engine.url import URL
-except (ImportError, AttributeError):
-    url = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-    URL = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.exc import DatabaseError
-except (ImportError, AttributeError):
-    DatabaseError = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.exc import IntegrityError
-except (ImportError, AttributeError):
-    IntegrityError = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.exc import NoSuchTableError
-except (ImportError, AttributeError):
-    NoSuchTableError = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.exc import OperationalError
-except (ImportError, AttributeError):
-    OperationalError = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.exc import ProgrammingError
-except (ImportError, AttributeError):
-    ProgrammingError = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.exc import SQLAlchemyError
-except (ImportError, AttributeError):
-    SQLAlchemyError = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
+    from sqlalchemy.exc import (
+        DatabaseError,
+        IntegrityError,
+        NoSuchTableError,
+        OperationalError,
+        ProgrammingError,
+        SQLAlchemyError,
+    )
     from sqlalchemy.orm import declarative_base
-except (ImportError, AttributeError):
-    declarative_base = SQLALCHEMY_NOT_IMPORTED
-
-try:
-    from sqlalchemy.sql import functions
-except (ImportError, AttributeError):
-    functions = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from sqlalchemy.sql import Insert
-except (ImportError, AttributeError):
-    Insert = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.elements import literal
-except (ImportError, AttributeError):
-    literal = SQLALCHEMY_NOT_IMPORTED  # type: ignore[assignment]
-
-try:
-    from sqlalchemy.sql.elements import TextClause
-except (ImportError, AttributeError):
-    TextClause = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.elements import quoted_name
-except (ImportError, AttributeError):
-    quoted_name = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.elements import _anonymous_label
-except (ImportError, AttributeError):
-    _anonymous_label = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.elements import ColumnElement
-except (ImportError, AttributeError):
-    ColumnElement = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import Cast
-except (ImportError, AttributeError):
-    Cast = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import ColumnOperators
-except (ImportError, AttributeError):
-    ColumnOperators = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import CTE
-except (ImportError, AttributeError):
-    CTE = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import BinaryExpression
-except (ImportError, AttributeError):
-    BinaryExpression = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import BooleanClauseList
-except (ImportError, AttributeError):
-    BooleanClauseList = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import ColumnClause
-except (ImportError, AttributeError):
-    ColumnClause = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import Label
-except (ImportError, AttributeError):
-    Label = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import Select
-except (ImportError, AttributeError):
-    Select = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql import Selectable
-except (ImportError, AttributeError):
-    Selectable = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import TableClause
-except (ImportError, AttributeError):
-    TableClause = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import TextualSelect
-except (ImportError, AttributeError):
-    TextualSelect = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.expression import WithinGroup
-except (ImportError, AttributeError):
-    WithinGroup = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.sql.operators import custom_op
-except (ImportError, AttributeError):
-    custom_op = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy.engine.cursor import LegacyCursorResult  # type: ignore[attr-defined]
-except (ImportError, AttributeError):
-    LegacyCursorResult = SQLALCHEMY_NOT_IMPORTED
-
-try:
-    from sqlalchemy.engine.cursor import CursorResult
-except (ImportError, AttributeError):
-    CursorResult = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
     from sqlalchemy.pool import StaticPool
-except (ImportError, AttributeError):
-    StaticPool = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
-
-try:
-    from sqlalchemy import Table
-except (ImportError, AttributeError):
-    Table = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc,assignment]
+    from sqlalchemy.sql import Insert, Selectable, functions
+    from sqlalchemy.sql.elements import (
+        ColumnElement,
+        TextClause,
+        _anonymous_label,
+        literal,
+        quoted_name,
+    )
+    from sqlalchemy.sql.expression import (
+        CTE,
+        BinaryExpression,
+        BooleanClauseList,
+        Cast,
+        ColumnClause,
+        ColumnOperators,
+        Label,
+        Select,
+        TableClause,
+        TextualSelect,
+        WithinGroup,
+    )
+    from sqlalchemy.sql.operators import custom_op
+    from sqlalchemy.sql.selectable import Subquery
 
-try:
-    __version__: str | None = sqlalchemy.__version__
-except (ImportError, AttributeError):
-    __version__ = None
+# Imported on first use, rather than along with great_expectations
+_OPTIONAL_IMPORTS: Dict[str, OptionalImport] = {
+    name: OptionalImport(module, attribute, SQLALCHEMY_NOT_IMPORTED)
+    for name, (module, attribute) in {
+        "sqlalchemy": ("sqlalchemy", None),
+        "Subquery": ("sqlalchemy.sql.selectable", "Subquery"),
+        "engine": ("sqlalchemy.engine", None),
+        "dialects": ("sqlalchemy.dialects", None),
+        "inspect": ("sqlalchemy", "inspect"),
+        "sqlite": ("sqlalchemy.dialects.sqlite", None),
+        "registry": ("sqlalchemy.dialects", "registry"),
+        "Dialect": ("sqlalchemy.engine", "Dialect"),
+        "Inspector": ("sqlalchemy.engine", "Inspector"),
+        "reflection": ("sqlalchemy.engine.reflection", None),
+        "Connection": ("sqlalchemy.engine", "Connection"),
+        "Engine": ("sqlalchemy.engine", "Engine"),
+        "Row": ("sqlalchemy.engine", "Row"),
+        "RowProxy": ("sqlalchemy.engine.row", "RowProxy"),
+        "LegacyRow": ("sqlalchemy.engine.row", "LegacyRow"),
+        "DefaultDialect": ("sqlalchemy.engine.default", "DefaultDialect"),
+        "url": ("sqlalchemy.engine.url", None),
+        "URL": ("sqlalchemy.engine.url", "URL"),
+        "DatabaseError": ("sqlalchemy.exc", "DatabaseError"),
+        "IntegrityError": ("sqlalchemy.exc", "IntegrityError"),
+        "NoSuchTableError": ("sqlalchemy.exc", "NoSuchTableError"),
+        "OperationalError": ("sqlalchemy.exc", "OperationalError"),
+        "ProgrammingError": ("sqlalchemy.exc", "ProgrammingError"),
+        "SQLAlchemyError": ("sqlalchemy.exc", "SQLAlchemyError"),
+        "declarative_base": ("sqlalchemy.orm", "declarative_base"),
+        "functions": ("sqlalchemy.sql.functions", None),
+        "Insert": ("sqlalchemy.sql", "Insert"),
+        "literal": ("sqlalchemy.sql.elements", "literal"),
+        "TextClause": ("sqlalchemy.sql.elements", "TextClause"),
+        "quoted_name": ("sqlalchemy.sql.elements", "quoted_name"),
+        "_anonymous_label": ("sqlalchemy.sql.elements", "_anonymous_label"),
+        "ColumnElement": ("sqlalchemy.sql.elements", "ColumnElement"),
+        "Cast": ("sqlalchemy.sql.expression", "Cast"),
+        "ColumnOperators": ("sqlalchemy.sql.expression", "ColumnOperators"),
+        "CTE": ("sqlalchemy.sql.expression", "CTE"),
+        "BinaryExpression": ("sqlalchemy.sql.expression", "BinaryExpression"),
+        "BooleanClauseList": ("sqlalchemy.sql.expression", "BooleanClauseList"),
+        "ColumnClause": ("sqlalchemy.sql.expression", "ColumnClause"),
+        "Label": ("sqlalchemy.sql.expression", "Label"),
+        "Select": ("sqlalchemy.sql.expression", "Select"),
+        "Selectable": ("sqlalchemy.sql", "Selectable"),
+        "TableClause": ("sqlalchemy.sql.expression", "TableClause"),
+        "TextualSelect": ("sqlalchemy.sql.expression", "TextualSelect"),
+        "WithinGroup": ("sqlalchemy.sql.expression", "WithinGroup"),
+        "custom_op": ("sqlalchemy.sql.operators", "custom_op"),
+        "LegacyCursorResult": ("sqlalchemy.engine.cursor", "LegacyCursorResult"),
+        "CursorResult": ("sqlalchemy.engine.cursor", "CursorResult"),
+        "StaticPool": ("sqlalchemy.pool", "StaticPool"),
+        "Table": ("sqlalchemy", "Table"),
+    }.items()
+}
+
+_getattr = lazy_optional_imports(__name__, _OPTIONAL_IMPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name == "__version__":
+        sqlalchemy = _getattr("sqlalchemy")
+        return sqlalchemy.__version__ if sqlalchemy else None
+
+    return _getattr(name)
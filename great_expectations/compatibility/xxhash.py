@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+from great_expectations.compatibility.not_imported import NotImported
+
+XXHASH_NOT_IMPORTED = NotImported("xxhash is not installed, please 'pip install xxhash'")
+
+try:
+    import xxhash
+except ImportError:
+    xxhash = XXHASH_NOT_IMPORTED
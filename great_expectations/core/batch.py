@@ -18,7 +18,6 @@ from typing import (
 import pandas as pd
 
 from great_expectations._docs_decorators import deprecated_argument
-from great_expectations.compatibility import pyspark
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.id_dict import BatchKwargs, BatchSpec, IDDict
 from great_expectations.exceptions import InvalidBatchIdError
@@ -33,6 +32,7 @@ if TYPE_CHECKING:
     from typing_extensions import NotRequired, TypeAlias
 
     from great_expectations.alias_types import JSONValues
+    from great_expectations.compatibility import pyspark
     from great_expectations.datasource.fluent.data_connector.batch_filter import BatchSlice
     from great_expectations.datasource.fluent.interfaces import (
         Batch as FluentBatch,
@@ -1379,10 +1379,10 @@ def standardize_batch_request_display_ordering(
 if TYPE_CHECKING:
     AnyBatch: TypeAlias = Union[Batch, FluentBatch]
 
-if pyspark.DataFrame:  # type: ignore[truthy-function] # False if NotImported
     BatchDataUnion: TypeAlias = Union[BatchData, pd.DataFrame, pyspark.DataFrame]
 
     BatchDataType: TypeAlias = Union[Type[BatchData], Type[pd.DataFrame], Type[pyspark.DataFrame]]
 else:
-    BatchDataType = Union[Type[BatchData], Type[pd.DataFrame]]  # type: ignore[misc] # Cannot assign multiple types
-    BatchDataUnion = Union[BatchData, pd.DataFrame]  # type: ignore[misc] # Cannot assign multiple types
+    # At runtime the aliases only annotate; naming "pyspark.DataFrame" here would import pyspark.
+    BatchDataType = Union[Type[BatchData], Type[pd.DataFrame]]
+    BatchDataUnion = Union[BatchData, pd.DataFrame]
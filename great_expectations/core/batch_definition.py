@@ -9,6 +9,8 @@ from great_expectations.compatibility import pydantic
 # Partitioner class when we update forward refs, so we just import here.
 from great_expectations.core.freshness_diagnostics import (
     BatchDefinitionFreshnessDiagnostics,
+    cached_lookup,
+    check_freshness,
 )
 from great_expectations.core.partitioners import ColumnPartitioner, FileNamePartitioner
 from great_expectations.core.serdes import _EncodedValidationData, _IdentifierBundle
@@ -103,7 +105,7 @@ class BatchDefinition(pydantic.GenericModel, Generic[PartitionerT]):
         diagnostics = self._is_added()
         if not diagnostics.success:
             return diagnostics
-        return self._is_fresh()
+        return check_freshness(self, self._is_fresh)
 
     def _is_added(self) -> BatchDefinitionFreshnessDiagnostics:
         return BatchDefinitionFreshnessDiagnostics(
@@ -111,13 +113,7 @@ class BatchDefinition(pydantic.GenericModel, Generic[PartitionerT]):
         )
 
     def _is_fresh(self) -> BatchDefinitionFreshnessDiagnostics:
-        datasource_dict = project_manager.get_datasources()
-
-        datasource: Datasource | None
-        try:
-            datasource = datasource_dict[self.data_asset.datasource.name]
-        except KeyError:
-            datasource = None
+        datasource = _get_persisted_datasource(self.data_asset.datasource.name)
         if not datasource:
             return BatchDefinitionFreshnessDiagnostics(
                 errors=[
@@ -178,3 +174,15 @@ class BatchDefinition(pydantic.GenericModel, Generic[PartitionerT]):
             asset=asset_bundle,
             batch_definition=batch_definition_bundle,
         )
+
+
+def _get_persisted_datasource(name: str) -> Datasource | None:
+    """Retrieves a datasource from its store, once per name within a `freshness_cache`."""
+
+    def fetch() -> Datasource | None:
+        try:
+            return project_manager.get_datasources()[name]
+        except KeyError:
+            return None
+
+    return cached_lookup(("datasource", name), fetch)
@@ -63,7 +63,7 @@ class PandasBatchSpec(SerializableDotDict, BatchSpec, PandasBatchSpecProtocol):
     @override
     def to_json_dict(self) -> dict[str, JSONValues]:
         from great_expectations.datasource.fluent.pandas_datasource import (
-            _EXCLUDE_TYPES_FROM_JSON,
+            _get_types_excluded_from_json,
         )
 
         json_dict: dict[str, JSONValues] = dict()
@@ -71,7 +71,7 @@ class PandasBatchSpec(SerializableDotDict, BatchSpec, PandasBatchSpecProtocol):
         json_dict["reader_options"] = {
             reader_option_name: reader_option
             for reader_option_name, reader_option in self.reader_options.items()
-            if not isinstance(reader_option, tuple(_EXCLUDE_TYPES_FROM_JSON))
+            if not isinstance(reader_option, _get_types_excluded_from_json())
         }
         return json_dict
 
@@ -35,8 +35,9 @@ from great_expectations.expectations.expectation_configuration import (
     ExpectationConfiguration,
 )
 from great_expectations.expectations.registry import (
+    _get_registered_renderers,
     _registered_metrics,
-    _registered_renderers,
+    register_core_metrics,
 )
 from great_expectations.render import (
     CollapseContent,
@@ -158,6 +159,8 @@ class ExpectationDoctor:
             )
         )
 
+        # Core Metrics are registered on first use; they may not all have been looked up yet.
+        register_core_metrics()
         introspected_execution_engines: ExpectationExecutionEngineDiagnostics = (
             self._get_execution_engine_diagnostics(
                 metric_diagnostics_list=metric_diagnostics_list,
@@ -193,7 +196,11 @@ class ExpectationDoctor:
         renderers: List[ExpectationRendererDiagnostics] = self._get_renderer_diagnostics(
             expectation_type=description_diagnostics.snake_name,
             test_diagnostics=test_results,
-            registered_renderers=_registered_renderers,  # type: ignore[arg-type]
+            registered_renderers={  # type: ignore[arg-type]
+                description_diagnostics.snake_name: _get_registered_renderers(
+                    description_diagnostics.snake_name
+                )
+            },
         )
 
         maturity_checklist: ExpectationDiagnosticMaturityMessages = self._get_maturity_checklist(
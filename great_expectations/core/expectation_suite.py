@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
 import uuid
@@ -32,6 +33,9 @@ from great_expectations.compatibility.pydantic import ValidationError as Pydanti
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.freshness_diagnostics import (
     ExpectationSuiteFreshnessDiagnostics,
+    check_freshness,
+    is_known_fresh,
+    record_fresh,
 )
 from great_expectations.core.serdes import _IdentifierBundle
 from great_expectations.data_context.data_context.context_factory import project_manager
@@ -52,6 +56,10 @@ from great_expectations.util import (
 if TYPE_CHECKING:
     from great_expectations.alias_types import JSONValues
     from great_expectations.data_context.store.expectations_store import ExpectationsStore
+    from great_expectations.data_context.types.resource_identifiers import (
+        ExpectationSuiteIdentifier,
+        GXCloudIdentifier,
+    )
     from great_expectations.expectations.expectation import Expectation
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
@@ -261,7 +269,7 @@ class ExpectationSuite(SerializableDictDot):
         diagnostics = self._is_added()
         if not diagnostics.success:
             return diagnostics
-        return self._is_fresh()
+        return check_freshness(self, self._is_fresh)
 
     def _is_added(self) -> ExpectationSuiteFreshnessDiagnostics:
         return ExpectationSuiteFreshnessDiagnostics(
@@ -269,9 +277,37 @@ class ExpectationSuite(SerializableDictDot):
         )
 
     def _is_fresh(self) -> ExpectationSuiteFreshnessDiagnostics:
-        suite_dict: dict | None
         try:
             key = self._store.get_key(name=self.name, id=self.id)
+            # The version must be read before the value, so that it is never newer than the value.
+            version = self._store.get_version(key=key)
+        except (
+            StoreBackendError,  # Generic error from stores
+            InvalidKeyError,  # Ephemeral context error
+        ):
+            return ExpectationSuiteFreshnessDiagnostics(
+                errors=[ExpectationSuiteNotFoundError(name=self.name)]
+            )
+
+        if version is None:
+            return self._compare_with_stored_suite(key=key)
+
+        # A suite identical to one found to match this version of the stored suite still matches.
+        digest = self._freshness_digest()
+        if is_known_fresh(self._store, key.to_tuple(), version, digest):
+            return ExpectationSuiteFreshnessDiagnostics(errors=[])
+
+        diagnostics = self._compare_with_stored_suite(key=key)
+        if diagnostics.success:
+            record_fresh(self._store, key.to_tuple(), version, digest)
+
+        return diagnostics
+
+    def _compare_with_stored_suite(
+        self, key: GXCloudIdentifier | ExpectationSuiteIdentifier
+    ) -> ExpectationSuiteFreshnessDiagnostics:
+        suite_dict: dict | None
+        try:
             suite_dict = self._store.get(key=key)
         except (
             StoreBackendError,  # Generic error from stores
@@ -297,6 +333,11 @@ class ExpectationSuite(SerializableDictDot):
             errors=[] if self == suite else [ExpectationSuiteNotFreshError(name=self.name)]
         )
 
+    def _freshness_digest(self) -> str:
+        """Digest of the content of this suite, to recognize a suite already found to be fresh."""
+        content = json.dumps(self.to_json_dict(), sort_keys=True, default=str)
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
     def _has_been_saved(self) -> bool:
         """Has this ExpectationSuite been persisted to a Store?"""
         # todo: this should only check local keys instead of potentially querying the remote backend
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
 import datetime
+import io
 import json
 import logging
-from copy import deepcopy
-from typing import TYPE_CHECKING, List, Optional, Union
+from copy import copy
+from typing import TYPE_CHECKING, BinaryIO, List, Optional, Union
 
 from marshmallow import Schema, fields, post_dump, post_load, pre_dump
 from typing_extensions import TypedDict
@@ -295,8 +296,7 @@ class ExpectationValidationResult(SerializableDictDot):
             myself["expectation_config"] = convert_to_json_serializable(
                 myself["expectation_config"]
             )
-        if "result" in myself:
-            myself["result"] = convert_to_json_serializable(myself["result"])
+        # "result" is already converted by the "pre_dump" hook of the schema.
         if "meta" in myself:
             myself["meta"] = convert_to_json_serializable(myself["meta"])
         if "exception_info" in myself:
@@ -388,7 +388,8 @@ class ExpectationValidationResultSchema(Schema):
     # noinspection PyUnusedLocal
     @pre_dump
     def convert_result_to_serializable(self, data, **kwargs):
-        data = deepcopy(data)
+        # The result is converted into new objects, so a shallow copy leaves the original intact.
+        data = copy(data)
         if isinstance(data, ExpectationValidationResult):
             data.result = convert_to_json_serializable(data.result)
         elif isinstance(data, dict):
@@ -405,7 +406,6 @@ class ExpectationValidationResultSchema(Schema):
             ExpectationConfigurationSchema,
         )
 
-        data = deepcopy(data)
         for key in ExpectationConfigurationSchema.REMOVE_KEYS_IF_NONE:
             if key in data and data[key] is None:
                 data.pop(key)
@@ -538,11 +538,11 @@ class ExpectationSuiteValidationResult(SerializableDictDot):
         )
 
     def __repr__(self):  # type: ignore[explicit-override] # FIXME
-        return json.dumps(self.to_json_dict(), indent=2)
+        return self.to_json_str(indent=2)
 
     @override
     def __str__(self):
-        return json.dumps(self.to_json_dict(), indent=2)
+        return self.to_json_str(indent=2)
 
     @public_api
     def to_json_dict(self):
@@ -551,16 +551,83 @@ class ExpectationSuiteValidationResult(SerializableDictDot):
         Returns:
             A JSON-serializable dict representation of this ExpectationSuiteValidationResult.
         """
-        myself = deepcopy(self)
+        return self._to_json_dict(
+            results=[convert_to_json_serializable(result) for result in self.results]
+        )
+
+    def _to_json_dict(self, results: list) -> dict:
+        # Attributes are replaced with converted (new) objects, never mutated, so a shallow copy
+        # leaves this instance intact.
+        myself = copy(self)
         # NOTE - JPC - 20191031: migrate to expectation-specific schemas that subclass result with properly-typed  # noqa: E501
         # schemas to get serialization all-the-way down via dump
         myself["suite_parameters"] = convert_to_json_serializable(myself["suite_parameters"])
         myself["statistics"] = convert_to_json_serializable(myself["statistics"])
         myself["meta"] = convert_to_json_serializable(myself["meta"])
-        myself["results"] = [convert_to_json_serializable(result) for result in myself["results"]]
+        myself["results"] = results
         myself = expectationSuiteValidationResultSchema.dump(myself)
         return myself
 
+    def write_json(self, fp: BinaryIO, indent: Optional[int] = 2, sort_keys: bool = False) -> None:
+        """Writes the JSON representation of this ExpectationSuiteValidationResult to a binary file.
+
+        The output is that of "json.dumps(self.to_json_dict(), indent=indent, sort_keys=sort_keys)",
+        but results are serialized and written one at a time, so that the whole (possibly very
+        large, e.g. with the COMPLETE result format) JSON-serializable dict is never held in memory.
+
+        Args:
+            fp: A binary file-like object (e.g. an open file or an io.BytesIO buffer).
+            indent: The indentation of nested levels, or None for a single line.
+            sort_keys: Whether to sort the keys of objects.
+        """
+        header: dict = self._to_json_dict(results=[])
+        keys: list = sorted(header) if sort_keys else list(header)
+        if not keys:
+            fp.write(b"{}")
+            return
+
+        fp.write(b"{")
+        for idx, key in enumerate(keys):
+            if idx:
+                fp.write(_json_item_separator(indent))
+
+            fp.write(f"{_json_newline(indent, level=1)}{json.dumps(key)}: ".encode())
+            if key == "results" and self.results:
+                self._write_json_results(fp=fp, indent=indent, sort_keys=sort_keys)
+            else:
+                fp.write(
+                    _dumps_nested_json(
+                        header[key], indent=indent, sort_keys=sort_keys, level=1
+                    ).encode()
+                )
+
+        fp.write(f"{_json_newline(indent, level=0)}}}".encode())
+
+    def _write_json_results(self, fp: BinaryIO, indent: Optional[int], sort_keys: bool) -> None:
+        fp.write(b"[")
+        for idx, result in enumerate(self.results):
+            if idx:
+                fp.write(_json_item_separator(indent))
+
+            # The same as the serialization of an element of "results" by the schema.
+            result_dict: dict = expectationValidationResultSchema.dump(
+                convert_to_json_serializable(result)
+            )
+            fp.write(_json_newline(indent, level=2).encode())
+            fp.write(
+                _dumps_nested_json(
+                    result_dict, indent=indent, sort_keys=sort_keys, level=2
+                ).encode()
+            )
+
+        fp.write(f"{_json_newline(indent, level=1)}]".encode())
+
+    def to_json_str(self, indent: Optional[int] = 2, sort_keys: bool = False) -> str:
+        """Returns the JSON representation of this ExpectationSuiteValidationResult (see "write_json")."""  # noqa: E501
+        buffer = io.BytesIO()
+        self.write_json(fp=buffer, indent=indent, sort_keys=sort_keys)
+        return buffer.getvalue().decode("utf-8")
+
     def get_metric(self, metric_name, **kwargs):  # noqa: C901 - too complex
         metric_name_parts = metric_name.split(".")
         metric_kwargs_id = get_metric_kwargs_id(metric_kwargs=kwargs)
@@ -650,7 +717,7 @@ class ExpectationSuiteValidationResultSchema(Schema):
     # noinspection PyUnusedLocal
     @pre_dump
     def prepare_dump(self, data, **kwargs):
-        data = deepcopy(data)
+        data = copy(data)
         if isinstance(data, ExpectationSuiteValidationResult):
             data.meta = convert_to_json_serializable(data=data.meta)
             data.statistics = convert_to_json_serializable(data=data.statistics)
@@ -676,5 +743,24 @@ class ExpectationSuiteValidationResultSchema(Schema):
         return ExpectationSuiteValidationResult(**data)
 
 
+def _json_item_separator(indent: Optional[int]) -> bytes:
+    # As in "json.dumps".
+    return b", " if indent is None else b","
+
+
+def _json_newline(indent: Optional[int], level: int) -> str:
+    return "" if indent is None else "\n" + " " * (indent * level)
+
+
+def _dumps_nested_json(value, indent: Optional[int], sort_keys: bool, level: int) -> str:
+    """Serializes a value nested "level" levels deep in a document being written with "indent"."""
+    text: str = json.dumps(value, indent=indent, sort_keys=sort_keys)
+    if indent is None:
+        return text
+
+    # Newlines only occur between tokens, as those within strings are escaped.
+    return text.replace("\n", "\n" + " " * (indent * level))
+
+
 expectationSuiteValidationResultSchema = ExpectationSuiteValidationResultSchema()
 expectationValidationResultSchema = ExpectationValidationResultSchema()
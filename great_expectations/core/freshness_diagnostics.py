@@ -1,7 +1,22 @@
 from __future__ import annotations
 
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
-from typing import ClassVar, Tuple, Type
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Hashable,
+    Iterator,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.exceptions import (
@@ -15,6 +30,11 @@ from great_expectations.exceptions import (
     ValidationDefinitionRelatedResourcesFreshnessError,
 )
 
+if TYPE_CHECKING:
+    from great_expectations.data_context.store.store import Store
+
+_T = TypeVar("_T")
+
 
 @dataclass
 class FreshnessDiagnostics:
@@ -111,3 +131,104 @@ class CheckpointFreshnessDiagnostics(_ParentFreshnessDiagnostics):
     raise_for_error_class: ClassVar[Type[ResourceFreshnessAggregateError]] = (
         CheckpointRelatedResourcesFreshnessError
     )
+
+
+class FreshnessCache:
+    """
+    Memoizes freshness checks, and the lookups they share, for the duration of one operation.
+
+    Running a Checkpoint checks every ValidationDefinition, each of which checks its suite and
+    batch definition (retrieving their datasource), and then checks each ValidationDefinition
+    again as it is run.  Within the scope of a cache (see `freshness_cache`), each resource object
+    is checked once and each shared lookup (e.g. of a datasource) is made once.
+    """
+
+    def __init__(self) -> None:
+        # Keyed by object identity; the resource is kept alive with its diagnostics.
+        self._diagnostics: Dict[int, Tuple[Any, FreshnessDiagnostics]] = {}
+        self._lookups: Dict[Hashable, Any] = {}
+
+    def get_diagnostics(self, resource: Any, check: Callable[[], _T]) -> _T:
+        cached = self._diagnostics.get(id(resource))
+        if cached is None or cached[0] is not resource:
+            cached = (resource, check())  # type: ignore[assignment]
+            self._diagnostics[id(resource)] = cached  # type: ignore[assignment]
+
+        return cached[1]  # type: ignore[return-value]
+
+    def invalidate(self, resource: Any) -> None:
+        self._diagnostics.pop(id(resource), None)
+
+    def lookup(self, key: Hashable, fetch: Callable[[], _T]) -> _T:
+        if key not in self._lookups:
+            self._lookups[key] = fetch()
+
+        return self._lookups[key]
+
+
+_active_freshness_cache: ContextVar[Optional[FreshnessCache]] = ContextVar(
+    "_active_freshness_cache", default=None
+)
+
+
+@contextmanager
+def freshness_cache() -> Iterator[FreshnessCache]:
+    """Memoizes freshness checks within its scope; nested scopes share the outermost cache."""
+    cache = _active_freshness_cache.get()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = FreshnessCache()
+    token = _active_freshness_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_freshness_cache.reset(token)
+
+
+def check_freshness(resource: Any, check: Callable[[], _T]) -> _T:
+    """Runs "check" for the given resource, unless already done in the current `freshness_cache`."""
+    cache = _active_freshness_cache.get()
+    if cache is None:
+        return check()
+
+    return cache.get_diagnostics(resource, check)
+
+
+def invalidate_freshness(resource: Any) -> None:
+    """Forgets the freshness of a resource (e.g. once persisted) within the `freshness_cache`."""
+    cache = _active_freshness_cache.get()
+    if cache is not None:
+        cache.invalidate(resource)
+
+
+def cached_lookup(key: Hashable, fetch: Callable[[], _T]) -> _T:
+    """Returns the result of "fetch", made at most once per key in the current `freshness_cache`."""
+    cache = _active_freshness_cache.get()
+    if cache is None:
+        return fetch()
+
+    return cache.lookup(key, fetch)
+
+
+# Per store, the version stamp and content digest of every value last found to be fresh.
+_fresh_versions: weakref.WeakKeyDictionary[Store, Dict[Hashable, Tuple[str, str]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def is_known_fresh(store: Store, key: Hashable, version: str, digest: str) -> bool:
+    """
+    Whether a resource with the given content digest was found to match the value stored under
+    "key" while that value had the given version stamp; if so, they still match.
+    """
+    return _fresh_versions.get(store, {}).get(key) == (version, digest)
+
+
+def record_fresh(store: Store, key: Hashable, version: str, digest: str) -> None:
+    """Records that a resource with the given digest matches the given version of a stored value.
+
+    The version must have been read before the value it was compared with.
+    """
+    _fresh_versions.setdefault(store, {})[key] = (version, digest)
@@ -13,7 +13,6 @@ import numpy as np
 from IPython import get_ipython
 
 from great_expectations import exceptions as gx_exceptions
-from great_expectations.compatibility.sqlalchemy import SQLALCHEMY_NOT_IMPORTED, LegacyRow, Row
 
 if TYPE_CHECKING:
     from great_expectations.compatibility import pyspark
@@ -30,12 +29,6 @@ except ImportError:
     LineString = None
 
 
-if not LegacyRow:
-    LegacyRow = SQLALCHEMY_NOT_IMPORTED
-
-if not Row:  # type: ignore[truthy-function]
-    Row = SQLALCHEMY_NOT_IMPORTED  # type: ignore[misc]
-
 SCHEMAS = {
     "api_np": {
         "NegativeInfinity": -np.inf,
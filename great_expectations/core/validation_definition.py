@@ -12,12 +12,15 @@ from great_expectations.compatibility.pydantic import (
     validator,
 )
 from great_expectations.constants import DATAFRAME_REPLACEMENT_STR
-from great_expectations.core.batch_definition import BatchDefinition
+from great_expectations.core.batch_definition import BatchDefinition, _get_persisted_datasource
 from great_expectations.core.expectation_suite import (
     ExpectationSuite,
 )
 from great_expectations.core.freshness_diagnostics import (
     ValidationDefinitionFreshnessDiagnostics,
+    check_freshness,
+    freshness_cache,
+    invalidate_freshness,
 )
 from great_expectations.core.result_format import DEFAULT_RESULT_FORMAT
 from great_expectations.core.run_identifier import RunIdentifier
@@ -39,6 +42,9 @@ from great_expectations.exceptions.exceptions import (
     StoreBackendError,
     ValidationDefinitionNotFoundError,
 )
+from great_expectations.execution_engine.materialized_tables_scope import (
+    materialized_tables_scope,
+)
 from great_expectations.validator.v1_validator import Validator
 
 if TYPE_CHECKING:
@@ -130,6 +136,11 @@ class ValidationDefinition(BaseModel):
         return project_manager.get_validation_results_store()
 
     def is_fresh(self) -> ValidationDefinitionFreshnessDiagnostics:
+        # Retrieving the persisted validation definition retrieves its suite and datasource again.
+        with freshness_cache():
+            return check_freshness(self, self._is_fresh)
+
+    def _is_fresh(self) -> ValidationDefinitionFreshnessDiagnostics:
         validation_definition_diagnostics = ValidationDefinitionFreshnessDiagnostics(
             errors=[] if self.id else [ValidationDefinitionNotAddedError(name=self.name)]
         )
@@ -214,11 +225,9 @@ class ValidationDefinition(BaseModel):
         asset_name = data_identifiers.asset.name
         batch_definition_name = data_identifiers.batch_definition.name
 
-        datasource_dict = project_manager.get_datasources()
-        try:
-            ds = datasource_dict[ds_name]
-        except KeyError as e:
-            raise ValueError(f"Could not find datasource named '{ds_name}'.") from e  # noqa: TRY003
+        ds = _get_persisted_datasource(ds_name)
+        if not ds:
+            raise ValueError(f"Could not find datasource named '{ds_name}'.")  # noqa: TRY003
 
         try:
             asset = ds.get_asset(asset_name)
@@ -282,7 +291,10 @@ class ValidationDefinition(BaseModel):
             batch_parameters=batch_parameters,
             result_format=result_format,
         )
-        results = validator.validate_expectation_suite(self.suite, expectation_parameters)
+        # Tables materialized from queries are dropped once validated (or once the checkpoint
+        # run is over).
+        with materialized_tables_scope():
+            results = validator.validate_expectation_suite(self.suite, expectation_parameters)
         results.meta["validation_id"] = self.id
         results.meta["checkpoint_id"] = checkpoint_id
 
@@ -373,3 +385,4 @@ class ValidationDefinition(BaseModel):
         key = store.get_key(name=self.name, id=self.id)
 
         store.add(key=key, value=self)
+        invalidate_freshness(self)
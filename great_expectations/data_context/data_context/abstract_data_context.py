@@ -593,6 +593,7 @@ class AbstractDataContext(ConfigPeer, ABC):
         if datasource:
             if self._datasource_store.cloud_mode and _call_store:
                 self._datasource_store.delete(datasource)
+            datasource.close()
         else:
             # Raise key error instead?
             logger.info(f"No Datasource '{name}' to delete")
@@ -969,7 +970,9 @@ class AbstractDataContext(ConfigPeer, ABC):
 
         # Both the config and the actual stores need to be kept in sync
         self.config.stores.pop(name, None)
-        self._stores.pop(name, None)
+        store = self._stores.pop(name, None)
+        if store is not None:
+            store.store_backend.close()
 
         self._save_project_config()
 
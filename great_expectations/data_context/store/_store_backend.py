@@ -121,6 +121,15 @@ class StoreBackend(metaclass=ABCMeta):
         value = self._get(key, **kwargs)
         return value
 
+    def get_version(self, key) -> Optional[str]:
+        """Returns a stamp of the version of the value stored under "key" (such as an ETag or a
+        modification time), or None if this backend does not provide one.
+
+        Stamps are cheaper to read than values, and change whenever the value does.
+        """
+        self._validate_key(key)
+        return self._get_version(key)
+
     def get_all(self):
         return self._get_all()
 
@@ -235,12 +244,19 @@ class StoreBackend(metaclass=ABCMeta):
     def remove_key(self, key) -> None:
         raise NotImplementedError
 
+    def _get_version(self, key) -> Optional[str]:
+        return None
+
     def _has_key(self, key) -> bool:
         raise NotImplementedError
 
     def is_ignored_key(self, key):
         return any(ignored in key for ignored in self.IGNORED_FILES)
 
+    def close(self) -> None:  # noqa: B027 # empty-method-without-abstract-decorator
+        """Releases the resources (e.g. database connections) of the store backend."""
+        pass
+
     @property
     def config(self) -> dict:
         raise NotImplementedError
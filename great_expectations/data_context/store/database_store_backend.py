@@ -12,17 +12,13 @@ from great_expectations.compatibility.sqlalchemy import (
 )
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.data_context.store.store_backend import StoreBackend
+from great_expectations.execution_engine.sqlalchemy_engine_registry import engine_registry
 from great_expectations.util import (
     filter_properties_dict,
     get_sqlalchemy_url,
     import_make_url,
 )
 
-if sa:
-    make_url = import_make_url()
-    SQLAlchemyError = sqlalchemy.SQLAlchemyError
-
-
 logger = logging.getLogger(__name__)
 
 
@@ -62,6 +58,8 @@ class DatabaseStoreBackend(StoreBackend):
         self._connection_string = connection_string
         self._url = url
 
+        # Engines acquired from the registry are released on "close()"; given engines are not.
+        self._acquired_engine = engine is None
         if engine is not None:
             if credentials is not None:
                 logger.warning(
@@ -72,11 +70,11 @@ class DatabaseStoreBackend(StoreBackend):
         elif credentials is not None:
             self.engine = self._build_engine(credentials=credentials, **kwargs)
         elif connection_string is not None:
-            self.engine = sa.create_engine(connection_string, **kwargs)
+            self.engine = engine_registry.acquire(connection_string, **kwargs)
         elif url is not None:
-            parsed_url = make_url(url)
+            parsed_url = import_make_url()(url)
             self.drivername = parsed_url.drivername
-            self.engine = sa.create_engine(url, **kwargs)
+            self.engine = engine_registry.acquire(url, **kwargs)
         else:
             raise gx_exceptions.InvalidConfigError(  # noqa: TRY003
                 "Credentials, url, connection_string, or an engine are required for a DatabaseStoreBackend."  # noqa: E501
@@ -109,7 +107,7 @@ class DatabaseStoreBackend(StoreBackend):
                             sa.text(f"CREATE SCHEMA IF NOT EXISTS {self._schema_name};")
                         )
                 meta.create_all(self.engine)
-            except SQLAlchemyError as e:
+            except sqlalchemy.SQLAlchemyError as e:
                 raise gx_exceptions.StoreBackendError(  # noqa: TRY003
                     f"Unable to connect to table {table_name} because of an error. It is possible your table needs to be migrated to a new schema.  SqlAlchemyError: {e!s}"  # noqa: E501
                 )
@@ -156,6 +154,13 @@ class DatabaseStoreBackend(StoreBackend):
             self._store_backend_id = f"{self.STORE_BACKEND_ID_PREFIX}{store_id}"
         return self._store_backend_id.replace(self.STORE_BACKEND_ID_PREFIX, "")
 
+    @override
+    def close(self) -> None:
+        """Releases the engine of the store backend, if acquired from the engine registry."""
+        if self._acquired_engine:
+            self._acquired_engine = False
+            engine_registry.release(self.engine)
+
     def _build_engine(self, credentials, **kwargs) -> "sa.engine.Engine":  # noqa: UP037
         """
         Using a set of given credentials, constructs an Execution Engine , connecting to a database using a URL or a
@@ -178,7 +183,7 @@ class DatabaseStoreBackend(StoreBackend):
 
         self.drivername = drivername
 
-        engine = sa.create_engine(options, **create_engine_kwargs)
+        engine = engine_registry.acquire(options, **create_engine_kwargs)
         return engine
 
     @staticmethod
@@ -245,7 +250,7 @@ class DatabaseStoreBackend(StoreBackend):
             with self.engine.begin() as connection:
                 row = connection.execute(sel).fetchone()[0]
             return row
-        except (IndexError, SQLAlchemyError) as e:
+        except (IndexError, TypeError, sqlalchemy.SQLAlchemyError) as e:
             logger.debug(f"Error fetching value: {e!s}")
             raise gx_exceptions.StoreError(f"Unable to fetch value for key: {key!s}")  # noqa: TRY003
 
@@ -262,7 +267,14 @@ class DatabaseStoreBackend(StoreBackend):
             if self.has_key(key):
                 ins = (
                     self._table.update()
-                    .where(getattr(self._table.columns, self.key_columns[0]) == key[0])
+                    .where(
+                        sa.and_(
+                            *(
+                                getattr(self._table.columns, key_col) == val
+                                for key_col, val in zip(self.key_columns, key)
+                            )
+                        )
+                    )
                     .values(**cols)
                 )
             else:
@@ -319,7 +331,7 @@ class DatabaseStoreBackend(StoreBackend):
         try:
             with self.engine.begin() as connection:
                 return connection.execute(sel).fetchone()[0] == 1
-        except (IndexError, SQLAlchemyError) as e:
+        except (IndexError, sqlalchemy.SQLAlchemyError) as e:
             logger.debug(f"Error checking for value: {e!s}")
             return False
 
@@ -354,7 +366,7 @@ class DatabaseStoreBackend(StoreBackend):
         try:
             with self.engine.begin() as connection:
                 return connection.execute(delete_statement)
-        except SQLAlchemyError as e:
+        except sqlalchemy.SQLAlchemyError as e:
             raise gx_exceptions.StoreBackendError(  # noqa: TRY003
                 f"Unable to delete key: got sqlalchemy error {e!s}"
             )
@@ -6,6 +6,7 @@ import pathlib
 import re
 import tempfile
 from mimetypes import guess_type
+from typing import Optional
 from zipfile import ZipFile, is_zipfile
 
 from great_expectations.core.data_context_key import DataContextKey
@@ -202,6 +203,29 @@ class HtmlSiteStore:
                 class_name=store_backend["class_name"],
             )
 
+        build_manifest_config_defaults = {
+            "module_name": module_name,
+            "filepath_template": "build_manifest.json",
+            "suppress_store_backend_id": True,
+        }
+        if is_gx_cloud_store:
+            build_manifest_config_defaults = {
+                "module_name": module_name,
+                "suppress_store_backend_id": True,
+            }
+
+        build_manifest_obj = instantiate_class_from_config(
+            config=store_backend,
+            runtime_environment=runtime_environment,
+            config_defaults=build_manifest_config_defaults,
+        )
+        if not build_manifest_obj:
+            raise ClassInstantiationError(
+                module_name=module_name,
+                package_name=None,
+                class_name=store_backend["class_name"],
+            )
+
         static_assets_config_defaults = {
             "module_name": module_name,
             "filepath_template": None,
@@ -228,6 +252,7 @@ class HtmlSiteStore:
             ExpectationSuiteIdentifier: expectation_suite_identifier_obj,
             ValidationResultIdentifier: validation_result_idendifier_obj,
             "index_page": index_page_obj,
+            "build_manifest": build_manifest_obj,
             "static_assets": static_assets_obj,
         }
 
@@ -356,6 +381,27 @@ class HtmlSiteStore:
             content_type="text/html; " "charset=utf-8",
         )
 
+    def read_build_manifest(self) -> Optional[str]:
+        """Returns the manifest of the last incremental build of the site, if there is one."""
+        store_backend = self.store_backends["build_manifest"]
+        if isinstance(store_backend, GXCloudStoreBackend) or not store_backend.has_key(()):
+            return None
+
+        return store_backend.get(())
+
+    def write_build_manifest(self, manifest: str) -> None:
+        """Like the index page, the manifest is stored under a zero-length tuple key."""
+        store_backend = self.store_backends["build_manifest"]
+        if isinstance(store_backend, GXCloudStoreBackend):
+            return
+
+        store_backend.set(
+            (),
+            manifest,
+            content_encoding="utf-8",
+            content_type="application/json",
+        )
+
     def clean_site(self) -> None:
         for _, target_store_backend in self.store_backends.items():
             keys = target_store_backend.list_keys()
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import itertools
 from typing import TYPE_CHECKING, Any, Optional
 
 from great_expectations.compatibility.typing_extensions import override
@@ -14,6 +15,8 @@ if TYPE_CHECKING:
         DataContextVariableSchema,
     )
 
+_VERSION_COUNTER = itertools.count()
+
 
 class InMemoryStoreBackend(StoreBackend):
     """Uses an in-memory dictionary as a store backend."""
@@ -34,6 +37,8 @@ class InMemoryStoreBackend(StoreBackend):
             store_name=store_name,
         )
         self._store: dict = {}
+        # Version stamps of the values in "_store", drawn from a counter shared by all instances.
+        self._versions: dict = {}
         # Initialize with store_backend_id if not part of an HTMLSiteStore
         if not self._suppress_store_backend_id:
             _ = self.store_backend_id
@@ -57,6 +62,10 @@ class InMemoryStoreBackend(StoreBackend):
         except KeyError as e:
             raise InvalidKeyError(f"{e!s}")
 
+    @override
+    def _get_version(self, key) -> Optional[str]:
+        return self._versions.get(key)
+
     @override
     def _get_all(self) -> list[Any]:
         return [val for key, val in self._store.items() if key != self.STORE_BACKEND_ID_KEY]
@@ -64,11 +73,14 @@ class InMemoryStoreBackend(StoreBackend):
     @override
     def _set(self, key, value, **kwargs) -> None:
         self._store[key] = value
+        self._versions[key] = str(next(_VERSION_COUNTER))
 
     @override
     def _move(self, source_key, dest_key, **kwargs) -> None:
         self._store[dest_key] = self._store[source_key]
         self._store.pop(source_key)
+        self._versions[dest_key] = str(next(_VERSION_COUNTER))
+        self._versions.pop(source_key, None)
 
     def list_keys(self, prefix=()):  # type: ignore[explicit-override] # FIXME
         return [key for key in self._store if key[: len(prefix)] == prefix]
@@ -81,6 +93,7 @@ class InMemoryStoreBackend(StoreBackend):
         if isinstance(key, DataContextKey):
             key = key.to_tuple()
         del self._store[key]
+        self._versions.pop(key, None)
 
     @property
     @override
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
 import json
-from typing import ClassVar, Type
+from typing import Any, ClassVar, List, Optional, Type
+
+import numpy as np
 
 from great_expectations.data_context.store.database_store_backend import (
     DatabaseStoreBackend,
 )
 from great_expectations.data_context.store.store import Store
 from great_expectations.data_context.types.resource_identifiers import (
+    BatchMetricIdentifier,
     ValidationMetricIdentifier,
 )
 from great_expectations.util import (
@@ -23,6 +26,17 @@ class MetricStore(Store):
 
     _key_class: ClassVar[Type] = ValidationMetricIdentifier
 
+    # Defaults for the common case of a DatabaseStoreBackend
+    _default_table_name: ClassVar[str] = "ge_metrics"
+    _default_key_columns: ClassVar[List[str]] = [
+        "run_name",
+        "run_time",
+        "data_asset_name",
+        "expectation_suite_identifier",
+        "metric_name",
+        "metric_kwargs_id",
+    ]
+
     def __init__(self, store_backend=None, store_name=None) -> None:
         if store_backend is not None:
             store_backend_module_name = store_backend.get(
@@ -35,18 +49,12 @@ class MetricStore(Store):
             if issubclass(store_backend_class, DatabaseStoreBackend):
                 # Provide defaults for this common case
                 if "table_name" not in store_backend:
-                    store_backend["table_name"] = store_backend.get("table_name", "ge_metrics")
+                    store_backend["table_name"] = store_backend.get(
+                        "table_name", self._default_table_name
+                    )
                 if "key_columns" not in store_backend:
                     store_backend["key_columns"] = store_backend.get(
-                        "key_columns",
-                        [
-                            "run_name",
-                            "run_time",
-                            "data_asset_name",
-                            "expectation_suite_identifier",
-                            "metric_name",
-                            "metric_kwargs_id",
-                        ],
+                        "key_columns", list(self._default_key_columns)
                     )
 
         super().__init__(store_backend=store_backend, store_name=store_name)
@@ -57,3 +65,90 @@ class MetricStore(Store):
     def deserialize(self, value):  # type: ignore[explicit-override] # FIXME
         if value:
             return json.loads(value)["value"]
+
+
+class BatchMetricStore(MetricStore):
+    """
+    A BatchMetricStore stores the values of Metrics computed on individual Batches, so that
+    multi-Batch computations (e.g., of Rule-Based Profiler ParameterBuilders) only compute Metrics
+    of Batches not seen before.
+
+    Only numeric, boolean and string values (and arrays and lists of them) are stored.
+    """
+
+    _key_class: ClassVar[Type] = BatchMetricIdentifier
+
+    _default_table_name: ClassVar[str] = "ge_batch_metrics"
+    _default_key_columns: ClassVar[List[str]] = [
+        "batch_fingerprint",
+        "metric_name",
+        "metric_kwargs_id",
+    ]
+
+    @staticmethod
+    def is_storable(value: Any) -> bool:
+        """Whether the given Metric value is restored as an equal value once stored."""
+        if isinstance(value, np.ndarray):
+            return value.dtype.kind in "biuf"
+
+        if isinstance(value, (list, tuple)):
+            return all(_is_storable_scalar(element) for element in value)
+
+        return _is_storable_scalar(value)
+
+    def serialize(self, value):  # type: ignore[explicit-override] # FIXME
+        # NumPy types are recorded, so that stored values are restored with the types of computed
+        # ones (multi-Batch metric values of mixed types are not conditioned into arrays).
+        if isinstance(value, np.ndarray):
+            return json.dumps({"value": value.tolist(), "ndarray": True, "dtype": value.dtype.str})
+
+        if isinstance(value, (list, tuple)):
+            return json.dumps(
+                {
+                    "value": [_to_python_scalar(element) for element in value],
+                    "dtypes": [_get_numpy_dtype(element) for element in value],
+                }
+            )
+
+        return json.dumps({"value": _to_python_scalar(value), "dtype": _get_numpy_dtype(value)})
+
+    def deserialize(self, value):  # type: ignore[explicit-override] # FIXME
+        if value:
+            stored = json.loads(value)
+            if stored.get("ndarray"):
+                return np.asarray(stored["value"], dtype=stored.get("dtype"))
+
+            if "dtypes" in stored:
+                return [
+                    _from_python_scalar(element, dtype)
+                    for element, dtype in zip(stored["value"], stored["dtypes"])
+                ]
+
+            return _from_python_scalar(stored["value"], stored.get("dtype"))
+
+
+def _is_storable_scalar(value: Any) -> bool:
+    return value is None or isinstance(
+        value, (bool, int, float, str, np.bool_, np.integer, np.floating)
+    )
+
+
+def _get_numpy_dtype(value: Any) -> Optional[str]:
+    if isinstance(value, (np.bool_, np.integer, np.floating)):
+        return value.dtype.str
+
+    return None
+
+
+def _to_python_scalar(value: Any) -> Any:
+    if isinstance(value, (np.bool_, np.integer, np.floating)):
+        return value.item()
+
+    return value
+
+
+def _from_python_scalar(value: Any, dtype: Optional[str]) -> Any:
+    if dtype is None:
+        return value
+
+    return np.dtype(dtype).type(value)
@@ -13,14 +13,13 @@ from great_expectations.core.data_context_key import StringKey
 from great_expectations.data_context.store.store import Store
 from great_expectations.util import filter_properties_dict
 
-if sa:
-    if is_version_greater_or_equal(sa.__version__, "1.4.0"):
-        url_create_fn = sqlalchemy.URL.create
-    else:
-        url_create_fn = sqlalchemy.URL  # type: ignore[assignment]
+logger = logging.getLogger(__name__)
 
 
-logger = logging.getLogger(__name__)
+def _create_url(drivername: str, **credentials):
+    if is_version_greater_or_equal(sqlalchemy.__version__, "1.4.0"):
+        return sqlalchemy.URL.create(drivername, **credentials)
+    return sqlalchemy.URL(drivername, **credentials)
 
 
 class SqlAlchemyQueryStore(Store):
@@ -72,7 +71,7 @@ class SqlAlchemyQueryStore(Store):
             self.engine = sa.create_engine(credentials["connection_string"])
         else:
             drivername = credentials.pop("drivername")
-            options = url_create_fn(drivername, **credentials)
+            options = _create_url(drivername, **credentials)
             self.engine = sa.create_engine(options)
 
         # Gather the call arguments of the present function (include the "module_name" and add the "class_name"), filter  # noqa: E501
@@ -236,6 +236,20 @@ class Store:
 
         return None
 
+    def get_version(
+        self, key: DataContextKey | GXCloudIdentifier | ConfigurationIdentifier
+    ) -> Optional[str]:
+        """Returns a stamp of the version of the value stored under "key", if the backend has one.
+
+        Checking the stamp is cheaper than retrieving (and deserializing) the value; None means
+        that the value must be retrieved to tell whether it has changed.
+        """
+        if self.cloud_mode:
+            return None
+
+        self._validate_key(key)
+        return self._store_backend.get_version(self.key_to_tuple(key))
+
     def get_all(self) -> list[Any]:
         objs = self._store_backend.get_all()
         if self.cloud_mode:
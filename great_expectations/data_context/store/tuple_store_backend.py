@@ -9,7 +9,7 @@ import random
 import re
 import shutil
 from abc import ABCMeta
-from typing import Any, List, Tuple
+from typing import Any, List, Optional, Tuple
 
 from great_expectations.compatibility import aws
 from great_expectations.compatibility.typing_extensions import override
@@ -307,6 +307,18 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
         return contents
 
+    @override
+    def _get_version(self, key) -> Optional[str]:
+        filepath: str = os.path.join(  # noqa: PTH118
+            self.full_base_directory, self._convert_key_to_filepath(key)
+        )
+        try:
+            stat = os.stat(filepath)  # noqa: PTH116
+        except FileNotFoundError:
+            return None
+
+        return f"{stat.st_mtime_ns}-{stat.st_size}"
+
     @override
     def _get_all(self) -> list[Any]:
         keys = [key for key in self.list_keys() if key != StoreBackend.STORE_BACKEND_ID_KEY]
@@ -543,6 +555,16 @@ class TupleS3StoreBackend(TupleStoreBackend):
         s3_object_key = self._build_s3_object_key(key)
         return self._get_by_s3_object_key(client, s3_object_key)
 
+    @override
+    def _get_version(self, key) -> Optional[str]:
+        client = self._create_client()
+        s3_object_key = self._build_s3_object_key(key)
+        try:
+            return client.head_object(Bucket=self.bucket, Key=s3_object_key)["ETag"]
+        except client.exceptions.ClientError as e:
+            logger.debug(str(e))
+            return None
+
     @override
     def _get_all(self) -> list[Any]:
         """Get all objects from the store.
@@ -160,6 +160,9 @@ class ValidationResultsStore(Store):
     def serialize(self, value):  # type: ignore[explicit-override] # FIXME
         if self.cloud_mode:
             return value.to_json_dict()
+        if isinstance(value, ExpectationSuiteValidationResult):
+            # Streams results one at a time, rather than building the whole dict first.
+            return value.to_json_str(indent=2, sort_keys=True)
         return self._expectationSuiteValidationResultSchema.dumps(
             value.to_json_dict(), indent=2, sort_keys=True
         )
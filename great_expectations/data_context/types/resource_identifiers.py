@@ -325,6 +325,45 @@ class ValidationMetricIdentifier(MetricIdentifier):
         )
 
 
+class BatchMetricIdentifier(MetricIdentifier):
+    """A BatchMetricIdentifier keys the value of a Metric computed on a particular Batch of data.
+
+    The batch fingerprint identifies the Batch and, where available, a digest of its data, so that
+    the value is only reused for the same data.
+    """
+
+    def __init__(self, batch_fingerprint, metric_name, metric_kwargs_id) -> None:
+        super().__init__(metric_name, metric_kwargs_id)
+        self._batch_fingerprint = batch_fingerprint
+
+    @property
+    def batch_fingerprint(self):
+        return self._batch_fingerprint
+
+    def to_tuple(self):  # type: ignore[explicit-override] # FIXME
+        return (self.batch_fingerprint, *super().to_tuple())
+
+    def to_fixed_length_tuple(self):  # type: ignore[explicit-override] # FIXME
+        return self.to_tuple()
+
+    @classmethod
+    def from_tuple(cls, tuple_):
+        if len(tuple_) != 3:  # noqa: PLR2004
+            raise gx_exceptions.GreatExpectationsError(  # noqa: TRY003
+                "BatchMetricIdentifier tuple must have exactly three components."
+            )
+        metric_id = MetricIdentifier.from_tuple(tuple_[1:])
+        return cls(
+            batch_fingerprint=tuple_[0],
+            metric_name=metric_id.metric_name,
+            metric_kwargs_id=metric_id.metric_kwargs_id,
+        )
+
+    @classmethod
+    def from_fixed_length_tuple(cls, tuple_):
+        return cls.from_tuple(tuple_)
+
+
 class GXCloudIdentifier(DataContextKey):
     def __init__(
         self,
@@ -12,15 +12,11 @@ from urllib.parse import urlparse
 import pyparsing as pp
 
 from great_expectations.alias_types import PathStr  # noqa: TCH001
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.exceptions import StoreConfigurationError
 from great_expectations.types import safe_deep_copy
 from great_expectations.util import load_class, verify_dynamic_loading_support
 
-try:
-    import sqlalchemy as sa  # noqa: TID251
-except ImportError:
-    sa = None  # type: ignore[assignment]
-
 logger = logging.getLogger(__name__)
 
 
@@ -183,7 +179,7 @@ class PasswordMasker:
         """  # noqa: E501
         if url.startswith("DefaultEndpointsProtocol"):
             return cls._obfuscate_azure_blobstore_connection_string(url)
-        elif sa is not None and use_urlparse is False:
+        elif sa and use_urlparse is False:
             try:
                 engine = sa.create_engine(url, **kwargs)
                 return engine.url.__repr__()
@@ -24,8 +24,8 @@ from typing import (
 
 from ruamel.yaml import YAML
 
+from great_expectations.compatibility import sqlalchemy
 from great_expectations.compatibility.pydantic import Extra, Field, validator
-from great_expectations.compatibility.sqlalchemy import TextClause
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.datasource.fluent.constants import (
     _ASSETS_KEY,
@@ -75,10 +75,6 @@ _MISSING_FLUENT_DATASOURCES_ERRORS: Final[List[PydanticErrorDict]] = [
 # sentinel value to know if parameter was passed
 _MISSING: Final = object()
 
-JSON_ENCODERS: dict[Type, Callable] = {}
-if TextClause:  # type: ignore[truthy-function]
-    JSON_ENCODERS[TextClause] = lambda v: str(v)
-
 T = TypeVar("T")
 
 
@@ -101,7 +97,17 @@ class GxConfig(FluentBaseModel):
 
     class Config:
         extra = Extra.ignore  # ignore any old style config keys
-        json_encoders = JSON_ENCODERS
+
+    @override
+    def json(self, *, encoder: Callable[[Any], Any] | None = None, **kwargs: Any) -> str:
+        return super().json(encoder=encoder or self._json_encoder, **kwargs)
+
+    @classmethod
+    def _json_encoder(cls, value: Any) -> Any:
+        # Not a "json_encoders" entry, which would import sqlalchemy along with this module.
+        if sqlalchemy.TextClause and isinstance(value, sqlalchemy.TextClause):  # type: ignore[truthy-function]
+            return str(value)
+        return cls.__json_encoder__(value)
 
     @property
     def datasources(self) -> List[Datasource]:
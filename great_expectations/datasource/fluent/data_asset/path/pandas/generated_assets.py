@@ -1,9 +1,9 @@
 from __future__ import annotations
 
-from typing import Type
+from typing import TYPE_CHECKING, Any, Dict, Type
 
 from great_expectations.datasource.fluent.data_asset.path.file_asset import FileDataAsset
-from great_expectations.datasource.fluent.dynamic_pandas import _generate_pandas_data_asset_models
+from great_expectations.datasource.fluent.dynamic_pandas import _PandasDataAssetModels
 
 _PANDAS_FILE_TYPE_READER_METHOD_UNSUPPORTED_LIST = (
     # "read_csv",
@@ -26,15 +26,38 @@ _PANDAS_FILE_TYPE_READER_METHOD_UNSUPPORTED_LIST = (
     "read_table",  # type-name conflict
     # "read_xml",
 )
-_FILE_PATH_ASSET_MODELS = _generate_pandas_data_asset_models(
+_FILE_PATH_ASSET_MODELS = _PandasDataAssetModels(
     FileDataAsset,
     blacklist=_PANDAS_FILE_TYPE_READER_METHOD_UNSUPPORTED_LIST,
     use_docstring_from_method=True,
     skip_first_param=True,
 )
-CSVAsset: Type[FileDataAsset] = _FILE_PATH_ASSET_MODELS.get("csv", FileDataAsset)
-ExcelAsset: Type[FileDataAsset] = _FILE_PATH_ASSET_MODELS.get("excel", FileDataAsset)
-FWFAsset: Type[FileDataAsset] = _FILE_PATH_ASSET_MODELS.get("fwf", FileDataAsset)
-JSONAsset: Type[FileDataAsset] = _FILE_PATH_ASSET_MODELS.get("json", FileDataAsset)
-ORCAsset: Type[FileDataAsset] = _FILE_PATH_ASSET_MODELS.get("orc", FileDataAsset)
-ParquetAsset: Type[FileDataAsset] = _FILE_PATH_ASSET_MODELS.get("parquet", FileDataAsset)
+
+_ASSET_MODEL_TYPES: Dict[str, str] = {
+    "CSVAsset": "csv",
+    "ExcelAsset": "excel",
+    "FWFAsset": "fwf",
+    "JSONAsset": "json",
+    "ORCAsset": "orc",
+    "ParquetAsset": "parquet",
+}
+
+
+def _get_asset_model(name: str) -> Type[FileDataAsset]:
+    return _FILE_PATH_ASSET_MODELS.get(_ASSET_MODEL_TYPES[name], FileDataAsset)
+
+
+if TYPE_CHECKING:
+    CSVAsset: Type[FileDataAsset] = _get_asset_model("CSVAsset")
+    ExcelAsset: Type[FileDataAsset] = _get_asset_model("ExcelAsset")
+    FWFAsset: Type[FileDataAsset] = _get_asset_model("FWFAsset")
+    JSONAsset: Type[FileDataAsset] = _get_asset_model("JSONAsset")
+    ORCAsset: Type[FileDataAsset] = _get_asset_model("ORCAsset")
+    ParquetAsset: Type[FileDataAsset] = _get_asset_model("ParquetAsset")
+
+
+def __getattr__(name: str) -> Any:
+    # The asset models are generated on first use (see "_PandasDataAssetModels").
+    if name in _ASSET_MODEL_TYPES:
+        return _get_asset_model(name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
@@ -24,6 +24,7 @@ from great_expectations.datasource.fluent.sql_datasource import (
 from great_expectations.datasource.fluent.sql_datasource import (
     TableAsset as SqlTableAsset,
 )
+from great_expectations.execution_engine.sqlalchemy_engine_registry import engine_registry
 
 if TYPE_CHECKING:
     from sqlalchemy.sql import quoted_name  # noqa: TID251 # type-checking only
@@ -233,4 +234,4 @@ class DatabricksSQLDatasource(SQLDatasource):
 
         # Databricks connection is a bit finicky - the http_path portion of the connection string needs to be passed in connect_args  # noqa: E501
         connect_args = {"http_path": http_path}
-        return sa.create_engine(connection_string, connect_args=connect_args, **kwargs)
+        return engine_registry.acquire(connection_string, connect_args=connect_args, **kwargs)
@@ -4,6 +4,7 @@ import enum
 import functools
 import inspect
 import logging
+import threading
 import warnings
 from collections import defaultdict
 from pprint import pformat as pf
@@ -18,6 +19,7 @@ from typing import (
     Iterator,
     List,
     Literal,
+    Mapping,
     NamedTuple,
     Optional,
     Pattern,  # must use typing.Pattern for pydantic < v1.10
@@ -34,6 +36,7 @@ from packaging.version import Version
 
 from great_expectations.compatibility import pydantic
 from great_expectations.compatibility.pydantic import AnyUrl, Field, FilePath
+from great_expectations.compatibility.typing_extensions import override
 
 # from great_expectations.compatibility.pydantic.typing import resolve_annotations
 from great_expectations.datasource.fluent.config_str import ConfigStr
@@ -434,7 +437,8 @@ def _generate_pandas_data_asset_models(
                 if use_docstring_from_method
                 else "",
             )
-            logger.debug(f"{model_name}\n{pf(fields)}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"{model_name}\n{pf(fields)}")
         except NameError as err:
             # TODO: sql_table has a `schema` param that is a pydantic reserved attribute.
             # Solution is to use an alias field.
@@ -455,6 +459,57 @@ def _generate_pandas_data_asset_models(
                 f"Updating forward references for asset model {asset_model.__name__} raised TypeError: {e}"  # noqa: E501
             ) from e
 
-    logger.debug(f"Needs extra handling\n{pf(dict(NEED_SPECIAL_HANDLING))}")
-    logger.debug(f"No Annotation\n{FIELD_SKIPPED_NO_ANNOTATION}")
+    if logger.isEnabledFor(logging.DEBUG):
+        # Formatting the fields of every model is costly; these models are built at import time.
+        logger.debug(f"Needs extra handling\n{pf(dict(NEED_SPECIAL_HANDLING))}")
+        logger.debug(f"No Annotation\n{FIELD_SKIPPED_NO_ANNOTATION}")
     return data_asset_models
+
+
+class _PandasDataAssetModels(Mapping[str, M]):
+    """The models of `_generate_pandas_data_asset_models()`, generated on first use.
+
+    Generating the models takes long, and their datasources are defined when great_expectations is
+    imported; datasources with these models register them when first used (see `MetaDatasource`).
+    """
+
+    def __init__(
+        self,
+        base_model_class: M,
+        blacklist: Optional[Sequence[str]] = None,
+        use_docstring_from_method: bool = False,
+        skip_first_param: bool = False,
+    ) -> None:
+        self._generate_models = functools.partial(
+            _generate_pandas_data_asset_models,
+            base_model_class,
+            blacklist=blacklist,
+            use_docstring_from_method=use_docstring_from_method,
+            skip_first_param=skip_first_param,
+        )
+        self._models: Optional[Dict[str, M]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def generated(self) -> bool:
+        return self._models is not None
+
+    def _get_models(self) -> Dict[str, M]:
+        if self._models is None:
+            with self._lock:
+                # Models are generated once, as registration requires the same classes every time.
+                if self._models is None:
+                    self._models = self._generate_models()
+        return self._models
+
+    @override
+    def __getitem__(self, type_name: str) -> M:
+        return self._get_models()[type_name]
+
+    @override
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._get_models())
+
+    @override
+    def __len__(self) -> int:
+        return len(self._get_models())
@@ -751,6 +751,17 @@ class Datasource(
             self._cached_execution_engine_kwargs = current_execution_engine_kwargs
         return self._execution_engine
 
+    def close(self) -> None:
+        """Closes the execution engine of the datasource, releasing its connections (if any).
+
+        The execution engine is created again if the datasource is used afterwards.
+        """
+        execution_engine = self._execution_engine
+        self._execution_engine = None
+        self._cached_execution_engine_kwargs = {}
+        if execution_engine is not None:
+            execution_engine.close()  # type: ignore[attr-defined] # not bound to ExecutionEngine
+
     def get_batch(self, batch_request: BatchRequest) -> Batch:
         """A Batch that corresponds to the BatchRequest.
 
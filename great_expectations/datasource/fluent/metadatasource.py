@@ -5,11 +5,15 @@ POC for dynamically bootstrapping context.sources with Datasource factory method
 from __future__ import annotations
 
 import logging
+import threading
 from pprint import pformat as pf
-from typing import Set, Type
+from typing import Any, Set, Type
 
 from great_expectations.compatibility.pydantic import ModelMetaclass
-from great_expectations.datasource.fluent.sources import DataSourceManager
+from great_expectations.datasource.fluent.sources import (
+    DataSourceManager,
+    has_deferred_asset_types,
+)
 from great_expectations.datasource.fluent.type_lookup import TypeLookup
 
 logger = logging.getLogger(__name__)
@@ -17,6 +21,8 @@ logger = logging.getLogger(__name__)
 
 class MetaDatasource(ModelMetaclass):
     __cls_set: Set[Type] = set()
+    __registering_asset_types: Set[Type] = set()
+    __lock = threading.RLock()
 
     def __new__(  # noqa: PYI034 # Self cannot be used with Metaclass
         meta_cls: Type[MetaDatasource], cls_name: str, bases: tuple[type], cls_dict
@@ -46,7 +52,45 @@ class MetaDatasource(ModelMetaclass):
             logger.warning(
                 f"Datasource `{cls_name}` should not be defined as part of __main__ this may cause typing lookup collisions"  # noqa: E501
             )
-        # instantiate new TypeLookup to prevent child classes conflicts with parent class asset types  # noqa: E501
-        cls._type_lookup = TypeLookup()
+        if not has_deferred_asset_types(cls):
+            # instantiate new TypeLookup to prevent child classes conflicts with parent class asset types  # noqa: E501
+            cls._type_lookup = TypeLookup()
         DataSourceManager.register_datasource(cls)
         return cls
+
+    def __call__(cls, *args, **kwargs):
+        cls._register_deferred_asset_types()
+        return super().__call__(*args, **kwargs)
+
+    def __getattr__(cls, name: str) -> Any:
+        # `_type_lookup` and the `add_<asset_type>_asset()` methods are set by registering the
+        # deferred asset types; other lookups (e.g. of fields, when subclassing) must not register.
+        is_registered_attribute = name == "_type_lookup" or (
+            name.startswith("add_") and name.endswith("_asset")
+        )
+        if is_registered_attribute and cls._register_deferred_asset_types():
+            return getattr(cls, name)
+        raise AttributeError(f"type object {cls.__name__!r} has no attribute {name!r}")  # noqa: TRY003
+
+    def _register_deferred_asset_types(cls) -> bool:
+        """Registers the asset types of a `Datasource` deferred to its first use (see `DeferredAssetTypes`).
+
+        Returns:
+            Whether the asset types were registered.
+        """  # noqa: E501
+        if "_type_lookup" in cls.__dict__ or cls not in MetaDatasource.__cls_set:
+            return False
+        with MetaDatasource.__lock:
+            # Registering looks up the `add_<asset_type>_asset()` methods, which are not bound yet.
+            if "_type_lookup" in cls.__dict__ or cls in MetaDatasource.__registering_asset_types:
+                return False
+            logger.debug(f"Registering deferred asset types of `{cls.__name__}`")
+            MetaDatasource.__registering_asset_types.add(cls)
+            try:
+                type_lookup = TypeLookup()
+                with type_lookup.transaction() as asset_type_lookup:
+                    DataSourceManager._register_assets(cls, asset_type_lookup=asset_type_lookup)  # type: ignore[arg-type]
+                cls._type_lookup = type_lookup
+            finally:
+                MetaDatasource.__registering_asset_types.discard(cls)
+        return True
@@ -10,6 +10,7 @@ from typing import (
     Any,
     Callable,
     ClassVar,
+    Dict,
     Generic,
     List,
     Literal,
@@ -30,6 +31,7 @@ from great_expectations._docs_decorators import (
     public_api,
 )
 from great_expectations.compatibility import pydantic, sqlalchemy
+from great_expectations.compatibility.duckdb import duckdb_engine
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.batch import LegacyBatchDefinition
@@ -42,7 +44,7 @@ from great_expectations.datasource.fluent.constants import (
     _FIELDS_ALWAYS_SET,
 )
 from great_expectations.datasource.fluent.dynamic_pandas import (
-    _generate_pandas_data_asset_models,
+    _PandasDataAssetModels,
 )
 from great_expectations.datasource.fluent.interfaces import (
     Batch,
@@ -51,13 +53,20 @@ from great_expectations.datasource.fluent.interfaces import (
     _DataAssetT,
 )
 from great_expectations.datasource.fluent.signatures import _merge_signatures
-from great_expectations.datasource.fluent.sources import DEFAULT_PANDAS_DATA_ASSET_NAME
+from great_expectations.datasource.fluent.sources import (
+    DEFAULT_PANDAS_DATA_ASSET_NAME,
+    DeferredAssetTypes,
+)
 from great_expectations.exceptions.exceptions import BuildBatchRequestError
 
 _EXCLUDE_TYPES_FROM_JSON: list[Type] = [sqlite3.Connection]
 
-if sa:
-    _EXCLUDE_TYPES_FROM_JSON = _EXCLUDE_TYPES_FROM_JSON + [sqlalchemy.Engine]
+
+def _get_types_excluded_from_json() -> tuple[Type, ...]:
+    # sqlalchemy is imported on first use, not with this module.
+    if sa:
+        return (*_EXCLUDE_TYPES_FROM_JSON, sqlalchemy.Engine)
+    return tuple(_EXCLUDE_TYPES_FROM_JSON)
 
 
 if TYPE_CHECKING:
@@ -74,6 +83,9 @@ if TYPE_CHECKING:
     from great_expectations.datasource.fluent.data_connector.batch_filter import BatchSlice
     from great_expectations.datasource.fluent.interfaces import BatchMetadata
     from great_expectations.execution_engine import PandasExecutionEngine
+    from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+        SqlAlchemyExecutionEngine,
+    )
 
 
 logger = logging.getLogger(__name__)
@@ -272,7 +284,7 @@ work-around, until "type" naming convention and method for obtaining 'reader_met
         # don't check fields that should always be set
         check_fields: set[str] = self.__fields_set__.copy().difference(_FIELDS_ALWAYS_SET)
         for field in check_fields:
-            if isinstance(getattr(self, field), tuple(_EXCLUDE_TYPES_FROM_JSON)):
+            if isinstance(getattr(self, field), _get_types_excluded_from_json()):
                 exclude_fields[field] = True
 
         return super().json(
@@ -313,36 +325,72 @@ _PANDAS_READER_METHOD_UNSUPPORTED_LIST: tuple[str, ...] = (
 )
 
 
-_PANDAS_ASSET_MODELS = _generate_pandas_data_asset_models(
+_PANDAS_ASSET_MODELS = _PandasDataAssetModels(
     _PandasDataAsset,
     blacklist=_PANDAS_READER_METHOD_UNSUPPORTED_LIST,
     use_docstring_from_method=True,
     skip_first_param=False,
 )
 
+_ASSET_MODEL_TYPES: Dict[str, str] = {
+    "ClipboardAsset": "clipboard",
+    "CSVAsset": "csv",
+    "ExcelAsset": "excel",
+    "FeatherAsset": "feather",
+    "FWFAsset": "fwf",
+    "GBQAsset": "gbq",
+    "HDFAsset": "hdf",
+    "HTMLAsset": "html",
+    "JSONAsset": "json",
+    "ORCAsset": "orc",
+    "ParquetAsset": "parquet",
+    "PickleAsset": "pickle",
+    "SQLAsset": "sql",
+    "SQLQueryAsset": "sql_query",
+    "SQLTableAsset": "sql_table",
+    "SASAsset": "sas",
+    "SPSSAsset": "spss",
+    "StataAsset": "stata",
+    "TableAsset": "table",
+    "XMLAsset": "xml",
+}
+
+
+def _get_asset_model(name: str) -> Type[_PandasDataAsset]:
+    # read_xml doesn't exist for pandas < 1.3
+    return _PANDAS_ASSET_MODELS.get(_ASSET_MODEL_TYPES[name], _PandasDataAsset)
+
 
-ClipboardAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("clipboard", _PandasDataAsset)
-CSVAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("csv", _PandasDataAsset)
-ExcelAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("excel", _PandasDataAsset)
-FeatherAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("feather", _PandasDataAsset)
-FWFAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("fwf", _PandasDataAsset)
-GBQAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("gbq", _PandasDataAsset)
-HDFAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("hdf", _PandasDataAsset)
-HTMLAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("html", _PandasDataAsset)
-JSONAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("json", _PandasDataAsset)
-ORCAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("orc", _PandasDataAsset)
-ParquetAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("parquet", _PandasDataAsset)
-PickleAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("pickle", _PandasDataAsset)
-SQLAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("sql", _PandasDataAsset)
-SQLQueryAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("sql_query", _PandasDataAsset)
-SQLTableAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("sql_table", _PandasDataAsset)
-SASAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("sas", _PandasDataAsset)
-SPSSAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("spss", _PandasDataAsset)
-StataAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("stata", _PandasDataAsset)
-TableAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get("table", _PandasDataAsset)
-XMLAsset: Type[_PandasDataAsset] = _PANDAS_ASSET_MODELS.get(
-    "xml", _PandasDataAsset
-)  # read_xml doesn't exist for pandas < 1.3
+if TYPE_CHECKING:
+    ClipboardAsset: Type[_PandasDataAsset] = _get_asset_model("ClipboardAsset")
+    CSVAsset: Type[_PandasDataAsset] = _get_asset_model("CSVAsset")
+    ExcelAsset: Type[_PandasDataAsset] = _get_asset_model("ExcelAsset")
+    FeatherAsset: Type[_PandasDataAsset] = _get_asset_model("FeatherAsset")
+    FWFAsset: Type[_PandasDataAsset] = _get_asset_model("FWFAsset")
+    GBQAsset: Type[_PandasDataAsset] = _get_asset_model("GBQAsset")
+    HDFAsset: Type[_PandasDataAsset] = _get_asset_model("HDFAsset")
+    HTMLAsset: Type[_PandasDataAsset] = _get_asset_model("HTMLAsset")
+    JSONAsset: Type[_PandasDataAsset] = _get_asset_model("JSONAsset")
+    ORCAsset: Type[_PandasDataAsset] = _get_asset_model("ORCAsset")
+    ParquetAsset: Type[_PandasDataAsset] = _get_asset_model("ParquetAsset")
+    PickleAsset: Type[_PandasDataAsset] = _get_asset_model("PickleAsset")
+    SQLAsset: Type[_PandasDataAsset] = _get_asset_model("SQLAsset")
+    SQLQueryAsset: Type[_PandasDataAsset] = _get_asset_model("SQLQueryAsset")
+    SQLTableAsset: Type[_PandasDataAsset] = _get_asset_model("SQLTableAsset")
+    SASAsset: Type[_PandasDataAsset] = _get_asset_model("SASAsset")
+    SPSSAsset: Type[_PandasDataAsset] = _get_asset_model("SPSSAsset")
+    StataAsset: Type[_PandasDataAsset] = _get_asset_model("StataAsset")
+    TableAsset: Type[_PandasDataAsset] = _get_asset_model("TableAsset")
+    XMLAsset: Type[_PandasDataAsset] = _get_asset_model("XMLAsset")
+
+
+def __getattr__(name: str) -> Any:
+    # The asset models are generated on first use (see "_PandasDataAssetModels").
+    if name in _ASSET_MODEL_TYPES:
+        return _get_asset_model(name)
+    if name == "_DYNAMIC_ASSET_TYPES":
+        return list(_PANDAS_ASSET_MODELS.values())
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
 
 
 def _short_id() -> str:
@@ -517,6 +565,41 @@ class _PandasDatasource(Datasource, Generic[_DataAssetT]):
 
     # End Abstract Methods
 
+    @override
+    def get_execution_engine(self) -> Union[PandasExecutionEngine, SqlAlchemyExecutionEngine]:
+        """The execution engine of the datasource; a DuckDB one for the "duckdb" execution backend.
+
+        Only the datasources reading DataFrames or local files have an "execution_backend"; those
+        reading from object stores (S3, Azure Blob Storage, Google Cloud Storage, DBFS) do not.
+        """
+        execution_backend: str = getattr(self, "execution_backend", "pandas")
+        if execution_backend != "duckdb" or self.execution_engine_override:
+            return super().get_execution_engine()
+
+        if not duckdb_engine:
+            raise ModuleNotFoundError(str(duckdb_engine))
+
+        from great_expectations.execution_engine.duckdb_reader import (
+            DUCKDB_IN_MEMORY_CONNECTION_STRING,
+        )
+        from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+            SqlAlchemyExecutionEngine,
+        )
+
+        if not isinstance(self._execution_engine, SqlAlchemyExecutionEngine):
+            self._execution_engine = SqlAlchemyExecutionEngine(
+                connection_string=DUCKDB_IN_MEMORY_CONNECTION_STRING
+            )
+            # Never equal to the kwargs of a pandas execution engine, so that one is created again
+            # if the datasource is switched back to the "pandas" backend.
+            self._cached_execution_engine_kwargs = {"execution_backend": execution_backend}
+        return self._execution_engine
+
+    @classmethod
+    @override
+    def _get_exec_engine_excludes(cls) -> Set[str]:
+        return super()._get_exec_engine_excludes().union({"execution_backend"})
+
     @override
     def json(  # noqa: PLR0913
         self,
@@ -553,7 +636,7 @@ class _PandasDatasource(Datasource, Generic[_DataAssetT]):
                 # don't check fields that should always be set
                 check_fields: set[str] = asset.__fields_set__.copy().difference(_FIELDS_ALWAYS_SET)
                 for field in check_fields:
-                    if isinstance(getattr(asset, field), tuple(_EXCLUDE_TYPES_FROM_JSON)):
+                    if isinstance(getattr(asset, field), _get_types_excluded_from_json()):
                         exclude_assets[asset.name] = {field: True}
             if exclude_assets:
                 exclude_fields["assets"] = exclude_assets
@@ -602,9 +685,6 @@ class _PandasDatasource(Datasource, Generic[_DataAssetT]):
         return super()._add_asset(asset=asset, connect_options=connect_options)
 
 
-_DYNAMIC_ASSET_TYPES = list(_PANDAS_ASSET_MODELS.values())
-
-
 @public_api
 class PandasDatasource(_PandasDatasource):
     """Adds a single-batch pandas datasource to the data context.
@@ -619,11 +699,17 @@ class PandasDatasource(_PandasDatasource):
     ADD_READER_METHODS: ClassVar[bool] = True
 
     # class attributes
-    asset_types: ClassVar[Sequence[Type[DataAsset]]] = _DYNAMIC_ASSET_TYPES + [DataFrameAsset]
+    # also merges the method signatures, which require the generated asset models
+    asset_types: ClassVar[Sequence[Type[DataAsset]]] = DeferredAssetTypes(
+        lambda: _create_pandas_asset_types()
+    )
 
     # instance attributes
     type: Literal["pandas"] = "pandas"
     assets: List[_PandasDataAsset] = []
+    # "duckdb" validates the files (or DataFrames) of the assets with SQL queries run by DuckDB,
+    # instead of loading them into pandas DataFrames.
+    execution_backend: Literal["pandas", "duckdb"] = "pandas"
 
     @override
     def dict(self, _exclude_default_asset_names: bool = True, **kwargs):
@@ -729,7 +815,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The ClipboardAsset that has been added to this datasource.
         """
-        asset = ClipboardAsset(
+        asset = _get_asset_model("ClipboardAsset")(
             name=name,
             **kwargs,
         )
@@ -776,7 +862,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The CSVAsset that has been added to this datasource.
         """
-        asset = CSVAsset(
+        asset = _get_asset_model("CSVAsset")(
             name=name,
             filepath_or_buffer=filepath_or_buffer,  # type: ignore[call-arg]
             **kwargs,
@@ -827,7 +913,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The ExcelAsset that has been added to this datasource.
         """
-        asset = ExcelAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("ExcelAsset")(  # type: ignore[call-arg]
             name=name,
             io=io,
             **kwargs,
@@ -878,7 +964,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The FeatherAsset that has been added to this datasource.
         """
-        asset = FeatherAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("FeatherAsset")(  # type: ignore[call-arg]
             name=name,
             path=path,
             **kwargs,
@@ -929,7 +1015,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The FWFAsset that has been added to this datasource.
         """
-        asset = FWFAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("FWFAsset")(  # type: ignore[call-arg]
             name=name,
             filepath_or_buffer=filepath_or_buffer,
             **kwargs,
@@ -980,7 +1066,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The GBQAsset that has been added to this datasource.
         """
-        asset = GBQAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("GBQAsset")(  # type: ignore[call-arg]
             name=name,
             query=query,
             **kwargs,
@@ -1031,7 +1117,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The HDFAsset that has been added to this datasource.
         """
-        asset = HDFAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("HDFAsset")(  # type: ignore[call-arg]
             name=name,
             path_or_buf=path_or_buf,
             **kwargs,
@@ -1082,7 +1168,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The HTMLAsset that has been added to this datasource.
         """
-        asset = HTMLAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("HTMLAsset")(  # type: ignore[call-arg]
             name=name,
             io=io,
             **kwargs,
@@ -1133,7 +1219,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The JSONAsset that has been added to this datasource.
         """
-        asset = JSONAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("JSONAsset")(  # type: ignore[call-arg]
             name=name,
             path_or_buf=path_or_buf,
             **kwargs,
@@ -1184,7 +1270,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The ORCAsset that has been added to this datasource.
         """
-        asset = ORCAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("ORCAsset")(  # type: ignore[call-arg]
             name=name,
             path=path,
             **kwargs,
@@ -1235,7 +1321,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The ParquetAsset that has been added to this datasource.
         """
-        asset = ParquetAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("ParquetAsset")(  # type: ignore[call-arg]
             name=name,
             path=path,
             **kwargs,
@@ -1286,7 +1372,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The PickleAsset that has been added to this datasource.
         """
-        asset = PickleAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("PickleAsset")(  # type: ignore[call-arg]
             name=name,
             filepath_or_buffer=filepath_or_buffer,
             **kwargs,
@@ -1337,7 +1423,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The SASAsset that has been added to this datasource.
         """
-        asset = SASAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("SASAsset")(  # type: ignore[call-arg]
             name=name,
             filepath_or_buffer=filepath_or_buffer,
             **kwargs,
@@ -1388,7 +1474,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The SPSSAsset that has been added to this datasource.
         """
-        asset = SPSSAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("SPSSAsset")(  # type: ignore[call-arg]
             name=name,
             path=path,
             **kwargs,
@@ -1441,7 +1527,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The SQLAsset that has been added to this datasource.
         """
-        asset = SQLAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("SQLAsset")(  # type: ignore[call-arg]
             name=name,
             sql=sql,
             con=con,
@@ -1498,7 +1584,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The SQLQueryAsset that has been added to this datasource.
         """
-        asset = SQLQueryAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("SQLQueryAsset")(  # type: ignore[call-arg]
             name=name,
             sql=sql,
             con=con,
@@ -1555,7 +1641,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The SQLTableAsset that has been added to this datasource.
         """
-        asset = SQLTableAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("SQLTableAsset")(  # type: ignore[call-arg]
             name=name,
             table_name=table_name,
             con=con,
@@ -1610,7 +1696,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The StataAsset that has been added to this datasource.
         """
-        asset = StataAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("StataAsset")(  # type: ignore[call-arg]
             name=name,
             filepath_or_buffer=filepath_or_buffer,
             **kwargs,
@@ -1661,7 +1747,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The TableAsset that has been added to this datasource.
         """
-        asset = TableAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("TableAsset")(  # type: ignore[call-arg]
             name=name,
             filepath_or_buffer=filepath_or_buffer,
             **kwargs,
@@ -1712,7 +1798,7 @@ class PandasDatasource(_PandasDatasource):
         Returns:
             The XMLAsset that has been added to this datasource.
         """
-        asset = XMLAsset(  # type: ignore[call-arg]
+        asset = _get_asset_model("XMLAsset")(  # type: ignore[call-arg]
             name=name,
             path_or_buffer=path_or_buffer,
             **kwargs,
@@ -1745,119 +1831,20 @@ class PandasDatasource(_PandasDatasource):
         )
         return self._get_batch(asset=asset)
 
-    # attr-defined issue
-    # https://github.com/python/mypy/issues/12472
-    add_clipboard_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_clipboard_asset, ClipboardAsset, exclude={"type"}
-    )
-    read_clipboard.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_clipboard, ClipboardAsset, exclude={"type"}
-    )
-    add_csv_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_csv_asset, CSVAsset, exclude={"type"}
-    )
-    read_csv.__signature__ = _merge_signatures(read_csv, CSVAsset, exclude={"type"})  # type: ignore[attr-defined]
-    add_excel_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_excel_asset, ExcelAsset, exclude={"type"}
-    )
-    read_excel.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_excel, ExcelAsset, exclude={"type"}
-    )
-    add_feather_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_feather_asset, FeatherAsset, exclude={"type"}
-    )
-    read_feather.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_feather, FeatherAsset, exclude={"type"}
-    )
-    add_fwf_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_fwf_asset, FWFAsset, exclude={"type"}
-    )
-    read_fwf.__signature__ = _merge_signatures(read_fwf, FWFAsset, exclude={"type"})  # type: ignore[attr-defined]
-    add_gbq_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_gbq_asset, GBQAsset, exclude={"type"}
-    )
-    read_gbq.__signature__ = _merge_signatures(read_gbq, GBQAsset, exclude={"type"})  # type: ignore[attr-defined]
-    add_hdf_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_hdf_asset, HDFAsset, exclude={"type"}
-    )
-    read_hdf.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_hdf, HDFAsset, exclude={"type"}
-    )
-    add_html_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_html_asset, HTMLAsset, exclude={"type"}
-    )
-    read_html.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_html, HTMLAsset, exclude={"type"}
-    )
-    add_json_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_json_asset, JSONAsset, exclude={"type"}
-    )
-    read_json.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_json, JSONAsset, exclude={"type"}
-    )
-    add_orc_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_orc_asset, ORCAsset, exclude={"type"}
-    )
-    read_orc.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_orc, ORCAsset, exclude={"type"}
-    )
-    add_parquet_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_parquet_asset, ParquetAsset, exclude={"type"}
-    )
-    read_parquet.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_parquet, ParquetAsset, exclude={"type"}
-    )
-    add_pickle_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_pickle_asset, PickleAsset, exclude={"type"}
-    )
-    read_pickle.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_pickle, PickleAsset, exclude={"type"}
-    )
-    add_sas_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_sas_asset, SASAsset, exclude={"type"}
-    )
-    read_sas.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_sas, SASAsset, exclude={"type"}
-    )
-    add_spss_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_spss_asset, SPSSAsset, exclude={"type"}
-    )
-    read_spss.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_spss, SPSSAsset, exclude={"type"}
-    )
-    add_sql_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_sql_asset, SQLAsset, exclude={"type"}
-    )
-    read_sql.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_sql, SQLAsset, exclude={"type"}
-    )
-    add_sql_query_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_sql_query_asset, SQLQueryAsset, exclude={"type"}
-    )
-    read_sql_query.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_sql_query, SQLQueryAsset, exclude={"type"}
-    )
-    add_sql_table_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_sql_table_asset, SQLTableAsset, exclude={"type"}
-    )
-    read_sql_table.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_sql_table, SQLTableAsset, exclude={"type"}
-    )
-    add_stata_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_stata_asset, StataAsset, exclude={"type"}
-    )
-    read_stata.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_stata, StataAsset, exclude={"type"}
-    )
-    add_table_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_table_asset, TableAsset, exclude={"type"}
-    )
-    read_table.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_table, TableAsset, exclude={"type"}
-    )
-    add_xml_asset.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        add_xml_asset, XMLAsset, exclude={"type"}
-    )
-    read_xml.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
-        read_xml, XMLAsset, exclude={"type"}
-    )
+
+def _merge_asset_method_signatures() -> None:
+    """Merge the signatures of the asset models into their `add_*_asset` and `read_*` methods."""
+    for asset_model_name, type_name in _ASSET_MODEL_TYPES.items():
+        asset_model = _get_asset_model(asset_model_name)
+        for method_name in (f"add_{type_name}_asset", f"read_{type_name}"):
+            method = getattr(PandasDatasource, method_name)
+            # attr-defined issue
+            # https://github.com/python/mypy/issues/12472
+            method.__signature__ = _merge_signatures(  # type: ignore[attr-defined]
+                method, asset_model, exclude={"type"}
+            )
+
+
+def _create_pandas_asset_types() -> List[Type[DataAsset]]:
+    _merge_asset_method_signatures()
+    return [*_PANDAS_ASSET_MODELS.values(), DataFrameAsset]
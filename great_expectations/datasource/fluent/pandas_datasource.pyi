@@ -56,6 +56,8 @@ from great_expectations.execution_engine import PandasExecutionEngine
 
 _EXCLUDE_TYPES_FROM_JSON: list[Type]
 
+def _get_types_excluded_from_json() -> tuple[Type, ...]: ...
+
 MappingIntStrAny: TypeAlias = Mapping[Union[int, str], Any]
 AbstractSetIntStr: TypeAlias = AbstractSet[Union[int, str]]
 logger: Logger
@@ -167,6 +169,7 @@ class PandasDatasource(_PandasDatasource):
     asset_types: ClassVar[Sequence[Type[DataAsset]]]
     type: Literal["pandas"]
     assets: List[_PandasDataAsset]
+    execution_backend: Literal["pandas", "duckdb"]
     @override
     def test_connection(self, test_assets: bool = ...) -> None: ...
     @deprecated_argument(
@@ -6,10 +6,12 @@ from typing import TYPE_CHECKING, ClassVar, Literal, Type
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.util import DBFSPath
-from great_expectations.datasource.fluent import PandasFilesystemDatasource
 from great_expectations.datasource.fluent.data_connector import (
     DBFSDataConnector,
 )
+from great_expectations.datasource.fluent.pandas_filesystem_datasource import (
+    _PandasFilesystemDatasource,
+)
 
 if TYPE_CHECKING:
     from great_expectations.datasource.fluent.data_asset.path.file_asset import FileDataAsset
@@ -18,15 +20,14 @@ logger = logging.getLogger(__name__)
 
 
 @public_api
-class PandasDBFSDatasource(PandasFilesystemDatasource):
+class PandasDBFSDatasource(_PandasFilesystemDatasource):
     """Pandas based Datasource for DataBricks File System (DBFS) based data assets."""
 
     # class attributes
     data_connector_type: ClassVar[Type[DBFSDataConnector]] = DBFSDataConnector
 
     # instance attributes
-    # overridden from base `Literal['pandas_filesystem']`
-    type: Literal["pandas_dbfs"] = "pandas_dbfs"  # type: ignore[assignment] # base class has different type
+    type: Literal["pandas_dbfs"] = "pandas_dbfs"
 
     @override
     def _build_data_connector(
@@ -4,7 +4,6 @@ from typing import Hashable, Iterable, Literal, Optional, Sequence, Union
 
 from great_expectations._docs_decorators import public_api as public_api
 from great_expectations.compatibility.typing_extensions import override
-from great_expectations.datasource.fluent import PandasFilesystemDatasource
 from great_expectations.datasource.fluent.data_asset.path.pandas.generated_assets import (
     CSVAsset,
     ExcelAsset,
@@ -37,11 +36,14 @@ from great_expectations.datasource.fluent.interfaces import (
 from great_expectations.datasource.fluent.interfaces import (
     TestConnectionError as TestConnectionError,
 )
+from great_expectations.datasource.fluent.pandas_filesystem_datasource import (
+    _PandasFilesystemDatasource,
+)
 
 logger: Logger
 
-class PandasDBFSDatasource(PandasFilesystemDatasource):
-    type: Literal["pandas_dbfs"]  # type: ignore[assignment]
+class PandasDBFSDatasource(_PandasFilesystemDatasource):
+    type: Literal["pandas_dbfs"]
 
     @override
     def add_csv_asset(  # noqa: PLR0913
@@ -4,6 +4,7 @@ from typing import (
     TYPE_CHECKING,
     ClassVar,
     List,
+    Sequence,
     Type,
 )
 
@@ -16,6 +17,7 @@ from great_expectations.datasource.fluent.data_asset.path.pandas.generated_asset
 from great_expectations.datasource.fluent.pandas_datasource import (
     _PandasDatasource,
 )
+from great_expectations.datasource.fluent.sources import DeferredAssetTypes
 
 if TYPE_CHECKING:
     from great_expectations.datasource.fluent.interfaces import DataAsset
@@ -23,7 +25,9 @@ if TYPE_CHECKING:
 
 class _PandasFilePathDatasource(_PandasDatasource):
     # class attributes
-    asset_types: ClassVar[List[Type[DataAsset]]] = list(_FILE_PATH_ASSET_MODELS.values())
+    asset_types: ClassVar[Sequence[Type[DataAsset]]] = DeferredAssetTypes(
+        lambda: list(_FILE_PATH_ASSET_MODELS.values())
+    )
 
     # instance attributes
     assets: List[FileDataAsset] = []
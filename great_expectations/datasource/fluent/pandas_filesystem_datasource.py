@@ -18,10 +18,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-@public_api
-class PandasFilesystemDatasource(_PandasFilePathDatasource):
-    """Pandas based Datasource for filesystem based data assets."""
-
+class _PandasFilesystemDatasource(_PandasFilePathDatasource):
     # class attributes
     data_connector_type: ClassVar[Type[FilesystemDataConnector]] = FilesystemDataConnector
     # these fields should not be passed to the execution engine
@@ -30,23 +27,20 @@ class PandasFilesystemDatasource(_PandasFilePathDatasource):
         "data_context_root_directory",
     }
 
-    # instance attributes
-    type: Literal["pandas_filesystem"] = "pandas_filesystem"
-
     # Filesystem specific attributes
     base_directory: pathlib.Path
     data_context_root_directory: Optional[pathlib.Path] = None
 
     @override
     def test_connection(self, test_assets: bool = True) -> None:
-        """Test the connection for the PandasFilesystemDatasource.
+        """Test the connection for the filesystem based Datasource.
 
         Args:
-            test_assets: If assets have been passed to the PandasFilesystemDatasource, whether to test them as well.
+            test_assets: If assets have been passed to the Datasource, whether to test them as well.
 
         Raises:
             TestConnectionError: If the connection test fails.
-        """  # noqa: E501
+        """
         if not self.base_directory.exists():
             raise TestConnectionError(f"Path: {self.base_directory.resolve()} does not exist.")  # noqa: TRY003
 
@@ -79,3 +73,14 @@ class PandasFilesystemDatasource(_PandasFilePathDatasource):
                 base_directory=self.base_directory,
             )
         )
+
+
+@public_api
+class PandasFilesystemDatasource(_PandasFilesystemDatasource):
+    """Pandas based Datasource for filesystem based data assets."""
+
+    # instance attributes
+    type: Literal["pandas_filesystem"] = "pandas_filesystem"
+    # "duckdb" validates the files of the assets with SQL queries run by DuckDB, instead of loading
+    # them into pandas DataFrames.
+    execution_backend: Literal["pandas", "duckdb"] = "pandas"
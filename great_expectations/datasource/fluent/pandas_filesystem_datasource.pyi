@@ -50,8 +50,7 @@ from great_expectations.datasource.fluent.interfaces import (
 
 logger: Logger
 
-class PandasFilesystemDatasource(_PandasFilePathDatasource):
-    type: Literal["pandas_filesystem"]
+class _PandasFilesystemDatasource(_PandasFilePathDatasource):
     base_directory: pathlib.Path
     data_context_root_directory: Optional[pathlib.Path]
     @override
@@ -314,3 +313,7 @@ class PandasFilesystemDatasource(_PandasFilePathDatasource):
         compression: CompressionOptions = "infer",
         storage_options: StorageOptions = ...,
     ) -> XMLAsset: ...
+
+class PandasFilesystemDatasource(_PandasFilesystemDatasource):
+    type: Literal["pandas_filesystem"]
+    execution_backend: Literal["pandas", "duckdb"]
@@ -46,6 +46,7 @@ from great_expectations.datasource.fluent.sql_datasource import (
     TestConnectionError,
     to_lower_if_not_quoted,
 )
+from great_expectations.execution_engine.sqlalchemy_engine_registry import engine_registry
 
 if TYPE_CHECKING:
     from great_expectations.compatibility import sqlalchemy
@@ -741,6 +742,9 @@ class SnowflakeDatasource(SQLDatasource):
     @override
     def get_engine(self) -> sqlalchemy.Engine:
         if self.connection_string != self._cached_connection_string or not self._engine:
+            if self._engine:
+                engine_registry.release(self._engine)
+                self._engine = None
             try:
                 model_dict = self.dict(
                     exclude=self._get_exec_engine_excludes(),
@@ -792,7 +796,7 @@ class SnowflakeDatasource(SQLDatasource):
         else:
             url_args = {}
 
-        engine_kwargs: dict[Literal["url", "connect_args"], Any] = {}
+        engine_kwargs: dict[Literal["connect_args"], Any] = {}
         if connect_args:
             if private_key := connect_args.get("private_key"):
                 url_args.pop(  # TODO: update models + validation to handle this
@@ -807,6 +811,4 @@ class SnowflakeDatasource(SQLDatasource):
 
             engine_kwargs["connect_args"] = connect_args
 
-        engine_kwargs["url"] = url
-
-        return sa.create_engine(**engine_kwargs)  # type: ignore[misc]
+        return engine_registry.acquire(url, **engine_kwargs)
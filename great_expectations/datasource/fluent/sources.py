@@ -19,6 +19,7 @@ from typing import (
     Tuple,
     Type,
     Union,
+    overload,
 )
 
 from great_expectations._docs_decorators import public_api
@@ -76,6 +77,49 @@ class CrudMethodType(str, Enum):
 CrudMethodInfoFn: TypeAlias = Callable[..., Tuple[CrudMethodType, Type["Datasource"]]]
 
 
+class DeferredAssetTypes(Sequence[Type["DataAsset"]]):
+    """`Datasource.asset_types` created on first use, rather than when the `Datasource` is defined.
+
+    A `Datasource` with deferred asset types registers them when it is first used, e.g. when it is
+    instantiated (see `MetaDatasource`).
+    """
+
+    def __init__(self, create_asset_types: Callable[[], Sequence[Type[DataAsset]]]) -> None:
+        self._create_asset_types = create_asset_types
+        self._asset_types: Optional[List[Type[DataAsset]]] = None
+
+    @property
+    def created(self) -> bool:
+        return self._asset_types is not None
+
+    def _get_asset_types(self) -> List[Type[DataAsset]]:
+        if self._asset_types is None:
+            self._asset_types = list(self._create_asset_types())
+        return self._asset_types
+
+    @overload
+    def __getitem__(self, index: int) -> Type[DataAsset]: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> Sequence[Type[DataAsset]]: ...
+
+    @override
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[Type[DataAsset], Sequence[Type[DataAsset]]]:
+        return self._get_asset_types()[index]
+
+    @override
+    def __len__(self) -> int:
+        return len(self._get_asset_types())
+
+
+def has_deferred_asset_types(ds_type: Type[Datasource]) -> bool:
+    """Whether the asset types of the `Datasource` are yet to be created and registered."""
+    asset_types = ds_type.asset_types
+    return isinstance(asset_types, DeferredAssetTypes) and not asset_types.created
+
+
 @public_api
 class DataSourceManager:
     """
@@ -127,6 +171,16 @@ class DataSourceManager:
                 f"`{ds_type.__name__}` is missing a `type` attribute with an assigned string value"
             )
 
+        if has_deferred_asset_types(ds_type):
+            # The asset types are registered when the datasource is first used (`MetaDatasource`).
+            with cls.type_lookup.transaction() as ds_type_lookup:
+                cls._register_datasource(
+                    ds_type,
+                    ds_type_name=ds_type_name,
+                    datasource_type_lookup=ds_type_lookup,
+                )
+            return
+
         # rollback type registrations if exception occurs
         with cls.type_lookup.transaction() as ds_type_lookup, ds_type._type_lookup.transaction() as asset_type_lookup:  # noqa: E501
             cls._register_assets(ds_type, asset_type_lookup=asset_type_lookup)
@@ -259,7 +259,7 @@ class DataSourceManager:
         self,
         name: str,
     ) -> None: ...
-    def add_sql(
+    def add_sql(  # noqa: PLR0913
         self,
         name_or_datasource: Optional[Union[str, Datasource]] = None,
         name: Optional[str] = None,
@@ -267,8 +267,9 @@ class DataSourceManager:
         *,
         connection_string: Union[ConfigStr, str] = ...,
         create_temp_table: bool = True,
+        batch_identifiers_cache_ttl: float = 0,
     ) -> SQLDatasource: ...
-    def update_sql(
+    def update_sql(  # noqa: PLR0913
         self,
         name_or_datasource: Optional[Union[str, Datasource]] = None,
         name: Optional[str] = None,
@@ -276,8 +277,9 @@ class DataSourceManager:
         *,
         connection_string: Union[ConfigStr, str] = ...,
         create_temp_table: bool = True,
+        batch_identifiers_cache_ttl: float = 0,
     ) -> SQLDatasource: ...
-    def add_or_update_sql(
+    def add_or_update_sql(  # noqa: PLR0913
         self,
         name_or_datasource: Optional[Union[str, Datasource]] = None,
         name: Optional[str] = None,
@@ -285,12 +287,13 @@ class DataSourceManager:
         *,
         connection_string: Union[ConfigStr, str] = ...,
         create_temp_table: bool = True,
+        batch_identifiers_cache_ttl: float = 0,
     ) -> SQLDatasource: ...
     def delete_sql(
         self,
         name: str,
     ) -> None: ...
-    def add_postgres(
+    def add_postgres(  # noqa: PLR0913
         self,
         name_or_datasource: Optional[Union[str, Datasource]] = None,
         name: Optional[str] = None,
@@ -298,8 +301,9 @@ class DataSourceManager:
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
         create_temp_table: bool = True,
+        batch_identifiers_cache_ttl: float = 0,
     ) -> PostgresDatasource: ...
-    def update_postgres(
+    def update_postgres(  # noqa: PLR0913
         self,
         name_or_datasource: Optional[Union[str, Datasource]] = None,
         name: Optional[str] = None,
@@ -307,8 +311,9 @@ class DataSourceManager:
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
         create_temp_table: bool = True,
+        batch_identifiers_cache_ttl: float = 0,
     ) -> PostgresDatasource: ...
-    def add_or_update_postgres(
+    def add_or_update_postgres(  # noqa: PLR0913
         self,
         name_or_datasource: Optional[Union[str, Datasource]] = None,
         name: Optional[str] = None,
@@ -316,6 +321,7 @@ class DataSourceManager:
         *,
         connection_string: Union[ConfigStr, pydantic.networks.PostgresDsn, str] = ...,
         create_temp_table: bool = True,
+        batch_identifiers_cache_ttl: float = 0,
     ) -> PostgresDatasource: ...
     def delete_postgres(
         self,
@@ -546,7 +552,7 @@ class DataSourceManager:
         self,
         name: str,
     ) -> None: ...
-    def add_sqlite(
+    def add_sqlite(  # noqa: PLR0913
         self,
         name_or_datasource: Optional[Union[str, Datasource]] = None,
         name: Optional[str] = None,
@@ -554,8 +560,9 @@ class DataSourceManager:
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
         create_temp_table: bool = True,
+        batch_identifiers_cache_ttl: float = 0,
     ) -> SqliteDatasource: ...
-    def update_sqlite(
+    def update_sqlite(  # noqa: PLR0913
         self,
         name_or_datasource: Optional[Union[str, Datasource]] = None,
         name: Optional[str] = None,
@@ -563,8 +570,9 @@ class DataSourceManager:
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
         create_temp_table: bool = True,
+        batch_identifiers_cache_ttl: float = 0,
     ) -> SqliteDatasource: ...
-    def add_or_update_sqlite(
+    def add_or_update_sqlite(  # noqa: PLR0913
         self,
         name_or_datasource: Optional[Union[str, Datasource]] = None,
         name: Optional[str] = None,
@@ -572,6 +580,7 @@ class DataSourceManager:
         *,
         connection_string: Union[ConfigStr, SqliteDsn, str] = ...,
         create_temp_table: bool = True,
+        batch_identifiers_cache_ttl: float = 0,
     ) -> SqliteDatasource: ...
     def delete_sqlite(
         self,
@@ -28,7 +28,7 @@ from great_expectations.compatibility.pydantic import (
     StrictInt,
     StrictStr,
 )
-from great_expectations.compatibility.pyspark import ConnectDataFrame, DataFrame, pyspark
+from great_expectations.compatibility.pyspark import pyspark
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core import IDDict
 from great_expectations.core.batch import LegacyBatchDefinition
@@ -50,7 +50,7 @@ from great_expectations.exceptions.exceptions import BuildBatchRequestError
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias, TypeGuard
 
-    from great_expectations.compatibility.pyspark import SparkSession
+    from great_expectations.compatibility.pyspark import ConnectDataFrame, DataFrame, SparkSession
     from great_expectations.core.batch_definition import BatchDefinition
     from great_expectations.core.partitioners import ColumnPartitioner
     from great_expectations.datasource.fluent.data_connector.batch_filter import BatchSlice
@@ -320,6 +320,8 @@ class DataFrameAsset(DataAsset, Generic[_SparkDataFrameT]):
         """Check that a given object is a Spark DataFrame.
         This could either be a regular Spark DataFrame or a Spark Connect DataFrame.
         """
+        from great_expectations.compatibility.pyspark import ConnectDataFrame, DataFrame
+
         data_frame_types = [DataFrame, ConnectDataFrame]
         return any((cls and isinstance(df, cls)) for cls in data_frame_types)
 
@@ -2,12 +2,14 @@ from __future__ import annotations
 
 import copy
 import logging
+import time
 import warnings
 from datetime import date, datetime
 from pprint import pformat as pf
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     ClassVar,
     Dict,
     Final,
@@ -17,6 +19,7 @@ from typing import (
     Optional,
     Protocol,
     Sequence,
+    Set,
     Tuple,
     Type,
     Union,
@@ -70,13 +73,13 @@ from great_expectations.datasource.fluent.interfaces import (
     TestConnectionError,
 )
 from great_expectations.exceptions.exceptions import NoAvailableBatchesError
-from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 from great_expectations.execution_engine.partition_and_sample.data_partitioner import (
     DatePart,
 )
 from great_expectations.execution_engine.partition_and_sample.sqlalchemy_data_partitioner import (
     SqlAlchemyDataPartitioner,
 )
+from great_expectations.execution_engine.sqlalchemy_engine_registry import engine_registry
 
 if TYPE_CHECKING:
     from sqlalchemy.sql import quoted_name  # noqa: TID251 # type-checking only
@@ -88,6 +91,7 @@ if TYPE_CHECKING:
         BatchMetadata,
         BatchSlice,
     )
+    from great_expectations.execution_engine import SqlAlchemyExecutionEngine
 
 LOGGER: Final[logging.Logger] = logging.getLogger(__name__)
 
@@ -173,11 +177,24 @@ def _partitioner_and_sql_asset_to_batch_identifier_data(
 ) -> list[dict]:
     execution_engine = asset.datasource.get_execution_engine()
     sqlalchemy_data_partitioner = SqlAlchemyDataPartitioner(execution_engine.dialect_name)
-    return sqlalchemy_data_partitioner.get_data_for_batch_identifiers(
-        execution_engine=execution_engine,
-        selectable=asset.as_selectable(),
-        partitioner_method_name=partitioner.method_name,
-        partitioner_kwargs=partitioner.partitioner_method_kwargs(),
+    selectable = asset.as_selectable()
+    return asset.datasource._get_batch_identifier_data(
+        key=(asset.name, str(selectable), partitioner.json()),
+        fetch=lambda: sqlalchemy_data_partitioner.get_data_for_batch_identifiers(
+            execution_engine=execution_engine,
+            selectable=selectable,
+            partitioner_method_name=partitioner.method_name,
+            partitioner_kwargs=partitioner.partitioner_method_kwargs(),
+        ),
+    )
+
+
+def _selects_last_batch(batch_slice: slice) -> bool:
+    """Whether the last batch in a batch slice is always the last of all (non-empty) batches."""
+    return (
+        batch_slice.step in (None, 1)
+        and batch_slice.stop is None
+        and (batch_slice.start is None or batch_slice.start <= 0)
     )
 
 
@@ -199,6 +216,21 @@ class _PartitionerDatetime(FluentBaseModel):
             params.append(identifer_data[self.column_name])
         return params
 
+    def last_param_defaults(self, sql_asset: _SQLAsset) -> list[dict]:
+        """The last of param_defaults() in sorted order (if any), found with a single-row query."""
+        execution_engine = sql_asset.datasource.get_execution_engine()
+        data_partitioner = SqlAlchemyDataPartitioner(execution_engine.dialect_name)
+        batch_identifier_data = (
+            data_partitioner.get_data_for_last_batch_identifiers_for_partition_on_date_parts(
+                execution_engine=execution_engine,
+                selectable=sql_asset.as_selectable(),
+                column_name=self.column_name,
+                date_parts=self.param_names,
+                sort_ascending=self.sort_ascending,
+            )
+        )
+        return [identifer_data[self.column_name] for identifer_data in batch_identifier_data]
+
     def batch_parameters_to_batch_spec_kwarg_identifiers(
         self, options: BatchParameters
     ) -> Dict[str, Any]:
@@ -563,9 +595,28 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
 
         sql_partitioner = self.get_partitioner_implementation(batch_request.partitioner)
 
-        batch_requests: List[BatchRequest] = []
+        if all(batch_request.options.get(name) is not None for name in sql_partitioner.param_names):
+            # The batch request is already fully specified, so instead of finding all batches
+            # we only check that this one has data.
+            if not self._batch_has_data(batch_request, sql_partitioner):
+                return []
+            return [
+                BatchRequest(
+                    datasource_name=batch_request.datasource_name,
+                    data_asset_name=batch_request.data_asset_name,
+                    options=copy.deepcopy(batch_request.options),
+                    partitioner=batch_request.partitioner,
+                )
+            ]
+
         # We iterate through all possible batches as determined by the partitioner
-        for params in sql_partitioner.param_defaults(self):
+        return self._batch_requests_from_params(batch_request, sql_partitioner.param_defaults(self))
+
+    def _batch_requests_from_params(
+        self, batch_request: BatchRequest, params_list: List[dict]
+    ) -> List[BatchRequest]:
+        batch_requests: List[BatchRequest] = []
+        for params in params_list:
             # If the params from the partitioner don't match the batch parameters
             # we don't create this batch.
             if not _SQLAsset._matches_request_options(params, batch_request.options):
@@ -582,6 +633,65 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
             )
         return batch_requests
 
+    def _batch_has_data(self, batch_request: BatchRequest, sql_partitioner: SqlPartitioner) -> bool:
+        execution_engine: SqlAlchemyExecutionEngine = self.datasource.get_execution_engine()
+        return SqlAlchemyDataPartitioner(
+            execution_engine.dialect_name
+        ).has_data_for_batch_identifiers(
+            execution_engine=execution_engine,
+            selectable=self.as_selectable(),
+            partitioner_method_name=sql_partitioner.method_name,
+            partitioner_kwargs=sql_partitioner.partitioner_method_kwargs(),
+            batch_identifiers=sql_partitioner.batch_parameters_to_batch_spec_kwarg_identifiers(
+                batch_request.options
+            ),
+        )
+
+    def _last_batch_requests(
+        self, batch_request: BatchRequest, sql_partitioner: _PartitionerDatetime
+    ) -> List[BatchRequest]:
+        """The fully specified batch request of the last batch in sorted order (if any).
+
+        Only for batch requests without batch parameters: datetime partitions sort by their
+        (integer) date parts, so the database can find the last one without listing them all.
+        """
+        return self._batch_requests_from_params(
+            batch_request, sql_partitioner.last_param_defaults(self)
+        )
+
+    def _select_batch_request(
+        self, batch_request: BatchRequest, sql_partitioner: Optional[SqlPartitioner]
+    ) -> Tuple[BatchRequest, BatchMetadata]:
+        """The fully specified batch request, and batch metadata, of the batch get_batch returns.
+
+        This is the last batch of the sorted batches, sliced with the batch slice of the request.
+        """
+        requests: List[BatchRequest]
+        if (
+            isinstance(sql_partitioner, _PartitionerDatetime)
+            and all(value is None for value in batch_request.options.values())
+            and _selects_last_batch(batch_request.batch_slice)
+        ):
+            requests = self._last_batch_requests(batch_request, sql_partitioner)
+        else:
+            requests = self._fully_specified_batch_requests(batch_request)
+
+        if not requests:
+            raise NoAvailableBatchesError()
+
+        requests_and_metadata: List[Tuple[BatchRequest, BatchMetadata]] = [
+            (request, self._get_batch_metadata_from_batch_request(request)) for request in requests
+        ]
+        if sql_partitioner:
+            # Requests are sorted along with their metadata so that they need not be looked up.
+            requests_and_metadata = self._sort_batch_data_list(
+                requests_and_metadata,
+                sql_partitioner,
+                lambda key: lambda request_and_metadata: request_and_metadata[1][key],
+            )
+
+        return requests_and_metadata[batch_request.batch_slice][-1]
+
     @override
     def get_batch_identifiers_list(self, batch_request: BatchRequest) -> List[dict]:
         self._validate_batch_request(batch_request)
@@ -617,27 +727,7 @@ class _SQLAsset(DataAsset[DatasourceT, ColumnPartitioner], Generic[DatasourceT])
             sql_partitioner = None
 
         batch_spec_kwargs: dict[str, str | dict | None]
-        requests = self._fully_specified_batch_requests(batch_request)
-        unsorted_metadata_dicts = [self._get_batch_metadata_from_batch_request(r) for r in requests]
-
-        if not unsorted_metadata_dicts:
-            raise NoAvailableBatchesError()
-
-        if sql_partitioner:
-            sorted_metadata_dicts = self.sort_batch_identifiers_list(
-                unsorted_metadata_dicts, sql_partitioner
-            )
-        else:
-            sorted_metadata_dicts = unsorted_metadata_dicts
-
-        sorted_metadata_dicts = sorted_metadata_dicts[batch_request.batch_slice]
-        batch_metadata = sorted_metadata_dicts[-1]
-
-        # we've sorted the metadata, but not the requests, so we need the index of our
-        # batch_metadata from the original unsorted list so that we get the right request
-        request_index = unsorted_metadata_dicts.index(batch_metadata)
-
-        request = requests[request_index]
+        request, batch_metadata = self._select_batch_request(batch_request, sql_partitioner)
         batch_spec_kwargs = self._create_batch_spec_kwargs()
         if sql_partitioner:
             batch_spec_kwargs["partitioner_method"] = sql_partitioner.method_name
@@ -817,6 +907,21 @@ class QueryAsset(_SQLAsset):
     # Instance fields
     type: Literal["query"] = "query"
     query: str
+    materialization: Optional[Literal["never", "temp", "cached_table"]] = pydantic.Field(
+        default=None,
+        description="How the results of the query are validated: re-running the query within"
+        " every metric query (never), from a temporary table created for every batch (temp), or"
+        " from a table created once and reused by all batches of the same query until the run"
+        " (of a checkpoint or validation definition) ends, the execution engine is closed, or"
+        " materialization_ttl seconds pass (cached_table)."
+        " By default, a temporary table is created for every batch if create_temp_table is set"
+        " on the datasource. Dialects without temporary tables (e.g., Trino, Athena) always"
+        " re-run the query.",
+    )
+    materialization_ttl: Optional[float] = pydantic.Field(
+        default=None,
+        description="Seconds for which a table materialized from the query is reused.",
+    )
 
     @pydantic.validator("query")
     def query_must_start_with_select(cls, v: str):
@@ -835,12 +940,16 @@ class QueryAsset(_SQLAsset):
 
     @override
     def _create_batch_spec_kwargs(self) -> dict[str, Any]:
-        return {
+        batch_spec_kwargs: dict[str, Any] = {
             "data_asset_name": self.name,
             "query": self.query,
             "temp_table_schema_name": None,
             "batch_identifiers": {},
         }
+        if self.materialization:
+            batch_spec_kwargs["materialization"] = self.materialization
+            batch_spec_kwargs["materialization_ttl"] = self.materialization_ttl
+        return batch_spec_kwargs
 
     @override
     def _create_batch_spec(self, batch_spec_kwargs: dict) -> RuntimeQueryBatchSpec:
@@ -903,9 +1012,10 @@ class TableAsset(_SQLAsset):
         """
         datasource: SQLDatasource = self.datasource
         engine: sqlalchemy.Engine = datasource.get_engine()
-        inspector: sqlalchemy.Inspector = sa.inspect(engine)
+        # Schema names are reflected once per execution engine, not once per asset.
+        execution_engine: SqlAlchemyExecutionEngine = datasource.get_execution_engine()
 
-        if self.schema_name and self.schema_name not in inspector.get_schema_names():
+        if self.schema_name and self.schema_name not in execution_engine.get_schema_names():
             raise TestConnectionError(  # noqa: TRY003
                 f'Attempt to connect to table: "{self.qualified_name}" failed because the schema '
                 f'"{self.schema_name}" does not exist.'
@@ -1025,12 +1135,16 @@ class SQLDatasource(Datasource):
         create_temp_table: Whether to leverage temporary tables during metric computation.
         kwargs: Extra SQLAlchemy keyword arguments to pass to `create_engine()`. Note, only python
             primitive types will be serializable to config.
+        batch_identifiers_cache_ttl: Seconds for which the partitions found by introspecting the
+            data of an asset are reused. By default, the data is introspected every time batches
+            are requested.
         assets: An optional dictionary whose keys are SQL DataAsset names and whose values
             are SQL DataAsset objects.
     """
 
     # class var definitions
     asset_types: ClassVar[List[Type[DataAsset]]] = [TableAsset, QueryAsset]
+    _EXTRA_EXCLUDED_EXEC_ENG_ARGS: ClassVar[Set[str]] = {"batch_identifiers_cache_ttl"}
 
     # right side of the operator determines the type name
     # left side enforces the names on instance creation
@@ -1042,6 +1156,12 @@ class SQLDatasource(Datasource):
         description="Optional dictionary of `kwargs` will be passed to the SQLAlchemy Engine"
         " as part of `create_engine(connection_string, **kwargs)`",
     )
+    batch_identifiers_cache_ttl: float = pydantic.Field(
+        default=0,
+        ge=0,
+        description="Seconds for which the partitions found by introspecting the data of an asset"
+        " are reused. By default, the data is introspected every time batches are requested.",
+    )
     # We need to explicitly add each asset type to the Union due to how
     # deserialization is implemented in our pydantic base model.
     assets: List[AssetTypes] = []
@@ -1049,6 +1169,9 @@ class SQLDatasource(Datasource):
     # private attrs
     _cached_connection_string: Union[str, ConfigStr] = pydantic.PrivateAttr("")
     _engine: Union[sqlalchemy.Engine, None] = pydantic.PrivateAttr(None)
+    _batch_identifiers_cache: Dict[Tuple[str, ...], Tuple[float, List[dict]]] = (
+        pydantic.PrivateAttr(default_factory=dict)
+    )
 
     # These are instance var because ClassVars can't contain Type variables. See
     # https://peps.python.org/pep-0526/#class-and-instance-variable-annotations
@@ -1059,10 +1182,28 @@ class SQLDatasource(Datasource):
     @override
     def execution_engine_type(self) -> Type[SqlAlchemyExecutionEngine]:
         """Returns the default execution engine type."""
+        from great_expectations.execution_engine import SqlAlchemyExecutionEngine
+
         return SqlAlchemyExecutionEngine
 
+    @override
+    def close(self) -> None:
+        """Closes the execution engine of the datasource, and releases the engine of the datasource.
+
+        Engines are shared by all datasources, execution engines and stores with the same
+        connection parameters (see "engine_registry"), and disposed of once all of them released it.
+        """
+        super().close()
+        if self._engine:
+            engine_registry.release(self._engine)
+            self._engine = None
+            self._cached_connection_string = ""
+
     def get_engine(self) -> sqlalchemy.Engine:
         if self.connection_string != self._cached_connection_string or not self._engine:
+            if self._engine:
+                engine_registry.release(self._engine)
+                self._engine = None
             try:
                 self._engine = self._create_engine()
             except Exception as e:
@@ -1085,7 +1226,7 @@ class SQLDatasource(Datasource):
         if self.__class__.__name__ == "SQLDatasource":
             _warn_for_more_specific_datasource_type(connection_string)
         kwargs = model_dict.pop("kwargs", {})
-        return sa.create_engine(connection_string, **kwargs)
+        return engine_registry.acquire(connection_string, **kwargs)
 
     @override
     def get_execution_engine(self) -> SqlAlchemyExecutionEngine:
@@ -1103,14 +1244,35 @@ class SQLDatasource(Datasource):
             current_execution_engine_kwargs != self._cached_execution_engine_kwargs
             or not self._execution_engine
         ):
+            if self._execution_engine:
+                # Releases the (shared) engine of the replaced execution engine.
+                self._execution_engine.close()
             self._cached_execution_engine_kwargs = current_execution_engine_kwargs
-            engine_kwargs = current_execution_engine_kwargs.pop("kwargs", {})
+            # Not popped from the cached kwargs, which would then never match and the execution
+            # engine (with its connections and materialized tables) would not be reused.
+            execution_engine_kwargs = dict(current_execution_engine_kwargs)
+            engine_kwargs = execution_engine_kwargs.pop("kwargs", {})
             self._execution_engine = self._execution_engine_type()(
-                **current_execution_engine_kwargs,
+                **execution_engine_kwargs,
                 **engine_kwargs,
             )
         return self._execution_engine
 
+    def _get_batch_identifier_data(
+        self, key: Tuple[str, ...], fetch: Callable[[], List[dict]]
+    ) -> List[dict]:
+        """Batch identifier data from `fetch`, reused for batch_identifiers_cache_ttl seconds."""
+        if self.batch_identifiers_cache_ttl <= 0:
+            return fetch()
+
+        now = time.monotonic()
+        cached = self._batch_identifiers_cache.get(key)
+        if cached is None or now - cached[0] >= self.batch_identifiers_cache_ttl:
+            cached = (now, fetch())
+            self._batch_identifiers_cache[key] = cached
+        # Callers update batch identifiers in place (see _SQLAsset._matches_request_options).
+        return copy.deepcopy(cached[1])
+
     @override
     def test_connection(self, test_assets: bool = True) -> None:
         """Test the connection for the SQLDatasource.
@@ -1168,6 +1330,8 @@ class SQLDatasource(Datasource):
         name: str,
         query: str,
         batch_metadata: Optional[BatchMetadata] = None,
+        materialization: Optional[Literal["never", "temp", "cached_table"]] = None,
+        materialization_ttl: Optional[float] = None,
     ) -> QueryAsset:
         """Adds a query asset to this datasource.
 
@@ -1175,6 +1339,12 @@ class SQLDatasource(Datasource):
             name: The name of this table asset.
             query: The SELECT query to selects the data to validate. It must begin with the "SELECT".
             batch_metadata: BatchMetadata we want to associate with this DataAsset and all batches derived from it.
+            materialization: Whether to validate the results of the query by re-running it within every metric query ("never"),
+                from a temporary table created for every batch ("temp"), or from a table created once and reused by every
+                batch of the query ("cached_table"). Defaults to the "create_temp_table" setting of the datasource.
+                Dialects without temporary tables (e.g., Trino, Athena) always re-run the query.
+            materialization_ttl: Seconds for which a "cached_table" is reused; by default, until the run (of a checkpoint
+                or validation definition) ends, or else the execution engine is closed.
 
         Returns:
             The query asset that is added to the datasource.
@@ -1185,5 +1355,7 @@ class SQLDatasource(Datasource):
             name=name,
             query=query,
             batch_metadata=batch_metadata or {},
+            materialization=materialization,
+            materialization_ttl=materialization_ttl,
         )
         return self._add_asset(asset)
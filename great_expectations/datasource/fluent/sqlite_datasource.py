@@ -174,10 +174,18 @@ class SqliteDatasource(SQLDatasource):
         name: str,
         query: str,
         batch_metadata: Optional[BatchMetadata] = None,
+        materialization: Optional[Literal["never", "temp", "cached_table"]] = None,
+        materialization_ttl: Optional[float] = None,
     ) -> SqliteQueryAsset:
         return cast(
             SqliteQueryAsset,
-            super().add_query_asset(name=name, query=query, batch_metadata=batch_metadata),
+            super().add_query_asset(
+                name=name,
+                query=query,
+                batch_metadata=batch_metadata,
+                materialization=materialization,
+                materialization_ttl=materialization_ttl,
+            ),
         )
 
     add_query_asset.__doc__ = SQLDatasource.add_query_asset.__doc__
@@ -1,4 +1,29 @@
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
 from .execution_engine import ExecutionEngine
 from .pandas_execution_engine import PandasExecutionEngine
-from .sparkdf_execution_engine import SparkDFExecutionEngine
-from .sqlalchemy_execution_engine import SqlAlchemyExecutionEngine
+
+if TYPE_CHECKING:
+    from .sparkdf_execution_engine import SparkDFExecutionEngine
+    from .sqlalchemy_execution_engine import SqlAlchemyExecutionEngine
+
+# The Spark and SQL engines import their (optional) libraries eagerly, so they are imported on first use.  # noqa: E501
+_LAZY_EXECUTION_ENGINE_MODULES = {
+    "SparkDFExecutionEngine": "sparkdf_execution_engine",
+    "SqlAlchemyExecutionEngine": "sqlalchemy_execution_engine",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _LAZY_EXECUTION_ENGINE_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
+
+    return getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_EXECUTION_ENGINE_MODULES})
@@ -0,0 +1,266 @@
+"""Scans of files and pandas DataFrames with DuckDB, for validating pandas data assets with SQL.
+
+DuckDB reads CSV, Parquet and JSON files with its own multi-threaded, vectorized readers.  The
+data of a batch is a view over a table function (e.g. "read_parquet('data.parquet')"), so that
+the projections and filters of metric queries are pushed down into the scan of the file, and the
+aggregate metrics of a validation are bundled into few queries, as for any SQL database.  pandas
+DataFrames are registered with the DuckDB connection as views, and scanned in place without being
+copied.  Only local files are read.
+
+    Typical usage example:
+        selectable = build_duckdb_file_selectable(
+            reader_method="read_csv", reader_options={"sep": ";"}, path="data.csv"
+        )
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import TYPE_CHECKING, Any, Callable, Dict, Final, List, Optional
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from great_expectations.compatibility import sqlalchemy
+
+DUCKDB_IN_MEMORY_CONNECTION_STRING: Final[str] = "duckdb:///:memory:"
+
+# pandas reader methods, as DuckDB table functions
+DUCKDB_READER_FUNCTIONS: Final[Dict[str, str]] = {
+    "read_csv": "read_csv_auto",
+    "read_json": "read_json_auto",
+    "read_parquet": "read_parquet",
+}
+
+# Names of the pandas reader option holding the path of the file (for in-memory pandas datasources)
+_PATH_READER_OPTIONS: Final[Dict[str, str]] = {
+    "read_csv": "filepath_or_buffer",
+    "read_json": "path_or_buf",
+    "read_parquet": "path",
+}
+
+# Names of the pandas reader option holding the columns to read, if any
+_COLUMNS_READER_OPTIONS: Final[Dict[str, str]] = {
+    "read_csv": "usecols",
+    "read_parquet": "columns",
+}
+
+# URLs (e.g. "s3://bucket/data.csv"), as opposed to local paths (including "C:\\data.csv")
+_URL_SCHEME_PATTERN: Final[re.Pattern] = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]+://")
+
+_DuckDBOptions = Dict[str, Any]
+
+
+def _unsupported_reader_option(
+    reader_option: str, value: Any
+) -> gx_exceptions.ExecutionEngineError:
+    return gx_exceptions.ExecutionEngineError(
+        message=f'Reader option "{reader_option}"={value!r} is not supported by DuckDB.'
+    )
+
+
+def _convert_header(value: Any) -> _DuckDBOptions:
+    if value in (0, "infer"):
+        return {"header": True}
+    if value is None:
+        return {"header": False}
+    raise _unsupported_reader_option("header", value)
+
+
+def _convert_skiprows(value: Any) -> _DuckDBOptions:
+    if isinstance(value, int):
+        return {"skip": value}
+    raise _unsupported_reader_option("skiprows", value)
+
+
+def _convert_compression(value: Any) -> _DuckDBOptions:
+    if value is None:
+        return {"compression": "none"}
+    if value == "infer":
+        return {"compression": "auto"}
+    if value in ("gzip", "zstd"):
+        return {"compression": value}
+    raise _unsupported_reader_option("compression", value)
+
+
+def _convert_encoding(value: Any) -> _DuckDBOptions:
+    if str(value).lower().replace("-", "") == "utf8":
+        return {}
+    raise _unsupported_reader_option("encoding", value)
+
+
+# pandas reader options, by reader method, as the DuckDB table function parameters they convert to
+_READER_OPTION_CONVERTERS: Final[Dict[str, Dict[str, Callable[[Any], _DuckDBOptions]]]] = {
+    "read_csv": {
+        "sep": lambda value: {"delim": value},
+        "delimiter": lambda value: {"delim": value},
+        "header": _convert_header,
+        "names": lambda value: {"names": list(value)},
+        "skiprows": _convert_skiprows,
+        "quotechar": lambda value: {"quote": value},
+        "escapechar": lambda value: {"escape": value},
+        "na_values": lambda value: {"nullstr": value if isinstance(value, str) else list(value)},
+        "date_format": lambda value: {"dateformat": value},
+        "compression": _convert_compression,
+        "encoding": _convert_encoding,
+    },
+    "read_json": {
+        "lines": lambda value: {"format": "newline_delimited" if value else "array"},
+        "compression": _convert_compression,
+        "encoding": _convert_encoding,
+    },
+    "read_parquet": {},
+}
+
+
+def _to_sql_literal(value: Any) -> str:
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return repr(value)
+    if isinstance(value, (list, tuple)):
+        return f"[{', '.join(_to_sql_literal(element) for element in value)}]"
+    escaped_value = str(value).replace("'", "''")
+    return f"'{escaped_value}'"
+
+
+def _to_duckdb_options(reader_method: str, reader_options: Dict[str, Any]) -> _DuckDBOptions:
+    converters = _READER_OPTION_CONVERTERS[reader_method]
+    duckdb_options: _DuckDBOptions = {}
+    for reader_option, value in reader_options.items():
+        if reader_option not in converters:
+            raise _unsupported_reader_option(reader_option, value)
+        duckdb_options.update(converters[reader_option](value))
+
+    return duckdb_options
+
+
+def build_duckdb_file_selectable(
+    reader_method: str,
+    reader_options: Dict[str, Any],
+    path: Optional[str | os.PathLike] = None,
+) -> sqlalchemy.Select:
+    """Build a query scanning a file with the DuckDB reader matching a pandas reader method.
+
+    Args:
+        reader_method: pandas reader method (e.g. "read_csv") of the data asset.
+        reader_options: pandas reader options of the data asset.
+        path: Local path of the file; if None, the path is taken from reader_options.
+
+    Returns:
+        Query selecting the (configured columns of the) file.
+
+    Raises:
+        ExecutionEngineError: If DuckDB has no reader matching the reader method or options, or if
+            the path is not that of a local file.
+    """
+    if reader_method not in DUCKDB_READER_FUNCTIONS:
+        raise gx_exceptions.ExecutionEngineError(
+            message=f'Reader method "{reader_method}" is not supported by DuckDB; supported reader '
+            f"methods are {sorted(DUCKDB_READER_FUNCTIONS)}."
+        )
+
+    reader_options = dict(reader_options)
+    path_option: str = _PATH_READER_OPTIONS[reader_method]
+    if path is None:
+        path = reader_options.pop(path_option, None)
+    if isinstance(path, os.PathLike):
+        path = os.fspath(path)
+    if not isinstance(path, str):
+        raise gx_exceptions.ExecutionEngineError(
+            message=f'DuckDB reads files by path, but "{path_option}" is {path!r}.'
+        )
+
+    # Reading from object stores or HTTP would need the httpfs extension and the credentials of
+    # the datasource, neither of which is set up for the DuckDB connection.
+    if _URL_SCHEME_PATTERN.match(path):
+        raise gx_exceptions.ExecutionEngineError(
+            message=f'DuckDB reads local files only, but the path "{path}" is a URL; use the '
+            '"pandas" execution backend for it.'
+        )
+
+    columns: Optional[List[str]] = None
+    columns_option: Optional[str] = _COLUMNS_READER_OPTIONS.get(reader_method)
+    if columns_option and reader_options.get(columns_option) is not None:
+        columns = list(reader_options.pop(columns_option))
+
+    arguments: List[str] = [_to_sql_literal(path)]
+    arguments.extend(
+        f"{name}={_to_sql_literal(value)}"
+        for name, value in _to_duckdb_options(reader_method, reader_options).items()
+    )
+    table_function_call = f"{DUCKDB_READER_FUNCTIONS[reader_method]}({', '.join(arguments)})"
+    # Colons (e.g. of Windows drive letters) would otherwise be taken for bind parameters.
+    table_function = sa.text(table_function_call.replace(":", r"\:"))
+
+    select_list = [sa.column(column) for column in columns] if columns else [sa.text("*")]
+    return sa.select(*select_list).select_from(table_function)
+
+
+def build_duckdb_create_file_view_statement(
+    dialect: sqlalchemy.Dialect,
+    view_name: str,
+    reader_method: str,
+    reader_options: Dict[str, Any],
+    path: Optional[str | os.PathLike] = None,
+) -> sqlalchemy.TextClause:
+    """Build a statement creating a view that scans a file with the DuckDB reader of its format.
+
+    Views are reflected like tables, and are inlined into the queries selecting from them.
+
+    Args:
+        dialect: DuckDB dialect.
+        view_name: Name of the view of the file.
+        reader_method: pandas reader method (e.g. "read_csv") of the data asset.
+        reader_options: pandas reader options of the data asset.
+        path: Local path of the file; if None, the path is taken from reader_options.
+
+    Returns:
+        "CREATE VIEW" statement.
+
+    Raises:
+        ExecutionEngineError: See build_duckdb_file_selectable().
+    """
+    selectable = build_duckdb_file_selectable(
+        reader_method=reader_method, reader_options=reader_options, path=path
+    )
+    query = str(selectable.compile(dialect=dialect, compile_kwargs={"literal_binds": True}))
+    return sa.text(f"CREATE VIEW {_quote(dialect, view_name)} AS {query}".replace(":", r"\:"))
+
+
+def build_duckdb_drop_view_statement(
+    dialect: sqlalchemy.Dialect, view_name: str
+) -> sqlalchemy.TextClause:
+    """Build a statement dropping the view of a file or pandas DataFrame, releasing the DataFrame.
+
+    Args:
+        dialect: DuckDB dialect.
+        view_name: Name of the view.
+
+    Returns:
+        "DROP VIEW" statement.
+    """
+    return sa.text(f"DROP VIEW IF EXISTS {_quote(dialect, view_name)}")
+
+
+def register_duckdb_dataframe(
+    connection: sqlalchemy.Connection, view_name: str, dataframe: pd.DataFrame
+) -> None:
+    """Register a pandas DataFrame with a DuckDB connection as a view, without copying it.
+
+    The view keeps a reference to the DataFrame until it is dropped.
+
+    Args:
+        connection: Connection to DuckDB; the DataFrame is only visible to this connection.
+        view_name: Name of the view of the DataFrame.
+        dataframe: pandas DataFrame to scan.
+    """
+    connection.connection.dbapi_connection.register(view_name, dataframe)  # type: ignore[union-attr]
+
+
+def _quote(dialect: sqlalchemy.Dialect, identifier: str) -> str:
+    return dialect.identifier_preparer.quote_identifier(identifier)
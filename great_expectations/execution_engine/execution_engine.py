@@ -281,6 +281,20 @@ class ExecutionEngine(ABC):
             metric_fn_bundle_configurations=metric_fn_bundle_configurations,
         )
 
+    def prepare_for_metrics(  # noqa: B027 # empty-method-without-abstract-decorator
+        self, metric_configurations: Iterable[MetricConfiguration]
+    ) -> None:
+        """Optionally prepare loaded batches before the given metrics, and all of their dependencies, are resolved.
+
+        This is called with the full metric dependency graph before any of it is resolved, allowing
+        an execution engine to, for instance, load only the parts of a batch that the metrics read.
+        """  # noqa: E501
+        pass
+
+    def close(self) -> None:  # noqa: B027 # empty-method-without-abstract-decorator
+        """Optionally release the resources (e.g. connections or worker processes) of the execution engine."""  # noqa: E501
+        pass
+
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], MetricValue]:
         """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
         raise NotImplementedError
@@ -0,0 +1,75 @@
+"""Run-scoped lifetime of the tables materialized from the queries of batches.
+
+Query assets with "materialization" "cached_table" are materialized once and reused by every batch
+of the same query (see "SqlAlchemyExecutionEngine.get_batch_data_and_markers()").  Execution
+engines live as long as their datasource (and so, often, as long as the process), so tables
+materialized within the scope of a run (see `materialized_tables_scope`, entered by
+"Checkpoint.run()" and "ValidationDefinition.run()") are dropped as the run ends, rather than
+accumulating in the database until the execution engine is closed.
+"""
+
+from __future__ import annotations
+
+import logging
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Callable, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class MaterializedTablesScope:
+    """Callbacks dropping the tables materialized within the scope, run as the scope ends."""
+
+    def __init__(self) -> None:
+        self._drop_callbacks: List[Callable[[], None]] = []
+
+    def __len__(self) -> int:
+        return len(self._drop_callbacks)
+
+    def register(self, drop: Callable[[], None]) -> None:
+        self._drop_callbacks.append(drop)
+
+    def drop_all(self) -> None:
+        while self._drop_callbacks:
+            drop = self._drop_callbacks.pop()
+            try:
+                drop()
+            except Exception as e:
+                logger.warning(f"Could not drop materialized table: {e!r}")
+
+
+_active_materialized_tables_scope: ContextVar[Optional[MaterializedTablesScope]] = ContextVar(
+    "_active_materialized_tables_scope", default=None
+)
+
+
+@contextmanager
+def materialized_tables_scope() -> Iterator[MaterializedTablesScope]:
+    """Drops the tables materialized within its scope as it ends; nested scopes share the outermost scope."""  # noqa: E501
+    scope = _active_materialized_tables_scope.get()
+    if scope is not None:
+        yield scope
+        return
+
+    scope = MaterializedTablesScope()
+    token = _active_materialized_tables_scope.set(scope)
+    try:
+        yield scope
+    finally:
+        _active_materialized_tables_scope.reset(token)
+        scope.drop_all()
+
+
+def register_materialized_table(drop: Callable[[], None]) -> bool:
+    """Registers "drop" to run as the current `materialized_tables_scope` ends.
+
+    Returns:
+        Whether a scope is active (outside of one, the table is kept until dropped otherwise).
+    """
+    scope = _active_materialized_tables_scope.get()
+    if scope is None:
+        return False
+
+    scope.register(drop)
+    return True
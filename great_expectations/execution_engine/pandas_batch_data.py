@@ -1,11 +1,18 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import logging
+from typing import TYPE_CHECKING, Callable, Iterable, Iterator, List, Optional, Set
+
+import pandas as pd
 
 from great_expectations.core.batch import BatchData
 
 if TYPE_CHECKING:
-    import pandas as pd
+    from typing_extensions import TypeAlias
+
+logger = logging.getLogger(__name__)
+
+DataFrameChunksFactoryFn: TypeAlias = Callable[[], Iterator[pd.DataFrame]]
 
 
 class PandasBatchData(BatchData):
@@ -16,3 +23,153 @@ class PandasBatchData(BatchData):
     @property
     def dataframe(self):
         return self._dataframe
+
+
+class ChunkedPandasBatchData(PandasBatchData):
+    """Batch data backed by a re-iterable stream of DataFrame chunks instead of one DataFrame.
+
+    Every call to `iter_chunks` re-opens the underlying reader, so only one chunk needs to be held
+    in memory at a time.  Chunks are re-indexed so that, taken together, they carry the same
+    index as the DataFrame that reading the whole source at once would produce.
+
+    Accessing `dataframe` materializes (and caches) the whole batch; this is the fallback for
+    metrics that cannot be computed chunk by chunk.
+    """
+
+    def __init__(self, execution_engine, chunks_factory: DataFrameChunksFactoryFn) -> None:
+        super().__init__(execution_engine=execution_engine, dataframe=None)  # type: ignore[arg-type]
+        self._chunks_factory = chunks_factory
+
+    @property
+    def is_materialized(self) -> bool:
+        return self._dataframe is not None
+
+    def iter_chunks(self) -> Iterator[pd.DataFrame]:
+        if self._dataframe is not None:
+            yield self._dataframe
+            return
+
+        chunks = self._chunks_factory()
+        offset = 0
+        chunk: pd.DataFrame
+        try:
+            for chunk in chunks:
+                if isinstance(chunk.index, pd.RangeIndex):
+                    chunk.index = pd.RangeIndex(start=offset, stop=offset + len(chunk))
+                offset += len(chunk)
+                yield chunk
+        finally:
+            # Readers such as "pandas.io.parsers.TextFileReader" hold an open file handle.
+            close = getattr(chunks, "close", None)
+            if close is not None:
+                close()
+
+    def first_chunk(self) -> Optional[pd.DataFrame]:
+        chunks = self.iter_chunks()
+        try:
+            return next(chunks, None)
+        finally:
+            chunks.close()
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        if self._dataframe is None:
+            logger.warning(
+                "Materializing a chunked pandas batch in memory; "
+                "at least one requested metric cannot be computed chunk by chunk."
+            )
+            chunks = list(self.iter_chunks())
+            self._dataframe = pd.concat(chunks) if chunks else pd.DataFrame()
+
+        return self._dataframe
+
+
+class ProjectedPandasBatchData(PandasBatchData):
+    """Batch data read lazily from a file, loading only the columns (and rows) that are needed.
+
+    The execution engine calls `project` with the columns, and optionally the row filters, required
+    by the metrics about to be resolved.  Columns requested later are read and added to the frame
+    already loaded; a change of row filters re-reads the file.
+
+    Until `project` is called, accessing `dataframe` reads the whole file; afterwards, it returns
+    the projection loaded so far.  The names and types of all columns are available from `schema`.
+    """
+
+    def __init__(
+        self,
+        execution_engine,
+        reader_fn: Callable[[Optional[List[str]], Optional[list]], pd.DataFrame],
+        schema_fn: Callable[[], pd.DataFrame],
+        supports_filters: bool = False,
+    ) -> None:
+        """
+        Args:
+            execution_engine: The execution engine that owns this batch.
+            reader_fn: Reads the given columns (all of them, if None) of the rows that match the
+                given filters (all rows, if None).
+            schema_fn: Returns an empty DataFrame with the columns and types of the file.
+            supports_filters: Whether "reader_fn" can filter rows.
+        """
+        super().__init__(execution_engine=execution_engine, dataframe=None)  # type: ignore[arg-type]
+        self._reader_fn = reader_fn
+        self._schema_fn = schema_fn
+        self._supports_filters = supports_filters
+        self._schema: Optional[pd.DataFrame] = None
+        self._loaded_filters: Optional[list] = None
+
+    @property
+    def schema(self) -> pd.DataFrame:
+        if self._schema is None:
+            self._schema = self._schema_fn()
+
+        return self._schema
+
+    @property
+    def supports_filters(self) -> bool:
+        return self._supports_filters
+
+    @property
+    def loaded_columns(self) -> Optional[List[str]]:
+        """Columns loaded so far, or None if nothing has been loaded yet."""
+        if self._dataframe is None:
+            return None
+
+        return list(self._dataframe.columns)
+
+    def project(self, columns: Optional[Iterable[str]], filters: Optional[list] = None) -> None:
+        """Ensures that the given columns (all of them, if None) of the rows matching "filters" are loaded."""  # noqa: E501
+        all_columns: List[str] = list(self.schema.columns)
+        requested_columns: Set[str] = set(all_columns if columns is None else columns)
+
+        loaded_columns = self.loaded_columns
+        if loaded_columns is not None and filters == self._loaded_filters:
+            missing_columns = requested_columns - set(loaded_columns)
+            if not missing_columns:
+                return
+
+            additional_df = self._read(columns=missing_columns, filters=filters)
+            dataframe = pd.concat([self._dataframe, additional_df], axis=1)
+        else:
+            if loaded_columns is not None:
+                requested_columns.update(loaded_columns)
+
+            dataframe = self._read(columns=requested_columns, filters=filters)
+
+        self._dataframe = dataframe[[column for column in all_columns if column in dataframe]]
+        self._loaded_filters = filters
+
+    def _read(self, columns: Set[str], filters: Optional[list]) -> pd.DataFrame:
+        all_columns: List[str] = list(self.schema.columns)
+        if columns >= set(all_columns):
+            return self._reader_fn(None, filters)
+
+        # Reading no columns at all would also lose the number of rows.
+        ordered_columns = [column for column in all_columns if column in columns]
+        return self._reader_fn(ordered_columns or all_columns[:1], filters)
+
+    @property
+    def dataframe(self) -> pd.DataFrame:
+        if self._dataframe is None:
+            self.project(columns=None)
+
+        return self._dataframe
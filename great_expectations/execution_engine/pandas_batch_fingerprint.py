@@ -0,0 +1,122 @@
+"""Fingerprints of pandas batches, recorded in "BatchMarkers" to detect changes in the data.
+
+Strategies trade thoroughness for speed:
+
+- "full" hashes every value, and the index, of the whole DataFrame at once (the default).
+- "columnwise" hashes the underlying buffer of every column (and of the index) separately, in
+  parallel, combining the digests.  Values of object columns are hashed with pandas.
+- "sampled" hashes, column-wise, evenly spaced blocks of rows, together with the shape of the frame;
+  changes outside the sampled blocks go undetected.
+- "schema" only hashes the names and types of the columns and the number of rows.
+
+"xxhash" is used for buffers when it is installed; "hashlib.blake2b" otherwise.
+"""
+
+from __future__ import annotations
+
+import enum
+import hashlib
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.compatibility import xxhash
+
+# Full fingerprints are only computed for frames smaller than this many bytes.
+HASH_THRESHOLD = 1e9
+
+DEFAULT_SAMPLE_BLOCKS = 16
+DEFAULT_SAMPLE_BLOCK_ROWS = 1024
+
+
+class FingerprintStrategy(str, enum.Enum):
+    """How much of a pandas batch is hashed to fingerprint it."""
+
+    FULL = "full"
+    COLUMNWISE = "columnwise"
+    SAMPLED = "sampled"
+    SCHEMA = "schema"
+
+
+def hash_pandas_dataframe(df):
+    try:
+        obj = pd.util.hash_pandas_object(df, index=True).values
+    except TypeError:
+        # In case of facing unhashable objects (like dict), use pickle
+        obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
+
+    return hashlib.md5(obj).hexdigest()
+
+
+def fingerprint_pandas_dataframe(
+    df: pd.DataFrame,
+    strategy: FingerprintStrategy | str = FingerprintStrategy.FULL,
+    sample_blocks: int = DEFAULT_SAMPLE_BLOCKS,
+    sample_block_rows: int = DEFAULT_SAMPLE_BLOCK_ROWS,
+    max_workers: Optional[int] = None,
+) -> Optional[str]:
+    """Fingerprints "df" using the given strategy.
+
+    Returns None when no fingerprint is computed: with the "full" strategy, for frames of at least
+    "HASH_THRESHOLD" bytes.
+    """
+    strategy = FingerprintStrategy(strategy)
+    if strategy == FingerprintStrategy.FULL:
+        if df.memory_usage().sum() >= HASH_THRESHOLD:
+            return None
+
+        return hash_pandas_dataframe(df)
+
+    schema: bytes = repr(
+        (len(df), [(str(column), str(dtype)) for column, dtype in df.dtypes.items()])
+    ).encode()
+    if strategy == FingerprintStrategy.SCHEMA:
+        return _digest(schema)
+
+    if strategy == FingerprintStrategy.SAMPLED:
+        df = df.iloc[
+            _get_sampled_positions(
+                row_count=len(df), sample_blocks=sample_blocks, sample_block_rows=sample_block_rows
+            )
+        ]
+
+    series: List[pd.Series | pd.Index] = [df.index]
+    series.extend(column for _, column in df.items())
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        digests: List[str] = list(executor.map(_hash_values, series))
+
+    return _digest(b"".join([schema, *(digest.encode() for digest in digests)]))
+
+
+def _get_sampled_positions(
+    row_count: int, sample_blocks: int, sample_block_rows: int
+) -> np.ndarray:
+    if row_count <= sample_blocks * sample_block_rows:
+        return np.arange(row_count)
+
+    # The first and last blocks are always sampled; the others are spread evenly in between.
+    starts = np.linspace(0, row_count - sample_block_rows, num=sample_blocks).astype(np.int64)
+    return (starts[:, np.newaxis] + np.arange(sample_block_rows)).ravel()
+
+
+def _hash_values(values: pd.Series | pd.Index) -> str:
+    if isinstance(values.dtype, np.dtype) and values.dtype != object:
+        return _digest(np.ascontiguousarray(values.to_numpy()).view(np.uint8).data)
+
+    try:
+        hashed = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    except TypeError:
+        # In case of facing unhashable objects (like dict), use pickle
+        return _digest(pickle.dumps(values, pickle.HIGHEST_PROTOCOL))
+
+    return _digest(hashed.data)
+
+
+def _digest(data) -> str:
+    if xxhash.xxhash:
+        return xxhash.xxhash.xxh3_128_hexdigest(data)
+
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
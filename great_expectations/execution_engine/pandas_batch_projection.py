@@ -0,0 +1,183 @@
+"""Planning of the columns and rows of a "ProjectedPandasBatchData" that a set of metrics reads.
+
+Columns are collected from the Domain of every metric (and from value kwargs naming a column, such
+as "unexpected_index_column_names"), as well as from row conditions.  A metric whose Domain is the
+whole table, other than the few that only need the schema or the number of rows, requires every
+column.
+
+Row filters are only pushed down (to parquet readers) when every metric that reads rows uses the
+same simple row condition -- a conjunction of comparisons of a column with a literal -- and no
+metric reports row indices, which would no longer match those of the whole file.
+"""
+
+from __future__ import annotations
+
+import ast
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Iterable, List, Optional, Set, Tuple
+
+from great_expectations.core.metric_function_types import SummarizationMetricNameSuffixes
+
+if TYPE_CHECKING:
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+# Table metrics that are answered from the schema of the file, without reading any rows.
+SCHEMA_METRIC_NAMES = ("table.columns", "table.column_types", "table.column_count")
+
+# Table metrics that read rows, but none of the values of any particular column.
+_COLUMN_AGNOSTIC_TABLE_METRIC_NAMES = ("table.row_count",)
+
+_DOMAIN_COLUMN_KEYS = ("column", "column_A", "column_B")
+
+_INDEX_METRIC_SUFFIXES = (
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value,
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY.value,
+    SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value,
+)
+
+_FILTER_OPERATORS = {
+    ast.Eq: "==",
+    ast.Lt: "<",
+    ast.LtE: "<=",
+    ast.Gt: ">",
+    ast.GtE: ">=",
+    ast.In: "in",
+}
+# "!=" and "not in" are left out: unlike parquet filters, pandas queries keep nulls for those.
+
+
+@dataclass(frozen=True)
+class BatchProjection:
+    """Columns (all, if None) and row filters (none, if None) to load for a set of metrics."""
+
+    columns: Optional[List[str]]
+    filters: Optional[List[Tuple[str, str, Any]]] = None
+
+
+def get_batch_projection(
+    metric_configurations: Iterable[MetricConfiguration],
+    column_names: List[str],
+    supports_filters: bool = False,
+) -> BatchProjection:
+    """Computes the projection of a batch with the given columns that the given metrics read."""
+    column_name_set: Set[str] = set(column_names)
+    row_conditions: Set[Tuple[Optional[str], Optional[str]]] = set()
+    columns: Set[str] = set()
+    reports_row_indices = False
+
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metric_configurations:
+        metric_name: str = metric_configuration.metric_name
+        if metric_name in SCHEMA_METRIC_NAMES:
+            continue
+
+        domain_kwargs: dict = metric_configuration.metric_domain_kwargs
+        metric_columns = _get_domain_columns(domain_kwargs=domain_kwargs)
+        if not metric_columns and metric_name not in _COLUMN_AGNOSTIC_TABLE_METRIC_NAMES:
+            return BatchProjection(columns=None)
+
+        columns.update(metric_columns)
+        columns.update(
+            _get_columns_in_values(
+                values=metric_configuration.metric_value_kwargs.values(),
+                column_names=column_name_set,
+            )
+        )
+
+        row_condition: Optional[str] = domain_kwargs.get("row_condition")
+        if row_condition:
+            columns.update(column for column in column_names if column in row_condition)
+
+        row_conditions.add((row_condition, domain_kwargs.get("condition_parser")))
+        reports_row_indices = reports_row_indices or (
+            metric_name.rpartition(".")[2] in _INDEX_METRIC_SUFFIXES
+        )
+
+    filters: Optional[List[Tuple[str, str, Any]]] = None
+    if supports_filters and len(row_conditions) == 1 and not reports_row_indices:
+        ((row_condition, condition_parser),) = row_conditions
+        if row_condition and condition_parser in ("pandas", "python"):
+            filters = row_condition_to_filters(
+                row_condition=row_condition, column_names=column_names
+            )
+
+    return BatchProjection(
+        columns=[column for column in column_names if column in columns],
+        filters=filters,
+    )
+
+
+def row_condition_to_filters(
+    row_condition: str, column_names: List[str]
+) -> Optional[List[Tuple[str, str, Any]]]:
+    """Converts a pandas query made of "and"-ed comparisons of columns and literals to parquet filters.
+
+    Returns None for any other query.
+    """  # noqa: E501
+    try:
+        expression = ast.parse(row_condition.strip(), mode="eval").body
+    except SyntaxError:
+        return None
+
+    terms: List[ast.expr]
+    if isinstance(expression, ast.BoolOp) and isinstance(expression.op, ast.And):
+        terms = list(expression.values)
+    else:
+        terms = list(_flatten_bitwise_and(expression))
+
+    filters: List[Tuple[str, str, Any]] = []
+    for term in terms:
+        if not (
+            isinstance(term, ast.Compare)
+            and len(term.ops) == 1
+            and type(term.ops[0]) in _FILTER_OPERATORS
+            and isinstance(term.left, ast.Name)
+            and term.left.id in column_names
+        ):
+            return None
+
+        try:
+            value = ast.literal_eval(term.comparators[0])
+        except ValueError:
+            return None
+
+        operator = _FILTER_OPERATORS[type(term.ops[0])]
+        if operator == "in":
+            if not isinstance(value, (list, tuple, set)):
+                return None
+
+            value = list(value)
+
+        filters.append((term.left.id, operator, value))
+
+    return filters
+
+
+def _flatten_bitwise_and(expression: ast.expr) -> Iterable[ast.expr]:
+    if isinstance(expression, ast.BinOp) and isinstance(expression.op, ast.BitAnd):
+        yield from _flatten_bitwise_and(expression.left)
+        yield from _flatten_bitwise_and(expression.right)
+    else:
+        yield expression
+
+
+def _get_domain_columns(domain_kwargs: dict) -> List[str]:
+    columns: List[str] = [domain_kwargs[key] for key in _DOMAIN_COLUMN_KEYS if key in domain_kwargs]
+    columns.extend(domain_kwargs.get("column_list") or [])
+    return columns
+
+
+def _get_columns_in_values(values: Iterable[Any], column_names: Set[str]) -> Set[str]:
+    """Column names appearing among metric value kwargs (e.g. "unexpected_index_column_names")."""
+    columns: Set[str] = set()
+    value: Any
+    for value in values:
+        if isinstance(value, str):
+            if value in column_names:
+                columns.add(value)
+        elif isinstance(value, dict):
+            columns.update(_get_columns_in_values(values=value.values(), column_names=column_names))
+        elif isinstance(value, (list, tuple, set)):
+            columns.update(_get_columns_in_values(values=value, column_names=column_names))
+
+    return columns
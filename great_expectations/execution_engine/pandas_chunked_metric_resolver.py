@@ -0,0 +1,493 @@
+"""Resolution of metrics over a "ChunkedPandasBatchData", one chunk at a time.
+
+Metrics requested of a chunked batch fall into one of the following categories:
+
+- Row-local map partials (conditions and functions) are not computed on their own; they are
+  returned as the "CHUNK_LOCAL_METRIC_VALUE" placeholder and recomputed on every chunk by the
+  metrics that depend on them.
+- Aggregates that declare a "partial_state_type" are reduced to a partial state on every chunk;
+  the states are merged and finalized into the metric value.  Quantile states retain the non-null
+  values of the column, so medians and quantiles are exact, unless the execution engine is
+  configured with a "quantile_sketch_size", in which case they are estimated from bounded sketches.
+- Map summarization metrics (unexpected counts, values, indices, rows, etc.) are evaluated on every
+  chunk and their per-chunk results are concatenated or summed.
+- Table schema metrics are taken from the first chunk.
+
+Any other metric requires the whole batch, which is then materialized in memory (once) and all
+metrics of the batch are computed from it, as for an ordinary "PandasBatchData".
+"""
+
+from __future__ import annotations
+
+import ast
+import logging
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+import pandas as pd
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.core.metric_function_types import (
+    MetricPartialFunctionTypes,
+    SummarizationMetricNameSuffixes,
+)
+from great_expectations.expectations.registry import get_metric_provider
+
+if TYPE_CHECKING:
+    from great_expectations.execution_engine.pandas_batch_data import (
+        ChunkedPandasBatchData,
+    )
+    from great_expectations.execution_engine.pandas_execution_engine import (
+        PandasExecutionEngine,
+    )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+
+class _ChunkLocalMetricValue:
+    """Placeholder for a row-local metric that is only ever computed chunk by chunk."""
+
+    def __repr__(self) -> str:
+        return "<chunk-local metric value>"
+
+    def __reduce__(self) -> str:
+        # Unpickled (e.g. in worker processes) as this placeholder, which is compared by identity.
+        return "CHUNK_LOCAL_METRIC_VALUE"
+
+
+CHUNK_LOCAL_METRIC_VALUE = _ChunkLocalMetricValue()
+
+_CHUNK_LOCAL_PARTIAL_FUNCTION_TYPES = (
+    MetricPartialFunctionTypes.MAP_CONDITION_SERIES,
+    MetricPartialFunctionTypes.MAP_SERIES,
+)
+
+_SCHEMA_METRIC_NAMES = ("table.columns", "table.column_types")
+
+_SUMMED_SUFFIXES = (
+    SummarizationMetricNameSuffixes.UNEXPECTED_COUNT.value,
+    SummarizationMetricNameSuffixes.FILTERED_ROW_COUNT.value,
+)
+_LISTED_SUFFIXES = (
+    SummarizationMetricNameSuffixes.UNEXPECTED_VALUES.value,
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_LIST.value,
+)
+_CHUNKABLE_SUMMARIZATION_SUFFIXES = (
+    *_SUMMED_SUFFIXES,
+    *_LISTED_SUFFIXES,
+    SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value,
+    SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY.value,
+)
+
+_INDEX_QUERY_PREFIX = "df.filter(items="
+_INDEX_QUERY_SUFFIX = ", axis=0)"
+
+
+class PandasChunkedMetricResolver:
+    """Resolves the metrics of one "ChunkedPandasBatchData" with a single pass over its chunks."""
+
+    def __init__(
+        self,
+        execution_engine: PandasExecutionEngine,
+        batch_id: str,
+        batch_data: ChunkedPandasBatchData,
+    ) -> None:
+        self._execution_engine = execution_engine
+        self._batch_id = batch_id
+        self._batch_data = batch_data
+
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        (
+            aggregate_metrics,
+            summarization_metrics,
+            schema_metrics,
+            whole_batch_metrics,
+        ) = self._classify_metrics(
+            metrics_to_resolve=metrics_to_resolve, resolved_metrics=resolved_metrics
+        )
+
+        if whole_batch_metrics or self._batch_data.is_materialized:
+            # Once materialized, the batch is a single chunk, and every metric is computed from it.
+            return self._resolve_on_chunk(
+                metrics_to_resolve=metrics_to_resolve,
+                chunk=self._batch_data.dataframe,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        if schema_metrics:
+            first_chunk = self._batch_data.first_chunk()
+            resolved_metrics.update(
+                self._resolve_on_chunk(
+                    metrics_to_resolve=schema_metrics,
+                    chunk=pd.DataFrame() if first_chunk is None else first_chunk,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        if aggregate_metrics or summarization_metrics:
+            resolved_metrics.update(
+                self._resolve_by_chunk(
+                    aggregate_metrics=aggregate_metrics,
+                    summarization_metrics=summarization_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    def _classify_metrics(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> Tuple[
+        List[MetricConfiguration],
+        List[MetricConfiguration],
+        List[MetricConfiguration],
+        List[MetricConfiguration],
+    ]:
+        """Returns the aggregate, summarization, schema and whole-batch metrics to resolve.
+
+        Chunk-local metrics are resolved (as "CHUNK_LOCAL_METRIC_VALUE") into "resolved_metrics".
+        """
+        aggregate_metrics: List[MetricConfiguration] = []
+        summarization_metrics: List[MetricConfiguration] = []
+        schema_metrics: List[MetricConfiguration] = []
+        whole_batch_metrics: List[MetricConfiguration] = []
+
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metrics_to_resolve:
+            metric_class, metric_fn = get_metric_provider(
+                metric_name=metric_configuration.metric_name,
+                execution_engine=self._execution_engine,
+            )
+            if _is_chunk_local(metric_class=metric_class, metric_fn=metric_fn):
+                resolved_metrics[metric_configuration.id] = CHUNK_LOCAL_METRIC_VALUE
+            elif _supports_partial_state(
+                metric_class=metric_class, metric_name=metric_configuration.metric_name
+            ):
+                aggregate_metrics.append(metric_configuration)
+            elif _is_chunkable_summarization(
+                metric_class=metric_class, metric_name=metric_configuration.metric_name
+            ):
+                summarization_metrics.append(metric_configuration)
+            elif metric_configuration.metric_name in _SCHEMA_METRIC_NAMES:
+                schema_metrics.append(metric_configuration)
+            else:
+                whole_batch_metrics.append(metric_configuration)
+
+        return aggregate_metrics, summarization_metrics, schema_metrics, whole_batch_metrics
+
+    def _resolve_by_chunk(
+        self,
+        aggregate_metrics: List[MetricConfiguration],
+        summarization_metrics: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        partial_states: Dict[Tuple[str, str, str], list] = {
+            metric_configuration.id: [] for metric_configuration in aggregate_metrics
+        }
+        chunk_values: Dict[Tuple[str, str, str], list] = {
+            metric_configuration.id: [] for metric_configuration in summarization_metrics
+        }
+
+        metric_configuration: MetricConfiguration
+        for chunk_states, resolved_chunk_values in self._iter_chunk_results(
+            aggregate_metrics=aggregate_metrics,
+            summarization_metrics=summarization_metrics,
+            chunk_values=chunk_values,
+            metrics=metrics,
+            runtime_configuration=runtime_configuration,
+        ):
+            for metric_id, state in chunk_states.items():
+                partial_states[metric_id].append(state)
+            for metric_id, value in resolved_chunk_values.items():
+                chunk_values[metric_id].append(value)
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        for metric_configuration in aggregate_metrics:
+            metric_class, _ = get_metric_provider(
+                metric_name=metric_configuration.metric_name,
+                execution_engine=self._execution_engine,
+            )
+            try:
+                resolved_metrics[metric_configuration.id] = metric_class.finalize_partial_state(
+                    state=metric_class.combine_partial_states(
+                        partial_states[metric_configuration.id]
+                    ),
+                    **metric_configuration.metric_value_kwargs,
+                )
+            except Exception as e:
+                raise gx_exceptions.MetricResolutionError(
+                    message=str(e), failed_metrics=(metric_configuration,)
+                ) from e
+
+        for metric_configuration in summarization_metrics:
+            try:
+                resolved_metrics[metric_configuration.id] = _combine_summarization_values(
+                    metric_configuration=metric_configuration,
+                    values=chunk_values[metric_configuration.id],
+                )
+            except Exception as e:
+                raise gx_exceptions.MetricResolutionError(
+                    message=str(e), failed_metrics=(metric_configuration,)
+                ) from e
+
+        return resolved_metrics
+
+    def _iter_chunk_results(
+        self,
+        aggregate_metrics: List[MetricConfiguration],
+        summarization_metrics: List[MetricConfiguration],
+        chunk_values: Dict[Tuple[str, str, str], list],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict],
+    ) -> Iterator[Tuple[Dict[Tuple[str, str, str], Any], Dict[Tuple[str, str, str], MetricValue]]]:
+        """Yields the partial states and summarization values of every chunk, in order.
+
+        Summarization metrics whose values collected so far in "chunk_values" already fill the
+        requested result are not resolved on further chunks.
+        """
+        for chunk in self._batch_data.iter_chunks():
+            pending_metrics = [
+                metric_configuration
+                for metric_configuration in summarization_metrics
+                if not _is_complete(
+                    metric_configuration=metric_configuration,
+                    values=chunk_values[metric_configuration.id],
+                )
+            ]
+            yield self.resolve_chunk(
+                chunk=chunk,
+                aggregate_metrics=aggregate_metrics,
+                summarization_metrics=pending_metrics,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+    def resolve_chunk(
+        self,
+        chunk: pd.DataFrame,
+        aggregate_metrics: List[MetricConfiguration],
+        summarization_metrics: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict],
+    ) -> Tuple[Dict[Tuple[str, str, str], Any], Dict[Tuple[str, str, str], MetricValue]]:
+        """Returns the partial states of aggregate metrics, and the summarization values, of a chunk."""  # noqa: E501
+        chunk_engine = self._get_chunk_engine(chunk=chunk)
+        partial_states: Dict[Tuple[str, str, str], Any] = {
+            metric_configuration.id: self._get_partial_state(
+                chunk_engine=chunk_engine, metric_configuration=metric_configuration
+            )
+            for metric_configuration in aggregate_metrics
+        }
+
+        resolved_chunk_values: Dict[Tuple[str, str, str], MetricValue] = {}
+        if summarization_metrics:
+            resolved_chunk_values = self._resolve_on_chunk(
+                metrics_to_resolve=summarization_metrics,
+                chunk=chunk,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+                chunk_engine=chunk_engine,
+            )
+
+        return partial_states, {
+            metric_configuration.id: resolved_chunk_values[metric_configuration.id]
+            for metric_configuration in summarization_metrics
+        }
+
+    def _get_partial_state(
+        self,
+        chunk_engine: PandasExecutionEngine,
+        metric_configuration: MetricConfiguration,
+    ) -> Any:
+        metric_class, _ = get_metric_provider(
+            metric_name=metric_configuration.metric_name,
+            execution_engine=self._execution_engine,
+        )
+        metric_domain_kwargs: dict = metric_configuration.metric_domain_kwargs
+        metric_value_kwargs: dict = metric_configuration.metric_value_kwargs
+        if not metric_class.partial_state_type.merges_exactly:
+            metric_value_kwargs = {
+                **metric_value_kwargs,
+                "sketch_size": self._execution_engine._quantile_sketch_size,
+            }
+
+        try:
+            if "column" in metric_domain_kwargs:
+                df, _, accessor_domain_kwargs = chunk_engine.get_compute_domain(
+                    domain_kwargs=metric_domain_kwargs,
+                    domain_type=MetricDomainTypes.COLUMN,
+                )
+                column: pd.Series = df[accessor_domain_kwargs["column"]]
+                if metric_class.filter_column_isnull:
+                    column = column[column.notnull()]
+
+                return metric_class.get_partial_state(column, **metric_value_kwargs)
+
+            return metric_class.get_partial_state(
+                chunk_engine.get_domain_records(domain_kwargs=metric_domain_kwargs)
+            )
+        except Exception as e:
+            raise gx_exceptions.MetricResolutionError(
+                message=str(e), failed_metrics=(metric_configuration,)
+            ) from e
+
+    def _resolve_on_chunk(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        chunk: pd.DataFrame,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict],
+        chunk_engine: Optional[PandasExecutionEngine] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Computes metrics over a single chunk, recomputing any chunk-local dependencies on it."""
+        if chunk_engine is None:
+            chunk_engine = self._get_chunk_engine(chunk=chunk)
+
+        chunk_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        metrics_to_resolve = list(metrics_to_resolve)
+        for metric_configuration in metrics_to_resolve:
+            self._add_dependencies_on_chunk(
+                chunk_engine=chunk_engine,
+                metric_configuration=metric_configuration,
+                metrics=metrics,
+                chunk_metrics=chunk_metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        return chunk_engine.resolve_metrics(
+            metrics_to_resolve=metrics_to_resolve,
+            metrics=chunk_metrics,
+            runtime_configuration=runtime_configuration,
+        )
+
+    def _add_dependencies_on_chunk(
+        self,
+        chunk_engine: PandasExecutionEngine,
+        metric_configuration: MetricConfiguration,
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        chunk_metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict],
+    ) -> None:
+        dependency: MetricConfiguration
+        for dependency in metric_configuration.metric_dependencies.values():
+            if dependency.id in chunk_metrics:
+                continue
+
+            if dependency.id in metrics:
+                value = metrics[dependency.id]
+            elif dependency.id in self._execution_engine._metric_cache:
+                value = self._execution_engine._metric_cache[dependency.id]
+            else:
+                # Unresolved dependencies are reported by the execution engine when computing.
+                continue
+
+            if value is CHUNK_LOCAL_METRIC_VALUE:
+                self._add_dependencies_on_chunk(
+                    chunk_engine=chunk_engine,
+                    metric_configuration=dependency,
+                    metrics=metrics,
+                    chunk_metrics=chunk_metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+                value = chunk_engine.resolve_metrics(
+                    metrics_to_resolve=(dependency,),
+                    metrics=chunk_metrics,
+                    runtime_configuration=runtime_configuration,
+                )[dependency.id]
+
+            chunk_metrics[dependency.id] = value
+
+    def _get_chunk_engine(self, chunk: pd.DataFrame) -> PandasExecutionEngine:
+        return self._execution_engine.__class__(
+            caching=False,
+            discard_subset_failing_expectations=self._execution_engine.discard_subset_failing_expectations,
+            batch_data_dict={self._batch_id: chunk},
+        )
+
+
+def _is_chunk_local(metric_class: Any, metric_fn: Any) -> bool:
+    return getattr(
+        metric_fn, "metric_fn_type", None
+    ) in _CHUNK_LOCAL_PARTIAL_FUNCTION_TYPES and getattr(
+        metric_class, "supports_chunked_evaluation", False
+    )
+
+
+def _supports_partial_state(metric_class: Any, metric_name: str) -> bool:
+    return (
+        getattr(metric_class, "partial_state_type", None) is not None
+        and metric_class.metric_name == metric_name
+    )
+
+
+def _is_chunkable_summarization(metric_class: Any, metric_name: str) -> bool:
+    if not getattr(metric_class, "supports_chunked_evaluation", False):
+        return False
+
+    base_metric_name, _, suffix = metric_name.rpartition(".")
+    return suffix in _CHUNKABLE_SUMMARIZATION_SUFFIXES and base_metric_name in (
+        getattr(metric_class, "condition_metric_name", None),
+        getattr(metric_class, "function_metric_name", None),
+    )
+
+
+def _get_partial_unexpected_count(metric_configuration: MetricConfiguration) -> Optional[int]:
+    """Returns the number of entries to keep, or None if all of them are returned."""
+    result_format: Optional[dict] = metric_configuration.metric_value_kwargs.get("result_format")
+    if not isinstance(result_format, dict) or result_format.get("result_format") == "COMPLETE":
+        return None
+
+    return result_format.get("partial_unexpected_count")
+
+
+def _is_complete(metric_configuration: MetricConfiguration, values: list) -> bool:
+    """Whether the per-chunk values collected so far already fill the requested result."""
+    if metric_configuration.metric_name.rpartition(".")[2] not in _LISTED_SUFFIXES:
+        return False
+
+    limit = _get_partial_unexpected_count(metric_configuration=metric_configuration)
+    return limit is not None and sum(len(value) for value in values) >= limit
+
+
+def _combine_summarization_values(
+    metric_configuration: MetricConfiguration, values: list
+) -> MetricValue:
+    suffix: str = metric_configuration.metric_name.rpartition(".")[2]
+    limit = _get_partial_unexpected_count(metric_configuration=metric_configuration)
+
+    if suffix in _SUMMED_SUFFIXES:
+        return sum(values)
+
+    if suffix in _LISTED_SUFFIXES:
+        combined_values: list = [value for chunk_value in values for value in chunk_value]
+        return combined_values if limit is None else combined_values[:limit]
+
+    if suffix == SummarizationMetricNameSuffixes.UNEXPECTED_ROWS.value:
+        rows: pd.DataFrame = pd.concat(values) if values else pd.DataFrame()
+        return rows if limit is None else rows.iloc[:limit]
+
+    # SummarizationMetricNameSuffixes.UNEXPECTED_INDEX_QUERY
+    if any(value is None for value in values):
+        return None
+
+    index_list: list = []
+    for value in values:
+        index_list.extend(
+            ast.literal_eval(value[len(_INDEX_QUERY_PREFIX) : -len(_INDEX_QUERY_SUFFIX)])
+        )
+
+    return f"{_INDEX_QUERY_PREFIX}{index_list}{_INDEX_QUERY_SUFFIX}"
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
 import datetime
-import hashlib
+import inspect
 import logging
-import pickle
+import weakref
+from concurrent.futures import ProcessPoolExecutor
 from functools import partial
 from io import BytesIO
 from typing import (
     TYPE_CHECKING,
     Any,
+    BinaryIO,
     Callable,
     Dict,
     Iterable,
+    Iterator,
+    List,
     Optional,
     Tuple,
     Union,
@@ -22,7 +26,8 @@ from typing import (
 import pandas as pd
 
 import great_expectations.exceptions as gx_exceptions
-from great_expectations.compatibility import aws, azure, google
+from great_expectations.compatibility import aws, azure, google, pyarrow
+from great_expectations.compatibility.not_imported import is_version_less_than
 from great_expectations.compatibility.sqlalchemy_and_pandas import (
     execute_pandas_reader_fn,
 )
@@ -47,21 +52,50 @@ from great_expectations.execution_engine import ExecutionEngine
 from great_expectations.execution_engine.execution_engine import (
     PartitionDomainKwargs,  # noqa: TCH001
 )
-from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+    ProjectedPandasBatchData,
+)
+from great_expectations.execution_engine.pandas_batch_fingerprint import (
+    FingerprintStrategy,
+    fingerprint_pandas_dataframe,
+    hash_pandas_dataframe,  # noqa: F401 # kept importable from this module
+)
+from great_expectations.execution_engine.pandas_batch_projection import get_batch_projection
+from great_expectations.execution_engine.pandas_chunked_metric_resolver import (
+    CHUNK_LOCAL_METRIC_VALUE,
+    PandasChunkedMetricResolver,
+)
+from great_expectations.execution_engine.pandas_sharded_metric_resolver import (
+    DEFAULT_SHARD_SIZE,
+    PandasShardedFrame,
+    PandasShardedMetricResolver,
+)
 from great_expectations.execution_engine.partition_and_sample.pandas_data_partitioner import (
     PandasDataPartitioner,
 )
 from great_expectations.execution_engine.partition_and_sample.pandas_data_sampler import (
     PandasDataSampler,
 )
+from great_expectations.execution_engine.ranged_object_reader import open_ranged_object
+from great_expectations.execution_engine.value_set_lookup import (
+    DEFAULT_VALUE_SET_LOOKUP_THRESHOLD,
+    StagedValueSets,
+    is_stageable_value_set,
+)
+from great_expectations.expectations.row_conditions import parse_condition_to_pandas
 
 if TYPE_CHECKING:
     from typing_extensions import TypeAlias
 
-logger = logging.getLogger(__name__)
+    from great_expectations.core.batch import BatchData
+    from great_expectations.execution_engine.pandas_batch_data import DataFrameChunksFactoryFn
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
 
+logger = logging.getLogger(__name__)
 
-HASH_THRESHOLD = 1e9
 
 DataFrameFactoryFn: TypeAlias = Callable[..., pd.DataFrame]
 
@@ -113,6 +147,43 @@ class PandasExecutionEngine(ExecutionEngine):
         boto3_options: Dict[str, dict] = kwargs.pop("boto3_options", {})
         azure_options: Dict[str, dict] = kwargs.pop("azure_options", {})
         gcs_options: Dict[str, dict] = kwargs.pop("gcs_options", {})
+        # When set, file batches whose reader supports it are streamed in chunks of this many rows
+        # instead of being read into memory at once (see "ChunkedPandasBatchData").
+        self._chunk_size: Optional[int] = kwargs.pop("chunk_size", None)
+        # When set, medians and quantiles of chunked batches are estimated from mergeable sketches
+        # of at most this many points (with a rank error of about 1 / quantile_sketch_size) instead
+        # of being computed exactly, which holds the non-null values of the column in memory.
+        self._quantile_sketch_size: Optional[int] = kwargs.pop("quantile_sketch_size", None)
+        # When True, file batches are read lazily, loading only the columns (and, for parquet, the
+        # row groups) that the metrics being resolved read (see "ProjectedPandasBatchData").
+        self._projection_pushdown: bool = kwargs.pop("projection_pushdown", False)
+        # When True, objects in S3, GCS and Azure are read through a seekable stream of ranged reads
+        # instead of being downloaded into memory in full (see "RangedObjectReader").
+        self._streaming_reads: bool = kwargs.pop("streaming_reads", False)
+        # Optional "block_size" and "prefetch_blocks" of the streams opened for streaming reads.
+        self._streaming_read_options: dict = kwargs.pop("streaming_read_options", {})
+        # How much of every batch is hashed for its "pandas_data_fingerprint" batch marker, and the
+        # optional "sample_blocks", "sample_block_rows" and "max_workers" used to hash it.
+        self._fingerprint_strategy = FingerprintStrategy(
+            kwargs.pop("fingerprint_strategy", FingerprintStrategy.FULL)
+        )
+        self._fingerprint_options: dict = kwargs.pop("fingerprint_options", {})
+        # When set ("pyarrow" or "numpy_nullable"), file batches are read with this "dtype_backend";
+        # columns of Arrow-backed batches are evaluated with "pyarrow.compute" kernels where
+        # metrics support it, instead of as Python objects.
+        self._dtype_backend: Optional[str] = kwargs.pop("dtype_backend", None)
+        if self._dtype_backend is not None:
+            _check_dtype_backend(self._dtype_backend)
+        # When set (to more than 1), in-memory batches of more than "shard_size" rows are resolved
+        # by this many worker processes, a shard of rows at a time ("PandasShardedMetricResolver").
+        self._shard_workers: Optional[int] = kwargs.pop("shard_workers", None)
+        self._shard_size: int = kwargs.pop("shard_size", DEFAULT_SHARD_SIZE)
+        self._shard_executor: Optional[ProcessPoolExecutor] = None
+        # By batch ID: the DataFrame written (weakly referenced, since the id of a collected frame
+        # may be reused by the next one), and its shards (None if not convertible)
+        self._sharded_frames: Dict[
+            str, Tuple[weakref.ref[pd.DataFrame], Optional[PandasShardedFrame]]
+        ] = {}
 
         # Instantiate cloud provider clients as None at first.
         # They will be instantiated if/when passed cloud-specific in BatchSpec is passed in
@@ -120,6 +191,12 @@ class PandasExecutionEngine(ExecutionEngine):
         self._azure: azure.BlobServiceClient | None = None
         self._gcs = None
 
+        # Value sets of more values are staged as hashed indexes (see "get_value_set_lookup()").
+        self.value_set_lookup_threshold: int = kwargs.pop(
+            "value_set_lookup_threshold", DEFAULT_VALUE_SET_LOOKUP_THRESHOLD
+        )
+        self._staged_value_sets: StagedValueSets[pd.Index] = StagedValueSets()
+
         super().__init__(*args, **kwargs)
 
         self._config.update(
@@ -128,6 +205,17 @@ class PandasExecutionEngine(ExecutionEngine):
                 "boto3_options": boto3_options,
                 "azure_options": azure_options,
                 "gcs_options": gcs_options,
+                "chunk_size": self._chunk_size,
+                "quantile_sketch_size": self._quantile_sketch_size,
+                "projection_pushdown": self._projection_pushdown,
+                "streaming_reads": self._streaming_reads,
+                "streaming_read_options": self._streaming_read_options,
+                "fingerprint_strategy": self._fingerprint_strategy.value,
+                "fingerprint_options": self._fingerprint_options,
+                "dtype_backend": self._dtype_backend,
+                "shard_workers": self._shard_workers,
+                "shard_size": self._shard_size,
+                "value_set_lookup_threshold": self.value_set_lookup_threshold,
             }
         )
 
@@ -200,6 +288,13 @@ class PandasExecutionEngine(ExecutionEngine):
 
         super().load_batch_data(batch_id=batch_id, batch_data=batch_data)
 
+        # The shards of a batch unloaded for another DataFrame (of the same ID) are removed.
+        dataframe_ref, sharded_frame = self._sharded_frames.get(batch_id, (None, None))
+        if sharded_frame is not None and (
+            type(batch_data) is not PandasBatchData or dataframe_ref() is not batch_data.dataframe
+        ):
+            _release_sharded_frame(self._sharded_frames, batch_id, sharded_frame)
+
     @override
     def get_batch_data_and_markers(  # noqa: C901, PLR0912, PLR0915
         self, batch_spec: BatchSpec | PandasBatchSpecProtocol
@@ -248,7 +343,12 @@ class PandasExecutionEngine(ExecutionEngine):
                     if inferred_compression_param is not None:
                         reader_options["compression"] = inferred_compression_param
                 if s3_engine:
-                    s3_object: dict = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
+                    if self._streaming_reads:
+                        s3_object_size: int = s3_engine.head_object(
+                            Bucket=s3_url.bucket, Key=s3_url.key
+                        )["ContentLength"]
+                    else:
+                        s3_object: dict = s3_engine.get_object(Bucket=s3_url.bucket, Key=s3_url.key)
             except (
                 aws.exceptions.ParamValidationError,
                 aws.exceptions.ClientError,
@@ -258,8 +358,22 @@ class PandasExecutionEngine(ExecutionEngine):
                 )
             logger.debug(f"Fetching s3 object. Bucket: {s3_url.bucket} Key: {s3_url.key}")
             reader_fn: DataFrameFactoryFn = self._get_reader_fn(reader_method, s3_url.key)
-            buf = BytesIO(s3_object["Body"].read())  # type: ignore[possibly-undefined] # FIXME
-            buf.seek(0)
+            if self._streaming_reads:
+                open_fn: Callable[[], BinaryIO] = partial(
+                    self._open_s3_object,
+                    s3_url=s3_url,
+                    size=s3_object_size,  # type: ignore[possibly-undefined] # FIXME
+                )
+                projected_batch_data = self._get_projected_batch_data(
+                    batch_spec, reader_options=reader_options, source_fn=open_fn
+                )
+                if projected_batch_data is not None:
+                    return projected_batch_data, batch_markers
+
+                buf = open_fn()
+            else:
+                buf = BytesIO(s3_object["Body"].read())  # type: ignore[possibly-undefined] # FIXME
+                buf.seek(0)
             df = reader_fn(buf, **reader_options)
 
         elif isinstance(batch_spec, AzureBatchSpec):
@@ -279,13 +393,27 @@ class PandasExecutionEngine(ExecutionEngine):
             blob_client = azure_engine.get_blob_client(
                 container=azure_url.container, blob=azure_url.blob
             )
-            azure_object = blob_client.download_blob()
             logger.debug(
                 f"Fetching Azure blob. Container: {azure_url.container} Blob: {azure_url.blob}"
             )
             reader_fn = self._get_reader_fn(reader_method, azure_url.blob)
-            buf = BytesIO(azure_object.readall())
-            buf.seek(0)
+            if self._streaming_reads:
+                open_fn = partial(
+                    self._open_azure_blob,
+                    blob_client=blob_client,
+                    size=blob_client.get_blob_properties().size,
+                )
+                projected_batch_data = self._get_projected_batch_data(
+                    batch_spec, reader_options=reader_options, source_fn=open_fn
+                )
+                if projected_batch_data is not None:
+                    return projected_batch_data, batch_markers
+
+                buf = open_fn()
+            else:
+                azure_object = blob_client.download_blob()
+                buf = BytesIO(azure_object.readall())
+                buf.seek(0)
             df = reader_fn(buf, **reader_options)
 
         elif isinstance(batch_spec, GCSBatchSpec):
@@ -304,6 +432,9 @@ class PandasExecutionEngine(ExecutionEngine):
             try:
                 gcs_bucket = gcs_engine.get_bucket(gcs_url.bucket)
                 gcs_blob = gcs_bucket.blob(gcs_url.blob)
+                if self._streaming_reads:
+                    # Loads the size of the blob.
+                    gcs_blob.reload()
                 logger.debug(f"Fetching GCS blob. Bucket: {gcs_url.bucket} Blob: {gcs_url.blob}")
             except google.GoogleAPIError as error:
                 raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
@@ -311,8 +442,18 @@ class PandasExecutionEngine(ExecutionEngine):
 Bucket: {error}"""  # noqa: E501
                 )
             reader_fn = self._get_reader_fn(reader_method, gcs_url.blob)
-            buf = BytesIO(gcs_blob.download_as_bytes())
-            buf.seek(0)
+            if self._streaming_reads:
+                open_fn = partial(self._open_gcs_blob, gcs_blob=gcs_blob)
+                projected_batch_data = self._get_projected_batch_data(
+                    batch_spec, reader_options=reader_options, source_fn=open_fn
+                )
+                if projected_batch_data is not None:
+                    return projected_batch_data, batch_markers
+
+                buf = open_fn()
+            else:
+                buf = BytesIO(gcs_blob.download_as_bytes())
+                buf.seek(0)
             df = reader_fn(buf, **reader_options)
 
         # Experimental datasources will go down this code path
@@ -320,6 +461,18 @@ Bucket: {error}"""  # noqa: E501
             reader_method = batch_spec.reader_method
             reader_options = batch_spec.reader_options
             path = batch_spec.path
+            chunks_factory = self._get_chunks_factory(batch_spec)
+            if chunks_factory is not None:
+                # Chunked batches are never fingerprinted, since that would require a full read.
+                return ChunkedPandasBatchData(self, chunks_factory), batch_markers
+
+            projected_batch_data = self._get_projected_batch_data(
+                batch_spec, reader_options=reader_options, source_fn=lambda: path
+            )
+            if projected_batch_data is not None:
+                # Projected batches are not fingerprinted either; nothing has been read yet.
+                return projected_batch_data, batch_markers
+
             reader_fn = self._get_reader_fn(reader_method, path)
             df = reader_fn(path, **reader_options)
 
@@ -352,8 +505,11 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
             )
 
         df = self._apply_partitioning_and_sampling_methods(batch_spec, df)  # type: ignore[arg-type]
-        if df.memory_usage().sum() < HASH_THRESHOLD:
-            batch_markers["pandas_data_fingerprint"] = hash_pandas_dataframe(df)
+        fingerprint: Optional[str] = fingerprint_pandas_dataframe(
+            df, strategy=self._fingerprint_strategy, **self._fingerprint_options
+        )
+        if fingerprint is not None:
+            batch_markers["pandas_data_fingerprint"] = fingerprint
 
         typed_batch_data = PandasBatchData(execution_engine=self, dataframe=df)
 
@@ -469,6 +625,10 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
 
         try:
             reader_fn = getattr(pd, reader_method)
+            reader_options = {
+                **self._get_dtype_backend_options(reader_fn),
+                **(reader_options or {}),
+            }
             if reader_options:
                 reader_fn = partial(reader_fn, **reader_options)
             return reader_fn
@@ -477,6 +637,330 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
                 f'Unable to find reader_method "{reader_method}" in pandas.'
             )
 
+    def _get_chunks_factory(self, batch_spec: PathBatchSpec) -> Optional[DataFrameChunksFactoryFn]:
+        """Returns a factory of DataFrame chunks for the file in "batch_spec", or None if the batch must be read whole.
+
+        Chunked reading requires "chunk_size" to be configured, no partitioning or sampling on the batch spec,
+        and a reader able to stream the file: "read_csv", "read_table", "read_json" with "lines=True",
+        and "read_parquet" (through pyarrow, with no reader options besides "columns" and "engine").
+        """  # noqa: E501
+        chunk_size = self._chunk_size
+        if not chunk_size:
+            return None
+
+        if batch_spec.get("partitioner_method") or batch_spec.get("sampling_method"):
+            return None
+
+        path: str = batch_spec.path
+        reader_method: Optional[str] = batch_spec.reader_method
+        reader_options: dict = batch_spec.reader_options
+        if reader_method is None:
+            path_guess = self.guess_reader_method_from_path(path)
+            reader_method = path_guess["reader_method"]
+            reader_options = {**path_guess.get("reader_options", {}), **reader_options}
+
+        if reader_method in ("read_csv", "read_table") or (
+            reader_method == "read_json" and reader_options.get("lines")
+        ):
+            chunked_reader_fn = getattr(pd, reader_method)
+            return partial(
+                chunked_reader_fn,
+                path,
+                **{
+                    **self._get_dtype_backend_options(chunked_reader_fn),
+                    **reader_options,
+                    "chunksize": chunk_size,
+                },
+            )
+
+        if (
+            reader_method == "read_parquet"
+            and pyarrow.parquet
+            and set(reader_options) <= {"columns", "engine"}
+            and reader_options.get("engine", "auto") in ("auto", "pyarrow")
+        ):
+            return partial(
+                _iter_parquet_chunks,
+                path,
+                batch_size=chunk_size,
+                columns=reader_options.get("columns"),
+                dtype_backend=self._dtype_backend,
+            )
+
+        return None
+
+    def _get_dtype_backend_options(self, reader_fn: DataFrameFactoryFn) -> dict:
+        """Reader options reading with the configured "dtype_backend", if the reader supports it."""
+        if self._dtype_backend is None:
+            return {}
+
+        try:
+            parameters = inspect.signature(reader_fn).parameters
+        except (TypeError, ValueError):
+            return {}
+
+        if "dtype_backend" not in parameters:
+            logger.debug(f"Reader {reader_fn!r} does not support dtype_backend; not applied")
+            return {}
+
+        return {"dtype_backend": self._dtype_backend}
+
+    def _open_s3_object(self, s3_url: S3Url, size: int) -> BinaryIO:
+        s3_engine = self._s3
+
+        def fetch_range(start: int, stop: int) -> bytes:
+            s3_object: dict = s3_engine.get_object(  # type: ignore[attr-defined]
+                Bucket=s3_url.bucket, Key=s3_url.key, Range=f"bytes={start}-{stop - 1}"
+            )
+            return s3_object["Body"].read()
+
+        return open_ranged_object(
+            size=size, fetch_range_fn=fetch_range, name=s3_url.key, **self._streaming_read_options
+        )
+
+    def _open_azure_blob(self, blob_client, size: int) -> BinaryIO:
+        def fetch_range(start: int, stop: int) -> bytes:
+            return blob_client.download_blob(offset=start, length=stop - start).readall()
+
+        return open_ranged_object(
+            size=size,
+            fetch_range_fn=fetch_range,
+            name=blob_client.blob_name,
+            **self._streaming_read_options,
+        )
+
+    def _open_gcs_blob(self, gcs_blob) -> BinaryIO:
+        def fetch_range(start: int, stop: int) -> bytes:
+            # The end of the range is inclusive.
+            return gcs_blob.download_as_bytes(start=start, end=stop - 1)
+
+        return open_ranged_object(
+            size=gcs_blob.size,
+            fetch_range_fn=fetch_range,
+            name=gcs_blob.name,
+            **self._streaming_read_options,
+        )
+
+    def _get_projected_batch_data(  # noqa: C901
+        self,
+        batch_spec: PathBatchSpec,
+        reader_options: dict,
+        source_fn: Callable[[], Union[str, BinaryIO]],
+    ) -> Optional[ProjectedPandasBatchData]:
+        """Returns a lazily read batch for the file in "batch_spec", or None if the batch must be read eagerly.
+
+        Every read of the batch reads from a new path or stream returned by "source_fn".
+
+        Projection requires "projection_pushdown" to be enabled, no partitioning or sampling on the batch
+        spec, no column selection in the reader options, and a reader that can select columns:
+        "read_csv" and "read_table" ("usecols"), or "read_parquet", "read_feather" and "read_orc"
+        ("columns", with the schema read through pyarrow).  Only "read_parquet" filters rows.
+        """  # noqa: E501
+        if not self._projection_pushdown:
+            return None
+
+        if batch_spec.get("partitioner_method") or batch_spec.get("sampling_method"):
+            return None
+
+        reader_method: Optional[str] = batch_spec.reader_method
+        if reader_method is None:
+            path_guess = self.guess_reader_method_from_path(batch_spec.path)
+            reader_method = path_guess["reader_method"]
+            reader_options = {**path_guess.get("reader_options", {}), **reader_options}
+
+        if {"columns", "usecols", "filters"} & set(reader_options):
+            return None
+
+        pandas_reader_fn: DataFrameFactoryFn = getattr(pd, reader_method)
+        reader_options = {**self._get_dtype_backend_options(pandas_reader_fn), **reader_options}
+
+        def reader_fn(**kwargs) -> pd.DataFrame:
+            return pandas_reader_fn(source_fn(), **reader_options, **kwargs)
+
+        schema_fn: Callable[[], pd.DataFrame]
+        if reader_method in ("read_csv", "read_table"):
+            column_keyword = "usecols"
+            schema_fn = partial(reader_fn, nrows=0)
+        elif reader_method in _ARROW_SCHEMA_READERS and pyarrow.pyarrow:
+            column_keyword = "columns"
+            schema_fn = lambda: _read_arrow_schema(reader_method, source_fn())  # noqa: E731
+        else:
+            return None
+
+        supports_filters: bool = reader_method == "read_parquet"
+
+        def read_projection(columns: Optional[List[str]], filters: Optional[list]) -> pd.DataFrame:
+            projection_options: dict = {}
+            if columns is not None:
+                projection_options[column_keyword] = columns
+            if filters is not None and supports_filters:
+                projection_options["filters"] = filters
+            return reader_fn(**projection_options)
+
+        return ProjectedPandasBatchData(
+            execution_engine=self,
+            reader_fn=read_projection,
+            schema_fn=schema_fn,
+            supports_filters=supports_filters,
+        )
+
+    @override
+    def prepare_for_metrics(self, metric_configurations: Iterable[MetricConfiguration]) -> None:
+        """Loads, into every projected batch, only the columns and rows the given metrics read."""
+        metrics_by_batch_id: Dict[str, List[MetricConfiguration]] = {}
+        metric_configuration: MetricConfiguration
+        for metric_configuration in metric_configurations:
+            batch_id: Optional[str] = (
+                metric_configuration.metric_domain_kwargs.get("batch_id")
+                or self.batch_manager.active_batch_data_id
+            )
+            if isinstance(
+                self.batch_manager.batch_data_cache.get(batch_id),  # type: ignore[arg-type]
+                ProjectedPandasBatchData,
+            ):
+                metrics_by_batch_id.setdefault(batch_id, []).append(metric_configuration)  # type: ignore[arg-type]
+
+        for batch_id, batch_metrics in metrics_by_batch_id.items():
+            batch_data = cast(
+                ProjectedPandasBatchData, self.batch_manager.batch_data_cache[batch_id]
+            )
+            projection = get_batch_projection(
+                metric_configurations=batch_metrics,
+                column_names=list(batch_data.schema.columns),
+                supports_filters=batch_data.supports_filters,
+            )
+            batch_data.project(columns=projection.columns, filters=projection.filters)
+
+    @override
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: Iterable[MetricConfiguration],
+        metrics: Optional[Dict[Tuple[str, str, str], MetricValue]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves metrics of chunked batches chunk by chunk, of large batches shard by shard (if
+        "shard_workers" is set), and all other metrics as usual."""
+        chunked_metrics_by_batch_id: Dict[str, List[MetricConfiguration]] = {}
+        other_metrics: List[MetricConfiguration] = []
+
+        metric_to_resolve: MetricConfiguration
+        for metric_to_resolve in metrics_to_resolve or []:
+            batch_id: Optional[str] = (
+                metric_to_resolve.metric_domain_kwargs.get("batch_id")
+                or self.batch_manager.active_batch_data_id
+            )
+            batch_data = self.batch_manager.batch_data_cache.get(batch_id)  # type: ignore[arg-type]
+            if isinstance(batch_data, ChunkedPandasBatchData) or self._is_sharded(batch_data):
+                chunked_metrics_by_batch_id.setdefault(batch_id, []).append(metric_to_resolve)  # type: ignore[arg-type]
+            else:
+                other_metrics.append(metric_to_resolve)
+
+        if not chunked_metrics_by_batch_id:
+            return super().resolve_metrics(
+                metrics_to_resolve=other_metrics,
+                metrics=metrics,
+                runtime_configuration=runtime_configuration,
+            )
+
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if other_metrics:
+            resolved_metrics.update(
+                super().resolve_metrics(
+                    metrics_to_resolve=other_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        for batch_id, chunked_metrics in chunked_metrics_by_batch_id.items():
+            resolver = self._get_chunked_metric_resolver(batch_id=batch_id)
+            resolved_chunked_metrics = resolver.resolve_metrics(
+                metrics_to_resolve=chunked_metrics,
+                metrics=metrics or {},
+                runtime_configuration=runtime_configuration,
+            )
+            if self._caching:
+                self._metric_cache.update(
+                    {
+                        metric_id: value
+                        for metric_id, value in resolved_chunked_metrics.items()
+                        if value is not CHUNK_LOCAL_METRIC_VALUE
+                    }
+                )
+
+            resolved_metrics.update(resolved_chunked_metrics)
+
+        return resolved_metrics
+
+    def _is_sharded(self, batch_data: Optional[BatchData]) -> bool:
+        # Chunked and projected batches are not in memory; they are not sharded.
+        return (
+            self._shard_workers is not None
+            and self._shard_workers > 1
+            and type(batch_data) is PandasBatchData
+            and len(batch_data.dataframe) > self._shard_size
+        )
+
+    def _get_chunked_metric_resolver(self, batch_id: str) -> PandasChunkedMetricResolver:
+        batch_data = self.batch_manager.batch_data_cache[batch_id]
+        if isinstance(batch_data, ChunkedPandasBatchData):
+            return PandasChunkedMetricResolver(
+                execution_engine=self, batch_id=batch_id, batch_data=batch_data
+            )
+
+        batch_data = cast(PandasBatchData, batch_data)
+        if self._shard_executor is None:
+            self._shard_executor = ProcessPoolExecutor(max_workers=self._shard_workers)
+
+        return PandasShardedMetricResolver(
+            execution_engine=self,
+            batch_id=batch_id,
+            batch_data=batch_data,
+            executor=self._shard_executor,
+            sharded_frame=self._get_sharded_frame(
+                batch_id=batch_id, dataframe=batch_data.dataframe
+            ),
+            shard_size=self._shard_size,
+        )
+
+    def _get_sharded_frame(
+        self, batch_id: str, dataframe: pd.DataFrame
+    ) -> Optional[PandasShardedFrame]:
+        """Returns the shards of the batch, written once per batch (None if not convertible)."""
+        dataframe_ref, sharded_frame = self._sharded_frames.get(batch_id, (None, None))
+        if dataframe_ref is not None and dataframe_ref() is dataframe:
+            return sharded_frame
+
+        if sharded_frame is not None:
+            _release_sharded_frame(self._sharded_frames, batch_id, sharded_frame)
+
+        try:
+            sharded_frame = PandasShardedFrame(dataframe=dataframe, shard_size=self._shard_size)
+        except pyarrow.pyarrow.ArrowException as e:
+            logger.info(f"Batch {batch_id} does not convert to Arrow ({e}); resolving in-process")
+            sharded_frame = None
+        else:
+            # The shards are removed once the DataFrame is collected, not only on "close()".
+            weakref.finalize(
+                dataframe, _release_sharded_frame, self._sharded_frames, batch_id, sharded_frame
+            )
+
+        self._sharded_frames[batch_id] = (weakref.ref(dataframe), sharded_frame)
+        return sharded_frame
+
+    @override
+    def close(self) -> None:
+        """Stops the worker processes of sharded batches, and removes their shards."""
+        if self._shard_executor is not None:
+            self._shard_executor.shutdown()
+            self._shard_executor = None
+
+        # Shards may also be released (by the finalizers of their DataFrames) while iterating.
+        for _dataframe_ref, sharded_frame in list(self._sharded_frames.values()):
+            if sharded_frame is not None:
+                sharded_frame.cleanup()
+        self._sharded_frames.clear()
+
     @override
     def resolve_metric_bundle(self, metric_fn_bundle) -> Dict[Tuple[str, str, str], Any]:
         """Resolve a bundle of metrics with the same compute Domain as part of a single trip to the compute engine."""  # noqa: E501
@@ -526,10 +1010,12 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
             condition_parser = domain_kwargs.get("condition_parser", None)
 
             # Ensuring proper condition parser has been provided
-            if condition_parser not in ["python", "pandas"]:
+            if condition_parser == "great_expectations__experimental__":
+                data = data[parse_condition_to_pandas(row_condition, data)]
+            elif condition_parser not in ["python", "pandas"]:
                 raise ValueError(  # noqa: TRY003
                     "condition_parser is required when setting a row_condition,"
-                    " and must be 'python' or 'pandas'"
+                    " and must be 'python' or 'pandas' (or 'great_expectations__experimental__')"
                 )
             else:
                 # Querying row condition
@@ -591,6 +1077,25 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
 
         return data
 
+    def get_value_set_lookup(self, value_set: Iterable[Any]) -> Optional[pd.Index]:
+        """Hashed index of the values of a large value set, for in-set conditions.
+
+        "Series.isin()" hashes its value set on every call, i.e. for every batch; value sets of
+        more than "value_set_lookup_threshold" values are instead staged once as an index of their
+        unique values, whose hash table is reused with "Index.get_indexer()".
+
+        Args:
+            value_set: Values of the set; only sets of strings or of numbers (not NaN) are staged.
+
+        Returns:
+            Index of the values, or None if the value set is to be looked up with "isin()".
+        """
+        values: List[Any] = list(value_set)
+        if len(values) <= self.value_set_lookup_threshold or not is_stageable_value_set(values):
+            return None
+
+        return self._staged_value_sets.get_or_stage(values=values, stage=pd.Index)
+
     @override
     def get_compute_domain(
         self,
@@ -634,11 +1139,65 @@ not {batch_spec.__class__.__name__}"""  # noqa: E501
         return data, partition_domain_kwargs.compute, partition_domain_kwargs.accessor
 
 
-def hash_pandas_dataframe(df):
-    try:
-        obj = pd.util.hash_pandas_object(df, index=True).values
-    except TypeError:
-        # In case of facing unhashable objects (like dict), use pickle
-        obj = pickle.dumps(df, pickle.HIGHEST_PROTOCOL)
+_ARROW_SCHEMA_READERS = ("read_parquet", "read_feather", "read_orc")
 
-    return hashlib.md5(obj).hexdigest()
+_DTYPE_BACKENDS = ("pyarrow", "numpy_nullable")
+
+
+def _release_sharded_frame(
+    sharded_frames: Dict[str, Tuple[weakref.ref[pd.DataFrame], Optional[PandasShardedFrame]]],
+    batch_id: str,
+    sharded_frame: PandasShardedFrame,
+) -> None:
+    """Removes the shards of a batch, and forgets them unless the batch was sharded again."""
+    sharded_frame.cleanup()
+    if sharded_frames.get(batch_id, (None, None))[1] is sharded_frame:
+        del sharded_frames[batch_id]
+
+
+def _check_dtype_backend(dtype_backend: str) -> None:
+    if dtype_backend not in _DTYPE_BACKENDS:
+        raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+            f'dtype_backend must be one of {_DTYPE_BACKENDS}, not "{dtype_backend}".'
+        )
+
+    if is_version_less_than(pd.__version__, "2.0.0"):
+        raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+            f"dtype_backend requires pandas 2.0.0 or later (pandas {pd.__version__} is installed)."
+        )
+
+    if dtype_backend == "pyarrow" and not pyarrow.pyarrow:
+        raise gx_exceptions.ExecutionEngineError(  # noqa: TRY003
+            'dtype_backend "pyarrow" requires pyarrow; please "pip install pyarrow".'
+        )
+
+
+def _read_arrow_schema(reader_method: str, source: Union[str, BinaryIO]) -> pd.DataFrame:
+    if reader_method == "read_parquet":
+        schema = pyarrow.parquet.read_schema(source)
+    elif reader_method == "read_feather":
+        with pyarrow.pyarrow.ipc.open_file(source) as reader:
+            schema = reader.schema
+    else:
+        schema = pyarrow.orc.ORCFile(source).schema
+
+    return schema.empty_table().to_pandas()
+
+
+def _iter_parquet_chunks(
+    path: str,
+    batch_size: int,
+    columns: Optional[List[str]] = None,
+    dtype_backend: Optional[str] = None,
+) -> Iterator[pd.DataFrame]:
+    parquet_file = pyarrow.parquet.ParquetFile(path)
+    try:
+        for record_batch in parquet_file.iter_batches(batch_size=batch_size, columns=columns):
+            if dtype_backend == "pyarrow":
+                yield record_batch.to_pandas(types_mapper=pd.ArrowDtype)
+            elif dtype_backend is not None:
+                yield record_batch.to_pandas().convert_dtypes(dtype_backend=dtype_backend)
+            else:
+                yield record_batch.to_pandas()
+    finally:
+        parquet_file.close()
@@ -0,0 +1,326 @@
+"""Resolution of metrics over a large in-memory pandas batch, one row shard per worker process.
+
+Python-level map conditions (e.g. "column.map(is_json)" or "dateutil.parser.parse") run on a
+single core.  A batch of more than "shard_size" rows is instead split into row ranges ("shards"),
+written once to a temporary Arrow IPC file with one record batch per shard, and resolved by a pool
+of "shard_workers" processes, each memory-mapping the file and reading only its own shard (the
+frame itself is never pickled).
+
+Metrics are resolved per shard as per chunk of a "ChunkedPandasBatchData" (see
+"PandasChunkedMetricResolver"): partial states of aggregates are merged, and per-shard values of
+map summarization metrics are summed or concatenated in row order, so results (including
+unexpected indices) are those of the single-process path, up to floating point rounding of merged
+aggregates.  Metrics that require the whole batch, or whose partial states do not merge exactly
+(quantiles), are resolved in-process, as are all metrics of frames that do not convert to Arrow
+(e.g. object columns of mixed types).
+
+Worker processes are started with the default "multiprocessing" start method of the platform;
+with "spawn", custom metrics must be registered on import of a module the workers import.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple, Type
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility import pyarrow
+from great_expectations.compatibility.typing_extensions import override
+from great_expectations.execution_engine.pandas_chunked_metric_resolver import (
+    CHUNK_LOCAL_METRIC_VALUE,
+    PandasChunkedMetricResolver,
+)
+from great_expectations.expectations.registry import get_metric_provider
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+    from great_expectations.execution_engine.pandas_batch_data import PandasBatchData
+    from great_expectations.execution_engine.pandas_execution_engine import (
+        PandasExecutionEngine,
+    )
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SHARD_SIZE = 1_000_000
+
+
+class PandasShardedFrame:
+    """A DataFrame written to a temporary Arrow IPC file, with one record batch per row shard."""
+
+    def __init__(self, dataframe: pd.DataFrame, shard_size: int) -> None:
+        """Writes the frame; raises a "pyarrow.ArrowException" if it does not convert to Arrow."""
+        self.dtypes: Dict[str, Any] = dataframe.dtypes.to_dict()
+        self._directory = tempfile.TemporaryDirectory(prefix="gx_shards_")
+        self.path = os.path.join(self._directory.name, "batch.arrow")  # noqa: PTH118
+
+        # The index is stored as a column, so that every shard keeps the indices of its rows.
+        schema = pyarrow.pyarrow.Schema.from_pandas(dataframe, preserve_index=True)
+        self.shard_count = 0
+        try:
+            with pyarrow.pyarrow.ipc.new_file(self.path, schema) as writer:
+                for start in range(0, len(dataframe), shard_size):
+                    writer.write_table(
+                        pyarrow.pyarrow.Table.from_pandas(
+                            dataframe.iloc[start : start + shard_size],
+                            schema=schema,
+                            preserve_index=True,
+                        )
+                    )
+                    self.shard_count += 1
+        except Exception:
+            self.cleanup()
+            raise
+
+    def cleanup(self) -> None:
+        self._directory.cleanup()
+
+
+def read_shard(path: str, shard_number: int, dtypes: Dict[str, Any]) -> pd.DataFrame:
+    """Reads one shard of a "PandasShardedFrame", restoring the dtypes of its columns."""
+    with pyarrow.pyarrow.memory_map(path) as source:
+        record_batch = pyarrow.pyarrow.ipc.open_file(source).get_batch(shard_number)
+        shard: pd.DataFrame = pyarrow.pyarrow.Table.from_batches([record_batch]).to_pandas()
+
+    # e.g. "string[pyarrow]" columns are read as "string[python]"
+    changed_dtypes = {
+        column: dtype for column, dtype in dtypes.items() if shard[column].dtype != dtype
+    }
+    return shard.astype(changed_dtypes) if changed_dtypes else shard
+
+
+@dataclass(frozen=True)
+class _ShardTask:
+    path: str
+    shard_number: int
+    dtypes: Dict[str, Any]
+    execution_engine_class: Type[PandasExecutionEngine]
+    discard_subset_failing_expectations: bool
+    batch_id: str
+    aggregate_metrics: List[MetricConfiguration]
+    summarization_metrics: List[MetricConfiguration]
+    metrics: Dict[Tuple[str, str, str], MetricValue]
+    runtime_configuration: Optional[dict]
+
+
+@dataclass(frozen=True)
+class _ShardResult:
+    partial_states: Dict[Tuple[str, str, str], Any]
+    values: Dict[Tuple[str, str, str], MetricValue]
+    # Metric resolution errors are returned, since "MetricResolutionError" does not unpickle.
+    error: Optional[str] = None
+    failed_metric_ids: Tuple[Tuple[str, str, str], ...] = ()
+
+
+def _resolve_shard(task: _ShardTask) -> _ShardResult:
+    """Resolves the metrics of one shard (in a worker process)."""
+    shard = read_shard(path=task.path, shard_number=task.shard_number, dtypes=task.dtypes)
+    resolver = PandasChunkedMetricResolver(
+        execution_engine=task.execution_engine_class(
+            caching=False,
+            discard_subset_failing_expectations=task.discard_subset_failing_expectations,
+        ),
+        batch_id=task.batch_id,
+        batch_data=None,  # type: ignore[arg-type] # only "resolve_chunk()" is used
+    )
+    try:
+        partial_states, values = resolver.resolve_chunk(
+            chunk=shard,
+            aggregate_metrics=task.aggregate_metrics,
+            summarization_metrics=task.summarization_metrics,
+            metrics=task.metrics,
+            runtime_configuration=task.runtime_configuration,
+        )
+    except gx_exceptions.MetricResolutionError as e:
+        return _ShardResult(
+            partial_states={},
+            values={},
+            error=str(e),
+            failed_metric_ids=tuple(
+                metric_configuration.id for metric_configuration in e.failed_metrics
+            ),
+        )
+
+    return _ShardResult(partial_states=partial_states, values=values)
+
+
+class PandasShardedMetricResolver(PandasChunkedMetricResolver):
+    """Resolves the metrics of one in-memory "PandasBatchData" over row shards, in parallel."""
+
+    def __init__(  # noqa: PLR0913
+        self,
+        execution_engine: PandasExecutionEngine,
+        batch_id: str,
+        batch_data: PandasBatchData,
+        executor: ProcessPoolExecutor,
+        sharded_frame: Optional[PandasShardedFrame],
+        shard_size: int,
+    ) -> None:
+        super().__init__(
+            execution_engine=execution_engine,
+            batch_id=batch_id,
+            batch_data=batch_data,  # type: ignore[arg-type]
+        )
+        self._executor = executor
+        self._sharded_frame = sharded_frame
+        self._shard_size = shard_size
+
+    @override
+    def resolve_metrics(
+        self,
+        metrics_to_resolve: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        (
+            aggregate_metrics,
+            summarization_metrics,
+            schema_metrics,
+            whole_batch_metrics,
+        ) = self._classify_metrics(
+            metrics_to_resolve=metrics_to_resolve, resolved_metrics=resolved_metrics
+        )
+
+        # Quantile states hold the values of the column (or are approximate); the batch is in
+        # memory, so quantiles are computed from it instead.
+        for metric_configuration in list(aggregate_metrics):
+            metric_class, _ = get_metric_provider(
+                metric_name=metric_configuration.metric_name,
+                execution_engine=self._execution_engine,
+            )
+            if not metric_class.partial_state_type.merges_exactly:
+                aggregate_metrics.remove(metric_configuration)
+                whole_batch_metrics.append(metric_configuration)
+
+        if schema_metrics or whole_batch_metrics:
+            resolved_metrics.update(
+                self._resolve_on_chunk(
+                    metrics_to_resolve=schema_metrics + whole_batch_metrics,
+                    chunk=self._batch_data.dataframe,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        if aggregate_metrics or summarization_metrics:
+            resolved_metrics.update(
+                self._resolve_by_chunk(
+                    aggregate_metrics=aggregate_metrics,
+                    summarization_metrics=summarization_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            )
+
+        return resolved_metrics
+
+    @override
+    def _iter_chunk_results(
+        self,
+        aggregate_metrics: List[MetricConfiguration],
+        summarization_metrics: List[MetricConfiguration],
+        chunk_values: Dict[Tuple[str, str, str], list],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+        runtime_configuration: Optional[dict],
+    ) -> Iterator[Tuple[Dict[Tuple[str, str, str], Any], Dict[Tuple[str, str, str], MetricValue]]]:
+        dataframe: pd.DataFrame = self._batch_data.dataframe
+        if self._sharded_frame is None:
+            # Frames that do not convert to Arrow are resolved shard by shard in-process.
+            for start in range(0, len(dataframe), self._shard_size):
+                yield self.resolve_chunk(
+                    chunk=dataframe.iloc[start : start + self._shard_size],
+                    aggregate_metrics=aggregate_metrics,
+                    summarization_metrics=summarization_metrics,
+                    metrics=metrics,
+                    runtime_configuration=runtime_configuration,
+                )
+            return
+
+        dependency_values = self._get_dependency_values(
+            metric_configurations=aggregate_metrics + summarization_metrics, metrics=metrics
+        )
+        futures = [
+            self._executor.submit(
+                _resolve_shard,
+                _ShardTask(
+                    path=self._sharded_frame.path,
+                    shard_number=shard_number,
+                    dtypes=self._sharded_frame.dtypes,
+                    execution_engine_class=self._execution_engine.__class__,
+                    discard_subset_failing_expectations=self._execution_engine.discard_subset_failing_expectations,
+                    batch_id=self._batch_id,
+                    aggregate_metrics=aggregate_metrics,
+                    summarization_metrics=summarization_metrics,
+                    metrics=dependency_values,
+                    runtime_configuration=runtime_configuration,
+                ),
+            )
+            for shard_number in range(self._sharded_frame.shard_count)
+        ]
+        try:
+            for shard_number, future in enumerate(futures):
+                try:
+                    result: _ShardResult = future.result()
+                except Exception as e:
+                    # e.g. a worker process that died, or a metric value that does not pickle
+                    raise gx_exceptions.MetricResolutionError(
+                        message=f"Shard {shard_number} failed to resolve: {e!r}",
+                        failed_metrics=tuple(aggregate_metrics + summarization_metrics),
+                    ) from e
+
+                if result.error is not None:
+                    metrics_by_id = {
+                        metric_configuration.id: metric_configuration
+                        for metric_configuration in aggregate_metrics + summarization_metrics
+                    }
+                    raise gx_exceptions.MetricResolutionError(
+                        message=result.error,
+                        failed_metrics=tuple(
+                            metrics_by_id[metric_id]
+                            for metric_id in result.failed_metric_ids
+                            if metric_id in metrics_by_id
+                        ),
+                    )
+
+                yield result.partial_states, result.values
+        finally:
+            for future in futures:
+                future.cancel()
+
+    def _get_dependency_values(
+        self,
+        metric_configurations: List[MetricConfiguration],
+        metrics: Dict[Tuple[str, str, str], MetricValue],
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Values of the (transitive, through chunk-local metrics) dependencies of the metrics.
+
+        Worker processes have neither the metrics resolved so far nor the metric cache of the
+        execution engine; only the values needed to resolve the metrics on a shard are sent.
+        """
+        dependency_values: Dict[Tuple[str, str, str], MetricValue] = {}
+        pending: List[MetricConfiguration] = list(metric_configurations)
+        while pending:
+            dependency: MetricConfiguration
+            for dependency in pending.pop().metric_dependencies.values():
+                if dependency.id in dependency_values:
+                    continue
+
+                if dependency.id in metrics:
+                    value = metrics[dependency.id]
+                elif dependency.id in self._execution_engine._metric_cache:
+                    value = self._execution_engine._metric_cache[dependency.id]
+                else:
+                    continue
+
+                dependency_values[dependency.id] = value
+                if value is CHUNK_LOCAL_METRIC_VALUE:
+                    pending.append(dependency)
+
+        return dependency_values
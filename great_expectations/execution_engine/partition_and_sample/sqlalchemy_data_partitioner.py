@@ -353,6 +353,37 @@ class SqlAlchemyDataPartitioner(DataPartitioner):
 
         return batch_identifiers_list
 
+    def has_data_for_batch_identifiers(
+        self,
+        execution_engine: SqlAlchemyExecutionEngine,
+        selectable: sqlalchemy.Selectable,
+        partitioner_method_name: str,
+        partitioner_kwargs: dict,
+        batch_identifiers: dict,
+    ) -> bool:
+        """Whether the partition with the given batch identifiers contains any rows.
+
+        This is a single "LIMIT 1" query, for when batch identifiers are known in advance and
+        introspecting all partitions of the data (see get_data_for_batch_identifiers) is not needed.
+
+        Args:
+            execution_engine: Used to query the data.
+            selectable: Selectable to partition.
+            partitioner_method_name: Desired partitioner method to use.
+            partitioner_kwargs: Dict of directives used by the partitioner method as keyword arguments of key=value.
+            batch_identifiers: Batch identifiers of the partition, as passed to the partitioner method.
+
+        Returns:
+            True if the partition contains at least one row.
+        """  # noqa: E501
+        partition_clause = self.get_partitioner_method(partitioner_method_name)(
+            batch_identifiers=batch_identifiers, **partitioner_kwargs
+        )
+        query: sqlalchemy.Selectable = (
+            sa.select(sa.literal(1)).select_from(selectable).where(partition_clause).limit(1)  # type: ignore[arg-type]
+        )
+        return len(self._execute_partitioned_query(execution_engine, query)) > 0
+
     def _is_datetime_partitioner(self, partitioner_method_name: str) -> bool:
         """Whether the partitioner method is a datetime partitioner.
 
@@ -573,6 +604,66 @@ class SqlAlchemyDataPartitioner(DataPartitioner):
             column_name, result, date_parts
         )
 
+    def get_data_for_last_batch_identifiers_for_partition_on_date_parts(
+        self,
+        execution_engine: SqlAlchemyExecutionEngine,
+        selectable: sqlalchemy.Selectable,
+        column_name: str,
+        date_parts: Union[List[DatePart], List[str]],
+        sort_ascending: bool = True,
+    ) -> List[dict]:
+        """Build batch_identifiers of the last batch only of a column partition on date parts.
+
+        Batches are ordered by their date parts, in turn, with missing (NULL) date parts first (or
+        last, if sort_ascending is False).  Instead of selecting all distinct date parts, this
+        method sorts rows in the database and keeps the first one ("ORDER BY ... LIMIT 1").
+
+        Args:
+            execution_engine: used to query the data to find batch identifiers.
+            selectable: selectable to partition.
+            column_name: column in table to use in determining partition.
+            date_parts: part of the date to be used for partitioning e.g.
+                DatePart.DAY or the case-insensitive string representation "day"
+            sort_ascending: whether batches are sorted in ascending order of their date parts.
+
+        Returns:
+            List of at most one dict of the form [{column_name: {date_part_name: date_part_value}}]
+        """
+        self._validate_date_parts(date_parts)
+
+        date_parts = self._convert_date_parts(date_parts)
+
+        date_part_columns: List[sqlalchemy.Cast] = [
+            sa.cast(sa.func.extract(date_part.value, sa.column(column_name)), sa.Integer)
+            for date_part in date_parts
+        ]
+        # Ordering on whether a date part is NULL first keeps the order independent of how each
+        # dialect sorts NULL values.
+        order_by_clauses: list = []
+        for date_part_column in date_part_columns:
+            for clause in (sa.case((date_part_column.is_(None), 0), else_=1), date_part_column):
+                order_by_clauses.append(clause.desc() if sort_ascending else clause.asc())
+
+        partitioned_query: sqlalchemy.Selectable = (
+            sa.select(  # type: ignore[call-overload]
+                *[
+                    date_part_column.label(date_part.value)
+                    for date_part, date_part_column in zip(date_parts, date_part_columns)
+                ]
+            )
+            .select_from(selectable)
+            .order_by(*order_by_clauses)
+            .limit(1)
+        )
+
+        result: List[sqlalchemy.Row | sqlalchemy.LegacyRow] = self._execute_partitioned_query(
+            execution_engine, partitioned_query
+        )
+
+        return self._get_params_for_batch_identifiers_from_date_part_partitioner(
+            column_name, result, date_parts
+        )
+
     @staticmethod
     def _execute_partitioned_query(
         execution_engine: SqlAlchemyExecutionEngine,
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import io
+import logging
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import TYPE_CHECKING, Callable, Optional
+
+if TYPE_CHECKING:
+    from typing_extensions import TypeAlias
+
+logger = logging.getLogger(__name__)
+
+# Returns the bytes of the object from "start" (inclusive) to "stop" (exclusive).
+RangeFetchFn: TypeAlias = Callable[[int, int], bytes]
+
+DEFAULT_BLOCK_SIZE = 8 * 1024 * 1024
+DEFAULT_PREFETCH_BLOCKS = 4
+
+
+class RangedObjectReader(io.RawIOBase):
+    """Seekable, read-only file-like view of a remote object of known size, fetched in ranged reads.
+
+    The object is read in blocks of "block_size" bytes, each fetched with a single ranged GET.
+    Only a bounded number of blocks is cached, so memory use does not grow with the size of the
+    object.  Whenever blocks are read in sequence, the next "prefetch_blocks" blocks are fetched
+    concurrently in the background; random access (e.g., reading a parquet footer, then only some
+    column chunks) fetches only the blocks actually read.
+
+    Readers expecting a buffered stream should wrap it using "io.BufferedReader" (see
+    "open_ranged_object").
+    """
+
+    def __init__(
+        self,
+        size: int,
+        fetch_range_fn: RangeFetchFn,
+        block_size: int = DEFAULT_BLOCK_SIZE,
+        prefetch_blocks: int = DEFAULT_PREFETCH_BLOCKS,
+        name: Optional[str] = None,
+    ) -> None:
+        super().__init__()
+        self._size = size
+        self._fetch_range_fn = fetch_range_fn
+        self._block_size = block_size
+        self._prefetch_blocks = prefetch_blocks
+        self.name = name
+
+        self._position = 0
+        self._last_block_index = -1
+        # Holds the blocks being fetched or recently read, in order of last use.
+        self._blocks: OrderedDict[int, Future] = OrderedDict()
+        self._max_cached_blocks = prefetch_blocks + 2
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = self._size + offset
+        else:
+            raise ValueError(f"Invalid whence ({whence}).")  # noqa: TRY003
+
+        if position < 0:
+            raise ValueError(f"Negative seek position {position}.")  # noqa: TRY003
+
+        self._position = position
+        return position
+
+    def readinto(self, buffer) -> int:
+        view = memoryview(buffer).cast("B")
+        end = min(self._position + len(view), self._size)
+        written = 0
+        while self._position < end:
+            block_index, block_offset = divmod(self._position, self._block_size)
+            block: bytes = self._get_block(block_index)
+            count = min(len(block) - block_offset, end - self._position)
+            if count <= 0:
+                break
+
+            view[written : written + count] = block[block_offset : block_offset + count]
+            written += count
+            self._position += count
+
+        return written
+
+    def readall(self) -> bytes:
+        return self.read(max(self._size - self._position, 0))
+
+    def close(self) -> None:
+        if self._executor is not None:
+            with self._lock:
+                for block in self._blocks.values():
+                    block.cancel()
+
+                self._blocks.clear()
+
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+        super().close()
+
+    def _get_block(self, block_index: int) -> bytes:
+        sequential = block_index == self._last_block_index + 1
+        self._last_block_index = block_index
+        with self._lock:
+            block = self._blocks.get(block_index)
+            if block is None:
+                block = Future()
+                block.set_result(self._fetch_block(block_index))
+                self._blocks[block_index] = block
+
+            self._blocks.move_to_end(block_index)
+            if sequential and self._prefetch_blocks > 0:
+                self._prefetch(first_block_index=block_index + 1)
+
+            while len(self._blocks) > self._max_cached_blocks:
+                _, evicted_block = self._blocks.popitem(last=False)
+                evicted_block.cancel()
+
+        return block.result()
+
+    def _prefetch(self, first_block_index: int) -> None:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._prefetch_blocks, thread_name_prefix="gx-ranged-read"
+            )
+
+        last_block_index = (self._size - 1) // self._block_size
+        for block_index in range(
+            first_block_index, min(first_block_index + self._prefetch_blocks, last_block_index + 1)
+        ):
+            if block_index not in self._blocks:
+                self._blocks[block_index] = self._executor.submit(self._fetch_block, block_index)
+
+    def _fetch_block(self, block_index: int) -> bytes:
+        start = block_index * self._block_size
+        stop = min(start + self._block_size, self._size)
+        logger.debug(f"Fetching bytes {start}-{stop - 1} of {self.name or 'remote object'}")
+        return self._fetch_range_fn(start, stop)
+
+
+def open_ranged_object(
+    size: int,
+    fetch_range_fn: RangeFetchFn,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+    prefetch_blocks: int = DEFAULT_PREFETCH_BLOCKS,
+    name: Optional[str] = None,
+) -> io.BufferedReader:
+    """Opens a buffered, seekable stream over a remote object fetched in ranged reads."""
+    raw = RangedObjectReader(
+        size=size,
+        fetch_range_fn=fetch_range_fn,
+        block_size=block_size,
+        prefetch_blocks=prefetch_blocks,
+        name=name,
+    )
+    return io.BufferedReader(raw, buffer_size=min(block_size, io.DEFAULT_BUFFER_SIZE * 8))
@@ -60,6 +60,11 @@ from great_expectations.execution_engine.partition_and_sample.sparkdf_data_sampl
     SparkDataSampler,
 )
 from great_expectations.execution_engine.sparkdf_batch_data import SparkDFBatchData
+from great_expectations.execution_engine.value_set_lookup import (
+    DEFAULT_VALUE_SET_LOOKUP_THRESHOLD,
+    StagedValueSets,
+    is_stageable_value_set,
+)
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -220,6 +225,12 @@ class SparkDFExecutionEngine(ExecutionEngine):
         azure_options: dict = kwargs.pop("azure_options", {})
         self._azure_options = azure_options
 
+        # Value sets of more values are staged as array literals (see "get_value_set_lookup()").
+        self.value_set_lookup_threshold: int = kwargs.pop(
+            "value_set_lookup_threshold", DEFAULT_VALUE_SET_LOOKUP_THRESHOLD
+        )
+        self._staged_value_sets: StagedValueSets[Any] = StagedValueSets()
+
         if force_reuse_spark_context is not None:
             # deprecated-v1.0.0
             warnings.warn(
@@ -236,6 +247,7 @@ class SparkDFExecutionEngine(ExecutionEngine):
                 "persist": self._persist,
                 "spark_config": spark_config,
                 "azure_options": azure_options,
+                "value_set_lookup_threshold": self.value_set_lookup_threshold,
             }
         )
 
@@ -801,6 +813,28 @@ illegal.  Please check your config."""  # noqa: E501
             partitioned_domain_kwargs.accessor,
         )
 
+    def get_value_set_lookup(self, value_set: Iterable[Any]) -> Optional[pyspark.Column]:
+        """Array literal of the values of a large value set, for in-set conditions.
+
+        "Column.isin()" builds an expression per value, analyzed anew for every batch; value sets
+        of more than "value_set_lookup_threshold" values are instead staged once as an array
+        literal of their unique values, for "array_contains()" conditions.
+
+        Args:
+            value_set: Values of the set; only sets of strings or of numbers are staged.
+
+        Returns:
+            Array literal of the values, or None if the value set is to be inlined.
+        """
+        values: List[Any] = list(value_set)
+        if len(values) <= self.value_set_lookup_threshold or not is_stageable_value_set(values):
+            return None
+
+        return self._staged_value_sets.get_or_stage(
+            values=values,
+            stage=lambda unique_values: F.array(*(F.lit(value) for value in unique_values)),
+        )
+
     def add_column_row_condition(  # type: ignore[explicit-override] # FIXME
         self, domain_kwargs, column_name=None, filter_null=True, filter_nan=False
     ):
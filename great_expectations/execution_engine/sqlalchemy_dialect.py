@@ -1,11 +1,14 @@
 from __future__ import annotations
 
 from enum import Enum
-from typing import Any, Final, List, Literal, Mapping, Union, overload
+from typing import TYPE_CHECKING, Any, Final, List, Literal, Mapping, Union, overload
 
-from great_expectations.compatibility.sqlalchemy import quoted_name
+from great_expectations.compatibility import sqlalchemy
 from great_expectations.compatibility.typing_extensions import override
 
+if TYPE_CHECKING:
+    from great_expectations.compatibility.sqlalchemy import quoted_name
+
 
 class GXSqlDialect(Enum):
     """Contains sql dialects that have some level of support in Great Expectations.
@@ -16,6 +19,7 @@ class GXSqlDialect(Enum):
     BIGQUERY = "bigquery"
     DATABRICKS = "databricks"
     DREMIO = "dremio"
+    DUCKDB = "duckdb"
     HIVE = "hive"
     MSSQL = "mssql"
     MYSQL = "mysql"
@@ -66,6 +70,7 @@ class GXSqlDialect(Enum):
 DIALECT_IDENTIFIER_QUOTE_STRINGS: Final[Mapping[GXSqlDialect, Literal['"', "`"]]] = {
     # TODO: add other dialects
     GXSqlDialect.DATABRICKS: "`",
+    GXSqlDialect.DUCKDB: '"',
     GXSqlDialect.MYSQL: "`",
     GXSqlDialect.POSTGRESQL: '"',
     GXSqlDialect.SNOWFLAKE: '"',
@@ -104,7 +109,7 @@ def wrap_identifier(
 def wrap_identifier(
     indentifier: str | quoted_name, dialect: GXSqlDialect | None = None
 ) -> quoted_name:
-    if isinstance(indentifier, quoted_name):
+    if isinstance(indentifier, sqlalchemy.quoted_name):
         return indentifier
     wo_quotes = _strip_quotes(indentifier, dialect)  # type: ignore[arg-type] # accounted for in overload
-    return quoted_name(wo_quotes, quote=True)
+    return sqlalchemy.quoted_name(wo_quotes, quote=True)
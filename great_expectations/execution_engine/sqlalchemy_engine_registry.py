@@ -0,0 +1,223 @@
+"""Process-wide registry of SQLAlchemy engines, shared by datasources, execution engines and stores.
+
+Every SQLAlchemy "Engine" has its own connection pool; creating one per datasource, execution
+engine and store means that validating many batches of the same database opens (and authenticates)
+many more connections than needed.  Engines are instead acquired from the registry, which creates
+one engine per distinct set of connection parameters (URL and "create_engine()" keyword arguments),
+counts its holders, and disposes of it once the last holder releases it.
+
+In-memory SQLite and DuckDB databases are private to their engine, so their engines are never
+shared.
+
+    Typical usage example:
+        engine = engine_registry.acquire("postgresql+psycopg2://user@host/db", pool_pre_ping=True)
+        ...
+        engine_registry.release(engine)
+"""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple, Union
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+
+if TYPE_CHECKING:
+    from great_expectations.compatibility import sqlalchemy
+
+logger = logging.getLogger(__name__)
+
+_EngineKey = Tuple[str, str]
+
+_IN_MEMORY_DATABASES = (None, "", ":memory:")
+
+
+@dataclass
+class EngineStatistics:
+    """Use of the connection pool of a registered engine."""
+
+    # DBAPI connections opened (i.e., connection handshakes with the database)
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    # Seconds spent getting connections from the pool (waiting for, or opening, connections)
+    wait_time: float = 0.0
+
+    @property
+    def active_connections(self) -> int:
+        """Connections currently checked out of the pool."""
+        return self.checkouts - self.checkins
+
+
+class _RegisteredEngine:
+    def __init__(self, key: _EngineKey, engine: sqlalchemy.Engine) -> None:
+        self.key = key
+        self.engine = engine
+        self.holders = 0
+        self.statistics = EngineStatistics()
+        # Objects standing in for engines (e.g. test doubles) have no events to listen to.
+        if isinstance(engine, sa.engine.Engine):
+            self._instrument()
+
+    def _instrument(self) -> None:
+        statistics = self.statistics
+
+        def _on_connect(dbapi_connection, connection_record) -> None:
+            statistics.connects += 1
+
+        def _on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+            statistics.checkouts += 1
+
+        def _on_checkin(dbapi_connection, connection_record) -> None:
+            statistics.checkins += 1
+
+        def _on_engine_disposed(engine: sqlalchemy.Engine) -> None:
+            # "Engine.dispose()" replaces the pool of the engine.
+            self._time_pool_connect()
+
+        sa.event.listen(self.engine, "connect", _on_connect)
+        sa.event.listen(self.engine, "checkout", _on_checkout)
+        sa.event.listen(self.engine, "checkin", _on_checkin)
+        sa.event.listen(self.engine, "engine_disposed", _on_engine_disposed)
+        self._time_pool_connect()
+
+    def _time_pool_connect(self) -> None:
+        # Pool events are emitted once a connection is obtained; time the whole of "Pool.connect()".
+        statistics = self.statistics
+        pool = self.engine.pool
+        pool_connect: Callable[[], Any] = pool.connect
+
+        def _timed_connect() -> Any:
+            start = time.perf_counter()
+            try:
+                return pool_connect()
+            finally:
+                statistics.wait_time += time.perf_counter() - start
+
+        pool.connect = _timed_connect  # type: ignore[method-assign]
+
+
+class SqlAlchemyEngineRegistry:
+    """Reference-counted SQLAlchemy engines, keyed by normalized connection parameters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._engines: Dict[_EngineKey, _RegisteredEngine] = {}
+        self._engines_by_id: Dict[int, _RegisteredEngine] = {}
+        self._pool_options: Dict[str, Any] = {}
+
+    def configure_pool(
+        self,
+        pool_size: Optional[int] = None,
+        max_overflow: Optional[int] = None,
+        pool_pre_ping: Optional[bool] = None,
+    ) -> None:
+        """Sets the pool options of engines created from now on (unless given to "acquire()").
+
+        The options only apply to dialects pooling connections in a "QueuePool" (the default of
+        most dialects).
+        """
+        pool_options = {
+            "pool_size": pool_size,
+            "max_overflow": max_overflow,
+            "pool_pre_ping": pool_pre_ping,
+        }
+        with self._lock:
+            self._pool_options = {
+                name: value for name, value in pool_options.items() if value is not None
+            }
+
+    def acquire(
+        self, url: Union[str, sqlalchemy.URL], **create_engine_kwargs: Any
+    ) -> sqlalchemy.Engine:
+        """Returns the engine for the connection parameters, creating it if not registered yet.
+
+        Every call must be paired with a call of "release()" once the engine is no longer used.
+
+        Args:
+            url: Connection string or URL of the database.
+            create_engine_kwargs: Keyword arguments of "sqlalchemy.create_engine()".
+
+        Returns:
+            Engine shared with all holders of the same connection parameters.
+        """
+        parsed_url: sqlalchemy.URL = sa.engine.make_url(url)
+        if "poolclass" not in create_engine_kwargs and "pool" not in create_engine_kwargs:
+            create_engine_kwargs = {**self._get_pool_options(parsed_url), **create_engine_kwargs}
+        if _is_in_memory_database(parsed_url):
+            return sa.create_engine(url, **create_engine_kwargs)
+
+        key = _engine_key(parsed_url, create_engine_kwargs)
+        with self._lock:
+            registered_engine = self._engines.get(key)
+            if registered_engine is None:
+                registered_engine = _RegisteredEngine(
+                    key=key, engine=sa.create_engine(url, **create_engine_kwargs)
+                )
+                self._engines[key] = registered_engine
+                self._engines_by_id[id(registered_engine.engine)] = registered_engine
+                logger.debug(f"Created shared engine for {parsed_url!r}")
+
+            registered_engine.holders += 1
+            return registered_engine.engine
+
+    def release(self, engine: sqlalchemy.Engine) -> None:
+        """Releases an engine, disposing of it if it was released by all of its holders.
+
+        Engines that were not acquired from the registry are disposed of.
+        """
+        with self._lock:
+            registered_engine = self._engines_by_id.get(id(engine))
+            if registered_engine is not None:
+                registered_engine.holders -= 1
+                if registered_engine.holders > 0:
+                    return
+
+                del self._engines[registered_engine.key]
+                del self._engines_by_id[id(engine)]
+                logger.debug(
+                    f"Disposing of shared engine {engine!r}: {registered_engine.statistics}"
+                )
+
+        engine.dispose()
+
+    def is_registered(self, engine: sqlalchemy.Engine) -> bool:
+        return id(engine) in self._engines_by_id
+
+    def get_statistics(self, engine: sqlalchemy.Engine) -> Optional[EngineStatistics]:
+        """Use of the connection pool of a registered engine (None for other engines)."""
+        registered_engine = self._engines_by_id.get(id(engine))
+        return registered_engine.statistics if registered_engine else None
+
+    def _get_pool_options(self, url: sqlalchemy.URL) -> Dict[str, Any]:
+        if not self._pool_options:
+            return {}
+
+        try:
+            pool_class = url.get_dialect().get_pool_class(url)
+        except Exception:
+            # The dialect (e.g. a missing plugin) fails when creating the engine anyway.
+            return {}
+
+        if issubclass(pool_class, sa.pool.QueuePool):
+            return dict(self._pool_options)
+        return {}
+
+
+def _is_in_memory_database(url: sqlalchemy.URL) -> bool:
+    return url.get_backend_name() in ("sqlite", "duckdb") and url.database in _IN_MEMORY_DATABASES
+
+
+def _engine_key(url: sqlalchemy.URL, create_engine_kwargs: Dict[str, Any]) -> _EngineKey:
+    # Query parameters in a different order denote the same connection.
+    normalized_url = url.set(query=dict(sorted(url.query.items())))
+    return (
+        normalized_url.render_as_string(hide_password=False),
+        repr(sorted(create_engine_kwargs.items())),
+    )
+
+
+engine_registry = SqlAlchemyEngineRegistry()
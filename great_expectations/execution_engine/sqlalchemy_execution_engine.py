@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import copy
 import datetime
+import functools
 import hashlib
 import logging
 import math
@@ -9,7 +10,10 @@ import os
 import random
 import re
 import string
+import time
 import traceback
+import uuid
+import weakref
 from collections.abc import Generator
 from contextlib import contextmanager
 from pathlib import Path
@@ -22,6 +26,7 @@ from typing import (
     List,
     MutableMapping,
     Optional,
+    Set,
     Tuple,
     Union,
     cast,
@@ -63,6 +68,9 @@ del get_versions  # isort:skip
 from great_expectations.core import IDDict
 from great_expectations.core.batch import BatchMarkers, BatchSpec
 from great_expectations.core.batch_spec import (
+    PandasBatchSpec,
+    PathBatchSpec,
+    RuntimeDataBatchSpec,
     RuntimeQueryBatchSpec,
     SqlAlchemyDatasourceBatchSpec,
 )
@@ -75,10 +83,28 @@ from great_expectations.exceptions import (
 )
 from great_expectations.exceptions import exceptions as gx_exceptions
 from great_expectations.execution_engine import ExecutionEngine
+from great_expectations.execution_engine.duckdb_reader import (
+    build_duckdb_create_file_view_statement,
+    build_duckdb_drop_view_statement,
+    register_duckdb_dataframe,
+)
+from great_expectations.execution_engine.materialized_tables_scope import (
+    register_materialized_table,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
 from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
+from great_expectations.execution_engine.sqlalchemy_engine_registry import engine_registry
+from great_expectations.execution_engine.sqlalchemy_reflection_cache import (
+    DEFAULT_REFLECTION_CACHE_TTL,
+    ReflectionKey,
+    SqlAlchemyReflectionCache,
+)
+from great_expectations.execution_engine.value_set_lookup import (
+    DEFAULT_VALUE_SET_LOOKUP_THRESHOLD,
+    is_stageable_value_set,
+)
 from great_expectations.expectations.row_conditions import (
     RowCondition,
     RowConditionParserType,
@@ -86,6 +112,7 @@ from great_expectations.expectations.row_conditions import (
 )
 from great_expectations.util import (
     filter_properties_dict,
+    generate_temporary_table_name,
     get_sqlalchemy_selectable,
     get_sqlalchemy_url,
     import_library_module,
@@ -98,9 +125,31 @@ from great_expectations.validator.metric_configuration import (
 logger = logging.getLogger(__name__)
 
 
+try:
+    from sqlalchemy.ext.compiler import compiles  # noqa: TID251
+except ImportError:
+    compiles = None
+
 if sa:
     make_url = import_make_url()
 
+    class _ValueSetValues(sa.sql.expression.Values):
+        """VALUES list of the values of a value set (see "_select_value_set_values()")."""
+
+        inherit_cache = True
+
+    @compiles(_ValueSetValues, GXSqlDialect.MYSQL.value)
+    def _compile_mysql_value_set_values(element: _ValueSetValues, compiler, **kw) -> str:
+        # MySQL table value constructors require every row to be a "ROW()".
+        (column,) = element.columns
+        rows = ", ".join(
+            f"ROW({compiler.render_literal_value(value, column.type)})"
+            for chunk in element._data
+            for (value,) in chunk
+        )
+        preparer = compiler.preparer
+        return f"(VALUES {rows}) AS {preparer.quote(element.name)} ({preparer.quote(column.name)})"
+
 
 try:
     import psycopg2  # noqa: F401
@@ -201,13 +250,79 @@ def _get_dialect_type_module(dialect):  # noqa: C901
     return dialect
 
 
+# Dialects in which batches are never copied to temporary tables (nor materialized from queries).
+_NO_TEMP_TABLE_DIALECTS = (
+    GXSqlDialect.TRINO,
+    GXSqlDialect.AWSATHENA,  # WKS 202201 - AWS Athena currently doesn't support temp_tables.
+    GXSqlDialect.CLICKHOUSE,
+    # DuckDB scans files (and DataFrames) faster than it would copy them to temp tables.
+    GXSqlDialect.DUCKDB,
+)
+
 _PERSISTED_CONNECTION_DIALECTS = (
     GXSqlDialect.SQLITE,
+    GXSqlDialect.DUCKDB,
     GXSqlDialect.MSSQL,
     GXSqlDialect.BIGQUERY,
 )
 
 
+# Dialects in which large value sets are staged in temporary lookup tables (see
+# "SqlAlchemyExecutionEngine.get_value_set_lookup()"), rather than bound as parameters.
+# Temporary tables only exist on the connection creating them, so only dialects whose
+# connection is persisted (see "SqlAlchemyExecutionEngine.get_connection()") stage value sets.
+_VALUE_SET_LOOKUP_DIALECTS = (
+    GXSqlDialect.SQLITE,
+    GXSqlDialect.DUCKDB,
+    GXSqlDialect.MSSQL,
+)
+
+# Dialects in which large value sets are looked up from VALUES lists, which inline the values as
+# the rows of a derived table (see "SqlAlchemyExecutionEngine.get_value_set_lookup()"), rather than
+# bound as parameters.  The connections of these dialects are not persisted.
+_VALUES_VALUE_SET_LOOKUP_DIALECTS = (
+    GXSqlDialect.POSTGRESQL,
+    GXSqlDialect.SNOWFLAKE,
+    GXSqlDialect.MYSQL,
+)
+
+# Most rows of a VALUES list (as Snowflake limits them); larger value sets are unions of lists.
+_VALUES_MAX_ROWS = 16384
+
+# Longest strings of a value set staged in a lookup table (as VARCHAR values)
+_VALUE_SET_LOOKUP_MAX_STRING_LENGTH = 4000
+
+
+def _get_value_set_column_type(values: List[Any]) -> Any:
+    """Type of the lookup table column of a value set (None if the value set is not staged)."""
+    if not is_stageable_value_set(values):
+        return None
+
+    if all(isinstance(value, str) for value in values):
+        max_length = max(len(value) for value in values)
+        if max_length > _VALUE_SET_LOOKUP_MAX_STRING_LENGTH:
+            return None
+        return sa.String(length=max(max_length, 1))
+
+    if all(isinstance(value, int) for value in values):
+        return sa.BigInteger()
+    # Double precision, so that (mixed integer and) float values are not rounded when staged.
+    return sa.Float(precision=53)
+
+
+def _select_value_set_values(column_type: Any, values: List[Any]) -> sqlalchemy.Selectable:
+    """Query selecting the values of a value set from (a union of) VALUES lists."""
+    selects = [
+        sa.select(
+            _ValueSetValues(sa.column("value", column_type), name="value_set", literal_binds=True)
+            .data([(value,) for value in values[start : start + _VALUES_MAX_ROWS]])
+            .c.value
+        )
+        for start in range(0, len(values), _VALUES_MAX_ROWS)
+    ]
+    return selects[0] if len(selects) == 1 else sa.union_all(*selects)
+
+
 def _dialect_requires_persisted_connection(
     connection_string: str | None = None,
     credentials: dict | None = None,
@@ -274,6 +389,13 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url (string): If neither the engines, the credentials, nor the connection_string have been provided, a \
             URL can be used to access the data. This will be overridden by all other configuration options if \
             any are provided.
+        approximate_quantiles_rank_error (float): If set, quantiles are computed from a random sample of rows \
+            on dialects without approximate percentile functions (SQLite and MySQL), with a rank error within \
+            this fraction of the number of rows (but for a probability of 1e-3). By default, they are exact.
+        reflection_cache_ttl (float): Seconds for which reflected column metadata of tables and queries is \
+            reused (None: until "invalidate_reflection_cache()" is called, 0: never). Defaults to 300.
+        value_set_lookup_threshold (int): Value sets of in-set conditions with more values than this are \
+            staged in a temporary lookup table instead of being inlined into statements. Defaults to 999.
         kwargs (dict): These will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine
 
     For example:
@@ -293,6 +415,9 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         url: Optional[str] = None,
         batch_data_dict: Optional[dict] = None,
         create_temp_table: bool = True,
+        approximate_quantiles_rank_error: Optional[float] = None,
+        reflection_cache_ttl: Optional[float] = DEFAULT_REFLECTION_CACHE_TTL,
+        value_set_lookup_threshold: int = DEFAULT_VALUE_SET_LOOKUP_THRESHOLD,
         # kwargs will be passed as optional parameters to the SQLAlchemy engine, **not** the ExecutionEngine  # noqa: E501
         **kwargs,
     ) -> None:
@@ -303,6 +428,16 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self._connection_string = connection_string
         self._url = url
         self._create_temp_table = create_temp_table
+        if approximate_quantiles_rank_error is not None and not (
+            0.0 < approximate_quantiles_rank_error < 1.0
+        ):
+            raise ValueError(  # noqa: TRY003
+                "approximate_quantiles_rank_error must be a float between 0 and 1."
+            )
+        self._approximate_quantiles_rank_error = approximate_quantiles_rank_error
+        # Value sets of more values are staged in a temporary lookup table (see
+        # "get_value_set_lookup()").
+        self.value_set_lookup_threshold = value_set_lookup_threshold
         os.environ["SF_PARTNER"] = "great_expectations_oss"  # noqa: TID251
 
         # sqlite/mssql temp tables only persist within a connection, so we need to keep the connection alive by  # noqa: E501
@@ -317,6 +452,25 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         # built-in caching.
         self._inspector = None
 
+        # Column metadata (and other reflection) of tables and queries, reused across the batches
+        # and validators of the execution engine (see "invalidate_reflection_cache()").
+        self._reflection_cache = SqlAlchemyReflectionCache(ttl=reflection_cache_ttl)
+
+        # Tables materialized from the queries of batches (see "SqlAlchemyExecutionEngine.close()"),
+        # by fingerprint of the query: the time they were created at and the table.
+        self._materialized_tables: Dict[str, Tuple[float, sqlalchemy.Table]] = {}
+
+        # Temporary lookup tables of large value sets, by fingerprint of the value set.
+        self._value_set_tables: Dict[str, sqlalchemy.Table] = {}
+
+        # Names of the DuckDB views of the files and pandas DataFrames of batches (see "close()").
+        self._duckdb_views: Set[str] = set()
+
+        # Engines created from connection parameters are shared (see "engine_registry"), except
+        # for dialects whose single persisted connection is private to the execution engine.
+        self._shared_engine = False
+        self._shared_engine_released = False
+
         if engine is not None:
             if credentials is not None:
                 logger.warning(
@@ -332,15 +486,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 url=url,
             )
 
-        # these are two backends where temp_table_creation is not supported we set the default value to False.  # noqa: E501
-        if (
-            self.dialect_name
-            in [
-                GXSqlDialect.TRINO,
-                GXSqlDialect.AWSATHENA,  # WKS 202201 - AWS Athena currently doesn't support temp_tables.  # noqa: E501
-                GXSqlDialect.CLICKHOUSE,
-            ]
-        ):
+        # these are backends where temp_table_creation is not supported we set the default value to False.  # noqa: E501
+        if self.dialect_name in _NO_TEMP_TABLE_DIALECTS:
             self._create_temp_table = False
 
         # Get the dialect **for purposes of identifying types**
@@ -380,6 +527,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             )
         elif self.dialect_name == GXSqlDialect.DATABRICKS:
             self.dialect_module = import_library_module("databricks.sqlalchemy")
+        elif self.dialect_name == GXSqlDialect.DUCKDB:
+            self.dialect_module = import_library_module("duckdb_engine")
         else:
             self.dialect_module = None
 
@@ -428,11 +577,19 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             "connection_string": connection_string,
             "url": url,
             "batch_data_dict": batch_data_dict,
+            "approximate_quantiles_rank_error": approximate_quantiles_rank_error,
             "module_name": self.__class__.__module__,
             "class_name": self.__class__.__name__,
         }
         self._config.update(kwargs)
         filter_properties_dict(properties=self._config, clean_falsy=True, inplace=True)
+        # Kept even if falsy: None and 0 differ from the defaults.
+        self._config.update(
+            {
+                "reflection_cache_ttl": reflection_cache_ttl,
+                "value_set_lookup_threshold": value_set_lookup_threshold,
+            }
+        )
 
         self._data_partitioner = SqlAlchemyDataPartitioner(dialect=self.dialect_name)
         self._data_sampler = SqlAlchemyDataSampler()
@@ -465,7 +622,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                     connection_string, **kwargs, poolclass=sqlalchemy.StaticPool
                 )
             else:
-                self.engine = sa.create_engine(connection_string, **kwargs)
+                self.engine = engine_registry.acquire(connection_string, **kwargs)
+                self._shared_engine = True
         elif url is not None:
             parsed_url = make_url(url)
             self.drivername = parsed_url.drivername
@@ -474,7 +632,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
             ):
                 self.engine = sa.create_engine(url, **kwargs, poolclass=sqlalchemy.StaticPool)
             else:
-                self.engine = sa.create_engine(url, **kwargs)
+                self.engine = engine_registry.acquire(url, **kwargs)
+                self._shared_engine = True
         else:
             raise InvalidConfigError(  # noqa: TRY003
                 "Credentials or an engine are required for a SqlAlchemyExecutionEngine."
@@ -492,6 +651,10 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def url(self) -> Optional[str]:
         return self._url
 
+    @property
+    def approximate_quantiles_rank_error(self) -> Optional[float]:
+        return self._approximate_quantiles_rank_error
+
     @property
     @override
     def dialect(self) -> sqlalchemy.Dialect:
@@ -538,7 +701,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 options, **create_engine_kwargs, poolclass=sqlalchemy.StaticPool
             )
         else:
-            engine = sa.create_engine(options, **create_engine_kwargs)
+            engine = engine_registry.acquire(options, **create_engine_kwargs)
+            self._shared_engine = True
 
         return engine
 
@@ -1056,7 +1220,8 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return resolved_metrics
 
-    def close(self) -> None:
+    @override
+    def close(self) -> None:  # noqa: C901
         """
         Note: Will 20210729
 
@@ -1073,12 +1238,27 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
         self.engine.dispose()
 
         More background can be found here: https://github.com/great-expectations/great_expectations/pull/3104/
+
+        Tables materialized from the queries of batches (with "materialization" "cached_table") are dropped.
         """  # noqa: E501
-        if self._engine_backup:
+        for fingerprint in list(self._materialized_tables):
+            self._drop_materialized_table(fingerprint=fingerprint)
+        for fingerprint in list(self._value_set_tables):
+            self._drop_table(table=self._value_set_tables.pop(fingerprint))
+        for view_name in list(self._duckdb_views):
+            self._drop_duckdb_view(view_name=view_name)
+
+        if self._shared_engine:
+            # Other holders of the engine may still be using it; it is disposed of by the registry.
+            if not self._shared_engine_released:
+                self._shared_engine_released = True
+                engine_registry.release(self._engine_backup or self.engine)
+        elif self._engine_backup:
             if self._connection:
                 self._connection.close()
             self._engine_backup.dispose()
-        else:
+        elif not engine_registry.is_registered(self.engine):
+            # Shared engines given to the execution engine are released by their holder.
             self.engine.dispose()
 
     def _get_partitioner_method(self, partitioner_method_name: str) -> Callable:
@@ -1213,6 +1393,11 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
     def get_batch_data_and_markers(
         self, batch_spec: BatchSpec
     ) -> Tuple[SqlAlchemyBatchData, BatchMarkers]:
+        if self.dialect_name == GXSqlDialect.DUCKDB and isinstance(
+            batch_spec, (PathBatchSpec, PandasBatchSpec, RuntimeDataBatchSpec)
+        ):
+            return self._get_duckdb_batch_data_and_markers(batch_spec=batch_spec)
+
         if not isinstance(batch_spec, (SqlAlchemyDatasourceBatchSpec, RuntimeQueryBatchSpec)):
             raise InvalidBatchSpecError(  # noqa: TRY003
                 f"""SqlAlchemyExecutionEngine accepts batch_spec only of type SqlAlchemyDatasourceBatchSpec or
@@ -1254,12 +1439,22 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
                 compile_kwargs={"literal_binds": True},
             )
             query_str = str(compiled_query)
-            batch_data = SqlAlchemyBatchData(
-                execution_engine=self,
-                query=query_str,
-                temp_table_schema_name=temp_table_schema_name,
-                create_temp_table=create_temp_table,
-            )
+            materialization: Optional[str] = self._get_query_materialization(batch_spec)
+            if materialization == "cached_table":
+                batch_data = self._get_materialized_query_batch_data(
+                    query=query_str,
+                    temp_table_schema_name=temp_table_schema_name,
+                    ttl=batch_spec.get("materialization_ttl"),
+                )
+            else:
+                if materialization is not None:
+                    create_temp_table = materialization == "temp"
+                batch_data = SqlAlchemyBatchData(
+                    execution_engine=self,
+                    query=query_str,
+                    temp_table_schema_name=temp_table_schema_name,
+                    create_temp_table=create_temp_table,
+                )
         elif isinstance(batch_spec, SqlAlchemyDatasourceBatchSpec):
             batch_data = SqlAlchemyBatchData(
                 execution_engine=self,
@@ -1271,6 +1466,235 @@ class SqlAlchemyExecutionEngine(ExecutionEngine):
 
         return batch_data, batch_markers
 
+    def _get_query_materialization(self, batch_spec: BatchSpec) -> Optional[str]:
+        """The "materialization" of the batch spec, or "never" if the dialect has no temp tables."""
+        materialization: Optional[str] = batch_spec.get("materialization")
+        if materialization in ("temp", "cached_table") and (
+            self.dialect_name in _NO_TEMP_TABLE_DIALECTS
+        ):
+            logger.warning(
+                f'Materialization "{materialization}" is not supported by {self.dialect_name};'
+                " the query is validated as a subquery instead."
+            )
+            return "never"
+
+        return materialization
+
+    def _get_materialized_query_batch_data(
+        self,
+        query: str,
+        temp_table_schema_name: Optional[str],
+        ttl: Optional[float],
+    ) -> SqlAlchemyBatchData:
+        """Batch data of a table materialized from the query, reusing the table if already created.
+
+        The query is materialized once per execution engine (or again, once the table is older
+        than "ttl" seconds), rather than once per batch, so that validating batches of the same
+        query with many validators (e.g., by the checkpoint run) runs the query only once.  Tables
+        materialized within a run (see "materialized_tables_scope()") are dropped as it ends.
+        """
+        fingerprint = hashlib.sha256(f"{temp_table_schema_name}|{query}".encode()).hexdigest()
+        if fingerprint in self._materialized_tables:
+            created_at, table = self._materialized_tables[fingerprint]
+            if ttl is None or time.monotonic() - created_at < ttl:
+                return SqlAlchemyBatchData(
+                    execution_engine=self, table_name=table.name, schema_name=table.schema
+                )
+            self._drop_materialized_table(fingerprint=fingerprint)
+
+        batch_data = SqlAlchemyBatchData(
+            execution_engine=self,
+            query=query,
+            temp_table_schema_name=temp_table_schema_name,
+            create_temp_table=True,
+        )
+        table = batch_data.selectable
+        self._materialized_tables[fingerprint] = (time.monotonic(), table)
+        register_materialized_table(
+            functools.partial(
+                self._drop_materialized_table_if_current, fingerprint=fingerprint, table=table
+            )
+        )
+        return batch_data
+
+    def _drop_materialized_table_if_current(
+        self, fingerprint: str, table: sqlalchemy.Table
+    ) -> None:
+        # The table may have been dropped already (see "ttl" and "close()").
+        if self._materialized_tables.get(fingerprint, (None, None))[1] is table:
+            self._drop_materialized_table(fingerprint=fingerprint)
+
+    def _drop_materialized_table(self, fingerprint: str) -> None:
+        _, table = self._materialized_tables.pop(fingerprint)
+        self.invalidate_reflection_cache(table_name=table.name, schema_name=table.schema)
+        self._drop_table(table=table)
+
+    def _drop_table(self, table: sqlalchemy.Table) -> None:
+        # Databricks "temporary tables" are temporary views.
+        stmt = (
+            sa.text(f"DROP VIEW IF EXISTS `{table.name}`")
+            if self.dialect_name == GXSqlDialect.DATABRICKS
+            else sa.schema.DropTable(table, if_exists=True)
+        )
+        try:
+            self.execute_query_in_transaction(stmt)  # type: ignore[arg-type]
+        except sqlalchemy.DatabaseError as e:
+            # Temporary tables are dropped with the session anyway.
+            logger.warning(f"Could not drop temporary table {table.name}: {e!r}")
+
+    def get_value_set_lookup(self, value_set: Iterable[Any]) -> Optional[sqlalchemy.Selectable]:
+        """Query selecting the values of a large value set from a temporary lookup table.
+
+        Conditions like "column IN (:value_1, ..., :value_n)" bind a parameter per value, so that
+        large value sets exceed the limits of drivers and databases on bound parameters (and
+        bloat the statements).  Value sets of more than "value_set_lookup_threshold" values are
+        instead inserted (once per execution engine) into a temporary table, for conditions like
+        "column IN (SELECT value FROM lookup_table)".  Dialects whose connections are not
+        persisted (PostgreSQL, Snowflake, MySQL) select the values from an inlined VALUES list
+        instead, which is planned as a (hashed) join rather than a long list of comparisons.
+
+        Args:
+            value_set: Values of the set; only sets of strings or of numbers are staged.
+
+        Returns:
+            Query selecting the values, or None if the value set is to be bound as parameters.
+        """
+        value_list: List[Any] = list(value_set)
+        if len(value_list) <= self.value_set_lookup_threshold or self.dialect_name not in (
+            *_VALUE_SET_LOOKUP_DIALECTS,
+            *_VALUES_VALUE_SET_LOOKUP_DIALECTS,
+        ):
+            return None
+
+        # Typed before dropping duplicates, which would not tell "True" and "1" apart.
+        column_type = _get_value_set_column_type(value_list)
+        if column_type is None:
+            return None
+
+        values: List[Any] = list(dict.fromkeys(value_list))
+        if self.dialect_name in _VALUES_VALUE_SET_LOOKUP_DIALECTS:
+            return _select_value_set_values(column_type=column_type, values=values)
+
+        fingerprint = hashlib.sha256(repr((str(column_type), values)).encode()).hexdigest()
+        table: Optional[sqlalchemy.Table] = self._value_set_tables.get(fingerprint)
+        if table is None:
+            table = self._create_value_set_table(column_type=column_type, values=values)
+            self._value_set_tables[fingerprint] = table
+
+        return sa.select(table.c.value)
+
+    def _create_value_set_table(self, column_type: Any, values: List[Any]) -> sqlalchemy.Table:
+        table_name = generate_temporary_table_name()
+        if self.dialect_name == GXSqlDialect.MSSQL:
+            # mssql temporary tables are named with a "#" prefix
+            table = sa.Table(f"#{table_name}", sa.MetaData(), sa.Column("value", column_type))
+        else:
+            table = sa.Table(
+                table_name,
+                sa.MetaData(),
+                sa.Column("value", column_type),
+                prefixes=["TEMPORARY"],
+            )
+
+        rows = [{"value": value} for value in values]
+        with self.get_connection() as connection:
+            if (
+                is_version_greater_or_equal(sqlalchemy.sqlalchemy.__version__, "2.0.0")
+                and not connection.closed
+            ):
+                table.create(connection)
+                connection.execute(table.insert(), rows)
+                connection.commit()
+            else:
+                with connection.begin():
+                    table.create(connection)
+                    connection.execute(table.insert(), rows)
+
+        logger.debug(f"Staged value set of {len(values)} values in {table.name}")
+        return table
+
+    @property
+    def reflection_cache(self) -> SqlAlchemyReflectionCache:
+        return self._reflection_cache
+
+    def invalidate_reflection_cache(
+        self, table_name: Optional[str] = None, schema_name: Optional[str] = None
+    ) -> None:
+        """Forgets the reflected column metadata of a table, e.g. after altering it.
+
+        Args:
+            table_name: Name of the table; if None, all tables (of the schema) are forgotten.
+            schema_name: Schema of the table; if None, tables of any schema are forgotten.
+        """
+        self._reflection_cache.invalidate(table_name=table_name, schema_name=schema_name)
+        # The inspector keeps all of its reflection, too.
+        self._inspector = None
+
+    def get_schema_names(self) -> List[str]:
+        """Schema names of the database, as reflected (and cached) by the execution engine."""
+        return self._reflection_cache.get_or_reflect(
+            key=ReflectionKey(kind="schema_names"),
+            reflect=lambda: list(self.get_inspector().get_schema_names()),
+        )
+
+    def _get_duckdb_batch_data_and_markers(
+        self, batch_spec: PathBatchSpec | PandasBatchSpec | RuntimeDataBatchSpec
+    ) -> Tuple[SqlAlchemyBatchData, BatchMarkers]:
+        """Batch data of a file or pandas DataFrame (of a pandas data asset), scanned by DuckDB.
+
+        The batch data selects from a view of the file or DataFrame.  The view is dropped once it
+        is copied into a temporary table, or else once the batch data is garbage collected (or the
+        execution engine closed), releasing the DataFrame.
+        """
+        view_name = f"gx_{uuid.uuid4().hex}"
+        if isinstance(batch_spec, RuntimeDataBatchSpec):
+            with self.get_connection() as connection:
+                register_duckdb_dataframe(
+                    connection=connection, view_name=view_name, dataframe=batch_spec.batch_data
+                )
+        else:
+            self.execute_query_in_transaction(
+                build_duckdb_create_file_view_statement(
+                    dialect=self.dialect,
+                    view_name=view_name,
+                    reader_method=batch_spec.reader_method,
+                    reader_options=batch_spec.reader_options,
+                    path=batch_spec.path if isinstance(batch_spec, PathBatchSpec) else None,
+                )
+            )
+        self._duckdb_views.add(view_name)
+
+        batch_data: SqlAlchemyBatchData
+        if batch_spec.get("create_temp_table", self._create_temp_table):
+            batch_data = SqlAlchemyBatchData(
+                execution_engine=self,
+                selectable=sa.select(sa.text("*")).select_from(sa.table(view_name)),
+                create_temp_table=True,
+            )
+            self._drop_duckdb_view(view_name=view_name)
+        else:
+            # Views are reflected like tables.
+            batch_data = SqlAlchemyBatchData(execution_engine=self, table_name=view_name)
+            finalizer = weakref.finalize(batch_data, self._drop_duckdb_view, view_name=view_name)
+            finalizer.atexit = False
+
+        batch_markers = BatchMarkers(
+            {
+                "ge_load_time": datetime.datetime.now(datetime.timezone.utc).strftime(
+                    "%Y%m%dT%H%M%S.%fZ"
+                )
+            }
+        )
+        return batch_data, batch_markers
+
+    def _drop_duckdb_view(self, view_name: str) -> None:
+        if view_name not in self._duckdb_views:
+            return  # already dropped (e.g. by "close()")
+        self._duckdb_views.discard(view_name)
+        self.execute_query_in_transaction(
+            build_duckdb_drop_view_statement(dialect=self.dialect, view_name=view_name)
+        )
+
     def get_inspector(self) -> sqlalchemy.engine.reflection.Inspector:
         if self._inspector is None:
             if version.parse(sa.__version__) < version.parse("1.4"):
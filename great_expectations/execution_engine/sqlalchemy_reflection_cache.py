@@ -0,0 +1,103 @@
+"""Cache of database reflection (e.g. column metadata of tables and queries) per execution engine.
+
+Resolving "table.column_types" or "table.columns" reflects the columns of the table (or query) of
+the batch, with catalog queries or, if reflection fails, by running the query of the batch.  An
+execution engine is shared by the validators of a datasource, so the same table is otherwise
+reflected again for every batch, expectation suite and metric run validated with it.
+
+Reflected metadata is kept for "ttl" seconds (or until invalidated), keyed by the schema and name
+of the table, or by the fingerprint of the query.
+
+    Typical usage example:
+        columns = reflection_cache.get_or_reflect(
+            key=ReflectionKey.for_table("columns", table_name="my_table", schema_name="public"),
+            reflect=lambda: inspector.get_columns("my_table", schema="public"),
+        )
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, NamedTuple, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Seconds for which reflected metadata is reused by default
+DEFAULT_REFLECTION_CACHE_TTL = 300
+
+
+class ReflectionKey(NamedTuple):
+    # What is reflected (e.g. "columns" or "schema_names")
+    kind: str
+    schema_name: Optional[str] = None
+    table_name: Optional[str] = None
+    query_fingerprint: Optional[str] = None
+
+    @classmethod
+    def for_table(
+        cls, kind: str, table_name: str, schema_name: Optional[str] = None
+    ) -> ReflectionKey:
+        return cls(kind=kind, schema_name=schema_name, table_name=table_name)
+
+    @classmethod
+    def for_query(cls, kind: str, query: str) -> ReflectionKey:
+        return cls(kind=kind, query_fingerprint=hashlib.sha256(query.encode()).hexdigest())
+
+
+class SqlAlchemyReflectionCache:
+    """Reflected database metadata, kept for "ttl" seconds (None: until invalidated)."""
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._entries: Dict[ReflectionKey, Tuple[float, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get_or_reflect(self, key: ReflectionKey, reflect: Callable[[], T]) -> T:
+        """Returns the cached metadata of the key, reflecting (and caching) it if not cached.
+
+        Exceptions raised by "reflect" are not cached.
+        """
+        if self.ttl is not None and self.ttl <= 0:
+            return reflect()
+
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is not None:
+            reflected_at, value = entry
+            if self.ttl is None or time.monotonic() - reflected_at < self.ttl:
+                return value
+
+        value = reflect()
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+
+        return value
+
+    def invalidate(
+        self, table_name: Optional[str] = None, schema_name: Optional[str] = None
+    ) -> None:
+        """Forgets reflected metadata of a table (of any schema, if schema_name is None).
+
+        Without a table_name, metadata of all tables (of the schema, if given) is forgotten.
+        Metadata of queries, and of the database as a whole (e.g. its schema names), is always
+        forgotten, since it may depend on any table.
+        """
+        with self._lock:
+            self._entries = {
+                key: entry
+                for key, entry in self._entries.items()
+                if key.table_name is not None
+                and not (
+                    (table_name is None or key.table_name == table_name)
+                    and (schema_name is None or key.schema_name == schema_name)
+                )
+            }
+        logger.debug(f"Invalidated reflection of table {table_name} (schema {schema_name})")
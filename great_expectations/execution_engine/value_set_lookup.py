@@ -0,0 +1,85 @@
+"""Large value sets of in-set conditions, staged once for lookups.
+
+Conditions like "column_values.in_set" build a hash table of their value set for every batch they
+are evaluated on (pandas "Series.isin()"), or inline the values into the query plan (Spark
+"Column.isin()").  Value sets of many values (e.g. millions of reference IDs) are instead staged
+once, as a hashed pandas Index or a Spark array literal, and reused for the batches of a
+validation run; the most recently used value sets are kept.
+
+    Typical usage example:
+        staged_value_sets = StagedValueSets()
+        index = staged_value_sets.get_or_stage(values=value_list, stage=pd.Index)
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Generic, List, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Value sets kept staged by an execution engine (the least recently used ones are released)
+DEFAULT_MAX_STAGED_VALUE_SETS = 8
+
+# Value sets of more values are staged by default (SQLite used to limit statements to 999 bound
+# parameters).
+DEFAULT_VALUE_SET_LOOKUP_THRESHOLD = 999
+
+
+def is_stageable_value_set(values: List[Any]) -> bool:
+    """Whether a value set compares alike when staged: only strings, or only (non-bool) numbers.
+
+    Value sets with None or NaN values are not staged: "x NOT IN (..., NULL)" is never true, NaN
+    compares unequal to itself in SQL and Spark, and NaN values make a pandas Index non-unique.
+    """
+    if all(isinstance(value, str) for value in values):
+        return True
+
+    return all(
+        isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and not (isinstance(value, float) and math.isnan(value))
+        for value in values
+    )
+
+
+class StagedValueSets(Generic[T]):
+    """Staged value sets, by their values (compared, not fingerprinted, on lookup)."""
+
+    def __init__(self, max_size: int = DEFAULT_MAX_STAGED_VALUE_SETS) -> None:
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        # By hash of the values: the values (to tell colliding value sets apart) and staged set
+        self._staged: OrderedDict[int, Tuple[Tuple[Any, ...], T]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._staged)
+
+    def get_or_stage(self, values: List[Any], stage: Callable[[List[Any]], T]) -> T:
+        """Returns the staged value set of the values, staging it with "stage" if not staged yet."""
+        values_tuple: Tuple[Any, ...] = tuple(values)
+        key = hash(values_tuple)
+        with self._lock:
+            entry = self._staged.get(key)
+            if entry is not None and entry[0] == values_tuple:
+                self._staged.move_to_end(key)
+                return entry[1]
+
+        staged = stage(list(dict.fromkeys(values)))
+        logger.debug(f"Staged value set of {len(values_tuple)} values")
+        with self._lock:
+            self._staged[key] = (values_tuple, staged)
+            self._staged.move_to_end(key)
+            while len(self._staged) > self._max_size:
+                self._staged.popitem(last=False)
+
+        return staged
+
+    def clear(self) -> None:
+        with self._lock:
+            self._staged.clear()
@@ -1,59 +1,77 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, List
+
+from great_expectations.expectations import core
 from great_expectations.expectations.expectation import Expectation
 
-from .core import (
-    ExpectColumnDistinctValuesToBeInSet,
-    ExpectColumnDistinctValuesToContainSet,
-    ExpectColumnDistinctValuesToEqualSet,
-    ExpectColumnKLDivergenceToBeLessThan,
-    ExpectColumnMaxToBeBetween,
-    ExpectColumnMeanToBeBetween,
-    ExpectColumnMedianToBeBetween,
-    ExpectColumnMinToBeBetween,
-    ExpectColumnMostCommonValueToBeInSet,
-    ExpectColumnPairValuesAToBeGreaterThanB,
-    ExpectColumnPairValuesToBeEqual,
-    ExpectColumnPairValuesToBeInSet,
-    ExpectColumnProportionOfUniqueValuesToBeBetween,
-    ExpectColumnQuantileValuesToBeBetween,
-    ExpectColumnStdevToBeBetween,
-    ExpectColumnSumToBeBetween,
-    ExpectColumnToExist,
-    ExpectColumnUniqueValueCountToBeBetween,
-    ExpectColumnValueLengthsToBeBetween,
-    ExpectColumnValueLengthsToEqual,
-    ExpectColumnValuesToBeBetween,
-    ExpectColumnValuesToBeDateutilParseable,
-    ExpectColumnValuesToBeDecreasing,
-    ExpectColumnValuesToBeIncreasing,
-    ExpectColumnValuesToBeInSet,
-    ExpectColumnValuesToBeInTypeList,
-    ExpectColumnValuesToBeJsonParseable,
-    ExpectColumnValuesToBeNull,
-    ExpectColumnValuesToBeOfType,
-    ExpectColumnValuesToBeUnique,
-    ExpectColumnValuesToMatchJsonSchema,
-    ExpectColumnValuesToMatchLikePattern,
-    ExpectColumnValuesToMatchLikePatternList,
-    ExpectColumnValuesToMatchRegex,
-    ExpectColumnValuesToMatchRegexList,
-    ExpectColumnValuesToMatchStrftimeFormat,
-    ExpectColumnValuesToNotBeInSet,
-    ExpectColumnValuesToNotBeNull,
-    ExpectColumnValuesToNotMatchLikePattern,
-    ExpectColumnValuesToNotMatchLikePatternList,
-    ExpectColumnValuesToNotMatchRegex,
-    ExpectColumnValuesToNotMatchRegexList,
-    ExpectColumnValueZScoresToBeLessThan,
-    ExpectCompoundColumnsToBeUnique,
-    ExpectMulticolumnSumToEqual,
-    ExpectMulticolumnValuesToBeUnique,
-    ExpectSelectColumnValuesToBeUniqueWithinRecord,
-    ExpectTableColumnCountToBeBetween,
-    ExpectTableColumnCountToEqual,
-    ExpectTableColumnsToMatchOrderedList,
-    ExpectTableColumnsToMatchSet,
-    ExpectTableRowCountToBeBetween,
-    ExpectTableRowCountToEqual,
-    ExpectTableRowCountToEqualOtherTable,
-    UnexpectedRowsExpectation,
-)
+if TYPE_CHECKING:
+    from .core import (
+        ExpectColumnDistinctValuesToBeInSet,
+        ExpectColumnDistinctValuesToContainSet,
+        ExpectColumnDistinctValuesToEqualSet,
+        ExpectColumnKLDivergenceToBeLessThan,
+        ExpectColumnMaxToBeBetween,
+        ExpectColumnMeanToBeBetween,
+        ExpectColumnMedianToBeBetween,
+        ExpectColumnMinToBeBetween,
+        ExpectColumnMostCommonValueToBeInSet,
+        ExpectColumnPairValuesAToBeGreaterThanB,
+        ExpectColumnPairValuesToBeEqual,
+        ExpectColumnPairValuesToBeInSet,
+        ExpectColumnProportionOfUniqueValuesToBeBetween,
+        ExpectColumnQuantileValuesToBeBetween,
+        ExpectColumnStdevToBeBetween,
+        ExpectColumnSumToBeBetween,
+        ExpectColumnToExist,
+        ExpectColumnUniqueValueCountToBeBetween,
+        ExpectColumnValueLengthsToBeBetween,
+        ExpectColumnValueLengthsToEqual,
+        ExpectColumnValuesToBeBetween,
+        ExpectColumnValuesToBeDateutilParseable,
+        ExpectColumnValuesToBeDecreasing,
+        ExpectColumnValuesToBeIncreasing,
+        ExpectColumnValuesToBeInSet,
+        ExpectColumnValuesToBeInTypeList,
+        ExpectColumnValuesToBeJsonParseable,
+        ExpectColumnValuesToBeNull,
+        ExpectColumnValuesToBeOfType,
+        ExpectColumnValuesToBeUnique,
+        ExpectColumnValuesToMatchJsonSchema,
+        ExpectColumnValuesToMatchLikePattern,
+        ExpectColumnValuesToMatchLikePatternList,
+        ExpectColumnValuesToMatchRegex,
+        ExpectColumnValuesToMatchRegexList,
+        ExpectColumnValuesToMatchStrftimeFormat,
+        ExpectColumnValuesToNotBeInSet,
+        ExpectColumnValuesToNotBeNull,
+        ExpectColumnValuesToNotMatchLikePattern,
+        ExpectColumnValuesToNotMatchLikePatternList,
+        ExpectColumnValuesToNotMatchRegex,
+        ExpectColumnValuesToNotMatchRegexList,
+        ExpectColumnValueZScoresToBeLessThan,
+        ExpectCompoundColumnsToBeUnique,
+        ExpectMulticolumnSumToEqual,
+        ExpectMulticolumnValuesToBeUnique,
+        ExpectSelectColumnValuesToBeUniqueWithinRecord,
+        ExpectTableColumnCountToBeBetween,
+        ExpectTableColumnCountToEqual,
+        ExpectTableColumnsToMatchOrderedList,
+        ExpectTableColumnsToMatchSet,
+        ExpectTableRowCountToBeBetween,
+        ExpectTableRowCountToEqual,
+        ExpectTableRowCountToEqualOtherTable,
+        UnexpectedRowsExpectation,
+    )
+
+
+def __getattr__(name: str) -> Any:
+    # Core Expectations are imported on first access (see "great_expectations.expectations.core").
+    if name in core.__all__:
+        return getattr(core, name)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")  # noqa: TRY003
+
+
+def __dir__() -> List[str]:
+    return sorted({*globals(), *core.__all__})
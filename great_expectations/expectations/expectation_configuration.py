@@ -526,7 +526,8 @@ class ExpectationConfigurationSchema(Schema):
 
     @pre_dump
     def convert_result_to_serializable(self, data, **kwargs):
-        data = copy.deepcopy(data)
+        # The kwargs are converted into new objects, so a shallow copy leaves the original intact.
+        data = copy.copy(data)
         data["kwargs"] = convert_to_json_serializable(data.get("kwargs", {}))
         return data
 
@@ -534,7 +535,6 @@ class ExpectationConfigurationSchema(Schema):
     def clean_null_attrs(self, data: dict, **kwargs: dict) -> dict:
         """Removes the attributes in ExpectationConfigurationSchema.REMOVE_KEYS_IF_NONE during serialization if
         their values are None."""  # noqa: E501
-        data = copy.deepcopy(data)
         for key in ExpectationConfigurationSchema.REMOVE_KEYS_IF_NONE:
             if key in data and data[key] is None:
                 data.pop(key)
@@ -2,8 +2,19 @@ from __future__ import annotations
 
 import logging
 from functools import wraps
-from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Type, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    ClassVar,
+    Dict,
+    Iterable,
+    Optional,
+    Type,
+    Union,
+)
 
+import great_expectations.exceptions as gx_exceptions
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
@@ -31,10 +42,15 @@ from great_expectations.validator.metric_configuration import MetricConfiguratio
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from great_expectations.compatibility import sqlalchemy
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
+    from great_expectations.expectations.metrics.partial_aggregate_state import (
+        PartialAggregateState,
+    )
 
 
 def column_aggregate_value(
@@ -263,6 +279,10 @@ class ColumnAggregateMetricProvider(TableMetricProvider):
     In some cases, subclasses of MetricProvider, such as ColumnAggregateMetricProvider, will already
     have correct values that may simply be inherited by Metric classes.
 
+    Metrics that can be computed over independent chunks of a batch and merged exactly declare a
+    `partial_state_type` and implement `get_partial_state` and `finalize_partial_state`; see
+    `resolve_from_chunks`.
+
     ---Documentation---
         - https://docs.greatexpectations.io/docs/guides/expectations/creating_custom_expectations/how_to_create_custom_column_aggregate_expectations
     """
@@ -275,6 +295,64 @@ class ColumnAggregateMetricProvider(TableMetricProvider):
         "condition_parser",
     )
     filter_column_isnull = False
+    partial_state_type: ClassVar[Optional[Type[PartialAggregateState]]] = None
+
+    @classmethod
+    def supports_partial_state(cls) -> bool:
+        """Whether this metric can be computed from merged partial states of chunks of a batch."""
+        return cls.partial_state_type is not None
+
+    @classmethod
+    def get_partial_state(cls, column: pd.Series, **metric_value_kwargs) -> PartialAggregateState:
+        """Compute the partial state of this metric over one chunk of a column.
+
+        Args:
+            column: The chunk of the column; nulls are already removed if `filter_column_isnull`.
+            **metric_value_kwargs: The value kwargs of the metric being computed.
+
+        Returns:
+            A partial state of type `partial_state_type`.
+        """
+        raise gx_exceptions.MetricProviderError(  # noqa: TRY003
+            f"{cls.metric_name} does not support partial aggregate states"
+        )
+
+    @classmethod
+    def combine_partial_states(
+        cls, states: Iterable[PartialAggregateState]
+    ) -> PartialAggregateState:
+        """Merge partial states computed over disjoint chunks of the same column."""
+        if cls.partial_state_type is None:
+            raise gx_exceptions.MetricProviderError(  # noqa: TRY003
+                f"{cls.metric_name} does not support partial aggregate states"
+            )
+
+        return cls.partial_state_type.combine(states)
+
+    @classmethod
+    def finalize_partial_state(cls, state: PartialAggregateState, **metric_value_kwargs) -> Any:
+        """Turn a (merged) partial state into the value of this metric."""
+        raise gx_exceptions.MetricProviderError(  # noqa: TRY003
+            f"{cls.metric_name} does not support partial aggregate states"
+        )
+
+    @classmethod
+    def resolve_from_chunks(cls, columns: Iterable[pd.Series], **metric_value_kwargs) -> Any:
+        """Compute this metric over a column supplied as an iterable of chunks.
+
+        Each chunk is reduced to a partial state as it is consumed, so only one chunk needs to be
+        held in memory at a time.  The result matches computing the metric over the concatenated column.
+        """  # noqa: E501
+        states = (
+            cls.get_partial_state(
+                column=column[column.notnull()] if cls.filter_column_isnull else column,
+                **metric_value_kwargs,
+            )
+            for column in columns
+        )
+        return cls.finalize_partial_state(
+            state=cls.combine_partial_states(states), **metric_value_kwargs
+        )
 
     @classmethod
     @override
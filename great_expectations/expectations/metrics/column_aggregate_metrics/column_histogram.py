@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import copy
 import logging
-from typing import TYPE_CHECKING, Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 import numpy as np
 
@@ -127,6 +127,14 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
                 list(execution_engine.execute_query(query).fetchone())  # type: ignore[arg-type]
             )
 
+        if len(bins) > 2:  # noqa: PLR2004
+            return _get_bucketed_histogram(
+                execution_engine=execution_engine,
+                selectable=selectable,
+                column=column,
+                bins=bins,
+            )
+
         idx = 0
 
         # If we have an infinite lower bound, don't express that in sql
@@ -279,3 +287,143 @@ class ColumnHistogram(ColumnAggregateMetricProvider):
                 logger.warning("Discarding histogram values above highest bin.")
 
         return hist
+
+
+def _get_bucketed_histogram(
+    execution_engine: SqlAlchemyExecutionEngine,
+    selectable: sa.sql.Selectable,
+    column: str,
+    bins: List[float],
+) -> List[int]:
+    """Counts the non-null values of "column" in each bin, using numpy histogram bin semantics.
+
+    Every row is assigned the id of its bin by a single expression (see "_get_bucket_expression"),
+    and rows are counted with one "GROUP BY" on that id, rather than with one "SUM(CASE ...)" per bin.
+    """  # noqa: E501
+    bucket = _get_bucket_expression(column=sa.column(column), bins=bins).label("bucket")
+    buckets = (
+        sa.select(bucket)
+        .where(
+            sa.column(column) != None,  # noqa: E711
+        )
+        .select_from(selectable)  # type: ignore[arg-type]
+        .subquery()
+    )
+    query = sa.select(buckets.c.bucket, sa.func.count().label("count")).group_by(buckets.c.bucket)
+
+    hist: List[int] = [0] * (len(bins) - 1)
+    for bucket_id, count in execution_engine.execute_query(query).fetchall():  # type: ignore[arg-type]
+        # Values outside of the range of the bins have no bucket, and are discarded.
+        if bucket_id is not None:
+            hist[int(bucket_id)] = int(count)
+
+    return hist
+
+
+def _get_bucket_expression(column: sa.ColumnClause, bins: List[float]) -> sa.Case:
+    """Returns the index of the bin of "column", or NULL if it lies outside of the range of the bins.
+
+    Bins are half-open ("bins[i] <= column < bins[i + 1]"), except for the last one, which also
+    includes its upper edge.  Infinite outer edges are not compared against.  Between the finite
+    edges, evenly spaced bins are found by arithmetic, and other bins by a binary search, so that
+    the cost per row does not grow with the number of bins.
+    """  # noqa: E501
+    lower_unbounded: bool = _is_infinite(bins[0], negative=True)
+    upper_unbounded: bool = _is_infinite(bins[-1], negative=False)
+    edges: List[float] = [
+        float(edge) for edge in bins[int(lower_unbounded) : len(bins) - int(upper_unbounded)]
+    ]
+    offset = int(lower_unbounded)
+    last_bucket = len(bins) - 2
+
+    whens: list = [
+        (column < edges[0], _bucket_id(0) if lower_unbounded else sa.null()),
+    ]
+    if upper_unbounded:
+        whens.append((column >= edges[-1], _bucket_id(last_bucket)))
+    else:
+        whens.append((column > edges[-1], sa.null()))
+        whens.append((column == edges[-1], _bucket_id(last_bucket)))
+
+    if len(edges) == 1:
+        return sa.case(*whens)
+
+    width: Optional[float] = _get_uniform_bin_width(edges=edges)
+    if width is None:
+        inner_bucket = _binary_search_bucket(
+            column=column, edges=edges, first=0, last=len(edges) - 1, offset=offset
+        )
+    else:
+        inner_bucket = _arithmetic_bucket(column=column, edges=edges, width=width, offset=offset)
+
+    return sa.case(*whens, else_=inner_bucket)
+
+
+def _get_uniform_bin_width(edges: List[float]) -> Optional[float]:
+    """Returns the width of the bins if every edge but the last is "edges[0] + i * width" exactly.
+
+    This is how "numpy.linspace" computes edges, so that the edges recomputed in SQL are identical.
+    """
+    width: float = (edges[-1] - edges[0]) / (len(edges) - 1)
+    if not width > 0:
+        return None
+
+    if all(edges[0] + idx * width == edge for idx, edge in enumerate(edges[:-1])):
+        return width
+
+    return None
+
+
+def _arithmetic_bucket(
+    column: sa.ColumnClause, edges: List[float], width: float, offset: int
+) -> sa.Case:
+    """Bucket of a value between the first and last edges of evenly spaced bins.
+
+    Casting to an integer truncates on some dialects and rounds on others, and floating point
+    division may be off near an edge; either way, the estimate is off by at most one bin, which is
+    corrected by comparing the value with the (exact) edges of the estimated bin.
+    """
+    estimate = sa.cast((column - edges[0]) / width, sa.Integer)
+    corrected = sa.case(
+        (column < edges[0] + estimate * width, estimate - 1),
+        (column >= edges[0] + (estimate + 1) * width, estimate + 1),
+        else_=estimate,
+    )
+    # The last edge is the upper bound of the range itself, rather than "edges[0] + n * width".
+    last_inner_bucket: int = len(edges) - 2
+    return sa.case(
+        (corrected > last_inner_bucket, _bucket_id(last_inner_bucket + offset)),
+        else_=corrected + offset,
+    )
+
+
+def _binary_search_bucket(
+    column: sa.ColumnClause, edges: List[float], first: int, last: int, offset: int
+):
+    """Bucket of a value in "[edges[first], edges[last])", found with nested "CASE" expressions."""
+    if last - first == 1:
+        return _bucket_id(first + offset)
+
+    middle = (first + last) // 2
+    return sa.case(
+        (
+            column < edges[middle],
+            _binary_search_bucket(
+                column=column, edges=edges, first=first, last=middle, offset=offset
+            ),
+        ),
+        else_=_binary_search_bucket(
+            column=column, edges=edges, first=middle, last=last, offset=offset
+        ),
+    )
+
+
+def _bucket_id(idx: int):
+    # Rendered inline, to keep the number of bound parameters independent of the number of bins.
+    return sa.literal_column(str(idx))
+
+
+def _is_infinite(edge: float, negative: bool) -> bool:
+    return edge == get_sql_dialect_floating_point_infinity_value(
+        schema="api_np", negative=negative
+    ) or edge == get_sql_dialect_floating_point_infinity_value(schema="api_cast", negative=negative)
@@ -1,7 +1,12 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -12,11 +17,16 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_partial,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.partial_aggregate_state import MinMaxState
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 class ColumnMax(ColumnAggregateMetricProvider):
     metric_name = "column.max"
     value_keys = ()
+    partial_state_type = MinMaxState
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
@@ -29,3 +39,15 @@ class ColumnMax(ColumnAggregateMetricProvider):
     @column_aggregate_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
         return F.max(column)
+
+    @classmethod
+    @override
+    def get_partial_state(cls, column: pd.Series, **metric_value_kwargs) -> MinMaxState:
+        return MinMaxState.from_series(column)
+
+    @classmethod
+    @override
+    def finalize_partial_state(  # type: ignore[override]
+        cls, state: MinMaxState, **metric_value_kwargs
+    ) -> Any:
+        return np.nan if state.max is None else state.max
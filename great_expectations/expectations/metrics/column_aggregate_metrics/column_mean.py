@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
+import numpy as np
+
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.pyspark import types
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -13,13 +18,18 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_partial,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.partial_aggregate_state import MomentsState
 from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class ColumnMean(ColumnAggregateMetricProvider):
     """MetricProvider Class for Aggregate Mean MetricProvider"""
 
     metric_name = "column.mean"
+    partial_state_type = MomentsState
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
@@ -48,3 +58,17 @@ class ColumnMean(ColumnAggregateMetricProvider):
                 f"Expected numeric column type for function mean(). Recieved type: {column_data_type}"  # noqa: E501
             )
         return F.mean(column)
+
+    @classmethod
+    @override
+    def get_partial_state(cls, column: pd.Series, **metric_value_kwargs) -> MomentsState:
+        """Pandas Mean partial state over one chunk of a column"""
+        return MomentsState.from_series(convert_pandas_series_decimal_to_float_dtype(data=column))
+
+    @classmethod
+    @override
+    def finalize_partial_state(  # type: ignore[override]
+        cls, state: MomentsState, **metric_value_kwargs
+    ) -> float:
+        """Mean from merged partial states"""
+        return state.mean if state.count > 0 else np.nan
@@ -18,6 +18,9 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.partial_aggregate_state import (
+    QuantileSketchState,
+)
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
@@ -32,6 +35,7 @@ class ColumnMedian(ColumnAggregateMetricProvider):
     """MetricProvider Class for Aggregate Mean MetricProvider"""
 
     metric_name = "column.median"
+    partial_state_type = QuantileSketchState
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
@@ -40,6 +44,22 @@ class ColumnMedian(ColumnAggregateMetricProvider):
         column_nonnull_elements: pd.Series = column[~column_null_elements_cond]
         return column_nonnull_elements.median()
 
+    @classmethod
+    @override
+    def get_partial_state(
+        cls, column: pd.Series, sketch_size: Optional[int] = None, **metric_value_kwargs
+    ) -> QuantileSketchState:
+        """Pandas Median partial state over one chunk of a column (approximate if sketch_size)"""
+        return QuantileSketchState.from_series(column, max_size=sketch_size)
+
+    @classmethod
+    @override
+    def finalize_partial_state(  # type: ignore[override]
+        cls, state: QuantileSketchState, **metric_value_kwargs
+    ) -> Any:
+        """Median from the merged sketch; exact unless the sketch has been compacted."""
+        return state.quantiles([0.5], interpolation="linear")[0]
+
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
         cls,
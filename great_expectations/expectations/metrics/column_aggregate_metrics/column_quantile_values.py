@@ -3,9 +3,10 @@ from __future__ import annotations
 import ast
 import itertools
 import logging
+import math
 import traceback
 from collections.abc import Iterable
-from typing import Any
+from typing import TYPE_CHECKING, Any, Optional, Tuple
 
 import numpy as np
 
@@ -13,6 +14,7 @@ from great_expectations.compatibility import sqlalchemy, trino
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -26,30 +28,53 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_value,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.partial_aggregate_state import (
+    QuantileSketchState,
+)
 from great_expectations.expectations.metrics.util import attempt_allowing_relative_error
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Probability that some approximate quantile exceeds the configured rank error (for dialects that
+# compute approximate quantiles from a sample of rows; see "_get_approximate_quantiles_sample").
+APPROXIMATE_QUANTILES_FAILURE_PROBABILITY = 1.0e-3
+
+# The first version of SQLite to support window functions.
+_SQLITE_WINDOW_FUNCTIONS_VERSION = (3, 25, 0)
+
 
 class ColumnQuantileValues(ColumnAggregateMetricProvider):
     metric_name = "column.quantile_values"
     value_keys = ("quantiles", "allow_relative_error")
 
+    partial_state_type = QuantileSketchState
+
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, quantiles, allow_relative_error, **kwargs):
         """Quantile Function"""
-        interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
-
-        if not allow_relative_error:
-            allow_relative_error = "nearest"
-
-        if allow_relative_error not in interpolation_options:
-            raise ValueError(  # noqa: TRY003
-                f"If specified for pandas, allow_relative_error must be one an allowed value for the 'interpolation'"  # noqa: E501
-                f"parameter of .quantile() (one of {interpolation_options})"
-            )
-
-        return column.quantile(quantiles, interpolation=allow_relative_error).tolist()
+        interpolation = _get_pandas_quantile_interpolation(allow_relative_error)
+        return column.quantile(quantiles, interpolation=interpolation).tolist()
+
+    @classmethod
+    @override
+    def get_partial_state(
+        cls, column: pd.Series, sketch_size: Optional[int] = None, **metric_value_kwargs
+    ) -> QuantileSketchState:
+        return QuantileSketchState.from_series(column, max_size=sketch_size)
+
+    @classmethod
+    @override
+    def finalize_partial_state(  # type: ignore[override]
+        cls, state: QuantileSketchState, **metric_value_kwargs
+    ) -> list:
+        """Quantiles from the merged sketch; exact unless the sketch has been compacted."""
+        interpolation = _get_pandas_quantile_interpolation(
+            metric_value_kwargs.get("allow_relative_error")
+        )
+        return state.quantiles(metric_value_kwargs["quantiles"], interpolation=interpolation)
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(  # noqa: C901, PLR0911
@@ -88,10 +113,16 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
                 execution_engine=execution_engine,
             )
         elif dialect_name == GXSqlDialect.MYSQL:
+            sample = _get_approximate_quantiles_sample(
+                column=column,
+                selectable=selectable,
+                table_row_count=table_row_count,
+                execution_engine=execution_engine,
+            )
             return _get_column_quantiles_mysql(
                 column=column,
                 quantiles=quantiles,
-                selectable=selectable,
+                selectable=selectable if sample is None else sample[0],
                 execution_engine=execution_engine,
             )
         elif dialect_name.lower() == GXSqlDialect.CLICKHOUSE:
@@ -125,6 +156,25 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
                 execution_engine=execution_engine,
             )
         elif dialect_name == GXSqlDialect.SQLITE:
+            server_version_info = execution_engine.engine.dialect.server_version_info
+            if server_version_info and server_version_info < _SQLITE_WINDOW_FUNCTIONS_VERSION:
+                return _get_column_quantiles_sqlite_by_offset(
+                    column=column,
+                    quantiles=quantiles,
+                    selectable=selectable,
+                    execution_engine=execution_engine,
+                    table_row_count=table_row_count,
+                )
+
+            sample = _get_approximate_quantiles_sample(
+                column=column,
+                selectable=selectable,
+                table_row_count=table_row_count,
+                execution_engine=execution_engine,
+            )
+            if sample is not None:
+                selectable, table_row_count = sample
+
             return _get_column_quantiles_sqlite(
                 column=column,
                 quantiles=quantiles,
@@ -183,6 +233,21 @@ class ColumnQuantileValues(ColumnAggregateMetricProvider):
         return df.approxQuantile(column, list(quantiles), allow_relative_error)  # type: ignore[attr-defined]
 
 
+def _get_pandas_quantile_interpolation(allow_relative_error: Any) -> str:
+    interpolation_options = ("linear", "lower", "higher", "midpoint", "nearest")
+
+    if not allow_relative_error:
+        allow_relative_error = "nearest"
+
+    if allow_relative_error not in interpolation_options:
+        raise ValueError(  # noqa: TRY003
+            f"If specified for pandas, allow_relative_error must be one an allowed value for the 'interpolation'"  # noqa: E501
+            f"parameter of .quantile() (one of {interpolation_options})"
+        )
+
+    return allow_relative_error
+
+
 def _get_column_quantiles_mssql(
     column, quantiles: Iterable, selectable, execution_engine: SqlAlchemyExecutionEngine
 ) -> list:
@@ -230,6 +295,8 @@ def _get_column_quantiles_mysql(
 ) -> list:
     # MySQL does not support "percentile_disc", so we implement it as a compound query.
     # Please see https://stackoverflow.com/questions/19770026/calculate-percentile-value-using-mysql for reference.  # noqa: E501
+    # Rows are ranked once; the value of every quantile is then the greatest value whose percent
+    # rank does not exceed that quantile, all of which are computed in a single aggregation.
     percent_rank_query: sqlalchemy.CTE = (
         sa.select(
             column,
@@ -238,34 +305,27 @@ def _get_column_quantiles_mysql(
                 sa.dialects.mysql.DECIMAL(18, 15),
             ).label("p"),
         )
-        .order_by(sa.column("p").asc())
         .select_from(selectable)
         .cte("t")
     )
 
-    selects: list[sqlalchemy.WithinGroup] = []
+    selects: list[sqlalchemy.Label] = []
     for idx, quantile in enumerate(quantiles):
         # pymysql cannot handle conversion of numpy float64 to float; convert just in case
         if np.issubdtype(type(quantile), np.double):
             quantile = float(quantile)  # noqa: PLW2901
-        quantile_column: sqlalchemy.Label = (
-            sa.func.first_value(column)
-            .over(
-                order_by=sa.case(
-                    (
-                        percent_rank_query.columns.p
-                        <= sa.cast(quantile, sa.dialects.mysql.DECIMAL(18, 15)),
-                        percent_rank_query.columns.p,
-                    ),
-                    else_=None,
-                ).desc()
+        quantile_column: sqlalchemy.Label = sa.func.max(
+            sa.case(
+                (
+                    percent_rank_query.columns.p
+                    <= sa.cast(quantile, sa.dialects.mysql.DECIMAL(18, 15)),
+                    percent_rank_query.columns[column.name],
+                ),
+                else_=None,
             )
-            .label(f"q_{idx}")
-        )
-        selects.append(quantile_column)  # type: ignore[arg-type]
-    quantiles_query: sqlalchemy.Select = (
-        sa.select(*selects).distinct().order_by(percent_rank_query.columns.p.desc())
-    )
+        ).label(f"q_{idx}")
+        selects.append(quantile_column)
+    quantiles_query: sqlalchemy.Select = sa.select(*selects).select_from(percent_rank_query)
 
     try:
         quantiles_results = execution_engine.execute_query(quantiles_query).fetchone()
@@ -324,10 +384,60 @@ def _get_column_quantiles_sqlite(
     table_row_count,
 ) -> list:
     """
-    The present implementation is somewhat inefficient, because it requires as many calls to
-    "execution_engine.execute_query()" as the number of partitions in the "quantiles" parameter (albeit, typically,
-    only a few).  However, this is the only mechanism available for SQLite at the present time (11/17/2021), because
-    the analytical processing is not a very strongly represented capability of the SQLite database management system.
+    Rows are numbered once in ascending order (using the "ROW_NUMBER" window function), and the value at the offset of
+    every quantile is picked in the same pass, as the greatest value numbered at or before that offset.
+    """  # noqa: E501
+    ranked_query: sqlalchemy.Subquery = (
+        sa.select(
+            column,
+            sa.func.row_number().over(order_by=column.asc()).label("row_number"),
+        )
+        .select_from(selectable)
+        .subquery()
+    )
+
+    selects: list[sqlalchemy.Label] = []
+    for idx, offset in enumerate(_get_quantile_offsets(quantiles, table_row_count)):
+        selects.append(
+            sa.func.max(
+                sa.case(
+                    (
+                        ranked_query.columns.row_number <= offset + 1,
+                        ranked_query.columns[column.name],
+                    ),
+                    else_=None,
+                )
+            ).label(f"q_{idx}")
+        )
+    quantiles_query: sqlalchemy.Select = sa.select(*selects).select_from(ranked_query)
+
+    try:
+        quantiles_results = execution_engine.execute_query(quantiles_query).fetchone()
+        return list(quantiles_results)  # type: ignore[arg-type]
+    except sqlalchemy.ProgrammingError as pe:
+        exception_message: str = "An SQL syntax Exception occurred."
+        exception_traceback: str = traceback.format_exc()
+        exception_message += f'{type(pe).__name__}: "{pe!s}".  Traceback: "{exception_traceback}".'
+        logger.error(exception_message)  # noqa: TRY400
+        raise pe  # noqa: TRY201
+
+
+def _get_quantile_offsets(quantiles: Iterable, table_row_count: int) -> list[int]:
+    # Truncated, and no less than zero, as for "ORDER BY ... OFFSET" in SQLite.
+    return [max(int(quantile * table_row_count - 1), 0) for quantile in quantiles]
+
+
+def _get_column_quantiles_sqlite_by_offset(
+    column,
+    quantiles: Iterable,
+    selectable,
+    execution_engine: SqlAlchemyExecutionEngine,
+    table_row_count,
+) -> list:
+    """
+    This implementation is somewhat inefficient, because it requires as many calls to
+    "execution_engine.execute_query()" (each sorting the column) as the number of partitions in the "quantiles"
+    parameter (albeit, typically, only a few).  It is only used for versions of SQLite that predate window functions.
     """  # noqa: E501
     offsets: list[int] = [quantile * table_row_count - 1 for quantile in quantiles]
     quantile_queries: list[sqlalchemy.Select] = [
@@ -430,3 +540,38 @@ def _get_column_quantiles_generic_sqlalchemy(
                 f'The SQL engine dialect "{execution_engine.dialect!s}" does not support computing quantiles with '  # noqa: E501
                 "approximation error; set allow_relative_error to False to disable approximate quantiles."  # noqa: E501
             )
+
+
+def _get_approximate_quantiles_sample(
+    column,
+    selectable,
+    table_row_count: Optional[int],
+    execution_engine: SqlAlchemyExecutionEngine,
+) -> Optional[Tuple[sqlalchemy.Subquery, int]]:
+    """Random sample of rows, from which quantiles are computed within the rank error configured.
+
+    Applies to dialects without approximate percentile functions, if the execution engine is
+    configured with an "approximate_quantiles_rank_error" (the greatest acceptable error in the
+    rank of a quantile, as a fraction of the number of rows).
+
+    Returns the sample and its number of rows, or None if quantiles are to be computed exactly.
+    """
+    rank_error: Optional[float] = execution_engine.approximate_quantiles_rank_error
+    if rank_error is None or not table_row_count:
+        return None
+
+    # By the Dvoretzky-Kiefer-Wolfowitz inequality, this many rows bound the rank error of every
+    # quantile by "rank_error", but for "APPROXIMATE_QUANTILES_FAILURE_PROBABILITY".
+    sample_size: int = math.ceil(
+        math.log(2.0 / APPROXIMATE_QUANTILES_FAILURE_PROBABILITY) / (2.0 * rank_error**2)
+    )
+    if sample_size >= table_row_count:
+        return None
+
+    random_fn = (
+        sa.func.rand() if execution_engine.dialect_name == GXSqlDialect.MYSQL else sa.func.random()
+    )
+    sample_query: sqlalchemy.Subquery = (
+        sa.select(column).select_from(selectable).order_by(random_fn).limit(sample_size).subquery()
+    )
+    return sample_query, sample_size
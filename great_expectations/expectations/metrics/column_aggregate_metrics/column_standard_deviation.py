@@ -21,10 +21,13 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_partial,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.partial_aggregate_state import MomentsState
 from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
 if TYPE_CHECKING:
+    import pandas as pd
+
     from great_expectations.expectations.expectation_configuration import (
         ExpectationConfiguration,
     )
@@ -36,6 +39,7 @@ class ColumnStandardDeviation(ColumnAggregateMetricProvider):
     """MetricProvider Class for Aggregate Standard Deviation metric"""
 
     metric_name = "column.standard_deviation"
+    partial_state_type = MomentsState
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
@@ -67,6 +71,20 @@ class ColumnStandardDeviation(ColumnAggregateMetricProvider):
         """Spark Standard Deviation implementation"""
         return F.stddev_samp(column)
 
+    @classmethod
+    @override
+    def get_partial_state(cls, column: pd.Series, **metric_value_kwargs) -> MomentsState:
+        """Pandas Standard Deviation partial state over one chunk of a column"""
+        return MomentsState.from_series(convert_pandas_series_decimal_to_float_dtype(data=column))
+
+    @classmethod
+    @override
+    def finalize_partial_state(  # type: ignore[override]
+        cls, state: MomentsState, **metric_value_kwargs
+    ) -> float:
+        """Sample Standard Deviation from merged (Welford) partial states"""
+        return state.standard_deviation(ddof=1)
+
     @classmethod
     @override
     def _get_evaluation_dependencies(
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
     SparkDFExecutionEngine,
@@ -12,11 +15,16 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     column_aggregate_partial,
     column_aggregate_value,
 )
+from great_expectations.expectations.metrics.partial_aggregate_state import SumState
 from great_expectations.util import convert_pandas_series_decimal_to_float_dtype
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class ColumnSum(ColumnAggregateMetricProvider):
     metric_name = "column.sum"
+    partial_state_type = SumState
 
     @column_aggregate_value(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
@@ -30,3 +38,15 @@ class ColumnSum(ColumnAggregateMetricProvider):
     @column_aggregate_partial(engine=SparkDFExecutionEngine)
     def _spark(cls, column, **kwargs):
         return F.sum(column)
+
+    @classmethod
+    @override
+    def get_partial_state(cls, column: pd.Series, **metric_value_kwargs) -> SumState:
+        return SumState.from_series(convert_pandas_series_decimal_to_float_dtype(data=column))
+
+    @classmethod
+    @override
+    def finalize_partial_state(  # type: ignore[override]
+        cls, state: SumState, **metric_value_kwargs
+    ) -> Any:
+        return state.sum
@@ -6,6 +6,7 @@ import pandas as pd
 
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.execution_engine import (
     PandasExecutionEngine,
@@ -16,6 +17,7 @@ from great_expectations.expectations.metrics.column_aggregate_metric_provider im
     ColumnAggregateMetricProvider,
 )
 from great_expectations.expectations.metrics.metric_provider import metric_value
+from great_expectations.expectations.metrics.partial_aggregate_state import ValueCountsState
 
 if TYPE_CHECKING:
     from great_expectations.compatibility import pyspark, sqlalchemy
@@ -26,6 +28,7 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
     value_keys = ("sort", "collate")
 
     default_kwarg_values = {"sort": "value", "collate": None}
+    partial_state_type = ValueCountsState
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(
@@ -53,6 +56,33 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
         column: str = accessor_domain_kwargs["column"]
 
         counts: pd.Series = df[column].value_counts()
+        return cls._sort_pandas_value_counts(
+            counts=counts, sort=sort, is_object_dtype=df[column].dtype == object
+        )
+
+    @classmethod
+    @override
+    def get_partial_state(cls, column: pd.Series, **metric_value_kwargs) -> ValueCountsState:
+        return ValueCountsState.from_series(column)
+
+    @classmethod
+    @override
+    def finalize_partial_state(  # type: ignore[override]
+        cls, state: ValueCountsState, **metric_value_kwargs
+    ) -> pd.Series:
+        sort: str = metric_value_kwargs.get("sort") or cls.default_kwarg_values["sort"]
+        if sort not in ["value", "count", "none"]:
+            raise ValueError("sort must be either 'value', 'count', or 'none'")  # noqa: TRY003
+        if metric_value_kwargs.get("collate") is not None:
+            raise ValueError("collate parameter is not supported in PandasDataset")  # noqa: TRY003
+
+        counts: pd.Series = state.to_series()
+        return cls._sort_pandas_value_counts(
+            counts=counts, sort=sort, is_object_dtype=counts.index.dtype == object
+        )
+
+    @staticmethod
+    def _sort_pandas_value_counts(counts: pd.Series, sort: str, is_object_dtype: bool) -> pd.Series:
         if sort == "value":
             try:
                 counts.sort_index(inplace=True)
@@ -60,7 +90,7 @@ class ColumnValueCounts(ColumnAggregateMetricProvider):
                 # Having values of multiple types in a object dtype column (e.g., strings and floats)  # noqa: E501
                 # raises a TypeError when the sorting method performs comparisons.
                 # Related to the noqa E721 below: numpy / pandas implements equality, see https://github.com/astral-sh/ruff/issues/9570
-                if df[column].dtype == object:
+                if is_object_dtype:
                     counts.index = counts.index.astype(str)
                     counts.sort_index(inplace=True)
         elif sort == "counts":
@@ -19,6 +19,7 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     column_condition_partial,
     column_function_partial,
 )
+from great_expectations.expectations.metrics.util import arrow_value_lengths
 from great_expectations.util import pandas_series_between_inclusive
 from great_expectations.validator.metric_configuration import MetricConfiguration
 
@@ -96,6 +97,10 @@ class ColumnValuesValueLength(ColumnMapMetricProvider):
 
     @column_function_partial(engine=PandasExecutionEngine)
     def _pandas_function(cls, column, **kwargs):
+        value_lengths = arrow_value_lengths(column)
+        if value_lengths is not None:
+            return value_lengths
+
         return column.astype(str).str.len()
 
     @column_function_partial(engine=SqlAlchemyExecutionEngine)
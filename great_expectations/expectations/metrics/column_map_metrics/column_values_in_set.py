@@ -3,6 +3,7 @@ from __future__ import annotations
 from collections.abc import Sequence
 
 import numpy as np
+import pandas as pd
 
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.execution_engine import (
@@ -14,6 +15,11 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import (
+    arrow_is_in,
+    get_pandas_value_set_lookup,
+    get_spark_in_set_condition,
+)
 
 try:
     import sqlalchemy as sa  # noqa: TID251
@@ -36,6 +42,14 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
             # Vacuously true
             return np.ones(len(column), dtype=np.bool_)
 
+        is_in = arrow_is_in(column, value_set)
+        if is_in is not None:
+            return is_in
+
+        value_set_lookup = get_pandas_value_set_lookup(column, value_set, **kwargs)
+        if value_set_lookup is not None:
+            return pd.Series(value_set_lookup.get_indexer(column) >= 0, index=column.index)
+
         return column.isin(value_set)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
@@ -72,6 +86,13 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
                     and isinstance(column_info["type"], sa.Boolean)
                 ):
                     return sa.or_(*[column == value for value in value_set])
+
+        execution_engine = kwargs.get("_execution_engine")
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+            value_set_lookup = execution_engine.get_value_set_lookup(value_set)
+            if value_set_lookup is not None:
+                return column.in_(value_set_lookup)
+
         return column.in_(value_set)
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
@@ -85,4 +106,8 @@ class ColumnValuesInSet(ColumnMapMetricProvider):
             # vacuously true
             return F.lit(True)
 
+        is_in = get_spark_in_set_condition(column, value_set, **kwargs)
+        if is_in is not None:
+            return is_in
+
         return column.isin(value_set)
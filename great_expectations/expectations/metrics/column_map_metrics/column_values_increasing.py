@@ -20,6 +20,7 @@ from great_expectations.expectations.metrics.metric_provider import metric_parti
 class ColumnValuesIncreasing(ColumnMapMetricProvider):
     condition_metric_name = "column_values.increasing"
     condition_value_keys = ("strictly",)
+    supports_chunked_evaluation = False
     default_kwarg_values = {
         "strictly": False,
     }
@@ -12,7 +12,12 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import parse_value_set
+from great_expectations.expectations.metrics.util import (
+    arrow_is_in,
+    get_pandas_value_set_lookup,
+    get_spark_in_set_condition,
+    parse_value_set,
+)
 
 
 class ColumnValuesNotInSet(ColumnMapMetricProvider):
@@ -34,6 +39,14 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
         else:
             parsed_value_set = value_set
 
+        is_in = arrow_is_in(column, parsed_value_set)
+        if is_in is not None:
+            return ~is_in
+
+        value_set_lookup = get_pandas_value_set_lookup(column, parsed_value_set, **kwargs)
+        if value_set_lookup is not None:
+            return pd.Series(value_set_lookup.get_indexer(column) < 0, index=column.index)
+
         return ~column.isin(parsed_value_set)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
@@ -46,6 +59,12 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
         if value_set is None or len(value_set) == 0:
             return True
 
+        execution_engine = kwargs.get("_execution_engine")
+        if isinstance(execution_engine, SqlAlchemyExecutionEngine):
+            value_set_lookup = execution_engine.get_value_set_lookup(value_set)
+            if value_set_lookup is not None:
+                return column.notin_(value_set_lookup)
+
         return column.notin_(tuple(value_set))
 
     @column_condition_partial(engine=SparkDFExecutionEngine)
@@ -55,4 +74,8 @@ class ColumnValuesNotInSet(ColumnMapMetricProvider):
         value_set,
         **kwargs,
     ):
+        is_in = get_spark_in_set_condition(column, value_set, **kwargs)
+        if is_in is not None:
+            return ~is_in
+
         return ~column.isin(value_set)
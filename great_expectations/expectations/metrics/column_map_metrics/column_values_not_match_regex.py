@@ -11,7 +11,10 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
-from great_expectations.expectations.metrics.util import get_dialect_regex_expression
+from great_expectations.expectations.metrics.util import (
+    arrow_match_regex,
+    get_dialect_regex_expression,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +25,10 @@ class ColumnValuesNotMatchRegex(ColumnMapMetricProvider):
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, regex, **kwargs):
+        matches = arrow_match_regex(column, regex)
+        if matches is not None:
+            return ~matches
+
         return ~column.astype(str).str.contains(regex)
 
     @column_condition_partial(engine=SqlAlchemyExecutionEngine)
@@ -15,14 +15,20 @@ from great_expectations.expectations.metrics.map_metric_provider import (
     ColumnMapMetricProvider,
     column_condition_partial,
 )
+from great_expectations.expectations.metrics.util import arrow_is_unique
 from great_expectations.util import generate_temporary_table_name
 
 
 class ColumnValuesUnique(ColumnMapMetricProvider):
     condition_metric_name = "column_values.unique"
+    supports_chunked_evaluation = False
 
     @column_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column, **kwargs):
+        is_unique = arrow_is_unique(column)
+        if is_unique is not None:
+            return is_unique
+
         return ~column.duplicated(keep=False)
 
     # NOTE: 20201119 - JPC - We cannot split per-dialect into window and non-window functions
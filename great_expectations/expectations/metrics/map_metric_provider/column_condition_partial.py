@@ -114,6 +114,7 @@ def column_condition_partial(  # noqa: C901, PLR0915
                     cls,
                     df[column_name],
                     **metric_value_kwargs,
+                    _execution_engine=execution_engine,
                     _metrics=metrics,
                 )
                 return (
@@ -264,6 +265,7 @@ def column_condition_partial(  # noqa: C901, PLR0915
                     column,
                     **metric_value_kwargs,
                     _table=data,
+                    _execution_engine=execution_engine,
                     _metrics=metrics,
                     _compute_domain_kwargs=compute_domain_kwargs,
                     _accessor_domain_kwargs=accessor_domain_kwargs,
@@ -101,6 +101,9 @@ class MapMetricProvider(MetricProvider):
     condition_value_keys: tuple[str, ...] = tuple()
     function_value_keys: tuple[str, ...] = tuple()
     filter_column_isnull = True
+    # Whether the value of a row depends only on that row, so the pandas condition and function
+    # partials of this metric may be evaluated on each chunk of a chunked batch independently.
+    supports_chunked_evaluation = True
 
     @classmethod
     def _register_metric_functions(cls):  # noqa: C901, PLR0912, PLR0915
@@ -52,6 +52,7 @@ class CompoundColumnsUnique(MulticolumnMapMetricProvider):
         "condition_parser",
         "ignore_row_if",
     )
+    supports_chunked_evaluation = False
 
     @multicolumn_condition_partial(engine=PandasExecutionEngine)
     def _pandas(cls, column_list, **kwargs):
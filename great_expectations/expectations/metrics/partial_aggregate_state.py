@@ -0,0 +1,283 @@
+"""Mergeable partial states for aggregate metrics.
+
+An aggregate metric that can be expressed as a partial state per chunk (or partition) of a batch
+plus an associative combine step can be evaluated over many independent chunks -- streamed,
+in parallel, or across files -- and merged into the same value the whole-batch computation returns.
+
+Each state is a small value object exposing `merge`, which returns a new state and leaves its
+operands untouched.
+"""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass, field
+from functools import reduce
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    ClassVar,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    TypeVar,
+)
+
+import numpy as np
+import pandas as pd
+
+from great_expectations.compatibility.typing_extensions import override
+
+if TYPE_CHECKING:
+    from typing_extensions import Self
+
+StateT = TypeVar("StateT", bound="PartialAggregateState")
+
+
+class PartialAggregateState:
+    """Base class of all mergeable partial aggregate states."""
+
+    # Whether merged states finalize to the whole-batch value (up to floating point rounding)
+    merges_exactly: ClassVar[bool] = True
+
+    def merge(self, other: Self) -> Self:
+        raise NotImplementedError
+
+    @classmethod
+    def combine(cls, states: Iterable[StateT]) -> StateT:
+        """Merge an iterable of states of the same type into a single state.
+
+        An empty iterable yields the empty state of this type.
+        """
+        states = iter(states)
+        first = next(states, None)
+        if first is None:
+            return cls()  # type: ignore[return-value]
+
+        return reduce(lambda left, right: left.merge(right), states, first)
+
+
+@dataclass(frozen=True)
+class CountState(PartialAggregateState):
+    """Number of elements (rows, nulls, unexpected values, etc.) observed."""
+
+    count: int = 0
+
+    @override
+    def merge(self, other: CountState) -> CountState:
+        return CountState(count=self.count + other.count)
+
+
+@dataclass(frozen=True)
+class SumState(PartialAggregateState):
+    """Sum of the non-null elements observed."""
+
+    sum: Any = 0
+
+    @classmethod
+    def from_series(cls, column: pd.Series) -> SumState:
+        return cls(sum=column.sum())
+
+    @override
+    def merge(self, other: SumState) -> SumState:
+        return SumState(sum=self.sum + other.sum)
+
+
+@dataclass(frozen=True)
+class MinMaxState(PartialAggregateState):
+    """Smallest and largest non-null elements observed; `None` until a non-null value is seen."""
+
+    min: Any = None
+    max: Any = None
+
+    @classmethod
+    def from_series(cls, column: pd.Series) -> MinMaxState:
+        column = column.dropna()
+        if column.empty:
+            return cls()
+
+        return cls(min=column.min(), max=column.max())
+
+    @override
+    def merge(self, other: MinMaxState) -> MinMaxState:
+        return MinMaxState(
+            min=_merge_optional(self.min, other.min, min),
+            max=_merge_optional(self.max, other.max, max),
+        )
+
+
+@dataclass(frozen=True)
+class MomentsState(PartialAggregateState):
+    """Count, mean, and sum of squared deviations from the mean (M2) of the non-null elements.
+
+    States are merged with the parallel variant of Welford's algorithm (Chan et al.), which is
+    numerically stable and exact regardless of how the data is chunked.
+    """
+
+    count: int = 0
+    mean: float = 0.0
+    m2: float = 0.0
+
+    @classmethod
+    def from_series(cls, column: pd.Series) -> MomentsState:
+        column = column.dropna().astype(float)
+        count = int(column.size)
+        if count == 0:
+            return cls()
+
+        mean = float(column.mean())
+        m2 = float(((column - mean) ** 2).sum())
+        return cls(count=count, mean=mean, m2=m2)
+
+    @override
+    def merge(self, other: MomentsState) -> MomentsState:
+        if other.count == 0:
+            return self
+
+        if self.count == 0:
+            return other
+
+        count = self.count + other.count
+        delta = other.mean - self.mean
+        mean = self.mean + delta * other.count / count
+        m2 = self.m2 + other.m2 + delta * delta * self.count * other.count / count
+        return MomentsState(count=count, mean=mean, m2=m2)
+
+    def variance(self, ddof: int = 1) -> float:
+        if self.count - ddof <= 0:
+            return np.nan
+
+        return self.m2 / (self.count - ddof)
+
+    def standard_deviation(self, ddof: int = 1) -> float:
+        return math.sqrt(self.variance(ddof=ddof))
+
+
+@dataclass(frozen=True)
+class ValueCountsState(PartialAggregateState):
+    """Occurrence count of every distinct non-null element observed."""
+
+    counts: Dict[Any, int] = field(default_factory=dict)
+
+    @classmethod
+    def from_series(cls, column: pd.Series) -> ValueCountsState:
+        return cls(counts=column.value_counts().to_dict())
+
+    @override
+    def merge(self, other: ValueCountsState) -> ValueCountsState:
+        counts: Dict[Any, int] = dict(self.counts)
+        for value, count in other.counts.items():
+            counts[value] = counts.get(value, 0) + count
+
+        return ValueCountsState(counts=counts)
+
+    def to_series(self) -> pd.Series:
+        return pd.Series(self.counts, dtype="int64")
+
+
+@dataclass(frozen=True, eq=False)
+class QuantileSketchState(PartialAggregateState):
+    """Mergeable quantile sketch over the non-null elements observed.
+
+    The sketch holds sorted (value, weight) pairs.  Without a `max_size` (the default), every
+    element is retained with weight 1, and quantiles are exact.  With a `max_size`, once more
+    elements than that are observed, the sketch is compacted to `max_size` weighted points taken at
+    evenly spaced ranks, which bounds the rank error of any quantile estimate by roughly
+    `1 / max_size`.
+    """
+
+    # Bounded sketches are approximate once compacted.
+    merges_exactly: ClassVar[bool] = False
+
+    values: np.ndarray = field(default_factory=lambda: np.array([], dtype=float))
+    weights: np.ndarray = field(default_factory=lambda: np.array([], dtype=float))
+    max_size: Optional[int] = None
+
+    @classmethod
+    def from_series(cls, column: pd.Series, max_size: Optional[int] = None) -> QuantileSketchState:
+        values = np.sort(column.dropna().to_numpy())
+        return cls(
+            values=values, weights=np.ones(values.size, dtype=float), max_size=max_size
+        )._compacted()
+
+    @classmethod
+    @override
+    def combine(cls, states: Iterable[QuantileSketchState]) -> QuantileSketchState:  # type: ignore[override]
+        """Merge all states at once, sorting the retained elements a single time."""
+        states = list(states)
+        if not states:
+            return cls()
+
+        values = np.concatenate([state.values for state in states])
+        weights = np.concatenate([state.weights for state in states])
+        order = np.argsort(values, kind="mergesort")
+        return cls(
+            values=values[order],
+            weights=weights[order],
+            max_size=_min_max_size(state.max_size for state in states),
+        )._compacted()
+
+    @property
+    def count(self) -> float:
+        return float(self.weights.sum())
+
+    @property
+    def is_exact(self) -> bool:
+        return bool(np.all(self.weights == 1.0))
+
+    @override
+    def merge(self, other: QuantileSketchState) -> QuantileSketchState:
+        values = np.concatenate([self.values, other.values])
+        weights = np.concatenate([self.weights, other.weights])
+        order = np.argsort(values, kind="mergesort")
+        return QuantileSketchState(
+            values=values[order],
+            weights=weights[order],
+            max_size=_min_max_size((self.max_size, other.max_size)),
+        )._compacted()
+
+    def quantiles(self, quantiles: Sequence[float], interpolation: str = "nearest") -> List[Any]:
+        """Quantiles of the observed elements; exact (matching `pd.Series.quantile`) until compacted."""  # noqa: E501
+        if self.values.size == 0:
+            return [np.nan for _ in quantiles]
+
+        if self.is_exact:
+            return pd.Series(self.values).quantile(quantiles, interpolation=interpolation).tolist()
+
+        cumulative_weights = np.cumsum(self.weights)
+        ranks = np.asarray(quantiles, dtype=float) * cumulative_weights[-1]
+        positions = np.searchsorted(cumulative_weights, ranks, side="left")
+        positions = np.clip(positions, 0, self.values.size - 1)
+        return self.values[positions].tolist()
+
+    def _compacted(self) -> QuantileSketchState:
+        if self.max_size is None or self.values.size <= self.max_size:
+            return self
+
+        cumulative_weights = np.cumsum(self.weights)
+        total_weight = cumulative_weights[-1]
+        step = total_weight / self.max_size
+        ranks = (np.arange(self.max_size) + 0.5) * step
+        positions = np.searchsorted(cumulative_weights, ranks, side="left")
+        return QuantileSketchState(
+            values=self.values[positions],
+            weights=np.full(self.max_size, step),
+            max_size=self.max_size,
+        )
+
+
+def _min_max_size(max_sizes: Iterable[Optional[int]]) -> Optional[int]:
+    """The smallest of the bounds of sketches being merged; None if none of them is bounded."""
+    return min((max_size for max_size in max_sizes if max_size is not None), default=None)
+
+
+def _merge_optional(left: Optional[Any], right: Optional[Any], fn) -> Optional[Any]:
+    if left is None:
+        return right
+
+    if right is None:
+        return left
+
+    return fn(left, right)
@@ -10,6 +10,9 @@ from great_expectations.execution_engine import (
     SparkDFExecutionEngine,
     SqlAlchemyExecutionEngine,
 )
+from great_expectations.execution_engine.pandas_batch_data import (
+    ProjectedPandasBatchData,
+)
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
 )
@@ -34,10 +37,23 @@ class ColumnTypes(TableMetricProvider):
         metrics: Dict[str, Any],
         runtime_configuration: dict,
     ):
-        df, _, _ = execution_engine.get_compute_domain(
-            metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
+        batch_data = execution_engine.batch_manager.batch_data_cache.get(
+            metric_domain_kwargs.get("batch_id")
+            or execution_engine.batch_manager.active_batch_data_id  # type: ignore[arg-type]
         )
-        return [{"name": name, "type": dtype} for (name, dtype) in zip(df.columns, df.dtypes)]
+        if isinstance(batch_data, ProjectedPandasBatchData):
+            # Answered without loading the batch: the schema of the file describes the columns
+            # that have not been loaded (yet).
+            dtypes = batch_data.schema.dtypes.copy()
+            if batch_data.loaded_columns is not None:
+                dtypes.update(batch_data.dataframe.dtypes)
+        else:
+            df, _, _ = execution_engine.get_compute_domain(
+                metric_domain_kwargs, domain_type=MetricDomainTypes.TABLE
+            )
+            dtypes = df.dtypes
+
+        return [{"name": name, "type": dtype} for (name, dtype) in dtypes.items()]
 
     @metric_value(engine=SqlAlchemyExecutionEngine)
     def _sqlalchemy(
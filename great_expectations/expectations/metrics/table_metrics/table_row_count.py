@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Any, Dict
+from typing import TYPE_CHECKING, Any, Dict, Iterable
 
 from great_expectations.compatibility.pyspark import functions as F
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
@@ -15,13 +15,18 @@ from great_expectations.expectations.metrics.metric_provider import (
     metric_partial,
     metric_value,
 )
+from great_expectations.expectations.metrics.partial_aggregate_state import CountState
 from great_expectations.expectations.metrics.table_metric_provider import (
     TableMetricProvider,
 )
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 
 class TableRowCount(TableMetricProvider):
     metric_name = "table.row_count"
+    partial_state_type = CountState
 
     @metric_value(engine=PandasExecutionEngine)
     def _pandas(
@@ -66,3 +71,16 @@ class TableRowCount(TableMetricProvider):
         runtime_configuration: dict,
     ):
         return F.count(F.lit(1)), metric_domain_kwargs, {}
+
+    @classmethod
+    def get_partial_state(cls, df: pd.DataFrame, **metric_value_kwargs) -> CountState:
+        """Row count partial state over one chunk of a table (see ColumnAggregateMetricProvider)."""
+        return CountState(count=df.shape[0])
+
+    @classmethod
+    def combine_partial_states(cls, states: Iterable[CountState]) -> CountState:
+        return CountState.combine(states)
+
+    @classmethod
+    def finalize_partial_state(cls, state: CountState, **metric_value_kwargs) -> int:
+        return state.count
@@ -19,18 +19,20 @@ from typing import (
 )
 
 import numpy as np
+import pandas as pd
 from dateutil.parser import parse
 from packaging import version
 
 import great_expectations.exceptions as gx_exceptions
-from great_expectations.compatibility import aws, sqlalchemy, trino
+from great_expectations.compatibility import aws, pyarrow, pyspark, sqlalchemy, trino
 from great_expectations.compatibility.sqlalchemy import (
     sqlalchemy as sa,
 )
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.execution_engine import (
-    PandasExecutionEngine,  # noqa: TCH001
-    SqlAlchemyExecutionEngine,  # noqa: TCH001
+    PandasExecutionEngine,
+    SparkDFExecutionEngine,
+    SqlAlchemyExecutionEngine,
 )
 from great_expectations.execution_engine.sqlalchemy_batch_data import (
     SqlAlchemyBatchData,
@@ -38,6 +40,7 @@ from great_expectations.execution_engine.sqlalchemy_batch_data import (
 from great_expectations.execution_engine.sqlalchemy_dialect import (
     GXSqlDialect,
 )
+from great_expectations.execution_engine.sqlalchemy_reflection_cache import ReflectionKey
 from great_expectations.execution_engine.util import check_sql_engine_dialect
 
 try:
@@ -404,53 +407,27 @@ def get_sqlalchemy_column_metadata(
     table_selectable: sqlalchemy.Select,
     schema_name: Optional[str] = None,
 ) -> Sequence[Mapping[str, Any]] | None:
-    try:
-        columns: Sequence[Dict[str, Any]]
+    """Column metadata of a table (or custom query), cached by the execution engine.
 
-        engine = execution_engine.engine
-        inspector = execution_engine.get_inspector()
-        try:
-            # if a custom query was passed
-            if sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
-                if hasattr(table_selectable, "selected_columns"):
-                    # New in version 1.4.
-                    columns = table_selectable.selected_columns.columns
-                else:
-                    # Implicit subquery for columns().column was deprecated in SQLAlchemy 1.4
-                    # We must explicitly create a subquery
-                    columns = table_selectable.columns().subquery().columns
-            else:
-                # TODO: remove cast to a string once [this](https://github.com/snowflakedb/snowflake-sqlalchemy/issues/157) issue is resovled  # noqa: E501
-                table_name = str(table_selectable)
-                if execution_engine.dialect_name == GXSqlDialect.SNOWFLAKE:
-                    table_name = table_name.lower()
-                columns = inspector.get_columns(  # type: ignore[assignment]
-                    table_name=table_name,
-                    schema=schema_name,
-                )
-        except (
-            KeyError,
-            AttributeError,
-            sa.exc.NoSuchTableError,
-            sa.exc.ProgrammingError,
-        ) as exc:
-            logger.debug(f"{type(exc).__name__} while introspecting columns", exc_info=exc)
-            logger.info(f"While introspecting columns {exc!r}; attempting reflection fallback")
-            # we will get a KeyError for temporary tables, since
-            # reflection will not find the temporary schema
-            columns = column_reflection_fallback(
-                selectable=table_selectable,
-                dialect=engine.dialect,
-                sqlalchemy_engine=engine,
+    See "SqlAlchemyExecutionEngine.invalidate_reflection_cache()".
+    """
+    try:
+        reflection_key: ReflectionKey
+        if sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
+            reflection_key = ReflectionKey.for_query(kind="columns", query=str(table_selectable))
+        else:
+            reflection_key = ReflectionKey.for_table(
+                kind="columns", table_name=str(table_selectable), schema_name=schema_name
             )
 
-        # Use fallback because for mssql and trino reflection mechanisms do not throw an error but return an empty list  # noqa: E501
-        if len(columns) == 0:
-            columns = column_reflection_fallback(
-                selectable=table_selectable,
-                dialect=engine.dialect,
-                sqlalchemy_engine=engine,
-            )
+        columns: Sequence[Mapping[str, Any]] = execution_engine.reflection_cache.get_or_reflect(
+            key=reflection_key,
+            reflect=lambda: _reflect_sqlalchemy_column_metadata(
+                execution_engine=execution_engine,
+                table_selectable=table_selectable,
+                schema_name=schema_name,
+            ),
+        )
 
         dialect_name = execution_engine.dialect.name
         if dialect_name == GXSqlDialect.SNOWFLAKE:
@@ -460,12 +437,68 @@ def get_sqlalchemy_column_metadata(
                 for column in columns
             ]
 
-        return columns
+        # The cached sequence is shared by all callers.
+        return list(columns)
     except AttributeError as e:
         logger.debug(f"Error while introspecting columns: {e!r}", exc_info=e)
         return None
 
 
+def _reflect_sqlalchemy_column_metadata(
+    execution_engine: SqlAlchemyExecutionEngine,
+    table_selectable: sqlalchemy.Select,
+    schema_name: Optional[str] = None,
+) -> Sequence[Mapping[str, Any]]:
+    columns: Sequence[Dict[str, Any]]
+
+    engine = execution_engine.engine
+    inspector = execution_engine.get_inspector()
+    try:
+        # if a custom query was passed
+        if sqlalchemy.TextClause and isinstance(table_selectable, sqlalchemy.TextClause):  # type: ignore[truthy-function]
+            if hasattr(table_selectable, "selected_columns"):
+                # New in version 1.4.
+                columns = table_selectable.selected_columns.columns
+            else:
+                # Implicit subquery for columns().column was deprecated in SQLAlchemy 1.4
+                # We must explicitly create a subquery
+                columns = table_selectable.columns().subquery().columns
+        else:
+            # TODO: remove cast to a string once [this](https://github.com/snowflakedb/snowflake-sqlalchemy/issues/157) issue is resovled  # noqa: E501
+            table_name = str(table_selectable)
+            if execution_engine.dialect_name == GXSqlDialect.SNOWFLAKE:
+                table_name = table_name.lower()
+            columns = inspector.get_columns(  # type: ignore[assignment]
+                table_name=table_name,
+                schema=schema_name,
+            )
+    except (
+        KeyError,
+        AttributeError,
+        sa.exc.NoSuchTableError,
+        sa.exc.ProgrammingError,
+    ) as exc:
+        logger.debug(f"{type(exc).__name__} while introspecting columns", exc_info=exc)
+        logger.info(f"While introspecting columns {exc!r}; attempting reflection fallback")
+        # we will get a KeyError for temporary tables, since
+        # reflection will not find the temporary schema
+        columns = column_reflection_fallback(
+            selectable=table_selectable,
+            dialect=engine.dialect,
+            sqlalchemy_engine=engine,
+        )
+
+    # Use fallback because for mssql and trino reflection mechanisms do not throw an error but return an empty list  # noqa: E501
+    if len(columns) == 0:
+        columns = column_reflection_fallback(
+            selectable=table_selectable,
+            dialect=engine.dialect,
+            sqlalchemy_engine=engine,
+        )
+
+    return columns
+
+
 def column_reflection_fallback(  # noqa: C901, PLR0912, PLR0915
     selectable: sqlalchemy.Select,
     dialect: sqlalchemy.Dialect,
@@ -879,6 +912,192 @@ def parse_value_set(value_set: Iterable) -> list:
     return parsed_value_set
 
 
+def get_pandas_value_set_lookup(column: pd.Series, value_set, **kwargs) -> Optional[pd.Index]:
+    """Staged index of a large value set, if the column compares with it like with "isin()"."""
+    execution_engine = kwargs.get("_execution_engine")
+    if value_set is None or not isinstance(execution_engine, PandasExecutionEngine):
+        return None
+
+    # "isin()" parses strings as dates and takes "1" for True; lookups in an index do not.
+    if pd.api.types.is_datetime64_any_dtype(column) or pd.api.types.is_bool_dtype(column):
+        return None
+
+    return execution_engine.get_value_set_lookup(value_set)
+
+
+def _get_spark_value_set_type(data_type, values: List[Any]) -> Optional[Any]:
+    """Type to compare a column and its value set as (None if they do not compare as "isin()")."""
+    types = pyspark.types
+    if isinstance(data_type, types.StringType):
+        return data_type if all(isinstance(value, str) for value in values) else None
+
+    if not isinstance(data_type, types.NumericType) or any(
+        isinstance(value, str) for value in values
+    ):
+        return None
+
+    if all(isinstance(value, int) for value in values):
+        if isinstance(data_type, types.IntegralType):
+            return types.LongType()
+        if isinstance(data_type, types.DecimalType):
+            # Integers compare exactly with the (unrounded) decimal values.
+            return types.DecimalType(38, data_type.scale)
+
+    return types.DoubleType()
+
+
+def get_spark_in_set_condition(column, value_set, **kwargs) -> Optional[Any]:
+    """Condition of a string or numeric column being in a large, staged value set.
+
+    The staged array literal of the value set is looked up with "array_contains()"; column and
+    values are compared as one type, as "isin()" (which inlines every value) compares them.
+    """
+    execution_engine = kwargs.get("_execution_engine")
+    data = kwargs.get("_table")
+    if (
+        value_set is None
+        or not isinstance(execution_engine, SparkDFExecutionEngine)
+        or data is None
+    ):
+        return None
+
+    # Values of other columns (e.g. dates) are parsed by "isin()" rather than compared as is.
+    data_type = data.select(column).schema.fields[0].dataType
+    value_type = _get_spark_value_set_type(data_type, list(value_set))
+    if value_type is None:
+        return None
+
+    value_set_lookup = execution_engine.get_value_set_lookup(value_set)
+    if value_set_lookup is None:
+        return None
+
+    return pyspark.functions.array_contains(
+        value_set_lookup.cast(pyspark.types.ArrayType(value_type)), column.cast(value_type)
+    )
+
+
+def get_arrow_array(column: pd.Series) -> Optional[Any]:
+    """Arrow array of an Arrow-backed string or numeric column (e.g. read with dtype_backend="pyarrow").
+
+    Columns of other types (or not backed by Arrow) return None, and are evaluated by pandas.
+    """  # noqa: E501
+    arrow_extension_array = getattr(pd.arrays, "ArrowExtensionArray", None)
+    if (
+        not pyarrow.compute
+        or arrow_extension_array is None
+        or not isinstance(column.array, arrow_extension_array)
+    ):
+        return None
+
+    array = column.array.__arrow_array__()
+    arrow_types = pyarrow.pyarrow.types
+    if (
+        arrow_types.is_string(array.type)
+        or arrow_types.is_large_string(array.type)
+        or arrow_types.is_integer(array.type)
+        or arrow_types.is_floating(array.type)
+    ):
+        return array
+
+    return None
+
+
+def get_arrow_string_array(column: pd.Series) -> Optional[Any]:
+    """Arrow array of an Arrow-backed string column, for "pyarrow.compute" string kernels."""
+    array = get_arrow_array(column)
+    if array is None or not (
+        pyarrow.pyarrow.types.is_string(array.type)
+        or pyarrow.pyarrow.types.is_large_string(array.type)
+    ):
+        return None
+
+    return array
+
+
+def arrow_condition_to_series(condition, column: pd.Series) -> pd.Series:
+    """Boolean Series (with null conditions taken as False) of a "pyarrow.compute" condition."""
+    return pd.Series(
+        pyarrow.compute.fill_null(condition, False).to_numpy(zero_copy_only=False),
+        index=column.index,
+    )
+
+
+# Constructs that RE2 matches unlike Python: character classes (ASCII-only in RE2, Unicode in
+# Python), and inline flags (e.g. "(?x)" and "(?a)", or case folding of "(?i)").
+_ARROW_INCOMPATIBLE_REGEX_PATTERN = re.compile(r"\\[wWdDsSbB]|\(\?[a-zA-Z]")
+
+
+def arrow_match_regex(column: pd.Series, regex: str) -> Optional[pd.Series]:
+    """Whether the values of an Arrow-backed string column match a regex, searched like re.search.
+
+    Returns None for other columns, and for regexes that Arrow (RE2) does not support, such as
+    ones with lookarounds or backreferences, or matches differently than Python.
+    """
+    array = get_arrow_string_array(column)
+    if array is None:
+        return None
+
+    if _ARROW_INCOMPATIBLE_REGEX_PATTERN.search(regex) or (
+        # "$" also matches before a trailing newline in Python, but not in RE2.
+        "$" in regex and pyarrow.compute.any(pyarrow.compute.match_substring(array, "\n")).as_py()
+    ):
+        logger.debug(f"Regex {regex!r} is matched unlike Python by Arrow; it is matched by pandas")
+        return None
+
+    try:
+        condition = pyarrow.compute.match_substring_regex(array, pattern=regex)
+    except pyarrow.pyarrow.ArrowException:
+        logger.debug(f"Regex {regex!r} is not supported by Arrow; it is matched by pandas")
+        return None
+
+    return arrow_condition_to_series(condition, column)
+
+
+def arrow_value_lengths(column: pd.Series) -> Optional[pd.Series]:
+    """Lengths (in characters) of the values of an Arrow-backed string column."""
+    array = get_arrow_string_array(column)
+    if array is None:
+        return None
+
+    return pd.Series(
+        pyarrow.compute.utf8_length(array).to_numpy(zero_copy_only=False), index=column.index
+    )
+
+
+def arrow_is_in(column: pd.Series, value_set: Iterable[Any]) -> Optional[pd.Series]:
+    """Whether the values of an Arrow-backed column are in a value set of the type of the column.
+
+    Returns None if the values do not convert to the type of the column (e.g. fractions for an
+    integer column); the column is then compared with "isin()".
+    """
+    array = get_arrow_array(column)
+    if array is None:
+        return None
+
+    try:
+        arrow_value_set = pyarrow.pyarrow.array(list(value_set), type=array.type)
+        condition = pyarrow.compute.is_in(array, value_set=arrow_value_set)
+    except pyarrow.pyarrow.ArrowException:
+        return None
+
+    return arrow_condition_to_series(condition, column)
+
+
+def arrow_is_unique(column: pd.Series) -> Optional[pd.Series]:
+    """Whether the values of an Arrow-backed column occur only once in the column."""
+    array = get_arrow_array(column)
+    if array is None:
+        return None
+
+    value_counts = pyarrow.compute.value_counts(array)
+    duplicated_values = value_counts.field("values").filter(
+        pyarrow.compute.greater(value_counts.field("counts"), 1)
+    )
+    return arrow_condition_to_series(
+        pyarrow.compute.invert(pyarrow.compute.is_in(array, value_set=duplicated_values)), column
+    )
+
+
 def get_dialect_like_pattern_expression(  # noqa: C901, PLR0912, PLR0915
     column: sa.Column, dialect: ModuleType, like_pattern: str, positive: bool = True
 ) -> sa.BinaryExpression | None:
@@ -41,6 +41,7 @@ logger = logging.getLogger(__name__)
 _registered_expectations: dict = {}
 _registered_metrics: dict = {}
 _registered_renderers: dict = {}
+_core_metrics_registration_started = False
 
 """
 {
@@ -106,7 +107,7 @@ def get_renderer_names(expectation_or_metric_type: str) -> List[str]:
     Returns:
         A list of renderer names for the Expectation or Metric.
     """  # noqa: E501
-    return list(_registered_renderers.get(expectation_or_metric_type, {}).keys())
+    return list(_get_registered_renderers(expectation_or_metric_type).keys())
 
 
 def get_renderer_names_with_renderer_types(
@@ -132,17 +133,25 @@ def get_renderer_names_with_renderer_types(
 
 
 def get_renderer_impls(object_name: str) -> List[str]:
-    return list(_registered_renderers.get(object_name, {}).values())
+    return list(_get_registered_renderers(object_name).values())
 
 
 def get_renderer_impl(object_name: str, renderer_type: str) -> Optional[RendererImpl]:
-    renderer_tuple: Optional[tuple] = _registered_renderers.get(object_name, {}).get(renderer_type)
+    renderer_tuple: Optional[tuple] = _get_registered_renderers(object_name).get(renderer_type)
     renderer_impl: Optional[RendererImpl] = None
     if renderer_tuple:
         renderer_impl = RendererImpl(expectation=renderer_tuple[0], renderer=renderer_tuple[1])
     return renderer_impl
 
 
+def _get_registered_renderers(object_name: str) -> dict:
+    if object_name not in _registered_renderers:
+        # Renderers of core Expectations are registered along with them.
+        _register_core_expectation(expectation_type=object_name)
+
+    return _registered_renderers.get(object_name, {})
+
+
 def register_expectation(expectation: Type[Expectation]) -> None:
     expectation_type = expectation.expectation_type
     # TODO: add version to key
@@ -164,10 +173,12 @@ def register_core_metrics() -> None:
 
     We use this to grab metrics by name within our workflows.
 
-    Without this function, we need to hope that core Metrics are imported somewhere
-    in our import graph - if not, our registry will be empty and we'll see
-    MetricResolutionErrors.
+    Core Metrics are not imported along with great_expectations; this is called the first time a
+    Metric missing from the registry is looked up.
     """
+    global _core_metrics_registration_started  # noqa: PLW0603
+    _core_metrics_registration_started = True
+
     before_count = len(_registered_metrics)
 
     # Implicitly calls MetaMetricProvider.__new__ as Metrics are loaded from metrics.__init__.py
@@ -190,15 +201,16 @@ def register_core_expectations() -> None:
     We use this JIT in the Validator to ensure that core Expectations are available
     for usage when called upon.
 
-    Without this function, we need to hope that core Expectations are imported somewhere
-    in our import graph - if not, our registry will be empty and Validator workflows
-    will fail.
+    Core Expectations are not imported along with great_expectations; individual core
+    Expectations are otherwise registered the first time they are looked up by name.
     """
     before_count = len(_registered_expectations)
 
-    # Implicitly calls MetaExpectation.__new__ as Expectations are loaded from core.__init__.py
+    # Implicitly calls MetaExpectation.__new__ as core Expectations are imported
     # As __new__ calls upon register_expectation, this import builds our core registry
-    from great_expectations.expectations import core  # noqa: F401
+    from great_expectations.expectations import core
+
+    core.import_core_expectations()
 
     after_count = len(_registered_expectations)
 
@@ -208,6 +220,18 @@ def register_core_expectations() -> None:
         logger.debug(f"Registered {after_count-before_count} core expectations")
 
 
+def _register_core_expectation(expectation_type: str) -> None:
+    from great_expectations.expectations import core
+
+    if expectation_type in core.CORE_EXPECTATION_TYPES:
+        core.import_core_expectation(expectation_type)
+
+
+def _register_core_metrics_if_missing(metric_name: str) -> None:
+    if metric_name not in _registered_metrics:
+        register_core_metrics()
+
+
 def _add_response_key(res, key, value):
     if key in res:
         res[key].append(value)
@@ -240,6 +264,10 @@ def register_metric(  # noqa: PLR0913
     Returns:
         A dictionary containing warnings thrown during registration if applicable, and the success status of registration.
     """  # noqa: E501
+    if not _core_metrics_registration_started:
+        # Core Metrics are registered first, so that they never overwrite custom providers.
+        register_core_metrics()
+
     res: dict = {}
     execution_engine_name = execution_engine.__name__
     logger.debug(f"Registering metric: {metric_name}")
@@ -310,6 +338,7 @@ def register_metric(  # noqa: PLR0913
 def get_metric_provider(
     metric_name: str, execution_engine: ExecutionEngine
 ) -> Tuple[MetricProvider, Callable]:
+    _register_core_metrics_if_missing(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         return metric_definition["providers"][type(execution_engine).__name__]
@@ -322,6 +351,7 @@ def get_metric_provider(
 def get_metric_function_type(
     metric_name: str, execution_engine: ExecutionEngine
 ) -> Optional[Union[MetricPartialFunctionTypes, MetricFunctionTypes]]:
+    _register_core_metrics_if_missing(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics[metric_name]
         provider_fn, _provider_class = metric_definition["providers"][
@@ -339,6 +369,7 @@ def get_metric_kwargs(
     configuration: Optional[ExpectationConfiguration] = None,
     runtime_configuration: Optional[dict] = None,
 ) -> dict:
+    _register_core_metrics_if_missing(metric_name=metric_name)
     try:
         metric_definition = _registered_metrics.get(metric_name)
         if metric_definition is None:
@@ -391,6 +422,9 @@ def get_domain_metrics_dict_by_name(
 
 
 def get_expectation_impl(expectation_name: str) -> Type[Expectation]:
+    if expectation_name not in _registered_expectations:
+        _register_core_expectation(expectation_type=expectation_name)
+
     expectation: Type[Expectation] | None = _registered_expectations.get(expectation_name)
     if not expectation:
         raise gx_exceptions.ExpectationNotFoundError(f"{expectation_name} not found")  # noqa: TRY003
@@ -401,6 +435,8 @@ def get_expectation_impl(expectation_name: str) -> Type[Expectation]:
 def list_registered_expectation_implementations(
     expectation_root: Optional[Type[Expectation]] = None,
 ) -> List[str]:
+    register_core_expectations()
+
     registered_expectation_implementations = []
     for (
         expectation_name,
@@ -1,21 +1,28 @@
 from __future__ import annotations
 
 import enum
+import functools
 import operator
 from dataclasses import dataclass
 from string import punctuation
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Tuple, Union
 
+import pandas as pd
 from pyparsing import (
+    CaselessKeyword,
     CaselessLiteral,
     Combine,
     Literal,
     ParseException,
     Regex,
+    StringEnd,
     Suppress,
     Word,
     alphanums,
     alphas,
+    delimitedList,
+    infixNotation,
+    opAssoc,
 )
 
 import great_expectations.exceptions as gx_exceptions
@@ -26,44 +33,9 @@ from great_expectations.types import SerializableDictDot
 from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 if TYPE_CHECKING:
-    from great_expectations.compatibility import pyspark, sqlalchemy
-
-
-def _set_notnull(s, l, t) -> None:  # noqa: E741 # ambiguous name `l`
-    t["notnull"] = True
+    import numpy as np
 
-
-WHITESPACE_CHARS = " \t"
-column_name = Combine(
-    Suppress(Literal('col("'))
-    + Word(alphas, f"{alphanums}_-.").setResultsName("column")
-    + Suppress(Literal('")'))
-)
-gt = Literal(">")
-lt = Literal("<")
-ge = Literal(">=")
-le = Literal("<=")
-eq = Literal("==")
-ne = Literal("!=")
-ops = (gt ^ lt ^ ge ^ le ^ eq ^ ne).setResultsName("op")
-fnumber = Regex(r"[+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?").setResultsName("fnumber")
-punctuation_without_apostrophe = punctuation.replace('"', "").replace("'", "")
-condition_value_chars = alphanums + punctuation_without_apostrophe + WHITESPACE_CHARS
-condition_value = Suppress('"') + Word(f"{condition_value_chars}._").setResultsName(
-    "condition_value"
-) + Suppress('"') ^ Suppress("'") + Word(f"{condition_value_chars}._").setResultsName(
-    "condition_value"
-) + Suppress("'")
-date = (
-    Literal("date").setResultsName("date")
-    + Suppress(Literal("("))
-    + condition_value
-    + Suppress(Literal(")"))
-)
-not_null = CaselessLiteral(".notnull()").setResultsName("notnull")
-condition = (column_name + not_null).setParseAction(_set_notnull) ^ (
-    column_name + ops + (fnumber ^ condition_value ^ date)
-)
+    from great_expectations.compatibility import pyspark, sqlalchemy
 
 
 class ConditionParserError(gx_exceptions.GreatExpectationsError):
@@ -117,48 +89,6 @@ class RowCondition(SerializableDictDot):
         return convert_to_json_serializable(data=self.to_dict())
 
 
-def _parse_great_expectations_condition(row_condition: str):
-    try:
-        return condition.parseString(row_condition)
-    except ParseException:
-        raise ConditionParserError(f"unable to parse condition: {row_condition}")  # noqa: TRY003
-
-
-# noinspection PyUnresolvedReferences
-def parse_condition_to_spark(  # type: ignore[return] # return or raise exists for all branches  # noqa: C901, PLR0911
-    row_condition: str,
-) -> pyspark.Column:
-    parsed = _parse_great_expectations_condition(row_condition)
-    column = parsed["column"]
-    if "condition_value" in parsed:
-        if parsed["op"] == "==":
-            return F.col(column) == parsed["condition_value"]
-        else:
-            raise ConditionParserError(  # noqa: TRY003
-                f"Invalid operator: {parsed['op']} for string literal spark condition."
-            )
-    elif "fnumber" in parsed:
-        try:
-            num: int | float = int(parsed["fnumber"])
-        except ValueError:
-            num = float(parsed["fnumber"])
-        op = parsed["op"]
-        if op == ">":
-            return F.col(column) > num
-        elif op == "<":
-            return F.col(column) < num
-        elif op == ">=":
-            return F.col(column) >= num
-        elif op == "<=":
-            return F.col(column) <= num
-        elif op == "==":
-            return F.col(column) == num
-    elif "notnull" in parsed and parsed["notnull"] is True:
-        return F.col(column).isNotNull()
-    else:
-        raise ConditionParserError(f"unrecognized column condition: {row_condition}")  # noqa: TRY003
-
-
 def generate_condition_by_operator(column, op, value):
     operators = {
         "==": operator.eq,
@@ -171,26 +101,293 @@ def generate_condition_by_operator(column, op, value):
     return operators[op](column, value)
 
 
+# Rows of a pandas DataFrame for which a condition is (definitely) True and (definitely) False.  As
+# in SQL and Spark, a condition on a null value is neither, so that e.g. NOT filters out nulls too.
+_PandasMasks = Tuple[pd.Series, pd.Series]
+
+
+@dataclass(frozen=True)
+class DateValue:
+    """Value of a "date(...)" literal."""
+
+    value: str
+
+    def to_sqlalchemy(self) -> str:
+        return f"date({self.value})"
+
+    def to_spark(self) -> pyspark.Column:
+        return F.to_date(F.lit(self.value))
+
+    def to_pandas(self) -> pd.Timestamp:
+        return pd.Timestamp(self.value)
+
+
+RowConditionValue = Union[int, float, str, DateValue]
+
+
+def _lower_value(value: RowConditionValue, engine: str) -> Any:
+    if isinstance(value, DateValue):
+        return getattr(value, f"to_{engine}")()
+    return value
+
+
+class RowConditionNode:
+    """Node of a parsed (great_expectations) row condition, lowered to every execution engine."""
+
+    def to_sqlalchemy(self) -> sqlalchemy.ColumnElement:
+        raise NotImplementedError
+
+    def to_spark(self) -> pyspark.Column:
+        raise NotImplementedError
+
+    def to_pandas_masks(self, df: pd.DataFrame) -> _PandasMasks:
+        raise NotImplementedError
+
+    def to_pandas(self, df: pd.DataFrame) -> pd.Series:
+        """Boolean mask of the rows of "df" that satisfy the condition."""
+        return self.to_pandas_masks(df)[0]
+
+
+@dataclass(frozen=True)
+class ColumnComparison(RowConditionNode):
+    column: str
+    op: str
+    value: RowConditionValue
+
+    @override
+    def to_sqlalchemy(self) -> sqlalchemy.ColumnElement:
+        return generate_condition_by_operator(
+            sa.column(self.column), self.op, _lower_value(self.value, "sqlalchemy")
+        )
+
+    @override
+    def to_spark(self) -> pyspark.Column:
+        return generate_condition_by_operator(
+            F.col(self.column), self.op, _lower_value(self.value, "spark")
+        )
+
+    @override
+    def to_pandas_masks(self, df: pd.DataFrame) -> _PandasMasks:
+        column: pd.Series = df[self.column]
+        is_true = generate_condition_by_operator(
+            column, self.op, _lower_value(self.value, "pandas")
+        )
+        return _with_nulls_unknown(column, is_true)
+
+
+@dataclass(frozen=True)
+class ColumnNotNull(RowConditionNode):
+    column: str
+
+    @override
+    def to_sqlalchemy(self) -> sqlalchemy.ColumnElement:
+        return sa.not_(sa.column(self.column).is_(None))
+
+    @override
+    def to_spark(self) -> pyspark.Column:
+        return F.col(self.column).isNotNull()
+
+    @override
+    def to_pandas_masks(self, df: pd.DataFrame) -> _PandasMasks:
+        is_true: pd.Series = df[self.column].notna()
+        return is_true, ~is_true
+
+
+@dataclass(frozen=True)
+class ColumnIn(RowConditionNode):
+    column: str
+    values: Tuple[RowConditionValue, ...]
+
+    @override
+    def to_sqlalchemy(self) -> sqlalchemy.ColumnElement:
+        return sa.column(self.column).in_(
+            [_lower_value(value, "sqlalchemy") for value in self.values]
+        )
+
+    @override
+    def to_spark(self) -> pyspark.Column:
+        return F.col(self.column).isin([_lower_value(value, "spark") for value in self.values])
+
+    @override
+    def to_pandas_masks(self, df: pd.DataFrame) -> _PandasMasks:
+        column: pd.Series = df[self.column]
+        is_true = column.isin([_lower_value(value, "pandas") for value in self.values])
+        return _with_nulls_unknown(column, is_true)
+
+
+@dataclass(frozen=True)
+class ColumnBetween(RowConditionNode):
+    """Inclusive range, like SQL "BETWEEN"."""
+
+    column: str
+    min_value: RowConditionValue
+    max_value: RowConditionValue
+
+    @override
+    def to_sqlalchemy(self) -> sqlalchemy.ColumnElement:
+        return sa.column(self.column).between(
+            _lower_value(self.min_value, "sqlalchemy"), _lower_value(self.max_value, "sqlalchemy")
+        )
+
+    @override
+    def to_spark(self) -> pyspark.Column:
+        return F.col(self.column).between(
+            _lower_value(self.min_value, "spark"), _lower_value(self.max_value, "spark")
+        )
+
+    @override
+    def to_pandas_masks(self, df: pd.DataFrame) -> _PandasMasks:
+        column: pd.Series = df[self.column]
+        is_true = column.between(
+            _lower_value(self.min_value, "pandas"), _lower_value(self.max_value, "pandas")
+        )
+        return _with_nulls_unknown(column, is_true)
+
+
+@dataclass(frozen=True)
+class And(RowConditionNode):
+    operands: Tuple[RowConditionNode, ...]
+
+    @override
+    def to_sqlalchemy(self) -> sqlalchemy.ColumnElement:
+        return sa.and_(*(operand.to_sqlalchemy() for operand in self.operands))
+
+    @override
+    def to_spark(self) -> pyspark.Column:
+        return functools.reduce(operator.and_, (operand.to_spark() for operand in self.operands))
+
+    @override
+    def to_pandas_masks(self, df: pd.DataFrame) -> _PandasMasks:
+        operand_masks = [operand.to_pandas_masks(df) for operand in self.operands]
+        return (
+            functools.reduce(operator.and_, (is_true for is_true, _ in operand_masks)),
+            functools.reduce(operator.or_, (is_false for _, is_false in operand_masks)),
+        )
+
+
+@dataclass(frozen=True)
+class Or(RowConditionNode):
+    operands: Tuple[RowConditionNode, ...]
+
+    @override
+    def to_sqlalchemy(self) -> sqlalchemy.ColumnElement:
+        return sa.or_(*(operand.to_sqlalchemy() for operand in self.operands))
+
+    @override
+    def to_spark(self) -> pyspark.Column:
+        return functools.reduce(operator.or_, (operand.to_spark() for operand in self.operands))
+
+    @override
+    def to_pandas_masks(self, df: pd.DataFrame) -> _PandasMasks:
+        operand_masks = [operand.to_pandas_masks(df) for operand in self.operands]
+        return (
+            functools.reduce(operator.or_, (is_true for is_true, _ in operand_masks)),
+            functools.reduce(operator.and_, (is_false for _, is_false in operand_masks)),
+        )
+
+
+@dataclass(frozen=True)
+class Not(RowConditionNode):
+    operand: RowConditionNode
+
+    @override
+    def to_sqlalchemy(self) -> sqlalchemy.ColumnElement:
+        return sa.not_(self.operand.to_sqlalchemy())
+
+    @override
+    def to_spark(self) -> pyspark.Column:
+        return ~self.operand.to_spark()
+
+    @override
+    def to_pandas_masks(self, df: pd.DataFrame) -> _PandasMasks:
+        is_true, is_false = self.operand.to_pandas_masks(df)
+        return is_false, is_true
+
+
+def _with_nulls_unknown(column: pd.Series, is_true: pd.Series | np.ndarray) -> _PandasMasks:
+    is_known: pd.Series = column.notna()
+    return is_true & is_known, ~is_true & is_known
+
+
+def _to_number(number: str) -> int | float:
+    try:
+        return int(number)
+    except ValueError:
+        return float(number)
+
+
+# Compound conditions: predicates on single columns, combined with AND, OR, NOT and parentheses.
+_column = Combine(
+    Suppress(Literal('col("')) + Word(alphas, f"{alphanums}_-.") + Suppress(Literal('")'))
+)
+_op = Literal(">") ^ Literal("<") ^ Literal(">=") ^ Literal("<=") ^ Literal("==") ^ Literal("!=")
+_number = Regex(r"[+-]?\d+(?:\.\d*)?(?:[eE][+-]?\d+)?").setParseAction(lambda t: _to_number(t[0]))
+# Quoted strings contain no quotes (of either kind).
+_string_chars = Word(alphanums + punctuation.replace('"', "").replace("'", "") + " \t._")
+_string = (Suppress('"') + _string_chars + Suppress('"')) ^ (
+    Suppress("'") + _string_chars + Suppress("'")
+)
+_date = (
+    Suppress(Literal("date")) + Suppress(Literal("(")) + _string + Suppress(Literal(")"))
+).setParseAction(lambda t: DateValue(t[0]))
+_value = _date | _number | _string
+_comparison = (_column + _op + _value).setParseAction(
+    lambda t: ColumnComparison(column=t[0], op=t[1], value=t[2])
+)
+_not_null = (_column + Suppress(CaselessLiteral(".notnull()"))).setParseAction(
+    lambda t: ColumnNotNull(column=t[0])
+)
+_in = (
+    _column
+    + Suppress(CaselessLiteral(".isin(") + Literal("["))
+    + delimitedList(_value)
+    + Suppress(Literal("]") + Literal(")"))
+).setParseAction(lambda t: ColumnIn(column=t[0], values=tuple(t[1:])))
+_between = (
+    _column
+    + Suppress(CaselessLiteral(".between("))
+    + _value
+    + Suppress(Literal(","))
+    + _value
+    + Suppress(Literal(")"))
+).setParseAction(lambda t: ColumnBetween(column=t[0], min_value=t[1], max_value=t[2]))
+_predicate = _not_null | _in | _between | _comparison
+compound_condition = (
+    infixNotation(
+        _predicate,
+        [
+            (CaselessKeyword("not"), 1, opAssoc.RIGHT, lambda t: Not(operand=t[0][1])),
+            (CaselessKeyword("and"), 2, opAssoc.LEFT, lambda t: And(operands=tuple(t[0][::2]))),
+            (CaselessKeyword("or"), 2, opAssoc.LEFT, lambda t: Or(operands=tuple(t[0][::2]))),
+        ],
+    )
+    + StringEnd()
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def parse_row_condition(row_condition: str) -> RowConditionNode:
+    """Parses a (great_expectations) row condition once; nodes are immutable, so they are shared.
+
+    Besides single predicates (e.g., 'col("x") > 5', 'col("x").notnull()'), conditions may use
+    'col("x").isin([1, 2])', 'col("x").between(1, 5)' and combine them with AND, OR, NOT.
+    """
+    try:
+        return compound_condition.parseString(row_condition)[0]
+    except ParseException:
+        raise ConditionParserError(f"unable to parse condition: {row_condition}")  # noqa: TRY003
+
+
+def parse_condition_to_spark(row_condition: str) -> pyspark.Column:
+    return parse_row_condition(row_condition).to_spark()
+
+
 def parse_condition_to_sqlalchemy(
     row_condition: str,
 ) -> sqlalchemy.ColumnElement:
-    parsed = _parse_great_expectations_condition(row_condition)
-    column = parsed["column"]
-    if "date" in parsed:
-        date_value: str = parsed["condition_value"]
-        cast_as_date = f"date({date_value})"
-        return generate_condition_by_operator(sa.column(column), parsed["op"], cast_as_date)
-
-    elif "condition_value" in parsed:
-        return generate_condition_by_operator(
-            sa.column(column), parsed["op"], parsed["condition_value"]
-        )
-    elif "fnumber" in parsed:
-        number_value = parsed["fnumber"]
-        num = int(number_value) if number_value.isdigit() else float(number_value)
-        return generate_condition_by_operator(sa.column(column), parsed["op"], num)
-
-    elif "notnull" in parsed and parsed["notnull"] is True:
-        return sa.not_(sa.column(column).is_(None))
-    else:
-        raise ConditionParserError(f"unrecognized column condition: {row_condition}")  # noqa: TRY003
+    return parse_row_condition(row_condition).to_sqlalchemy()
+
+
+def parse_condition_to_pandas(row_condition: str, df: pd.DataFrame) -> pd.Series:
+    """Boolean mask of the rows of "df" that satisfy the row condition."""
+    return parse_row_condition(row_condition).to_pandas(df)
@@ -18,6 +18,9 @@ from great_expectations.core.metric_domain_types import MetricDomainTypes
 from great_expectations.data_context.util import instantiate_class_from_config
 from great_expectations.experimental.rule_based_profiler.domain_builder import DomainBuilder
 from great_expectations.experimental.rule_based_profiler.exceptions import ProfilerExecutionError
+from great_expectations.experimental.rule_based_profiler.helpers.resolved_metrics_cache import (
+    get_metric,
+)
 from great_expectations.experimental.rule_based_profiler.helpers.util import (
     build_domains_from_column_names,
     get_parameter_value_and_validate_return_type,
@@ -207,7 +210,8 @@ class ColumnDomainBuilder(DomainBuilder):
         if validator is None:
             validator = self.get_validator(variables=variables)
 
-        table_columns: List[str] = validator.get_metric(  # type: ignore[union-attr] # could be None
+        table_columns: List[str] = get_metric(
+            validator=validator,  # type: ignore[arg-type] # could be None
             metric=MetricConfiguration(
                 metric_name="table.columns",
                 metric_domain_kwargs={
@@ -217,7 +221,7 @@ class ColumnDomainBuilder(DomainBuilder):
                 metric_value_kwargs={
                     "include_nested": False,
                 },
-            )
+            ),
         )
         self._table_column_names = table_columns
 
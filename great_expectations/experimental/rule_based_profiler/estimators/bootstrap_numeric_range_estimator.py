@@ -1,14 +1,15 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.experimental.rule_based_profiler.estimators.numeric_range_estimator import (
     NumericRangeEstimator,
 )
 from great_expectations.experimental.rule_based_profiler.exceptions import ProfilerExecutionError
 from great_expectations.experimental.rule_based_profiler.helpers.util import (
-    compute_bootstrap_quantiles_point_estimate,
+    compute_bootstrap_quantiles_point_estimates,
     get_false_positive_rate_from_rule_state,
     get_parameter_value_and_validate_return_type,
     get_quantile_statistic_interpolation_method_from_rule_state,
@@ -43,6 +44,9 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
     (Please refer to "https://docs.scipy.org/doc/scipy/reference/generated/scipy.stats.bootstrap.html" for details.)
     """  # noqa: E501
 
+    # Vectors of "Domain" objects, resolving equal estimation arguments, are estimated together.
+    _compute_numeric_range_estimates = staticmethod(compute_bootstrap_quantiles_point_estimates)
+
     def __init__(
         self,
         configuration: Optional[Attributes] = None,
@@ -52,6 +56,7 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
             configuration=configuration,
         )
 
+    @override
     def _get_numeric_range_estimate(
         self,
         metric_values: np.ndarray,
@@ -59,10 +64,47 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
     ) -> NumericRangeEstimationResult:
-        if is_ndarray_datetime_dtype(
-            data=metric_values,
-            parse_strings_as_datetimes=True,
-            fuzzy=False,
+        return self._get_numeric_range_estimates(
+            metric_values_list=[metric_values],
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )[0]
+
+    @override
+    def _get_numeric_range_estimates(
+        self,
+        metric_values_list: List[np.ndarray],
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[NumericRangeEstimationResult]:
+        return self._compute_numeric_range_estimates(
+            metric_values_list=metric_values_list,
+            **self._get_estimation_kwargs(
+                metric_values_list=metric_values_list,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            ),
+        )
+
+    @override
+    def _get_estimation_kwargs(
+        self,
+        metric_values_list: List[np.ndarray],
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Dict[str, Any]:
+        metric_values: np.ndarray
+        if any(
+            is_ndarray_datetime_dtype(
+                data=metric_values,
+                parse_strings_as_datetimes=True,
+                fuzzy=False,
+            )
+            for metric_values in metric_values_list
         ):
             raise ProfilerExecutionError(
                 message=f'Estimator "{self.__class__.__name__}" does not support DateTime/TimeStamp data types.'  # noqa: E501
@@ -133,12 +175,11 @@ class BootstrapNumericRangeEstimator(NumericRangeEstimator):
                 DEFAULT_BOOTSTRAP_QUANTILE_BIAS_STD_ERROR_RATIO_THRESHOLD
             )
 
-        return compute_bootstrap_quantiles_point_estimate(
-            metric_values=metric_values,
-            false_positive_rate=false_positive_rate,
-            n_resamples=n_resamples,
-            random_seed=random_seed,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
-            quantile_bias_correction=quantile_bias_correction,
-            quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
-        )
+        return {
+            "false_positive_rate": false_positive_rate,
+            "n_resamples": n_resamples,
+            "random_seed": random_seed,
+            "quantile_statistic_interpolation_method": quantile_statistic_interpolation_method,
+            "quantile_bias_correction": quantile_bias_correction,
+            "quantile_bias_std_error_ratio_threshold": quantile_bias_std_error_ratio_threshold,
+        }
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import itertools
 import logging
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 
 from great_expectations.compatibility.typing_extensions import override
 from great_expectations.types import SerializableDictDot
@@ -82,6 +83,113 @@ class NumericRangeEstimator(ABC, SerializableDictDot):
             parameters=parameters,
         )
 
+    def get_numeric_range_estimates(
+        self,
+        metric_values_list: List[np.ndarray],
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[NumericRangeEstimationResult]:
+        """
+        Method that invokes implementation of the estimation algorithm for many vectors of metric values at once.
+        Args:
+            metric_values_list: "numpy.ndarray" objects, each to be estimated as by "get_numeric_range_estimate()".
+            domain: "Domain" object that is context for execution of this "NumericRangeEstimator" object.
+            variables: attribute name/value pairs
+            parameters: Dictionary of "ParameterContainer" objects corresponding to all "Domain" objects in memory.
+
+        Returns:
+            "NumericRangeEstimationResult" objects, one per element of "metric_values_list" (in the same order).
+        """  # noqa: E501
+        return self._get_numeric_range_estimates(
+            metric_values_list=metric_values_list,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+    @staticmethod
+    def get_numeric_range_estimates_for_domains(
+        numeric_range_estimators: List[NumericRangeEstimator],
+        metric_values_lists: List[List[np.ndarray]],
+        domains: List[Domain],
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[List[NumericRangeEstimationResult]]:
+        """
+        Estimates vectors of metric values of many "Domain" objects, each by its own "NumericRangeEstimator" object.
+
+        Vectors of all "Domain" objects, whose estimators are of the same type and resolve equal estimation arguments,
+        are estimated in one invocation of the estimation algorithm; others are estimated one "Domain" at a time.
+        Args:
+            numeric_range_estimators: "NumericRangeEstimator" objects, one per "Domain" object.
+            metric_values_lists: Lists of "numpy.ndarray" objects, one per "Domain" object.
+            domains: "Domain" objects that are context for execution of respective "NumericRangeEstimator" objects.
+            variables: attribute name/value pairs
+            parameters: Dictionary of "ParameterContainer" objects corresponding to all "Domain" objects in memory.
+
+        Returns:
+            Lists of "NumericRangeEstimationResult" objects, one list per "Domain" object (in the same order).
+        """  # noqa: E501
+        numeric_range_estimation_results: List[List[NumericRangeEstimationResult]] = [
+            [] for _ in domains
+        ]
+        positions_by_estimation: Dict[Tuple[type, Tuple[Tuple[str, Any], ...]], List[int]] = {}
+
+        idx: int
+        numeric_range_estimator: NumericRangeEstimator
+        metric_values_list: List[np.ndarray]
+        domain: Domain
+        for idx, (numeric_range_estimator, metric_values_list, domain) in enumerate(
+            zip(numeric_range_estimators, metric_values_lists, domains)
+        ):
+            if not metric_values_list:
+                continue
+
+            estimation_kwargs: Optional[Dict[str, Any]] = (
+                numeric_range_estimator._get_estimation_kwargs(
+                    metric_values_list=metric_values_list,
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                )
+            )
+            if estimation_kwargs is None:
+                numeric_range_estimation_results[idx] = (
+                    numeric_range_estimator.get_numeric_range_estimates(
+                        metric_values_list=metric_values_list,
+                        domain=domain,
+                        variables=variables,
+                        parameters=parameters,
+                    )
+                )
+            else:
+                positions_by_estimation.setdefault(
+                    (type(numeric_range_estimator), tuple(estimation_kwargs.items())), []
+                ).append(idx)
+
+        estimator_class: type
+        estimation_kwargs_items: Tuple[Tuple[str, Any], ...]
+        positions: List[int]
+        for (
+            estimator_class,
+            estimation_kwargs_items,
+        ), positions in positions_by_estimation.items():
+            estimates: Iterator[NumericRangeEstimationResult] = iter(
+                estimator_class._compute_numeric_range_estimates(
+                    metric_values_list=list(
+                        itertools.chain.from_iterable(metric_values_lists[idx] for idx in positions)
+                    ),
+                    **dict(estimation_kwargs_items),
+                )
+            )
+            for idx in positions:
+                numeric_range_estimation_results[idx] = list(
+                    itertools.islice(estimates, len(metric_values_lists[idx]))
+                )
+
+        return numeric_range_estimation_results
+
     @abstractmethod
     def _get_numeric_range_estimate(
         self,
@@ -95,6 +203,50 @@ class NumericRangeEstimator(ABC, SerializableDictDot):
         """
         pass
 
+    def _get_numeric_range_estimates(
+        self,
+        metric_values_list: List[np.ndarray],
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> List[NumericRangeEstimationResult]:
+        """
+        Estimates each vector on its own (subclasses may override this to estimate them together).
+        """
+        metric_values: np.ndarray
+        return [
+            self._get_numeric_range_estimate(
+                metric_values=metric_values,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+            for metric_values in metric_values_list
+        ]
+
+    def _get_estimation_kwargs(
+        self,
+        metric_values_list: List[np.ndarray],
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Arguments of "_compute_numeric_range_estimates()", resolved for "domain" (or "None", if vectors of metric values
+        of different "Domain" objects cannot be estimated together, which is the default).
+        """  # noqa: E501
+        return None
+
+    @staticmethod
+    def _compute_numeric_range_estimates(
+        metric_values_list: List[np.ndarray], **kwargs
+    ) -> List[NumericRangeEstimationResult]:
+        """
+        Estimation algorithm, given resolved estimation arguments (subclasses, which implement "_get_estimation_kwargs()",
+        must implement this method).
+        """  # noqa: E501
+        raise NotImplementedError
+
     @override
     def to_dict(self) -> dict:
         """
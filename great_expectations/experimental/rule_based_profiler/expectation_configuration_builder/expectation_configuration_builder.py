@@ -149,6 +149,34 @@ class ExpectationConfigurationBuilder(ABC, Builder):
                 runtime_configuration=runtime_configuration,
             )
 
+    def resolve_validation_dependencies_for_domains(  # noqa: PLR0913
+        self,
+        domains: List[Domain],
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        """
+        Resolves validation dependencies of all "domains", building parameters of every "ParameterBuilder" object for
+        all of them at once (as opposed to "resolve_validation_dependencies()", which handles one "Domain" object).
+        """  # noqa: E501
+        validation_parameter_builders: List[ParameterBuilder] = (
+            self.validation_parameter_builders or []
+        )
+
+        validation_parameter_builder: ParameterBuilder
+        for validation_parameter_builder in validation_parameter_builders:
+            validation_parameter_builder.build_parameters_for_domains(
+                domains=domains,
+                variables=variables,
+                parameters=parameters,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
+
     @abstractmethod
     def _build_expectation_configuration(
         self,
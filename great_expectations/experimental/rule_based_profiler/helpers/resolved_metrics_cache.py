@@ -0,0 +1,186 @@
+"""Metrics resolved once per "RuleBasedProfiler.run()" and shared by all of its Rules.
+
+Domain Builders and Parameter Builders of different Rules request many of the same metrics (e.g.,
+"table.columns", "column.min" of every numeric column, "column.distinct_values" for detecting
+categorical columns).  Metric requests depend on results of earlier ones (Domains, Parameters), so
+they cannot all be collected up front; instead, every metric resolved during a profiler run is
+kept, and the "ValidationGraph" built for each later request is pruned at metrics already resolved
+(whose values are handed to the graph), so that each metric is computed only once per run.
+
+Only final metric values are kept: partial functions (e.g., "*.map", "*.condition",
+"*.aggregate_fn") are bound to the data of the "Validator" that computed them.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Tuple
+
+from great_expectations.core.metric_function_types import MetricPartialFunctionTypeSuffixes
+from great_expectations.validator.validation_graph import MetricEdge, ValidationGraph
+
+if TYPE_CHECKING:
+    from great_expectations.validator.computed_metric import MetricValue
+    from great_expectations.validator.metric_configuration import MetricConfiguration
+    from great_expectations.validator.metrics_calculator import (
+        _AbortedMetricsInfoDict,
+        _MetricKey,
+        _MetricsDict,
+    )
+    from great_expectations.validator.validator import Validator
+
+_PARTIAL_METRIC_NAME_SUFFIXES = tuple(suffix.value for suffix in MetricPartialFunctionTypeSuffixes)
+
+
+class ResolvedMetricsCache:
+    """Final metric values, keyed by "MetricConfiguration.id" (which includes the "batch_id")."""
+
+    def __init__(self) -> None:
+        self._resolved_metrics: Dict[_MetricKey, MetricValue] = {}
+
+    def __len__(self) -> int:
+        return len(self._resolved_metrics)
+
+    def __contains__(self, metric_id: _MetricKey) -> bool:
+        return metric_id in self._resolved_metrics
+
+    def __getitem__(self, metric_id: _MetricKey) -> MetricValue:
+        return self._resolved_metrics[metric_id]
+
+    def add(self, resolved_metrics: Dict[_MetricKey, MetricValue]) -> None:
+        metric_id: _MetricKey
+        metric_value: MetricValue
+        for metric_id, metric_value in resolved_metrics.items():
+            if metric_id[0].rpartition(".")[2] not in _PARTIAL_METRIC_NAME_SUFFIXES:
+                self._resolved_metrics[metric_id] = metric_value
+
+
+_active_resolved_metrics_cache: ContextVar[Optional[ResolvedMetricsCache]] = ContextVar(
+    "_active_resolved_metrics_cache", default=None
+)
+
+
+@contextmanager
+def resolved_metrics_cache() -> Iterator[ResolvedMetricsCache]:
+    """Shares resolved metrics among all metric computations within its scope (nested scopes share the outermost cache)."""  # noqa: E501
+    cache: Optional[ResolvedMetricsCache] = _active_resolved_metrics_cache.get()
+    if cache is not None:
+        yield cache
+        return
+
+    cache = ResolvedMetricsCache()
+    token = _active_resolved_metrics_cache.set(cache)
+    try:
+        yield cache
+    finally:
+        _active_resolved_metrics_cache.reset(token)
+
+
+def compute_metrics(
+    validator: Validator,
+    metric_configurations: List[MetricConfiguration],
+    runtime_configuration: Optional[dict] = None,
+) -> Tuple[_MetricsDict, _AbortedMetricsInfoDict]:
+    """Resolves metrics like "Validator.compute_metrics()", reusing those of the active cache (if any).
+
+    Returns:
+        Tuple of resolved metrics (keyed by metric ID) and aborted metrics information.
+    """  # noqa: E501
+    cache: Optional[ResolvedMetricsCache] = _active_resolved_metrics_cache.get()
+    if cache is None:
+        return validator.compute_metrics(
+            metric_configurations=metric_configurations,
+            runtime_configuration=runtime_configuration,
+            min_graph_edges_pbar_enable=0,
+        )
+
+    resolved_metrics: _MetricsDict = {}
+    metrics_to_compute: List[MetricConfiguration] = []
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metric_configurations:
+        if metric_configuration.id in cache:
+            resolved_metrics[metric_configuration.id] = cache[metric_configuration.id]
+        else:
+            metrics_to_compute.append(metric_configuration)
+
+    aborted_metrics_info: _AbortedMetricsInfoDict = {}
+    if metrics_to_compute:
+        metrics_calculator = validator.metrics_calculator
+        graph: ValidationGraph = metrics_calculator.build_metric_dependency_graph(
+            metric_configurations=metrics_to_compute,
+            runtime_configuration=runtime_configuration,
+        )
+        known_metrics: _MetricsDict
+        graph, known_metrics = _prune_validation_graph(
+            validator=validator,
+            graph=graph,
+            metric_configurations=metrics_to_compute,
+            cache=cache,
+        )
+        computed_metrics: _MetricsDict
+        (
+            computed_metrics,
+            aborted_metrics_info,
+        ) = metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
+            graph=graph,
+            runtime_configuration=runtime_configuration,
+            min_graph_edges_pbar_enable=0,
+            resolved_metrics=known_metrics,
+        )
+        cache.add(computed_metrics)
+        resolved_metrics.update(computed_metrics)
+
+    return resolved_metrics, aborted_metrics_info
+
+
+def get_metric(validator: Validator, metric: MetricConfiguration) -> MetricValue:
+    """Resolves a single metric like "Validator.get_metric()", reusing the active cache (if any)."""
+    resolved_metrics: _MetricsDict
+    resolved_metrics, _ = compute_metrics(validator=validator, metric_configurations=[metric])
+    return resolved_metrics[metric.id]
+
+
+def _prune_validation_graph(
+    validator: Validator,
+    graph: ValidationGraph,
+    metric_configurations: List[MetricConfiguration],
+    cache: ResolvedMetricsCache,
+) -> Tuple[ValidationGraph, _MetricsDict]:
+    """Keeps only edges needed to resolve the given metrics, stopping at metrics already in cache.
+
+    Returns:
+        Tuple of the pruned "ValidationGraph" and the cached values of metrics at which it was cut.
+    """
+    edges_by_metric_id: Dict[_MetricKey, List[MetricEdge]] = {}
+    edge: MetricEdge
+    for edge in graph.edges:
+        edges_by_metric_id.setdefault(edge.left.id, []).append(edge)
+
+    # Metric IDs are final only after the graph is built (it sets default metric kwargs).
+    known_metrics: _MetricsDict = {
+        metric_configuration.id: cache[metric_configuration.id]
+        for metric_configuration in metric_configurations
+        if metric_configuration.id in cache
+    }
+    metric_ids_to_visit: List[_MetricKey] = [
+        metric_configuration.id
+        for metric_configuration in metric_configurations
+        if metric_configuration.id not in known_metrics
+    ]
+
+    pruned_graph = ValidationGraph(execution_engine=validator.execution_engine)
+    visited_metric_ids = set(metric_ids_to_visit)
+    while metric_ids_to_visit:
+        for edge in edges_by_metric_id.get(metric_ids_to_visit.pop(), []):
+            pruned_graph.add(edge)
+            if edge.right is None:
+                continue
+
+            if edge.right.id in cache:
+                known_metrics[edge.right.id] = cache[edge.right.id]
+            elif edge.right.id not in visited_metric_ids:
+                visited_metric_ids.add(edge.right.id)
+                metric_ids_to_visit.append(edge.right.id)
+
+    return pruned_graph, known_metrics
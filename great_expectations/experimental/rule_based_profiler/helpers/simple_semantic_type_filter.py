@@ -19,6 +19,9 @@ from great_expectations.core.domain import (
 )
 from great_expectations.core.profiler_types_mapping import ProfilerTypeMapping
 from great_expectations.experimental.rule_based_profiler.exceptions import ProfilerExecutionError
+from great_expectations.experimental.rule_based_profiler.helpers.resolved_metrics_cache import (
+    get_metric,
+)
 from great_expectations.experimental.rule_based_profiler.semantic_type_filter import (
     SemanticTypeFilter,
 )
@@ -99,7 +102,8 @@ class SimpleSemanticTypeFilter(SemanticTypeFilter):
         validator: Validator,
         column_names: Optional[List[str]] = None,
     ) -> None:
-        column_types_dict_list: List[Dict[str, Any]] = validator.get_metric(
+        column_types_dict_list: List[Dict[str, Any]] = get_metric(
+            validator=validator,
             metric=MetricConfiguration(
                 metric_name="table.column_types",
                 metric_domain_kwargs={
@@ -108,11 +112,12 @@ class SimpleSemanticTypeFilter(SemanticTypeFilter):
                 metric_value_kwargs={
                     "include_nested": True,
                 },
-            )
+            ),
         )
 
         if column_names is None:
-            column_names = validator.get_metric(
+            column_names = get_metric(
+                validator=validator,
                 metric=MetricConfiguration(
                     metric_name="table.columns",
                     metric_domain_kwargs={
@@ -121,7 +126,7 @@ class SimpleSemanticTypeFilter(SemanticTypeFilter):
                     metric_value_kwargs={
                         "include_nested": True,
                     },
-                )
+                ),
             )
 
         column_name: str
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
+import concurrent.futures
 import copy
-import datetime
 import hashlib
 import itertools
 import logging
@@ -19,6 +19,7 @@ from typing import (
     List,
     Optional,
     Protocol,
+    Sequence,
     Tuple,
     Union,
 )
@@ -48,6 +49,9 @@ from great_expectations.experimental.rule_based_profiler.estimators.numeric_rang
     NumericRangeEstimationResult,
 )
 from great_expectations.experimental.rule_based_profiler.exceptions import ProfilerExecutionError
+from great_expectations.experimental.rule_based_profiler.helpers.resolved_metrics_cache import (
+    compute_metrics,
+)
 from great_expectations.experimental.rule_based_profiler.parameter_container import (
     FULLY_QUALIFIED_PARAMETER_NAME_SEPARATOR_CHARACTER,
     VARIABLES_PREFIX,
@@ -97,6 +101,9 @@ RECOGNIZED_QUANTILE_STATISTIC_INTERPOLATION_METHODS: set = {
 
 NP_RANDOM_GENERATOR: Final = np.random.default_rng()
 
+# Upper bound on the number of resampled values held in memory at once by the batched estimators.
+MAX_RESAMPLED_ELEMENTS: Final[int] = 2**24
+
 
 def get_validator(  # noqa: PLR0913
     purpose: str,
@@ -365,14 +372,14 @@ def get_resolved_metrics_by_key(
     # Step 1: Gather "MetricConfiguration" objects corresponding to all possible key values/combinations.  # noqa: E501
     # and compute all metric values (resolve "MetricConfiguration" objects ) using a single method call.  # noqa: E501
     resolved_metrics: _MetricsDict
-    resolved_metrics, _ = validator.compute_metrics(
+    resolved_metrics, _ = compute_metrics(
+        validator=validator,
         metric_configurations=[
             metric_configuration
             for key, metric_configurations_for_key in metric_configurations_by_key.items()
             for metric_configuration in metric_configurations_for_key
         ],
         runtime_configuration=runtime_configuration,
-        min_graph_edges_pbar_enable=0,
     )
 
     # Step 2: Gather "MetricConfiguration" ID values for each key (one element per batch_id in every list).  # noqa: E501
@@ -686,40 +693,53 @@ def compute_kde_quantiles_point_estimate(  # noqa: PLR0913
         random_seed: An optional random_seed to pass to "np.random.Generator(np.random.PCG64(random_seed))"
             for making probabilistic sampling deterministic.
     """  # noqa: E501
-    lower_quantile_pct: float = false_positive_rate / 2.0
-    upper_quantile_pct: float = 1.0 - (false_positive_rate / 2.0)
-
-    metric_values_density_estimate: stats.gaussian_kde = stats.gaussian_kde(
-        metric_values, bw_method=bw_method
-    )
-
-    metric_values_gaussian_sample: np.ndarray
-    if random_seed:
-        metric_values_gaussian_sample = metric_values_density_estimate.resample(
-            n_resamples,
-            seed=random_seed,
-        )
-    else:
-        metric_values_gaussian_sample = metric_values_density_estimate.resample(
-            n_resamples,
-        )
+    return compute_kde_quantiles_point_estimates(
+        metric_values_list=[metric_values],
+        false_positive_rate=false_positive_rate,
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        bw_method=bw_method,
+        random_seed=random_seed,
+    )[0]
+
+
+def compute_kde_quantiles_point_estimates(  # noqa: PLR0913
+    metric_values_list: Sequence[np.ndarray],
+    false_positive_rate: np.float64,
+    n_resamples: int,
+    quantile_statistic_interpolation_method: str,
+    bw_method: Union[str, float, Callable],
+    random_seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> List[NumericRangeEstimationResult]:
+    """
+    Batched version of "compute_kde_quantiles_point_estimate()", processing many vectors of metric values at once.
 
-    lower_quantile_point_estimate: Union[np.float64, datetime.datetime] = numpy.numpy_quantile(
-        metric_values_gaussian_sample,
-        q=lower_quantile_pct,
-        method=quantile_statistic_interpolation_method,
-    )
-    upper_quantile_point_estimate: Union[np.float64, datetime.datetime] = numpy.numpy_quantile(
-        metric_values_gaussian_sample,
-        q=upper_quantile_pct,
-        method=quantile_statistic_interpolation_method,
-    )
+    Vectors of equal size are stacked and resampled together (in chunks, capping memory use); with "random_seed", every
+    vector is estimated exactly as it would be on its own.  With "max_workers" greater than 1, vectors are distributed
+    among as many worker processes.
 
-    return build_numeric_range_estimation_result(
-        metric_values=metric_values,
-        min_value=lower_quantile_point_estimate,
-        max_value=upper_quantile_point_estimate,
+    Returns:
+        "NumericRangeEstimationResult" objects, one per vector of metric values (in the same order).
+    """  # noqa: E501
+    value_ranges: List[Tuple[np.float64, np.float64]] = _fan_out_range_estimation(
+        estimate_ranges=_compute_kde_quantile_ranges,
+        metric_values_list=metric_values_list,
+        random_seed=random_seed,
+        max_workers=max_workers,
+        false_positive_rate=false_positive_rate,
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        bw_method=bw_method,
     )
+    return [
+        build_numeric_range_estimation_result(
+            metric_values=metric_values,
+            min_value=min_value,
+            max_value=max_value,
+        )
+        for metric_values, (min_value, max_value) in zip(metric_values_list, value_ranges)
+    ]
 
 
 def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
@@ -785,55 +805,228 @@ def compute_bootstrap_quantiles_point_estimate(  # noqa: PLR0913
     computing the stopping criterion, expressed as the optimal number of bootstrap samples, needed to achieve a maximum
     probability that the value of the statistic of interest will be minimally deviating from its actual (ideal) value.
     """  # noqa: E501
-    lower_quantile_pct: float = false_positive_rate / 2.0
-    upper_quantile_pct: float = 1.0 - false_positive_rate / 2.0
+    return compute_bootstrap_quantiles_point_estimates(
+        metric_values_list=[metric_values],
+        false_positive_rate=false_positive_rate,
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        quantile_bias_correction=quantile_bias_correction,
+        quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+        random_seed=random_seed,
+    )[0]
+
+
+def compute_bootstrap_quantiles_point_estimates(  # noqa: PLR0913
+    metric_values_list: Sequence[np.ndarray],
+    false_positive_rate: np.float64,
+    n_resamples: int,
+    quantile_statistic_interpolation_method: str,
+    quantile_bias_correction: bool,
+    quantile_bias_std_error_ratio_threshold: float,
+    random_seed: Optional[int] = None,
+    max_workers: Optional[int] = None,
+) -> List[NumericRangeEstimationResult]:
+    """
+    Batched version of "compute_bootstrap_quantiles_point_estimate()", processing many vectors of metric values at once.
 
-    sample_lower_quantile: np.ndarray = numpy.numpy_quantile(
-        a=metric_values,
-        q=lower_quantile_pct,
-        method=quantile_statistic_interpolation_method,
-    )
-    sample_upper_quantile: np.ndarray = numpy.numpy_quantile(
-        a=metric_values,
-        q=upper_quantile_pct,
-        method=quantile_statistic_interpolation_method,
-    )
+    Vectors of equal size are stacked and resampled together (in chunks, capping memory use), and both quantiles of all
+    resamples are computed in one pass; with "random_seed", every vector is estimated exactly as it would be on its own.
+    With "max_workers" greater than 1, vectors are distributed among as many worker processes.
 
-    bootstraps: np.ndarray
-    if random_seed:
-        random_state: np.random.Generator = np.random.Generator(np.random.PCG64(random_seed))
-        bootstraps = random_state.choice(metric_values, size=(n_resamples, metric_values.size))
-    else:
-        bootstraps = NP_RANDOM_GENERATOR.choice(
-            metric_values, size=(n_resamples, metric_values.size)
+    Returns:
+        "NumericRangeEstimationResult" objects, one per vector of metric values (in the same order).
+    """  # noqa: E501
+    value_ranges: List[Tuple[np.float64, np.float64]] = _fan_out_range_estimation(
+        estimate_ranges=_compute_bootstrap_quantile_ranges,
+        metric_values_list=metric_values_list,
+        random_seed=random_seed,
+        max_workers=max_workers,
+        false_positive_rate=false_positive_rate,
+        n_resamples=n_resamples,
+        quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
+        quantile_bias_correction=quantile_bias_correction,
+        quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+    )
+    return [
+        build_numeric_range_estimation_result(
+            metric_values=metric_values,
+            min_value=min_value,
+            max_value=max_value,
         )
+        for metric_values, (min_value, max_value) in zip(metric_values_list, value_ranges)
+    ]
 
-    lower_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
-        _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=lower_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
-            quantile_bias_correction=quantile_bias_correction,
-            quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
-            sample_quantile=sample_lower_quantile,
+
+def _fan_out_range_estimation(
+    estimate_ranges: Callable[..., List[Tuple[np.float64, np.float64]]],
+    metric_values_list: Sequence[np.ndarray],
+    random_seed: Optional[int],
+    max_workers: Optional[int],
+    **kwargs,
+) -> List[Tuple[np.float64, np.float64]]:
+    """Calls "estimate_ranges" on all vectors, or on parts of them in "max_workers" processes."""
+    num_parts: int = min(max_workers or 1, len(metric_values_list))
+    if num_parts < 2:  # noqa: PLR2004
+        return estimate_ranges(
+            metric_values_list=metric_values_list, random_seed=random_seed, **kwargs
         )
+
+    # Workers cannot draw from "NP_RANDOM_GENERATOR"; without "random_seed", seed them from it.
+    random_seeds: List[Optional[int]] = (
+        [random_seed] * num_parts
+        if random_seed
+        else NP_RANDOM_GENERATOR.integers(1, 2**32, size=num_parts).tolist()
     )
-    upper_quantile_bias_corrected_point_estimate: Union[np.float64, datetime.datetime] = (
-        _determine_quantile_bias_corrected_point_estimate(
-            bootstraps=bootstraps,
-            quantile_pct=upper_quantile_pct,
-            quantile_statistic_interpolation_method=quantile_statistic_interpolation_method,
-            quantile_bias_correction=quantile_bias_correction,
-            quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
-            sample_quantile=sample_upper_quantile,
+    parts: List[np.ndarray] = np.array_split(np.arange(len(metric_values_list)), num_parts)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=num_parts) as executor:
+        futures: List[concurrent.futures.Future] = [
+            executor.submit(
+                estimate_ranges,
+                metric_values_list=[metric_values_list[idx] for idx in part],
+                random_seed=part_random_seed,
+                **kwargs,
+            )
+            for part, part_random_seed in zip(parts, random_seeds)
+        ]
+        return list(itertools.chain.from_iterable(future.result() for future in futures))
+
+
+def _group_by_size(metric_values_list: Sequence[np.ndarray]) -> Dict[int, List[int]]:
+    """Positions of vectors of metric values, grouped by vector size (vectors of equal size are stacked)."""  # noqa: E501
+    positions_by_size: Dict[int, List[int]] = {}
+    idx: int
+    metric_values: np.ndarray
+    for idx, metric_values in enumerate(metric_values_list):
+        positions_by_size.setdefault(metric_values.size, []).append(idx)
+
+    return positions_by_size
+
+
+def _compute_bootstrap_quantile_ranges(  # noqa: PLR0913
+    metric_values_list: Sequence[np.ndarray],
+    false_positive_rate: np.float64,
+    n_resamples: int,
+    quantile_statistic_interpolation_method: str,
+    quantile_bias_correction: bool,
+    quantile_bias_std_error_ratio_threshold: float,
+    random_seed: Optional[int] = None,
+) -> List[Tuple[np.float64, np.float64]]:
+    quantile_pcts = np.asarray([false_positive_rate / 2.0, 1.0 - false_positive_rate / 2.0])
+
+    value_ranges: List[Tuple[np.float64, np.float64]] = [None] * len(metric_values_list)  # type: ignore[list-item] # filled in below
+    positions: List[int]
+    for positions in _group_by_size(metric_values_list=metric_values_list).values():
+        size: int = metric_values_list[positions[0]].size
+        # Positions are drawn as "Generator.choice(metric_values, size=(n_resamples, size))" draws
+        # values, so vectors of equal size share resamples (as they do when estimated on their own).
+        random_state: np.random.Generator = (
+            np.random.Generator(np.random.PCG64(random_seed))
+            if random_seed
+            else NP_RANDOM_GENERATOR
         )
-    )
+        resampled_positions: np.ndarray = random_state.choice(size, size=(n_resamples, size))
+        # Bound the number of resampled values held in memory at once.
+        max_vectors_per_batch: int = max(1, MAX_RESAMPLED_ELEMENTS // resampled_positions.size)
+        for start in range(0, len(positions), max_vectors_per_batch):
+            batch_positions: List[int] = positions[start : start + max_vectors_per_batch]
+            vectors: np.ndarray = np.stack([metric_values_list[idx] for idx in batch_positions])
+            sample_quantiles: np.ndarray = numpy.numpy_quantile(
+                a=vectors,
+                q=quantile_pcts,
+                axis=-1,
+                method=quantile_statistic_interpolation_method,
+            )
+            # Contiguous resamples make their (pairwise) sums, so estimates, batching-independent.
+            bootstrap_quantiles: np.ndarray = np.ascontiguousarray(
+                numpy.numpy_quantile(
+                    a=vectors[:, resampled_positions],
+                    q=quantile_pcts,
+                    axis=-1,
+                    method=quantile_statistic_interpolation_method,
+                )
+            )
+            point_estimates: np.ndarray = _determine_quantile_bias_corrected_point_estimates(
+                bootstrap_quantiles=bootstrap_quantiles,
+                quantile_bias_correction=quantile_bias_correction,
+                quantile_bias_std_error_ratio_threshold=quantile_bias_std_error_ratio_threshold,
+                sample_quantiles=sample_quantiles,
+            )
+            for batch_idx, idx in enumerate(batch_positions):
+                value_ranges[idx] = (point_estimates[0, batch_idx], point_estimates[1, batch_idx])
 
-    return build_numeric_range_estimation_result(
-        metric_values=metric_values,
-        min_value=lower_quantile_bias_corrected_point_estimate,
-        max_value=upper_quantile_bias_corrected_point_estimate,
+    return value_ranges
+
+
+def _compute_kde_quantile_ranges(  # noqa: PLR0913
+    metric_values_list: Sequence[np.ndarray],
+    false_positive_rate: np.float64,
+    n_resamples: int,
+    quantile_statistic_interpolation_method: str,
+    bw_method: Union[str, float, Callable],
+    random_seed: Optional[int] = None,
+) -> List[Tuple[np.float64, np.float64]]:
+    quantile_pcts = np.asarray([false_positive_rate / 2.0, 1.0 - false_positive_rate / 2.0])
+    # Bound the number of Gaussian samples held in memory at once.
+    max_vectors_per_batch: int = max(1, MAX_RESAMPLED_ELEMENTS // n_resamples)
+
+    value_ranges: List[Tuple[np.float64, np.float64]] = [None] * len(metric_values_list)  # type: ignore[list-item] # filled in below
+    positions: List[int]
+    for positions in _group_by_size(metric_values_list=metric_values_list).values():
+        for start in range(0, len(positions), max_vectors_per_batch):
+            batch_positions: List[int] = positions[start : start + max_vectors_per_batch]
+            vectors: np.ndarray = np.stack([metric_values_list[idx] for idx in batch_positions])
+            metric_values_gaussian_samples: np.ndarray = _resample_kde(
+                vectors=vectors,
+                n_resamples=n_resamples,
+                bw_method=bw_method,
+                random_seed=random_seed,
+            )
+            quantile_point_estimates: np.ndarray = numpy.numpy_quantile(
+                metric_values_gaussian_samples,
+                q=quantile_pcts,
+                axis=-1,
+                method=quantile_statistic_interpolation_method,
+            )
+            for batch_idx, idx in enumerate(batch_positions):
+                value_ranges[idx] = (
+                    quantile_point_estimates[0, batch_idx],
+                    quantile_point_estimates[1, batch_idx],
+                )
+
+    return value_ranges
+
+
+def _resample_kde(
+    vectors: np.ndarray,
+    n_resamples: int,
+    bw_method: Union[str, float, Callable],
+    random_seed: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Draws "n_resamples" samples from the Gaussian kernel density estimate of every row of "vectors" (shaped "K x N").
+
+    Equivalent to "scipy.stats.gaussian_kde(vector, bw_method=bw_method).resample(n_resamples)" for every vector: a
+    sample is a randomly chosen data point plus Gaussian noise, whose variance is the (bandwidth-scaled) covariance of
+    the kernel.  Without "random_seed", stacking vectors lets all samples be drawn at once, rather than once per vector;
+    seeded samples are drawn by "scipy" itself, so that they are reproduced exactly.
+    """  # noqa: E501
+    kernels: List[stats.gaussian_kde] = [
+        stats.gaussian_kde(vector, bw_method=bw_method) for vector in vectors
+    ]
+    if random_seed:
+        return np.stack([kernel.resample(n_resamples, seed=random_seed)[0] for kernel in kernels])
+
+    num_vectors: int
+    size: int
+    num_vectors, size = vectors.shape
+    kernel_standard_deviations: np.ndarray = np.sqrt(
+        [kernel.covariance[0, 0] for kernel in kernels]
     )
+    means: np.ndarray = np.take_along_axis(
+        vectors, NP_RANDOM_GENERATOR.integers(0, size, size=(num_vectors, n_resamples)), axis=-1
+    )
+    noise: np.ndarray = NP_RANDOM_GENERATOR.standard_normal(size=(num_vectors, n_resamples))
+    return means + kernel_standard_deviations[:, np.newaxis] * noise
 
 
 def build_numeric_range_estimation_result(
@@ -885,43 +1078,39 @@ def build_numeric_range_estimation_result(
     )
 
 
-def _determine_quantile_bias_corrected_point_estimate(  # noqa: PLR0913
-    bootstraps: np.ndarray,
-    quantile_pct: float,
-    quantile_statistic_interpolation_method: str,
+def _determine_quantile_bias_corrected_point_estimates(
+    bootstrap_quantiles: np.ndarray,
     quantile_bias_correction: bool,
     quantile_bias_std_error_ratio_threshold: float,
-    sample_quantile: np.ndarray,
-) -> np.float64:
-    bootstrap_quantiles: Union[np.ndarray, np.float64] = numpy.numpy_quantile(
-        bootstraps,
-        q=quantile_pct,
-        axis=1,
-        method=quantile_statistic_interpolation_method,
-    )
-    bootstrap_quantile_point_estimate: np.ndarray = np.mean(bootstrap_quantiles)
-    bootstrap_quantile_standard_error: np.ndarray = np.std(bootstrap_quantiles)
-    bootstrap_quantile_bias: float = bootstrap_quantile_point_estimate - sample_quantile
+    sample_quantiles: np.ndarray,
+) -> np.ndarray:
+    """Point estimates of quantiles (of any shape), from their bootstraps along the last axis."""
+    bootstrap_quantile_point_estimates: np.ndarray = np.mean(bootstrap_quantiles, axis=-1)
+    bootstrap_quantile_standard_errors: np.ndarray = np.std(bootstrap_quantiles, axis=-1)
+    bootstrap_quantile_biases: np.ndarray = bootstrap_quantile_point_estimates - sample_quantiles
 
     # Bias / Standard Error > 0.25 is a rule of thumb for when to apply bias correction.
     # See:
     # Efron, B., & Tibshirani, R. J. (1993). Estimates of bias. An Introduction to the Bootstrap (pp. 128).  # noqa: E501
     #         Springer Science and Business Media Dordrecht. DOI 10.1007/978-1-4899-4541-9
-    quantile_bias_corrected_point_estimate: np.float64
-
-    if (
-        not quantile_bias_correction
-        and bootstrap_quantile_standard_error > 0.0
-        and bootstrap_quantile_bias / bootstrap_quantile_standard_error
-        <= quantile_bias_std_error_ratio_threshold
-    ):
-        quantile_bias_corrected_point_estimate = bootstrap_quantile_point_estimate
-    else:
-        quantile_bias_corrected_point_estimate = (
-            bootstrap_quantile_point_estimate - bootstrap_quantile_bias
-        )
+    positive_standard_errors: np.ndarray = bootstrap_quantile_standard_errors > 0.0
+    bias_to_standard_error_ratios: np.ndarray = np.divide(
+        bootstrap_quantile_biases,
+        bootstrap_quantile_standard_errors,
+        out=np.zeros_like(bootstrap_quantile_biases),
+        where=positive_standard_errors,
+    )
+    keep_uncorrected: np.ndarray = (
+        (not quantile_bias_correction)
+        & positive_standard_errors
+        & (bias_to_standard_error_ratios <= quantile_bias_std_error_ratio_threshold)
+    )
 
-    return quantile_bias_corrected_point_estimate
+    return np.where(
+        keep_uncorrected,
+        bootstrap_quantile_point_estimates,
+        bootstrap_quantile_point_estimates - bootstrap_quantile_biases,
+    )
 
 
 def convert_metric_values_to_float_dtype_best_effort(
@@ -4,6 +4,7 @@ import copy
 import datetime
 import itertools
 import logging
+from dataclasses import dataclass
 from numbers import Number
 from typing import (
     TYPE_CHECKING,
@@ -11,6 +12,7 @@ from typing import (
     Callable,
     ClassVar,
     Dict,
+    Iterator,
     List,
     Optional,
     Set,
@@ -19,6 +21,7 @@ from typing import (
 
 import numpy as np
 
+from great_expectations.compatibility.typing_extensions import override
 from great_expectations.core.domain import Domain  # noqa: TCH001
 from great_expectations.experimental.rule_based_profiler.config import (
     ParameterBuilderConfig,  # noqa: TCH001
@@ -37,7 +40,7 @@ from great_expectations.experimental.rule_based_profiler.estimators.numeric_rang
     NumericRangeEstimationResult,
 )
 from great_expectations.experimental.rule_based_profiler.estimators.numeric_range_estimator import (
-    NumericRangeEstimator,  # noqa: TCH001
+    NumericRangeEstimator,
 )
 from great_expectations.experimental.rule_based_profiler.estimators.quantiles_numeric_range_estimator import (  # noqa: E501
     QuantilesNumericRangeEstimator,
@@ -72,6 +75,7 @@ from great_expectations.util import (
 )
 
 if TYPE_CHECKING:
+    from great_expectations.core.batch import Batch, BatchRequestBase
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
@@ -83,6 +87,39 @@ logger.setLevel(logging.INFO)
 MAX_DECIMALS: int = 9
 
 
+@dataclass
+class _MetricValueRangeEstimation:
+    """
+    Vectors of metric values of one "Domain" object (one per element of multi-dimensional metric), prepared for range
+    estimation, along with all that is needed to assemble their estimates into the range of multi-dimensional metric.
+    """  # noqa: E501
+
+    parameter_node: ParameterNode
+    numeric_range_estimator: NumericRangeEstimator
+    round_decimals: int
+    lower_bound: Optional[float]
+    upper_bound: Optional[float]
+    datetime_detected: bool
+    metric_value_vector_indices: List[tuple]
+    metric_value_vectors: List[np.ndarray]
+    is_degenerate: List[bool]
+    metric_value_range: np.ndarray
+    estimation_histogram: np.ndarray
+
+    @property
+    def estimated_metric_value_vectors(self) -> List[np.ndarray]:
+        """Vectors of metric values, whose distributions are not degenerate (so their ranges need be estimated)."""  # noqa: E501
+        metric_value_vector: np.ndarray
+        degenerate: bool
+        return [
+            metric_value_vector
+            for metric_value_vector, degenerate in zip(
+                self.metric_value_vectors, self.is_degenerate
+            )
+            if not degenerate
+        ]
+
+
 class NumericMetricRangeMultiBatchParameterBuilder(MetricMultiBatchParameterBuilder):
     """
     A Multi-Batch implementation for obtaining the range estimation bounds for a resolved (evaluated) numeric metric,
@@ -330,6 +367,113 @@ detected.
          9. Return [low, high] for the desired metric as estimated by the specified sampling method.
         10. Set up the arguments and call build_parameter_container() to store the parameter as part of "rule state".
         """  # noqa: E501
+        metric_value_range_estimation: _MetricValueRangeEstimation = (
+            self._prepare_metric_value_range_estimation(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+                runtime_configuration=runtime_configuration,
+            )
+        )
+        numeric_range_estimation_results: List[NumericRangeEstimationResult] = (
+            metric_value_range_estimation.numeric_range_estimator.get_numeric_range_estimates(
+                metric_values_list=metric_value_range_estimation.estimated_metric_value_vectors,
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+            )
+        )
+        return self._build_metric_value_range_attributes(
+            metric_value_range_estimation=metric_value_range_estimation,
+            numeric_range_estimation_results=numeric_range_estimation_results,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+    @override
+    def build_parameters_for_domains(  # noqa: PLR0913
+        self,
+        domains: List[Domain],
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        """
+        Builds parameters for every one of "domains", estimating metric value ranges of all of them together (so that
+        estimators, such as "bootstrap" and "kde", process metric values of many "Domain" objects at once).
+        """  # noqa: E501
+        runtime_configuration = runtime_configuration or {}
+
+        domain: Domain
+        domains = [
+            domain
+            for domain in domains
+            if self._prepare_parameter_computation(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
+        ]
+        metric_value_range_estimations: List[_MetricValueRangeEstimation] = [
+            self._prepare_metric_value_range_estimation(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+                runtime_configuration=runtime_configuration,
+            )
+            for domain in domains
+        ]
+
+        metric_value_range_estimation: _MetricValueRangeEstimation
+        numeric_range_estimation_results_by_domain: List[List[NumericRangeEstimationResult]] = (
+            NumericRangeEstimator.get_numeric_range_estimates_for_domains(
+                numeric_range_estimators=[
+                    metric_value_range_estimation.numeric_range_estimator
+                    for metric_value_range_estimation in metric_value_range_estimations
+                ],
+                metric_values_lists=[
+                    metric_value_range_estimation.estimated_metric_value_vectors
+                    for metric_value_range_estimation in metric_value_range_estimations
+                ],
+                domains=domains,
+                variables=variables,
+                parameters=parameters,
+            )
+        )
+
+        numeric_range_estimation_results: List[NumericRangeEstimationResult]
+        for domain, metric_value_range_estimation, numeric_range_estimation_results in zip(
+            domains, metric_value_range_estimations, numeric_range_estimation_results_by_domain
+        ):
+            self._store_parameter_computation_result(
+                domain=domain,
+                parameters=parameters,  # type: ignore[arg-type] # could be None
+                parameter_computation_result=self._build_metric_value_range_attributes(
+                    metric_value_range_estimation=metric_value_range_estimation,
+                    numeric_range_estimation_results=numeric_range_estimation_results,
+                    domain=domain,
+                    variables=variables,
+                    parameters=parameters,
+                ),
+            )
+
+    def _prepare_metric_value_range_estimation(
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> _MetricValueRangeEstimation:
+        """
+        Retrieves metric values for all Batch objects and prepares vectors of samples (one for every element of the
+        multi-dimensional metric), along with the configured "NumericRangeEstimator", for estimation of their ranges.
+        """  # noqa: E501
         parameter_reference: str
         if self.metric_multi_batch_parameter_builder_name:
             # Obtain metric_multi_batch_parameter_builder_name from "rule state" (i.e., variables and parameters); from instance variable otherwise.  # noqa: E501
@@ -385,20 +529,39 @@ detected.
             variables=variables,
             parameters=parameters,
         )
+        return self._prepare_metric_value_vectors(
+            parameter_node=parameter_node,
+            metric_values=metric_values,
+            numeric_range_estimator=numeric_range_estimator,
+            round_decimals=round_decimals,
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+        )
+
+    def _build_metric_value_range_attributes(
+        self,
+        metric_value_range_estimation: _MetricValueRangeEstimation,
+        numeric_range_estimation_results: List[NumericRangeEstimationResult],
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+    ) -> Attributes:
+        """
+        Returns Attributes object, containing estimated metric value range and parameter computation details metadata.
+        """  # noqa: E501
         numeric_range_estimation_result: NumericRangeEstimationResult = (
             self._estimate_metric_value_range(
-                metric_values=metric_values,
-                numeric_range_estimator=numeric_range_estimator,
-                round_decimals=round_decimals,
-                domain=domain,
-                variables=variables,
-                parameters=parameters,
+                metric_value_range_estimation=metric_value_range_estimation,
+                numeric_range_estimation_results=numeric_range_estimation_results,
             )
         )
 
         value_range: np.ndarray = numeric_range_estimation_result.value_range
         details: Dict[str, Any] = copy.deepcopy(
-            parameter_node[FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY]
+            metric_value_range_estimation.parameter_node[
+                FULLY_QUALIFIED_PARAMETER_NAME_METADATA_KEY
+            ]
         )
 
         # Obtain include_estimator_samples_histogram_in_details from "rule state" (i.e., variables and parameters); from instance variable otherwise.  # noqa: E501
@@ -510,15 +673,16 @@ detected.
 
         return ExactNumericRangeEstimator()
 
-    def _estimate_metric_value_range(  # noqa: C901, PLR0912, PLR0913, PLR0915
+    def _prepare_metric_value_vectors(  # noqa: PLR0913
         self,
+        parameter_node: ParameterNode,
         metric_values: np.ndarray,
         numeric_range_estimator: NumericRangeEstimator,
         round_decimals: int,
         domain: Optional[Domain] = None,
         variables: Optional[ParameterContainer] = None,
         parameters: Optional[Dict[str, ParameterContainer]] = None,
-    ) -> NumericRangeEstimationResult:
+    ) -> _MetricValueRangeEstimation:
         """
         This method accepts "NumericRangeEstimator" and data samples in format "N x R^m", where "N" (most significant
         dimension) is the number of measurements (e.g., one per Batch of data), while "R^m" is the multi-dimensional
@@ -532,11 +696,6 @@ detected.
             variables=variables,
             parameters=parameters,
         )
-        lower_bound: Optional[float] = truncate_values.get("lower_bound")
-        upper_bound: Optional[float] = truncate_values.get("upper_bound")
-
-        min_value: Number
-        max_value: Number
 
         # Outer-most dimension is data samples (e.g., one per Batch); the rest are dimensions of the actual metric.  # noqa: E501
         metric_value_shape: tuple = metric_values.shape[1:]
@@ -593,34 +752,74 @@ detected.
             metric_value_range = np.zeros(shape=metric_value_range_shape)
             estimation_histogram = np.empty(shape=estimation_histogram_shape)
 
-        # Traverse indices of sample vectors corresponding to every element of multi-dimensional metric.  # noqa: E501
+        # Obtain "N"-element-long vector of samples for each element of multi-dimensional metric.
         metric_value_vector: np.ndarray
+        metric_value_vectors: List[np.ndarray] = [
+            metric_values[metric_value_idx] for metric_value_idx in metric_value_vector_indices
+        ]
+        # Computation is unnecessary if distribution is degenerate.
+        is_degenerate: List[bool] = [
+            not datetime_detected
+            and bool(np.all(np.isclose(metric_value_vector, metric_value_vector[0])))
+            for metric_value_vector in metric_value_vectors
+        ]
+
+        return _MetricValueRangeEstimation(
+            parameter_node=parameter_node,
+            numeric_range_estimator=numeric_range_estimator,
+            round_decimals=round_decimals,
+            lower_bound=truncate_values.get("lower_bound"),
+            upper_bound=truncate_values.get("upper_bound"),
+            datetime_detected=datetime_detected,
+            metric_value_vector_indices=metric_value_vector_indices,
+            metric_value_vectors=metric_value_vectors,
+            is_degenerate=is_degenerate,
+            metric_value_range=metric_value_range,
+            estimation_histogram=estimation_histogram,
+        )
+
+    @staticmethod
+    def _estimate_metric_value_range(  # noqa: C901
+        metric_value_range_estimation: _MetricValueRangeEstimation,
+        numeric_range_estimation_results: List[NumericRangeEstimationResult],
+    ) -> NumericRangeEstimationResult:
+        """
+        Assembles range estimates of vectors of samples (computed by "NumericRangeEstimator" for non-degenerate ones)
+        into the range estimate for the multi-dimensional metric, truncating and rounding them as configured.
+        """  # noqa: E501
+        lower_bound: Optional[float] = metric_value_range_estimation.lower_bound
+        upper_bound: Optional[float] = metric_value_range_estimation.upper_bound
+        round_decimals: int = metric_value_range_estimation.round_decimals
+        datetime_detected: bool = metric_value_range_estimation.datetime_detected
+        metric_value_range: np.ndarray = metric_value_range_estimation.metric_value_range
+        estimation_histogram: np.ndarray = metric_value_range_estimation.estimation_histogram
+
+        min_value: Number
+        max_value: Number
+
+        estimates: Iterator[NumericRangeEstimationResult] = iter(numeric_range_estimation_results)
+
+        # Traverse indices of sample vectors corresponding to every element of multi-dimensional metric.  # noqa: E501
         metric_value_range_min_idx: tuple
         metric_value_range_max_idx: tuple
         metric_value_estimation_histogram_idx: tuple
         numeric_range_estimation_result: NumericRangeEstimationResult
-        for metric_value_idx in metric_value_vector_indices:
-            # Obtain "N"-element-long vector of samples for each element of multi-dimensional metric.  # noqa: E501
-            metric_value_vector = metric_values[metric_value_idx]
-            if not datetime_detected and np.all(
-                np.isclose(metric_value_vector, metric_value_vector[0])
-            ):
-                # Computation is unnecessary if distribution is degenerate.
+        metric_value_idx: tuple
+        metric_value_vector: np.ndarray
+        degenerate: bool
+        for metric_value_idx, metric_value_vector, degenerate in zip(
+            metric_value_range_estimation.metric_value_vector_indices,
+            metric_value_range_estimation.metric_value_vectors,
+            metric_value_range_estimation.is_degenerate,
+        ):
+            if degenerate:
                 numeric_range_estimation_result = build_numeric_range_estimation_result(
                     metric_values=metric_value_vector,
                     min_value=metric_value_vector[0],
                     max_value=metric_value_vector[0],
                 )
             else:
-                # Compute low and high estimates for vector of samples for given element of multi-dimensional metric.  # noqa: E501
-                numeric_range_estimation_result = (
-                    numeric_range_estimator.get_numeric_range_estimate(
-                        metric_values=metric_value_vector,
-                        domain=domain,
-                        variables=variables,
-                        parameters=parameters,
-                    )
-                )
+                numeric_range_estimation_result = next(estimates)
 
             min_value = numeric_range_estimation_result.value_range[0]
             if lower_bound is not None:
@@ -24,8 +24,13 @@ import numpy as np
 import pandas as pd
 
 from great_expectations.core.batch import Batch, BatchRequestBase  # noqa: TCH001
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
 from great_expectations.core.domain import Domain  # noqa: TCH001
+from great_expectations.core.id_dict import IDDict
+from great_expectations.data_context.store.metric_store import BatchMetricStore
+from great_expectations.data_context.types.resource_identifiers import BatchMetricIdentifier
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.exceptions import InvalidKeyError, StoreError
 from great_expectations.experimental.rule_based_profiler.attributed_resolved_metrics import (
     AttributedResolvedMetrics,
 )
@@ -34,6 +39,9 @@ from great_expectations.experimental.rule_based_profiler.config import (
     ParameterBuilderConfig,  # noqa: TCH001
 )
 from great_expectations.experimental.rule_based_profiler.exceptions import ProfilerExecutionError
+from great_expectations.experimental.rule_based_profiler.helpers.resolved_metrics_cache import (
+    compute_metrics,
+)
 from great_expectations.experimental.rule_based_profiler.helpers.util import (
     build_metric_domain_kwargs,
     get_parameter_value_and_validate_return_type,
@@ -60,14 +68,12 @@ from great_expectations.util import convert_to_json_serializable, is_parseable_d
 from great_expectations.validator.computed_metric import MetricValue  # noqa: TCH001
 from great_expectations.validator.exception_info import ExceptionInfo  # noqa: TCH001
 from great_expectations.validator.metric_configuration import MetricConfiguration
-from great_expectations.validator.validation_graph import (
-    ValidationGraph,  # noqa: TCH001
-)
 
 if TYPE_CHECKING:
     from great_expectations.data_context.data_context.abstract_data_context import (
         AbstractDataContext,
     )
+    from great_expectations.data_context.store.store import Store
     from great_expectations.validator.validator import Validator
 
 logger = logging.getLogger(__name__)
@@ -147,6 +153,79 @@ class ParameterBuilder(ABC, Builder):
         """  # noqa: E501
         runtime_configuration = runtime_configuration or {}
 
+        if not self._prepare_parameter_computation(
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+            batch_list=batch_list,
+            batch_request=batch_request,
+            runtime_configuration=runtime_configuration,
+        ):
+            return
+
+        if parameter_computation_impl is None:
+            parameter_computation_impl = self._build_parameters
+
+        parameter_computation_result: Attributes = parameter_computation_impl(
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+            runtime_configuration=runtime_configuration,
+        )
+
+        self._store_parameter_computation_result(
+            domain=domain,
+            parameters=parameters,
+            parameter_computation_result=parameter_computation_result,
+        )
+
+    def build_parameters_for_domains(  # noqa: PLR0913
+        self,
+        domains: List[Domain],
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> None:
+        """
+        Builds parameters for every one of "domains" (subclasses may override this to compute them together).
+
+        Args:
+            domains: "Domain" objects, each of which is context for execution of this "ParameterBuilder" object.
+            variables: attribute name/value pairs
+            parameters: Dictionary of "ParameterContainer" objects corresponding to all "Domain" objects in memory.
+            batch_list: Explicit list of "Batch" objects to supply data at runtime.
+            batch_request: Explicit batch_request used to supply data at runtime.
+            runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
+        """  # noqa: E501
+        domain: Domain
+        for domain in domains:
+            self.build_parameters(
+                domain=domain,
+                variables=variables,
+                parameters=parameters,
+                parameter_computation_impl=None,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
+
+    def _prepare_parameter_computation(  # noqa: PLR0913
+        self,
+        domain: Domain,
+        variables: Optional[ParameterContainer] = None,
+        parameters: Optional[Dict[str, ParameterContainer]] = None,
+        batch_list: Optional[List[Batch]] = None,
+        batch_request: Optional[Union[BatchRequestBase, dict]] = None,
+        runtime_configuration: Optional[dict] = None,
+    ) -> bool:
+        """
+        Returns "False" if parameter values of "domain" exist (and are not to be recomputed); otherwise, sets up "Batch"
+        objects and resolves evaluation dependencies, so that parameter values can be computed, and returns "True".
+        """  # noqa: E501
+        runtime_configuration = runtime_configuration or {}
+
         fully_qualified_parameter_names: List[str] = get_fully_qualified_parameter_names(
             domain=domain,
             variables=variables,
@@ -158,46 +237,49 @@ class ParameterBuilder(ABC, Builder):
             "recompute_existing_parameter_values", False
         )
 
-        if (
+        if not (
             recompute_existing_parameter_values
             or self.raw_fully_qualified_parameter_name not in fully_qualified_parameter_names
             or self.json_serialized_fully_qualified_parameter_name
             not in fully_qualified_parameter_names
         ):
-            self.set_batch_list_if_null_batch_request(
-                batch_list=batch_list,
-                batch_request=batch_request,
-            )
+            return False
 
-            self.resolve_evaluation_dependencies(
-                domain=domain,
-                variables=variables,
-                parameters=parameters,
-                fully_qualified_parameter_names=fully_qualified_parameter_names,
-                runtime_configuration=runtime_configuration,
-            )
+        self.set_batch_list_if_null_batch_request(
+            batch_list=batch_list,
+            batch_request=batch_request,
+        )
 
-            if parameter_computation_impl is None:
-                parameter_computation_impl = self._build_parameters
+        self.resolve_evaluation_dependencies(
+            domain=domain,
+            variables=variables,
+            parameters=parameters,
+            fully_qualified_parameter_names=fully_qualified_parameter_names,
+            runtime_configuration=runtime_configuration,
+        )
 
-            parameter_computation_result: Attributes = parameter_computation_impl(
-                domain=domain,
-                variables=variables,
-                parameters=parameters,
-                runtime_configuration=runtime_configuration,
-            )
+        return True
 
-            parameter_values: Dict[str, Any] = {
-                self.raw_fully_qualified_parameter_name: parameter_computation_result,
-                self.json_serialized_fully_qualified_parameter_name: convert_to_json_serializable(
-                    data=parameter_computation_result
-                ),
-            }
+    def _store_parameter_computation_result(
+        self,
+        domain: Domain,
+        parameters: Dict[str, ParameterContainer],
+        parameter_computation_result: Attributes,
+    ) -> None:
+        """
+        Stores raw and JSON-serialized parameter values of "domain" as part of "rule state".
+        """
+        parameter_values: Dict[str, Any] = {
+            self.raw_fully_qualified_parameter_name: parameter_computation_result,
+            self.json_serialized_fully_qualified_parameter_name: convert_to_json_serializable(
+                data=parameter_computation_result
+            ),
+        }
 
-            build_parameter_container(
-                parameter_container=parameters[domain.id],
-                parameter_values=parameter_values,
-            )
+        build_parameter_container(
+            parameter_container=parameters[domain.id],
+            parameter_values=parameter_values,
+        )
 
     def resolve_evaluation_dependencies(
         self,
@@ -329,6 +411,64 @@ class ParameterBuilder(ABC, Builder):
             parameters=parameters,
         )
 
+    def _resolve_metrics(
+        self,
+        validator: Validator,
+        metric_configurations: List[MetricConfiguration],
+        runtime_configuration: Optional[dict] = None,
+    ) -> Dict[Tuple[str, str, str], MetricValue]:
+        """Resolves the given metrics, reusing those of Batches stored in a "BatchMetricStore"."""
+        batch_metric_store: Optional[BatchMetricStore] = self._get_batch_metric_store()
+        batch_metric_keys: Dict[Tuple[str, str, str], BatchMetricIdentifier] = {}
+        stored_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        if batch_metric_store is not None:
+            batch_metric_keys = _build_batch_metric_keys(
+                validator=validator, metric_configurations=metric_configurations
+            )
+            stored_metrics = _get_stored_batch_metrics(
+                batch_metric_store=batch_metric_store, batch_metric_keys=batch_metric_keys
+            )
+
+        metrics_to_compute: List[MetricConfiguration] = [
+            metric_configuration
+            for metric_configuration in metric_configurations
+            if metric_configuration.id not in stored_metrics
+        ]
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+        _aborted_metrics_info: Dict[
+            Tuple[str, str, str],
+            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
+        ]
+        if metrics_to_compute:
+            resolved_metrics, _aborted_metrics_info = compute_metrics(
+                validator=validator,
+                metric_configurations=metrics_to_compute,
+                runtime_configuration=runtime_configuration,
+            )
+
+        if batch_metric_store is not None:
+            _store_batch_metrics(
+                batch_metric_store=batch_metric_store,
+                batch_metric_keys=batch_metric_keys,
+                metric_configurations=metrics_to_compute,
+                resolved_metrics=resolved_metrics,
+            )
+            resolved_metrics.update(stored_metrics)
+
+        return resolved_metrics
+
+    def _get_batch_metric_store(self) -> Optional[BatchMetricStore]:
+        """The "BatchMetricStore" configured in the Data Context (if any) to reuse metrics of Batches."""  # noqa: E501
+        if self.data_context is None:
+            return None
+
+        store: Store
+        for store in self.data_context.stores.values():
+            if isinstance(store, BatchMetricStore):
+                return store
+
+        return None
+
     def get_metrics(  # noqa: C901, PLR0913
         self,
         metric_name: str,
@@ -462,25 +602,12 @@ specified (empty "metric_name" value detected)."""  # noqa: E501
             parameters=parameters,
         )
 
-        graph: ValidationGraph = validator.metrics_calculator.build_metric_dependency_graph(
+        resolved_metrics: Dict[Tuple[str, str, str], MetricValue] = self._resolve_metrics(
+            validator=validator,
             metric_configurations=metrics_to_resolve,
             runtime_configuration=runtime_configuration,
         )
 
-        resolved_metrics: Dict[Tuple[str, str, str], MetricValue]
-        aborted_metrics_info: Dict[
-            Tuple[str, str, str],
-            Dict[str, Union[MetricConfiguration, Set[ExceptionInfo], int]],
-        ]
-        (
-            resolved_metrics,
-            _aborted_metrics_info,
-        ) = validator.metrics_calculator.resolve_validation_graph_and_handle_aborted_metrics_info(
-            graph=graph,
-            runtime_configuration=runtime_configuration,
-            min_graph_edges_pbar_enable=0,
-        )
-
         # Step-5: Map resolved metrics to their attributes for identification and recovery by receiver.  # noqa: E501
 
         attributed_resolved_metrics_map: Dict[str, AttributedResolvedMetrics] = {}
@@ -708,6 +835,135 @@ numeric-valued and datetime-valued metrics (value {metric_value} of type "{type(
         )
 
 
+def _get_batch_fingerprint(batch: Batch, is_latest_batch: bool) -> Optional[str]:
+    """
+    Identifies a Batch by its data (i.e., its "pandas_data_fingerprint" marker) or, lacking one, by
+    the partition it holds; None if the data of the Batch may have changed since it was identified.
+
+    The latest Batch (i.e., the active one) is identified by its data only, since its partition may
+    still be receiving data; so is a Batch of an unpartitioned (e.g., whole-table) asset.
+    """
+    batch_markers: dict = batch.batch_markers or {}
+    data_fingerprint: Optional[str] = batch_markers.get("pandas_data_fingerprint")
+    if data_fingerprint is not None:
+        return IDDict({"batch_id": batch.id, "data_fingerprint": data_fingerprint}).to_id()
+
+    if is_latest_batch or isinstance(batch.batch_spec, RuntimeDataBatchSpec):
+        return None
+
+    partition_identifiers: Optional[dict] = _get_partition_identifiers(batch=batch)
+    if partition_identifiers is None:
+        return None
+
+    return IDDict({"batch_id": batch.id, "partition": partition_identifiers}).to_id()
+
+
+def _get_partition_identifiers(batch: Batch) -> Optional[dict]:
+    """
+    The batch parameters of the partitioner of a Batch (e.g., "year" and "month"), if the Batch has
+    a partitioner and its batch request specifies all of them; otherwise, None.
+    """
+    from great_expectations.datasource.fluent.interfaces import Batch as FluentBatch
+
+    if not isinstance(batch, FluentBatch) or batch.batch_request.partitioner is None:
+        return None
+
+    try:
+        batch_parameters_keys: Tuple[str, ...] = batch.data_asset.get_batch_parameters_keys(
+            partitioner=batch.batch_request.partitioner
+        )
+    except NotImplementedError:
+        return None
+
+    options: dict = batch.batch_request.options
+    partition_keys: List[str] = [
+        key for key in batch_parameters_keys if key not in ("path", "dataframe")
+    ]
+    if not partition_keys or any(options.get(key) is None for key in partition_keys):
+        return None
+
+    return {key: str(options[key]) for key in partition_keys}
+
+
+def _build_batch_metric_keys(
+    validator: Validator, metric_configurations: List[MetricConfiguration]
+) -> Dict[Tuple[str, str, str], BatchMetricIdentifier]:
+    batch_fingerprints: Dict[str, Optional[str]] = {}
+    batch_metric_keys: Dict[Tuple[str, str, str], BatchMetricIdentifier] = {}
+
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metric_configurations:
+        domain_kwargs: dict = dict(metric_configuration.metric_domain_kwargs)
+        batch_id: Optional[str] = domain_kwargs.pop("batch_id", None)
+        batch = validator.batch_cache.get(batch_id) if batch_id else None
+        if batch is None:
+            continue
+
+        if batch_id not in batch_fingerprints:
+            batch_fingerprints[batch_id] = _get_batch_fingerprint(
+                batch=batch, is_latest_batch=batch_id == validator.active_batch_id
+            )
+
+        batch_fingerprint: Optional[str] = batch_fingerprints[batch_id]
+        if batch_fingerprint is None:
+            continue
+
+        batch_metric_keys[metric_configuration.id] = BatchMetricIdentifier(
+            batch_fingerprint=batch_fingerprint,
+            metric_name=metric_configuration.metric_name,
+            metric_kwargs_id=IDDict(
+                {
+                    "domain_kwargs": domain_kwargs,
+                    "value_kwargs": metric_configuration.metric_value_kwargs,
+                }
+            ).to_id(),
+        )
+
+    return batch_metric_keys
+
+
+def _get_stored_batch_metrics(
+    batch_metric_store: BatchMetricStore,
+    batch_metric_keys: Dict[Tuple[str, str, str], BatchMetricIdentifier],
+) -> Dict[Tuple[str, str, str], MetricValue]:
+    stored_metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+
+    metric_id: Tuple[str, str, str]
+    batch_metric_key: BatchMetricIdentifier
+    for metric_id, batch_metric_key in batch_metric_keys.items():
+        try:
+            stored_metrics[metric_id] = batch_metric_store.get(key=batch_metric_key)
+        except (InvalidKeyError, StoreError):
+            # Not computed before
+            continue
+
+    return stored_metrics
+
+
+def _store_batch_metrics(
+    batch_metric_store: BatchMetricStore,
+    batch_metric_keys: Dict[Tuple[str, str, str], BatchMetricIdentifier],
+    metric_configurations: List[MetricConfiguration],
+    resolved_metrics: Dict[Tuple[str, str, str], MetricValue],
+) -> None:
+    metric_configuration: MetricConfiguration
+    for metric_configuration in metric_configurations:
+        batch_metric_key: Optional[BatchMetricIdentifier] = batch_metric_keys.get(
+            metric_configuration.id
+        )
+        if batch_metric_key is None or metric_configuration.id not in resolved_metrics:
+            continue
+
+        value: MetricValue = resolved_metrics[metric_configuration.id]
+        if not BatchMetricStore.is_storable(value):
+            continue
+
+        try:
+            batch_metric_store.set(key=batch_metric_key, value=value)
+        except StoreError as e:
+            logger.warning(f"Unable to store metric {metric_configuration.id[0]}: {e}")
+
+
 def init_rule_parameter_builders(
     parameter_builder_configs: Optional[List[dict]] = None,
     data_context: Optional[AbstractDataContext] = None,
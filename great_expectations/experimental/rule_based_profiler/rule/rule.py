@@ -141,46 +141,45 @@ class Rule(SerializableDictDot):
 
         rule_state.reset_parameter_containers()
 
+        domain: Domain
+        for domain in domains:
+            rule_state.initialize_parameter_container_for_domain(domain=domain)
+
         pbar_method: Callable = determine_progress_bar_method_by_environment()
 
-        domain: Domain
-        for domain in pbar_method(
-            domains,
+        # Every builder handles all domains at once, so that their parameters are computed together.
+        parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
+        parameter_builder: ParameterBuilder
+        for parameter_builder in pbar_method(
+            parameter_builders,
             desc="Profiling Dataset:",
             position=1,
             leave=False,
             bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
         ):
-            rule_state.initialize_parameter_container_for_domain(domain=domain)
-
-            parameter_builders: List[ParameterBuilder] = self.parameter_builders or []
-            parameter_builder: ParameterBuilder
-            for parameter_builder in parameter_builders:
-                parameter_builder.build_parameters(
-                    domain=domain,
-                    variables=variables,
-                    parameters=rule_state.parameters,
-                    parameter_computation_impl=None,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
-                )
-
-            expectation_configuration_builders: List[ExpectationConfigurationBuilder] = (
-                self.expectation_configuration_builders or []
+            parameter_builder.build_parameters_for_domains(
+                domains=domains,
+                variables=variables,
+                parameters=rule_state.parameters,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
             )
 
-            expectation_configuration_builder: ExpectationConfigurationBuilder
-
-            for expectation_configuration_builder in expectation_configuration_builders:
-                expectation_configuration_builder.resolve_validation_dependencies(
-                    domain=domain,
-                    variables=variables,
-                    parameters=rule_state.parameters,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
-                )
+        expectation_configuration_builders: List[ExpectationConfigurationBuilder] = (
+            self.expectation_configuration_builders or []
+        )
+
+        expectation_configuration_builder: ExpectationConfigurationBuilder
+        for expectation_configuration_builder in expectation_configuration_builders:
+            expectation_configuration_builder.resolve_validation_dependencies_for_domains(
+                domains=domains,
+                variables=variables,
+                parameters=rule_state.parameters,
+                batch_list=batch_list,
+                batch_request=batch_request,
+                runtime_configuration=runtime_configuration,
+            )
 
         return rule_state
 
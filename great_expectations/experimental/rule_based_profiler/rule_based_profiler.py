@@ -52,6 +52,9 @@ from great_expectations.experimental.rule_based_profiler.helpers.configuration_r
     ReconciliationStrategy,
     reconcile_rule_variables,
 )
+from great_expectations.experimental.rule_based_profiler.helpers.resolved_metrics_cache import (
+    resolved_metrics_cache,
+)
 from great_expectations.experimental.rule_based_profiler.helpers.util import (
     convert_variables_to_dict,
 )
@@ -306,37 +309,39 @@ class BaseRuleBasedProfiler(ConfigPeer):
 
         rule_state: RuleState
         rule: Rule
-        for rule in pbar_method(
-            effective_rules,
-            desc="Generating Expectations:",
-            disable=disable,
-            position=0,
-            leave=True,
-            bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
-        ):
-            try:
-                rule_state = rule.run(
-                    variables=effective_variables,
-                    batch_list=batch_list,
-                    batch_request=batch_request,
-                    runtime_configuration=runtime_configuration,
-                    reconciliation_directives=reconciliation_directives,
-                    rule_state=RuleState(),
-                )
-                self.rule_states.append(rule_state)
-            except Exception as err:
-                if self._catch_exceptions:
-                    rule_state = RuleState(rule=rule, catch_exceptions=True)
-                    exception_traceback: str = traceback.format_exc()
-                    exception_message: str = str(err)
-                    exception_info = ExceptionInfo(
-                        exception_traceback=exception_traceback,
-                        exception_message=exception_message,
+        # Metrics resolved for one Rule are reused by all subsequent Rules of this run.
+        with resolved_metrics_cache():
+            for rule in pbar_method(
+                effective_rules,
+                desc="Generating Expectations:",
+                disable=disable,
+                position=0,
+                leave=True,
+                bar_format="{desc:25}{percentage:3.0f}%|{bar}{r_bar}",
+            ):
+                try:
+                    rule_state = rule.run(
+                        variables=effective_variables,
+                        batch_list=batch_list,
+                        batch_request=batch_request,
+                        runtime_configuration=runtime_configuration,
+                        reconciliation_directives=reconciliation_directives,
+                        rule_state=RuleState(),
                     )
-                    rule_state.exception_traceback = exception_info
                     self.rule_states.append(rule_state)
-                else:
-                    raise err  # noqa: TRY201
+                except Exception as err:
+                    if self._catch_exceptions:
+                        rule_state = RuleState(rule=rule, catch_exceptions=True)
+                        exception_traceback: str = traceback.format_exc()
+                        exception_message: str = str(err)
+                        exception_info = ExceptionInfo(
+                            exception_traceback=exception_traceback,
+                            exception_message=exception_message,
+                        )
+                        rule_state.exception_traceback = exception_info
+                        self.rule_states.append(rule_state)
+                    else:
+                        raise err  # noqa: TRY201
 
         return RuleBasedProfilerResult(
             fully_qualified_parameter_names_by_domain=self.get_fully_qualified_parameter_names_by_domain(),
@@ -0,0 +1,175 @@
+"""Record of the pages of a data docs site, for building the site incrementally.
+
+For every page of every site section, the manifest keeps the key of the rendered resource, the
+version stamp (see "Store.get_version()") and content hash of the resource that was rendered, the
+path of the page, and the information that the index page shows for it.  A resource whose stamp or
+content hash matches that of its page need not be rendered again, and the index page can be built
+from the manifest, without listing stores or retrieving resources.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_ResourceKeyTuple = Tuple[str, ...]
+
+
+def content_hash(value: Union[str, bytes]) -> str:
+    """Hash of a serialized resource, as read from its store."""
+    if isinstance(value, str):
+        value = value.encode("utf-8")
+    return hashlib.sha256(value).hexdigest()
+
+
+@dataclass
+class SiteBuildManifestEntry:
+    resource_key: _ResourceKeyTuple
+    content_hash: str
+    path: str
+    version: Optional[str] = None
+    index_info: Dict[str, Any] = field(default_factory=dict)
+
+    def to_json_dict(self) -> dict:
+        json_dict = asdict(self)
+        json_dict["resource_key"] = list(self.resource_key)
+        return json_dict
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict) -> SiteBuildManifestEntry:
+        return cls(**{**json_dict, "resource_key": tuple(json_dict["resource_key"])})
+
+
+class SiteBuildManifestSection:
+    """Pages of one site section, rendered with the same renderers and views ("fingerprint")."""
+
+    def __init__(
+        self,
+        fingerprint: str,
+        entries: Optional[Iterable[SiteBuildManifestEntry]] = None,
+    ) -> None:
+        self.fingerprint = fingerprint
+        self._entries: Dict[_ResourceKeyTuple, SiteBuildManifestEntry] = {
+            entry.resource_key: entry for entry in entries or []
+        }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[SiteBuildManifestEntry]:
+        return iter(self._entries.values())
+
+    def get(self, resource_key: _ResourceKeyTuple) -> Optional[SiteBuildManifestEntry]:
+        return self._entries.get(resource_key)
+
+    def add(self, entry: SiteBuildManifestEntry) -> None:
+        self._entries[entry.resource_key] = entry
+
+    def retain(self, resource_keys: Iterable[_ResourceKeyTuple]) -> List[SiteBuildManifestEntry]:
+        """Removes entries of resources other than the given ones, returning the removed entries."""
+        resource_keys = set(resource_keys)
+        removed_entries: List[SiteBuildManifestEntry] = [
+            entry for entry in self._entries.values() if entry.resource_key not in resource_keys
+        ]
+        for entry in removed_entries:
+            del self._entries[entry.resource_key]
+
+        return removed_entries
+
+    def to_json_dict(self) -> dict:
+        return {
+            "fingerprint": self.fingerprint,
+            "entries": [entry.to_json_dict() for entry in self._entries.values()],
+        }
+
+    @classmethod
+    def from_json_dict(cls, json_dict: dict) -> SiteBuildManifestSection:
+        return cls(
+            fingerprint=json_dict["fingerprint"],
+            entries=[
+                SiteBuildManifestEntry.from_json_dict(entry_dict)
+                for entry_dict in json_dict["entries"]
+            ],
+        )
+
+
+class SiteBuildManifest:
+    MANIFEST_VERSION = 1
+
+    def __init__(
+        self,
+        sections: Optional[Dict[str, SiteBuildManifestSection]] = None,
+        static_assets_fingerprint: Optional[str] = None,
+    ) -> None:
+        self._sections: Dict[str, SiteBuildManifestSection] = sections or {}
+        self.static_assets_fingerprint = static_assets_fingerprint
+
+    def has_section(self, section_name: str, fingerprint: str) -> bool:
+        """Whether pages of a site section are recorded, as rendered with the given fingerprint."""
+        section: Optional[SiteBuildManifestSection] = self._sections.get(section_name)
+        return section is not None and section.fingerprint == fingerprint
+
+    def get_section(self, section_name: str, fingerprint: str) -> SiteBuildManifestSection:
+        """Returns the pages of a site section, forgotten if they were rendered differently."""
+        section: Optional[SiteBuildManifestSection] = self._sections.get(section_name)
+        if section is None or section.fingerprint != fingerprint:
+            if section is not None:
+                logger.debug(f"Renderers of site section {section_name} changed; rebuilding it")
+            section = SiteBuildManifestSection(fingerprint=fingerprint)
+            self._sections[section_name] = section
+
+        return section
+
+    def get_entries(self, section_name: str) -> List[SiteBuildManifestEntry]:
+        section: Optional[SiteBuildManifestSection] = self._sections.get(section_name)
+        if section is None:
+            return []
+
+        return list(section)
+
+    def retain_sections(self, section_names: Iterable[str]) -> None:
+        section_names = set(section_names)
+        self._sections = {
+            section_name: section
+            for section_name, section in self._sections.items()
+            if section_name in section_names
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "manifest_version": self.MANIFEST_VERSION,
+                "static_assets_fingerprint": self.static_assets_fingerprint,
+                "sections": {
+                    section_name: section.to_json_dict()
+                    for section_name, section in self._sections.items()
+                },
+            }
+        )
+
+    @classmethod
+    def from_json(cls, value: Optional[Union[str, bytes]]) -> SiteBuildManifest:
+        """Loads a manifest; a missing, unreadable or outdated manifest loads as an empty one."""
+        if not value:
+            return cls()
+
+        try:
+            json_dict: dict = json.loads(value)
+            if json_dict.get("manifest_version") != cls.MANIFEST_VERSION:
+                return cls()
+
+            return cls(
+                sections={
+                    section_name: SiteBuildManifestSection.from_json_dict(section_dict)
+                    for section_name, section_dict in json_dict["sections"].items()
+                },
+                static_assets_fingerprint=json_dict.get("static_assets_fingerprint"),
+            )
+        except (ValueError, KeyError, TypeError) as e:
+            logger.warning(f"Ignoring invalid data docs site build manifest: {e!s}")
+            return cls()
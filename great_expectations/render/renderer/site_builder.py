@@ -6,8 +6,9 @@ import pathlib
 import traceback
 import urllib
 from collections import OrderedDict
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
+from great_expectations import __version__ as ge_version
 from great_expectations import exceptions
 from great_expectations.core import ExpectationSuite
 from great_expectations.core.util import nested_update
@@ -23,13 +24,24 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.render.renderer.site_build_manifest import (
+    SiteBuildManifest,
+    SiteBuildManifestEntry,
+    content_hash,
+)
 from great_expectations.render.util import resource_key_passes_run_name_filter
+from great_expectations.util import convert_to_json_serializable  # noqa: TID251
 
 if TYPE_CHECKING:
     from great_expectations.core.expectation_validation_result import (
+        ExpectationSuiteValidationResult,
         ExpectationValidationResult,
     )
+    from great_expectations.core.run_identifier import RunIdentifier
     from great_expectations.data_context import AbstractDataContext
+    from great_expectations.render.renderer.site_build_manifest import (
+        SiteBuildManifestSection,
+    )
 
 logger = logging.getLogger(__name__)
 
@@ -118,6 +130,22 @@ class SiteBuilder:
                     view:
                         module_name: great_expectations.render.view
                         class_name: DefaultJinjaIndexPageView
+
+    Large sites can be built incrementally: a build manifest, stored with the site, records which
+    version of every resource each page was rendered from, so that only new or changed resources
+    are rendered, and the index page is built from the manifest instead of from the stores::
+
+        local_site:
+            class_name: SiteBuilder
+            incremental: true
+            store_backend:
+                class_name: TupleFilesystemStoreBackend
+                base_directory: uncommitted/data_docs/local_site/
+
+    An incremental build for given resources (e.g., by UpdateDataDocsAction) does not list source
+    stores, so pages of deleted resources are removed by the next full build; sections not yet
+    recorded in the manifest are built in full.  Edits to custom
+    views or styles are not detected: clean the site to render every page again.
     """
 
     def __init__(  # noqa: C901, PLR0912, PLR0913
@@ -132,12 +160,14 @@ class SiteBuilder:
         cloud_mode=False,
         # <GX_RENAME> Deprecated 0.15.37
         ge_cloud_mode=False,
+        incremental=False,
         **kwargs,
     ) -> None:
         self.site_name = site_name
         self.data_context = data_context
         self.store_backend = store_backend
         self.show_how_to_buttons = show_how_to_buttons
+        self.incremental = incremental
         if ge_cloud_mode:
             cloud_mode = ge_cloud_mode
         self.cloud_mode = cloud_mode
@@ -305,6 +335,11 @@ class SiteBuilder:
         :return:
         """
 
+        if self._builds_incrementally():
+            return self._build_incrementally(
+                resource_identifiers=resource_identifiers, build_index=build_index
+            )
+
         # copy static assets
         for site_section_builder in self.site_section_builders.values():
             site_section_builder.build(resource_identifiers=resource_identifiers)
@@ -322,6 +357,43 @@ class SiteBuilder:
             index_links_dict,
         )
 
+    def _builds_incrementally(self) -> bool:
+        if not self.incremental or self.cloud_mode:
+            return False
+
+        # Custom builders know nothing of the build manifest.
+        if not isinstance(self.site_index_builder, DefaultSiteIndexBuilder) or not all(
+            isinstance(site_section_builder, DefaultSiteSectionBuilder)
+            for site_section_builder in self.site_section_builders.values()
+        ):
+            logger.warning(
+                f"Site {self.site_name} uses custom site builders, which cannot be built incrementally; building the whole site."  # noqa: E501
+            )
+            return False
+
+        return True
+
+    def _build_incrementally(self, resource_identifiers=None, build_index: bool = True):
+        manifest = SiteBuildManifest.from_json(self.target_store.read_build_manifest())
+        manifest.retain_sections(self.site_section_builders.keys())
+        for site_section_builder in self.site_section_builders.values():
+            site_section_builder.build(resource_identifiers=resource_identifiers, manifest=manifest)
+
+        # Static assets change only with the version of Great Expectations.
+        if manifest.static_assets_fingerprint != ge_version:
+            self.target_store.copy_static_assets()
+            manifest.static_assets_fingerprint = ge_version
+
+        self.target_store.write_build_manifest(manifest.to_json())
+
+        _, index_links_dict = self.site_index_builder.build(
+            build_index=build_index, manifest=manifest
+        )
+        return (
+            self.get_resource_url(only_if_exists=False),
+            index_links_dict,
+        )
+
     def get_resource_url(self, resource_identifier=None, only_if_exists=True):
         """
         Return the URL of the HTML document that renders a resource
@@ -410,7 +482,13 @@ class DefaultSiteSectionBuilder:
                 class_name=view["class_name"],
             )
 
-    def build(self, resource_identifiers=None) -> None:  # noqa: C901, PLR0912
+    def build(
+        self, resource_identifiers=None, manifest: Optional[SiteBuildManifest] = None
+    ) -> None:
+        if manifest is not None:
+            self._build_incrementally(resource_identifiers=resource_identifiers, manifest=manifest)
+            return
+
         source_store_keys = self.source_store.list_keys()
         if self.name == "validations" and self.validation_results_limit:
             source_store_keys = sorted(
@@ -426,9 +504,8 @@ class DefaultSiteSectionBuilder:
             if resource_identifiers and resource_key not in resource_identifiers:
                 continue
 
-            if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
-                if not resource_key_passes_run_name_filter(resource_key, self.run_name_filter):
-                    continue
+            if not self._passes_run_name_filter(resource_key):
+                continue
             try:
                 resource = self.source_store.get(resource_key)
                 if isinstance(resource_key, ExpectationSuiteIdentifier):
@@ -439,58 +516,162 @@ class DefaultSiteSectionBuilder:
                 )
                 continue
 
-            if isinstance(resource_key, ExpectationSuiteIdentifier):
-                expectation_suite_name = resource_key.name
-                logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
-            elif isinstance(resource_key, ValidationResultIdentifier):
-                run_id = resource_key.run_id
-                run_name = run_id.run_name
-                run_time = run_id.run_time
-                expectation_suite_name = resource_key.expectation_suite_identifier.name
-                if self.name == "profiling":
-                    logger.debug(
-                        f"        Rendering profiling for batch {resource_key.batch_identifier}"
-                    )
-                else:
-                    logger.debug(
-                        f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
-                    )
+            self._render_resource(resource_key=resource_key, resource=resource)
 
-            try:
-                rendered_content = self.renderer_class.render(resource)
-
-                if self.cloud_mode:
-                    self.target_store.set(
-                        GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
-                        rendered_content,
-                        source_type=resource_key.resource_type,
-                        source_id=resource_key.id,
-                    )
-                else:
-                    viewable_content = self.view_class.render(
-                        rendered_content,
-                        data_context_id=self.data_context_id,
-                        show_how_to_buttons=self.show_how_to_buttons,
-                    )
-                    # Verify type
-                    self.target_store.set(
-                        SiteSectionIdentifier(
-                            site_section_name=self.name,
-                            resource_identifier=resource_key,
-                        ),
-                        viewable_content,
-                    )
-            except Exception as e:
-                exception_message = """\
+    def _build_incrementally(self, resource_identifiers, manifest: SiteBuildManifest) -> None:
+        """Renders only resources that are new or changed since the pages recorded in the manifest.
+
+        Given resource identifiers, only those resources are considered, without listing the source
+        store; otherwise, pages of resources no longer in the source store are also removed.  A
+        section whose pages are not recorded (e.g., on the first incremental build, or after its
+        renderers changed) is built from its whole source store, so that its index lists them all.
+        """
+        fingerprint: str = self._get_render_fingerprint()
+        if not manifest.has_section(section_name=self.name, fingerprint=fingerprint):
+            resource_identifiers = None
+
+        section: SiteBuildManifestSection = manifest.get_section(
+            section_name=self.name, fingerprint=fingerprint
+        )
+        if resource_identifiers:
+            source_store_keys = [
+                resource_key
+                for resource_key in resource_identifiers
+                if isinstance(resource_key, self.source_store.key_class)
+            ]
+        else:
+            source_store_keys = self.source_store.list_keys()
+            for entry in section.retain(
+                resource_key.to_tuple() for resource_key in source_store_keys
+            ):
+                self.target_store.store_backends[self.source_store.key_class].remove_key(
+                    entry.resource_key
+                )
+
+            if self.name == "validations" and self.validation_results_limit:
+                source_store_keys = sorted(
+                    source_store_keys, key=lambda x: x.run_id.run_time, reverse=True
+                )[: self.validation_results_limit]
+
+        for resource_key in source_store_keys:
+            if self._passes_run_name_filter(resource_key):
+                self._build_resource_incrementally(resource_key=resource_key, section=section)
+
+    def _build_resource_incrementally(
+        self, resource_key, section: SiteBuildManifestSection
+    ) -> None:
+        entry: Optional[SiteBuildManifestEntry] = section.get(resource_key.to_tuple())
+        try:
+            # The version must be read before the value, so that it is never newer than the value.
+            version: Optional[str] = self.source_store.get_version(resource_key)
+            if entry is not None and entry.version is not None and entry.version == version:
+                return
+
+            serialized_resource = self.source_store.store_backend.get(
+                self.source_store.key_to_tuple(resource_key)
+            )
+        except exceptions.InvalidKeyError:
+            serialized_resource = None
+
+        if not serialized_resource:
+            logger.warning(f"Object with Key: {resource_key!s} could not be retrieved. Skipping...")
+            return
+
+        resource_hash: str = content_hash(serialized_resource)
+        if entry is not None and entry.content_hash == resource_hash:
+            entry.version = version
+            return
+
+        resource = self.source_store.deserialize(serialized_resource)
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            resource = ExpectationSuite(**resource)
+
+        if self._render_resource(resource_key=resource_key, resource=resource):
+            section.add(
+                SiteBuildManifestEntry(
+                    resource_key=resource_key.to_tuple(),
+                    content_hash=resource_hash,
+                    path=_get_resource_filepath(resource_key),
+                    version=version,
+                    index_info=_get_index_info(resource),
+                )
+            )
+
+    def _get_render_fingerprint(self) -> str:
+        """Identifies how pages are rendered; pages rendered differently are rendered again."""
+        return ":".join(
+            [
+                ge_version,
+                type(self.renderer_class).__qualname__,
+                type(self.view_class).__qualname__,
+                str(self.show_how_to_buttons),
+                str(self.data_context_id),
+            ]
+        )
+
+    def _passes_run_name_filter(self, resource_key) -> bool:
+        if self.run_name_filter and not isinstance(resource_key, GXCloudIdentifier):
+            return resource_key_passes_run_name_filter(resource_key, self.run_name_filter)
+
+        return True
+
+    def _render_resource(self, resource_key, resource) -> bool:
+        """Renders a resource and writes its page to the target store, returning whether it did."""
+        if isinstance(resource_key, ExpectationSuiteIdentifier):
+            expectation_suite_name = resource_key.name
+            logger.debug(f"        Rendering expectation suite {expectation_suite_name}")
+        elif isinstance(resource_key, ValidationResultIdentifier):
+            run_id = resource_key.run_id
+            run_name = run_id.run_name
+            run_time = run_id.run_time
+            expectation_suite_name = resource_key.expectation_suite_identifier.name
+            if self.name == "profiling":
+                logger.debug(
+                    f"        Rendering profiling for batch {resource_key.batch_identifier}"
+                )
+            else:
+                logger.debug(
+                    f"        Rendering validation: run name: {run_name}, run time: {run_time}, suite {expectation_suite_name} for batch {resource_key.batch_identifier}"  # noqa: E501
+                )
+
+        try:
+            rendered_content = self.renderer_class.render(resource)
+
+            if self.cloud_mode:
+                self.target_store.set(
+                    GXCloudIdentifier(resource_type=GXCloudRESTResource.RENDERED_DATA_DOC),
+                    rendered_content,
+                    source_type=resource_key.resource_type,
+                    source_id=resource_key.id,
+                )
+            else:
+                viewable_content = self.view_class.render(
+                    rendered_content,
+                    data_context_id=self.data_context_id,
+                    show_how_to_buttons=self.show_how_to_buttons,
+                )
+                # Verify type
+                self.target_store.set(
+                    SiteSectionIdentifier(
+                        site_section_name=self.name,
+                        resource_identifier=resource_key,
+                    ),
+                    viewable_content,
+                )
+        except Exception as e:
+            exception_message = """\
 An unexpected Exception occurred during data docs rendering.  Because of this error, certain parts of data docs will \
 not be rendered properly and/or may not appear altogether.  Please use the trace, included in this message, to \
 diagnose and repair the underlying issue.  Detailed information follows:
-                """  # noqa: E501
-                exception_traceback = traceback.format_exc()
-                exception_message += (
-                    f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
-                )
-                logger.error(exception_message)  # noqa: TRY400
+            """  # noqa: E501
+            exception_traceback = traceback.format_exc()
+            exception_message += (
+                f'{type(e).__name__}: "{e!s}".  ' f'Traceback: "{exception_traceback}".'
+            )
+            logger.error(exception_message)  # noqa: TRY400
+            return False
+
+        return True
 
 
 class DefaultSiteIndexBuilder:
@@ -581,23 +762,11 @@ class DefaultSiteIndexBuilder:
         if f"{section_name}_links" not in index_links_dict:
             index_links_dict[f"{section_name}_links"] = []
 
-        if run_id:
-            filepath = (
-                pathlib.Path(
-                    *[
-                        "validations",
-                        *expectation_suite_name.split("."),
-                        *run_id.to_tuple(),
-                        batch_identifier,
-                    ]
-                ).as_posix()
-                + ".html"
-            )
-        else:
-            filepath = (
-                pathlib.Path(*["expectations", *expectation_suite_name.split(".")]).as_posix()
-                + ".html"
-            )
+        filepath = _get_filepath(
+            expectation_suite_name=expectation_suite_name,
+            run_id=run_id,
+            batch_identifier=batch_identifier,
+        )
 
         url_encoded_filepath = urllib.parse.quote(filepath)
 
@@ -708,12 +877,17 @@ class DefaultSiteIndexBuilder:
 
     # TODO: deprecate dual batch api support
     def build(
-        self, skip_and_clean_missing=True, build_index: bool = True
+        self,
+        skip_and_clean_missing=True,
+        build_index: bool = True,
+        manifest: Optional[SiteBuildManifest] = None,
     ) -> Tuple[Any, Optional[OrderedDict]]:
         """
         :param skip_and_clean_missing: if True, target html store keys without corresponding source store keys will
         be skipped and removed from the target store
         :param build_index: a flag if False, skips building the index page
+        :param manifest: if given, the index lists the pages recorded in this site build manifest, instead of those
+        found by listing the target and source stores
         :return: tuple(index_page_url, index_links_dict)
         """  # noqa: E501
 
@@ -729,16 +903,19 @@ class DefaultSiteIndexBuilder:
         if self.show_how_to_buttons:
             index_links_dict["cta_object"] = self.get_calls_to_action()
 
-        self._add_expectations_to_index_links(index_links_dict, skip_and_clean_missing)
-        validation_and_profiling_result_site_keys = (
-            self._build_validation_and_profiling_result_site_keys(skip_and_clean_missing)
-        )
-        self._add_profiling_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
-        )
-        self._add_validations_to_index_links(
-            index_links_dict, validation_and_profiling_result_site_keys
-        )
+        if manifest is None:
+            self._add_expectations_to_index_links(index_links_dict, skip_and_clean_missing)
+            validation_and_profiling_result_site_keys = (
+                self._build_validation_and_profiling_result_site_keys(skip_and_clean_missing)
+            )
+            self._add_profiling_to_index_links(
+                index_links_dict, validation_and_profiling_result_site_keys
+            )
+            self._add_validations_to_index_links(
+                index_links_dict, validation_and_profiling_result_site_keys
+            )
+        else:
+            self._add_manifest_entries_to_index_links(index_links_dict, manifest)
 
         viewable_content = ""
         try:
@@ -762,6 +939,58 @@ diagnose and repair the underlying issue.  Detailed information follows:
 
         return self.target_store.write_index_page(viewable_content), index_links_dict
 
+    def _add_manifest_entries_to_index_links(
+        self, index_links_dict: OrderedDict, manifest: SiteBuildManifest
+    ) -> None:
+        for entry in sorted(manifest.get_entries("expectations"), key=lambda x: x.path):
+            self.add_resource_info_to_index_links_dict(
+                index_links_dict=index_links_dict,
+                expectation_suite_name=ExpectationSuiteIdentifier.from_tuple(
+                    entry.resource_key
+                ).name,
+                section_name="expectations",
+            )
+
+        for entry in sorted(manifest.get_entries("profiling"), key=lambda x: x.path):
+            self._add_validation_result_entry_to_index_links(
+                index_links_dict=index_links_dict, section_name="profiling", entry=entry
+            )
+
+        validation_result_entries = sorted(
+            manifest.get_entries("validations"),
+            key=lambda x: ValidationResultIdentifier.from_tuple(x.resource_key).run_id.run_time,
+            reverse=True,
+        )
+        if self.validation_results_limit:
+            validation_result_entries = validation_result_entries[: self.validation_results_limit]
+        for entry in validation_result_entries:
+            self._add_validation_result_entry_to_index_links(
+                index_links_dict=index_links_dict, section_name="validations", entry=entry
+            )
+
+    def _add_validation_result_entry_to_index_links(
+        self, index_links_dict: OrderedDict, section_name: str, entry: SiteBuildManifestEntry
+    ) -> None:
+        validation_result_key = ValidationResultIdentifier.from_tuple(entry.resource_key)
+        self.add_resource_info_to_index_links_dict(
+            index_links_dict=index_links_dict,
+            expectation_suite_name=validation_result_key.expectation_suite_identifier.name,
+            section_name=section_name,
+            batch_identifier=validation_result_key.batch_identifier,
+            run_id=validation_result_key.run_id,
+            # As when listing stores, profiling results are indexed without their success.
+            validation_success=(
+                entry.index_info.get("validation_success")
+                if section_name == "validations"
+                else None
+            ),
+            run_time=validation_result_key.run_id.run_time,
+            run_name=validation_result_key.run_id.run_name,
+            asset_name=entry.index_info.get("asset_name"),
+            batch_kwargs=entry.index_info.get("batch_kwargs", {}),
+            batch_spec=entry.index_info.get("batch_spec", {}),
+        )
+
     def _add_expectations_to_index_links(
         self, index_links_dict: OrderedDict, skip_and_clean_missing: bool
     ) -> None:
@@ -954,6 +1183,58 @@ def _resolve_asset_name(validation_results: ExpectationValidationResult) -> str
     return active_batch.get("data_asset_name")
 
 
+def _get_filepath(
+    expectation_suite_name: str,
+    run_id: RunIdentifier | None = None,
+    batch_identifier: str | None = None,
+) -> str:
+    """Path of the page of an expectation suite or (given a run_id) of a validation result."""
+    if run_id:
+        return (
+            pathlib.Path(
+                *[
+                    "validations",
+                    *expectation_suite_name.split("."),
+                    *run_id.to_tuple(),
+                    batch_identifier,
+                ]
+            ).as_posix()
+            + ".html"
+        )
+
+    return pathlib.Path(*["expectations", *expectation_suite_name.split(".")]).as_posix() + ".html"
+
+
+def _get_resource_filepath(
+    resource_key: ExpectationSuiteIdentifier | ValidationResultIdentifier,
+) -> str:
+    if isinstance(resource_key, ValidationResultIdentifier):
+        return _get_filepath(
+            expectation_suite_name=resource_key.expectation_suite_identifier.name,
+            run_id=resource_key.run_id,
+            batch_identifier=resource_key.batch_identifier,
+        )
+
+    return _get_filepath(expectation_suite_name=resource_key.name)
+
+
+def _get_index_info(
+    resource: ExpectationSuite | ExpectationSuiteValidationResult,
+) -> Dict[str, Any]:
+    """What the index page shows of a resource, besides what its key tells."""
+    if isinstance(resource, ExpectationSuite):
+        return {}
+
+    return convert_to_json_serializable(
+        {
+            "validation_success": resource.success,
+            "asset_name": _resolve_asset_name(resource),
+            "batch_kwargs": resource.meta.get("batch_kwargs", {}),
+            "batch_spec": resource.meta.get("batch_spec", {}),
+        }
+    )
+
+
 class CallToActionButton:
     def __init__(self, title, link) -> None:
         self.title = title
@@ -48,7 +48,6 @@ from packaging import version
 
 from great_expectations._docs_decorators import public_api
 from great_expectations.compatibility import pydantic, pyspark, sqlalchemy
-from great_expectations.compatibility.sqlalchemy import LegacyRow, Row
 from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.compatibility.typing_extensions import override
 
@@ -1181,8 +1180,8 @@ def convert_to_json_serializable(
 ) -> None: ...
 
 
-@public_api  # - complexity 32
-def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
+@public_api
+def convert_to_json_serializable(
     data: JSONConvertable,
 ) -> JSONValues:
     """Converts an object to one that is JSON-serializable.
@@ -1207,92 +1206,175 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
     Raises:
         TypeError: A non-JSON-serializable field was found.
     """
-    if isinstance(data, pydantic.BaseModel):
-        return json.loads(data.json())
+    data_type = type(data)
+    converter = _JSON_CONVERTERS.get(data_type)
+    if converter is None:
+        converter = _get_json_converter(data_type)
+        _JSON_CONVERTERS[data_type] = converter
 
-    if isinstance(data, (SerializableDictDot, SerializableDotDict)):
-        return data.to_json_dict()
+    return converter(data)
 
-    # Handling "float(nan)" separately is required by Python-3.6 and Pandas-0.23 versions.
-    if isinstance(data, float) and np.isnan(data):
-        return None
 
-    if isinstance(data, (str, int, float, bool)):
-        # No problem to encode json
-        return data
+# Converters of "convert_to_json_serializable", by type of the object to convert (see
+# "_get_json_converter"); filled in as types are first encountered.
+_JSON_CONVERTERS: Dict[type, Callable[[Any], Any]] = {}
 
-    if isinstance(data, range):
-        return list(data)
+# Types of objects that "convert_to_json_serializable" returns as they are.
+_JSON_IDENTITY_TYPES = frozenset((str, int, bool, type(None)))
 
-    if isinstance(data, dict):
-        new_dict = {}
-        for key in data:
-            # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string  # noqa: E501
-            new_dict[str(key)] = convert_to_json_serializable(data[key])
 
-        return new_dict
+def _get_json_converter(  # noqa: C901, PLR0911, PLR0912
+    data_type: type,
+) -> Callable[[Any], Any]:
+    """Returns the converter of objects of the given type, by order of precedence of the checks."""
+    if issubclass(data_type, pydantic.BaseModel):
+        return _convert_pydantic_model_to_json_serializable
 
-    if isinstance(data, (list, tuple, set)):
-        new_list: List[JSONValues] = []
-        for val in data:
-            new_list.append(convert_to_json_serializable(val))
+    if issubclass(data_type, (SerializableDictDot, SerializableDotDict)):
+        return _convert_to_json_dict
 
-        return new_list
+    # Handling "float(nan)" separately is required by Python-3.6 and Pandas-0.23 versions.
+    if issubclass(data_type, float):
+        return _convert_float_to_json_serializable
 
-    if isinstance(data, (np.ndarray, pd.Index)):
-        # test_obj[key] = test_obj[key].tolist()
-        # If we have an array or index, convert it first to a list--causing coercion to float--and then round  # noqa: E501
-        # to the number of digits for which the string representation will equal the float representation  # noqa: E501
-        return [convert_to_json_serializable(x) for x in data.tolist()]
+    if issubclass(data_type, (str, int, bool)):
+        # No problem to encode json
+        return _identity
 
-    if isinstance(data, np.int64):
-        return int(data)
+    if issubclass(data_type, range):
+        return list
 
-    if isinstance(data, np.float64):
-        return float(data)
+    if issubclass(data_type, dict):
+        return _convert_dict_to_json_serializable
 
-    if isinstance(data, (datetime.datetime, datetime.date)):
-        return data.isoformat()
+    if issubclass(data_type, (list, tuple, set)):
+        return _convert_collection_to_json_serializable
 
-    if isinstance(data, (np.datetime64)):
-        return np.datetime_as_string(data)
+    if issubclass(data_type, (np.ndarray, pd.Index)):
+        return _convert_array_to_json_serializable
 
-    if isinstance(data, uuid.UUID):
-        return str(data)
+    if issubclass(data_type, np.int64):
+        return int
 
-    if isinstance(data, bytes):
-        return str(data)
+    if issubclass(data_type, (datetime.datetime, datetime.date)):
+        return _convert_to_isoformat
 
-    if isinstance(data, slice):
-        return str(data)
+    if issubclass(data_type, np.datetime64):
+        return np.datetime_as_string
 
-    if isinstance(data, pathlib.PurePath):
-        return str(data)
+    if issubclass(data_type, (uuid.UUID, bytes, slice, pathlib.PurePath)):
+        return str
 
     # noinspection PyTypeChecker
-    if Polygon and isinstance(data, (Point, Polygon, MultiPolygon, LineString)):
-        return str(data)
+    if Polygon and issubclass(data_type, (Point, Polygon, MultiPolygon, LineString)):
+        return str
 
     # Use built in base type from numpy, https://docs.scipy.org/doc/numpy-1.13.0/user/basics.types.html
     # https://github.com/numpy/numpy/pull/9505
-    if np.issubdtype(type(data), np.bool_):
-        return bool(data)
+    if np.issubdtype(data_type, np.bool_):
+        return bool
 
-    if np.issubdtype(type(data), np.integer) or np.issubdtype(type(data), np.uint):
-        return int(data)  # type: ignore[arg-type] # could be None
+    if np.issubdtype(data_type, np.integer) or np.issubdtype(data_type, np.uint):
+        return int
 
-    if np.issubdtype(type(data), np.floating):
-        # Note: Use np.floating to avoid FutureWarning from numpy
-        return float(round(data, sys.float_info.dig))  # type: ignore[arg-type] # could be None
+    if np.issubdtype(data_type, np.floating):
+        return _convert_numpy_floating_to_json_serializable
 
-    # Note: This clause has to come after checking for np.ndarray or we get:
-    #      `ValueError: The truth value of an array with more than one element is ambiguous. Use a.any() or a.all()`  # noqa: E501
-    if data is None:
+    if data_type is type(None):
         # No problem to encode json
-        return data
+        return _identity
+
+    # Whether objects of other types are null depends on their value, not only on their type.
+    return _convert_other_to_json_serializable
+
+
+def _identity(data: Any) -> Any:
+    return data
+
+
+def _convert_pydantic_model_to_json_serializable(data: pydantic.BaseModel) -> JSONValues:
+    return json.loads(data.json())
 
+
+def _convert_to_json_dict(data: Any) -> JSONValues:
+    return data.to_json_dict()
+
+
+def _convert_float_to_json_serializable(data: float) -> Optional[float]:
+    if np.isnan(data):
+        return None
+
+    return data
+
+
+def _convert_to_isoformat(data: datetime.date) -> str:
+    return data.isoformat()
+
+
+def _convert_numpy_floating_to_json_serializable(data: np.floating) -> float:
+    # Note: Use np.floating to avoid FutureWarning from numpy
+    return float(round(data, sys.float_info.dig))
+
+
+def _convert_dict_to_json_serializable(data: dict) -> dict:
+    new_dict = {}
+    for key in data:
+        # A pandas index can be numeric, and a dict key can be numeric, but a json key must be a string  # noqa: E501
+        new_dict[str(key)] = convert_to_json_serializable(data[key])
+
+    return new_dict
+
+
+def _convert_collection_to_json_serializable(data: Union[list, tuple, set]) -> list:
+    element_types = set(map(type, data))
+    if element_types <= _JSON_IDENTITY_TYPES:
+        return list(data)
+
+    if element_types <= _JSON_IDENTITY_TYPES | {float}:
+        # "NaN" is the only value not equal to itself.
+        return [None if value != value else value for value in data]  # noqa: PLR0124
+
+    return [convert_to_json_serializable(value) for value in data]
+
+
+def _convert_array_to_json_serializable(data: Union[np.ndarray, pd.Index]) -> list:
+    # test_obj[key] = test_obj[key].tolist()
+    # If we have an array or index, convert it first to a list--causing coercion to float--and then round  # noqa: E501
+    # to the number of digits for which the string representation will equal the float representation  # noqa: E501
+    values: list = data.tolist()
+    if isinstance(data, np.ndarray) and data.dtype.kind in "biu":
+        # Booleans and integers, all of which are JSON-serializable.
+        return values
+
+    if isinstance(data, np.ndarray) and data.dtype.kind == "f" and data.ndim == 1:
+        for idx in np.flatnonzero(np.isnan(data)):
+            values[idx] = None
+
+        return values
+
+    return _convert_collection_to_json_serializable(values)
+
+
+def _convert_series_to_json_serializable(data: pd.Series) -> list:
+    # Converting a series is tricky since the index may not be a string, but all json
+    # keys must be strings. So, we use a very ugly serialization strategy
+    index_name = data.index.name or "index"
+    value_name = data.name or "value"
+    # "tolist" returns the same (Python) scalars as iterating over the series does.
+    return [
+        {index_name: idx, value_name: val}
+        for idx, val in zip(
+            _convert_collection_to_json_serializable(data.index.tolist()),
+            _convert_collection_to_json_serializable(data.tolist()),
+        )
+    ]
+
+
+def _convert_other_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
+    data: Any,
+) -> JSONValues:
     try:
-        if not isinstance(data, list) and pd.isna(data):  # type: ignore[arg-type]
+        if not isinstance(data, list) and pd.isna(data):
             # pd.isna is functionally vectorized, but we only want to apply this to single objects
             # Hence, why we test for `not isinstance(list)`
             return None
@@ -1302,17 +1384,7 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
         pass
 
     if isinstance(data, pd.Series):
-        # Converting a series is tricky since the index may not be a string, but all json
-        # keys must be strings. So, we use a very ugly serialization strategy
-        index_name = data.index.name or "index"
-        value_name = data.name or "value"
-        return [
-            {
-                index_name: convert_to_json_serializable(idx),  # type: ignore[call-overload]
-                value_name: convert_to_json_serializable(val),  # type: ignore[dict-item]
-            }
-            for idx, val in data.items()
-        ]
+        return _convert_series_to_json_serializable(data)
 
     if isinstance(data, pd.DataFrame):
         return convert_to_json_serializable(data.to_dict(orient="records"))
@@ -1323,14 +1395,14 @@ def convert_to_json_serializable(  # noqa: C901, PLR0911, PLR0912
         return convert_to_json_serializable(dict(zip(data.schema.names, zip(*data.collect()))))
 
     # SQLAlchemy serialization
-    if LegacyRow and isinstance(data, LegacyRow):
+    if sqlalchemy.LegacyRow and isinstance(data, sqlalchemy.LegacyRow):
         return dict(data)
 
     # sqlalchemy text for SqlAlchemy 2 compatibility
     if sqlalchemy.TextClause and isinstance(data, sqlalchemy.TextClause):  # type: ignore[truthy-function]
         return str(data)
 
-    if Row and isinstance(data, Row):  # type: ignore[truthy-function]
+    if sqlalchemy.Row and isinstance(data, sqlalchemy.Row):  # type: ignore[truthy-function]
         return str(data)
 
     if isinstance(data, decimal.Decimal):
@@ -209,18 +209,19 @@ class MetricsCalculator:
         runtime_configuration: Optional[dict] = None,
         min_graph_edges_pbar_enable: int = 0,
         # Set to low number (e.g., 3) to suppress progress bar for small graphs.
+        resolved_metrics: Optional[_MetricsDict] = None,
     ) -> Tuple[_MetricsDict, _AbortedMetricsInfoDict]:
         """
         Args:
             graph: "ValidationGraph" object, containing "metric_edge" structures with "MetricConfiguration" objects.
             runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
             min_graph_edges_pbar_enable: Minumum number of graph edges to warrant showing progress bars.
+            resolved_metrics: Metrics resolved previously, which are not computed again.
 
         Returns:
             Dictionary with requested metrics resolved, with unique metric ID as key and computed metric as value.
             Dictionary with aborted metrics information, with metric ID as key.
         """  # noqa: E501
-        resolved_metrics: _MetricsDict
         aborted_metrics_info: _AbortedMetricsInfoDict
         (
             resolved_metrics,
@@ -229,6 +230,7 @@ class MetricsCalculator:
             graph=graph,
             runtime_configuration=runtime_configuration,
             min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
+            resolved_metrics=resolved_metrics,
         )
 
         if aborted_metrics_info:
@@ -247,6 +249,7 @@ class MetricsCalculator:
         runtime_configuration: Optional[dict] = None,
         min_graph_edges_pbar_enable: int = 0,
         # Set to low number (e.g., 3) to suppress progress bar for small graphs.
+        resolved_metrics: Optional[_MetricsDict] = None,
     ) -> Tuple[_MetricsDict, _AbortedMetricsInfoDict]:
         """
         Calls "ValidationGraph.resolve()" method with supplied arguments.
@@ -255,16 +258,20 @@ class MetricsCalculator:
             graph: "ValidationGraph" object, containing "metric_edge" structures with "MetricConfiguration" objects.
             runtime_configuration: Additional run-time settings (see "Validator.DEFAULT_RUNTIME_CONFIGURATION").
             min_graph_edges_pbar_enable: Minumum number of graph edges to warrant showing progress bars.
+            resolved_metrics: Metrics resolved previously, which are not computed again.
 
         Returns:
             Dictionary with requested metrics resolved, with unique metric ID as key and computed metric as value.
             Dictionary with aborted metrics information, with metric ID as key.
         """  # noqa: E501
-        resolved_metrics: _MetricsDict
         aborted_metrics_info: _AbortedMetricsInfoDict
+        self._execution_engine.prepare_for_metrics(
+            metric_configurations=graph.metric_configurations
+        )
         resolved_metrics, aborted_metrics_info = graph.resolve(
             runtime_configuration=runtime_configuration,
             min_graph_edges_pbar_enable=min_graph_edges_pbar_enable,
             show_progress_bars=self._show_progress_bars,
+            resolved_metrics=resolved_metrics,
         )
         return resolved_metrics, aborted_metrics_info
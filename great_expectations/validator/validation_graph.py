@@ -99,6 +99,18 @@ class ValidationGraph:
         """Returns "MetricEdge" objects, contained within this "ValidationGraph" object (as list)."""  # noqa: E501
         return self._edges
 
+    @property
+    def metric_configurations(self) -> List[MetricConfiguration]:
+        """Returns distinct "MetricConfiguration" objects, contained within this "ValidationGraph" object (as list)."""  # noqa: E501
+        metric_configurations: Dict[_MetricKey, MetricConfiguration] = {}
+        edge: MetricEdge
+        for edge in self._edges:
+            metric_configurations[edge.left.id] = edge.left
+            if edge.right is not None:
+                metric_configurations[edge.right.id] = edge.right
+
+        return list(metric_configurations.values())
+
     @property
     def edge_ids(self) -> Set[Tuple[str, str]]:
         """Returns "MetricEdge" objects, contained within this "ValidationGraph" object (as set of two-tuples)."""  # noqa: E501
@@ -195,11 +207,13 @@ class ValidationGraph:
         min_graph_edges_pbar_enable: int = 0,
         # Set to low number (e.g., 3) to suppress progress bar for small graphs.
         show_progress_bars: bool = True,
+        resolved_metrics: Optional[Dict[_MetricKey, MetricValue]] = None,
     ) -> Tuple[
         Dict[_MetricKey, MetricValue],
         _AbortedMetricsInfoDict,
     ]:
-        resolved_metrics: Dict[_MetricKey, MetricValue] = {}
+        # Metrics resolved previously (e.g., shared with other graphs) are not computed again.
+        resolved_metrics = dict(resolved_metrics) if resolved_metrics else {}
 
         # updates graph with aborted metrics
         aborted_metrics_info: _AbortedMetricsInfoDict = self._resolve(
@@ -38,6 +38,7 @@ def get_extras_require():
     sqla_keys = (
         "athena",  # https://github.com/laughingman7743/PyAthena/blob/master/pyproject.toml
         "dremio",  # https://github.com/narendrans/sqlalchemy_dremio/blob/master/setup.py
+        "duckdb",  # https://github.com/Mause/duckdb_engine/blob/main/pyproject.toml
         "hive",  # https://github.com/dropbox/PyHive/blob/master/setup.py
         "mssql",  # https://github.com/mkleehammer/pyodbc/blob/master/setup.py
         "mysql",  # https://github.com/PyMySQL/PyMySQL/blob/main/pyproject.toml
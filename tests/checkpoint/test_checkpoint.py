@@ -44,7 +44,10 @@ from great_expectations.core.result_format import ResultFormat
 from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.core.validation_definition import ValidationDefinition
 from great_expectations.data_context.data_context.abstract_data_context import AbstractDataContext
-from great_expectations.data_context.data_context.context_factory import set_context
+from great_expectations.data_context.data_context.context_factory import (
+    ProjectManager,
+    set_context,
+)
 from great_expectations.data_context.data_context.ephemeral_data_context import (
     EphemeralDataContext,
 )
@@ -1337,6 +1340,51 @@ def test_is_fresh_raises_errors_for_all_child_validation_definitions(in_memory_r
     ]
 
 
+@pytest.mark.unit
+def test_run_checks_freshness_of_each_resource_once(
+    in_memory_runtime_context, mocker: MockerFixture
+):
+    context = in_memory_runtime_context
+
+    batch_definition = (
+        context.data_sources.add_pandas(name="my_pandas_ds")
+        .add_dataframe_asset(name="my_pandas_asset")
+        .add_batch_definition_whole_dataframe(name="my_batch_def")
+    )
+    suite = context.suites.add(
+        ExpectationSuite(
+            name="my_suite",
+            expectations=[gxe.ExpectColumnValuesToNotBeNull(column="a")],
+        )
+    )
+    validation_definitions = [
+        context.validation_definitions.add(
+            ValidationDefinition(name=f"my_vd_{idx}", suite=suite, data=batch_definition)
+        )
+        for idx in range(3)
+    ]
+    checkpoint = context.checkpoints.add(
+        Checkpoint(name="my_checkpoint", validation_definitions=validation_definitions)
+    )
+
+    get_datasources = mocker.spy(ProjectManager, "get_datasources")
+    retrieve_suite = mocker.spy(ExpectationSuite, "_compare_with_stored_suite")
+    validation_definition_is_fresh = mocker.spy(ValidationDefinition, "_is_fresh")
+
+    result = checkpoint.run(batch_parameters={"dataframe": pd.DataFrame({"a": [1, 2]})})
+
+    assert result.success
+    assert get_datasources.call_count == 1
+    # Neither the suite nor its stored version changed since it was found fresh (when added)
+    retrieve_suite.assert_not_called()
+
+    # Running the validation definitions does not check them again
+    run_call_count = validation_definition_is_fresh.call_count
+    validation_definition_is_fresh.reset_mock()
+    checkpoint.is_fresh()
+    assert validation_definition_is_fresh.call_count == run_call_count
+
+
 class TestCheckpointPydanticSerializationMethods:
     """
     Test overridden Pydantic serialization methods for Checkpoint
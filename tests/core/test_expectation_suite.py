@@ -1200,6 +1200,48 @@ def test_is_fresh_freshness(in_memory_runtime_context):
     assert isinstance(diagnostics.errors[0], gx_exceptions.ExpectationSuiteNotFreshError)
 
 
+@pytest.mark.unit
+def test_is_fresh_skips_retrieval_of_unchanged_suite(in_memory_runtime_context):
+    context = in_memory_runtime_context
+
+    suite = context.suites.add(
+        ExpectationSuite(
+            name="my_suite",
+            expectations=[gxe.ExpectColumnValuesToNotBeNull(column="a")],
+        )
+    )
+    assert suite.is_fresh().success is True
+    other_suite = context.suites.get(name="my_suite")
+
+    with mock.patch.object(ExpectationsStore, "get", wraps=suite._store.get) as mock_get:
+        assert suite.is_fresh().success is True
+        # Another instance with the same content is known to be fresh as well
+        assert other_suite.is_fresh().success is True
+        mock_get.assert_not_called()
+
+        suite.expectations[0].column = "b"
+        diagnostics = suite.is_fresh()
+        mock_get.assert_called_once()
+
+    assert diagnostics.success is False
+    assert isinstance(diagnostics.errors[0], gx_exceptions.ExpectationSuiteNotFreshError)
+
+
+@pytest.mark.unit
+def test_is_fresh_detects_changes_to_stored_suite(in_memory_runtime_context):
+    context = in_memory_runtime_context
+
+    suite = context.suites.add(ExpectationSuite(name="my_suite"))
+    assert suite.is_fresh().success is True
+
+    other_suite = context.suites.get(name="my_suite")
+    other_suite.add_expectation(gxe.ExpectColumnValuesToNotBeNull(column="a"))
+
+    diagnostics = suite.is_fresh()
+    assert diagnostics.success is False
+    assert isinstance(diagnostics.errors[0], gx_exceptions.ExpectationSuiteNotFreshError)
+
+
 @pytest.mark.unit
 def test_is_fresh_fails_on_suite_retrieval(in_memory_runtime_context):
     context = in_memory_runtime_context
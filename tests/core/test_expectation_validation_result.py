@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import io
 import json
 
+import numpy as np
+import pandas as pd
 import pytest
 
 import great_expectations.expectations as gxe
@@ -11,7 +14,9 @@ from great_expectations.core import (
 )
 from great_expectations.core.expectation_validation_result import (
     ExpectationSuiteValidationResultMeta,
+    ExpectationSuiteValidationResultSchema,
 )
+from great_expectations.data_context.store import ValidationResultsStore
 from great_expectations.expectations.expectation_configuration import (
     ExpectationConfiguration,
 )
@@ -424,3 +429,98 @@ def test_render_updates_rendered_content():
     evr.render()
 
     assert evr.rendered_content is not None
+
+
+@pytest.fixture
+def suite_validation_result_with_numpy_values() -> ExpectationSuiteValidationResult:
+    return ExpectationSuiteValidationResult(
+        success=False,
+        statistics={"evaluated_expectations": 2, "success_percent": np.float64(50.0)},
+        suite_name="my_suite",
+        suite_parameters={"upper_bound": np.int64(5)},
+        meta={"great_expectations_version": "1.0.0", "note": "schön"},
+        id="dd2cd1f3-7fd3-4d2e-94f5-6d2a1f6c2d5a",
+        results=[
+            ExpectationValidationResult(
+                success=False,
+                result={
+                    "element_count": np.int64(6),
+                    "unexpected_count": 3,
+                    "unexpected_list": np.array([7.5, 8.5, 9.5]),
+                    "unexpected_index_list": [{"index": 3}, {"index": 4}, {"index": 5}],
+                    "observed_value": "multi\nline",
+                },
+                expectation_config=ExpectationConfiguration(
+                    type="expect_column_values_to_be_between",
+                    kwargs={"column": "a", "max_value": np.float64(5.0)},
+                ),
+            ),
+            ExpectationValidationResult(
+                success=True,
+                result={"observed_value": pd.Timestamp("2024-01-01")},
+                expectation_config=ExpectationConfiguration(
+                    type="expect_column_max_to_be_between",
+                    kwargs={"column": "b", "min_value": 0},
+                ),
+            ),
+        ],
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("indent", [2, 4, None])
+@pytest.mark.parametrize("sort_keys", [True, False])
+def test_expectation_suite_validation_result_write_json_matches_to_json_dict(
+    suite_validation_result_with_numpy_values: ExpectationSuiteValidationResult,
+    indent: int | None,
+    sort_keys: bool,
+):
+    buffer = io.BytesIO()
+    suite_validation_result_with_numpy_values.write_json(
+        fp=buffer, indent=indent, sort_keys=sort_keys
+    )
+
+    assert buffer.getvalue().decode("utf-8") == json.dumps(
+        suite_validation_result_with_numpy_values.to_json_dict(),
+        indent=indent,
+        sort_keys=sort_keys,
+    )
+
+
+@pytest.mark.unit
+def test_expectation_suite_validation_result_write_json_without_results():
+    svr = ExpectationSuiteValidationResult(success=True, results=[], suite_name="empty_suite")
+
+    assert svr.to_json_str() == json.dumps(svr.to_json_dict(), indent=2)
+
+
+@pytest.mark.unit
+def test_expectation_suite_validation_result_to_json_dict_does_not_modify_results(
+    suite_validation_result_with_numpy_values: ExpectationSuiteValidationResult,
+):
+    result = suite_validation_result_with_numpy_values.results[0].result
+
+    suite_validation_result_with_numpy_values.to_json_dict()
+    repr(suite_validation_result_with_numpy_values)
+
+    assert isinstance(result["unexpected_list"], np.ndarray)
+    assert isinstance(result["element_count"], np.int64)
+    assert isinstance(
+        suite_validation_result_with_numpy_values.statistics["success_percent"], np.float64
+    )
+
+
+@pytest.mark.unit
+def test_validation_results_store_serializes_by_streaming(
+    suite_validation_result_with_numpy_values: ExpectationSuiteValidationResult,
+):
+    store = ValidationResultsStore()
+
+    serialized = store.serialize(suite_validation_result_with_numpy_values)
+
+    assert serialized == ExpectationSuiteValidationResultSchema().dumps(
+        suite_validation_result_with_numpy_values.to_json_dict(), indent=2, sort_keys=True
+    )
+    assert store.deserialize(serialized) == store.deserialize(
+        json.dumps(suite_validation_result_with_numpy_values.to_json_dict())
+    )
@@ -0,0 +1,64 @@
+import pytest
+
+from great_expectations.core.freshness_diagnostics import (
+    FreshnessDiagnostics,
+    cached_lookup,
+    check_freshness,
+    freshness_cache,
+    invalidate_freshness,
+)
+
+
+class _Resource:
+    pass
+
+
+@pytest.mark.unit
+def test_check_freshness_without_cache_always_checks(mocker):
+    resource = _Resource()
+    check = mocker.Mock(return_value=FreshnessDiagnostics(errors=[]))
+
+    check_freshness(resource, check)
+    check_freshness(resource, check)
+
+    assert check.call_count == 2
+
+
+@pytest.mark.unit
+def test_check_freshness_checks_each_resource_once_per_cache(mocker):
+    resource, other_resource = _Resource(), _Resource()
+    check = mocker.Mock(return_value=FreshnessDiagnostics(errors=[]))
+
+    with freshness_cache():
+        assert check_freshness(resource, check) is check.return_value
+        # Nested scopes share the outermost cache
+        with freshness_cache():
+            check_freshness(resource, check)
+        assert check.call_count == 1
+
+        check_freshness(other_resource, check)
+        assert check.call_count == 2
+
+        invalidate_freshness(resource)
+        check_freshness(resource, check)
+        assert check.call_count == 3
+
+    with freshness_cache():
+        check_freshness(resource, check)
+    assert check.call_count == 4
+
+
+@pytest.mark.unit
+def test_cached_lookup(mocker):
+    fetch = mocker.Mock(return_value="my_datasource")
+
+    with freshness_cache():
+        assert cached_lookup(("datasource", "a"), fetch) == "my_datasource"
+        assert cached_lookup(("datasource", "a"), fetch) == "my_datasource"
+        assert fetch.call_count == 1
+
+        cached_lookup(("datasource", "b"), fetch)
+        assert fetch.call_count == 2
+
+    cached_lookup(("datasource", "a"), fetch)
+    assert fetch.call_count == 3
@@ -1,10 +1,13 @@
 import os
 import uuid
 
+import numpy as np
 import pytest
 
-from great_expectations.data_context.store.metric_store import MetricStore
+from great_expectations.data_context.store.metric_store import BatchMetricStore, MetricStore
+from great_expectations.data_context.types.resource_identifiers import BatchMetricIdentifier
 from great_expectations.data_context.util import instantiate_class_from_config
+from great_expectations.exceptions import StoreError
 
 
 @pytest.fixture(
@@ -104,3 +107,88 @@ def test_metric_store_deserialize() -> None:
 
     value = '{"value": {"foo": "bar"}}'
     assert store.deserialize(value=value) == {"foo": "bar"}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value,is_storable",
+    [
+        pytest.param(1, True, id="int"),
+        pytest.param(np.float64(1.5), True, id="numpy_float"),
+        pytest.param(None, True, id="none"),
+        pytest.param("a", True, id="str"),
+        pytest.param([1, 2.5, np.nan], True, id="list"),
+        pytest.param(np.array([1.0, 2.0]), True, id="float_array"),
+        pytest.param(np.array(["a", "b"]), False, id="str_array"),
+        pytest.param({"a": 1}, False, id="dict"),
+        pytest.param([[1, 2]], False, id="nested_list"),
+    ],
+)
+def test_batch_metric_store_is_storable(value, is_storable: bool) -> None:
+    assert BatchMetricStore.is_storable(value) is is_storable
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value,stored_type",
+    [
+        pytest.param(np.int64(3), np.int64, id="numpy_int"),
+        pytest.param(np.float32(0.5), np.float32, id="numpy_float"),
+        pytest.param(2.5, float, id="float"),
+        pytest.param([0.25, 0.5], list, id="list"),
+        pytest.param([np.float64(0.25), 0.5, None], list, id="mixed_list"),
+        pytest.param(np.array([[1.0, np.nan], [3.0, np.inf]]), np.ndarray, id="array"),
+    ],
+)
+def test_batch_metric_store_round_trip(value, stored_type: type) -> None:
+    store = BatchMetricStore()
+    key = BatchMetricIdentifier(
+        batch_fingerprint="my_fingerprint",
+        metric_name="column.quantile_values",
+        metric_kwargs_id="my_kwargs_id",
+    )
+
+    store.set(key=key, value=value)
+    stored_value = store.get(key=key)
+
+    assert type(stored_value) is stored_type
+    np.testing.assert_array_equal(stored_value, value)
+    if isinstance(value, list):
+        assert list(map(type, stored_value)) == list(map(type, value))
+
+
+@pytest.mark.unit
+def test_batch_metric_identifier_tuple_round_trip() -> None:
+    key = BatchMetricIdentifier(
+        batch_fingerprint="my_fingerprint", metric_name="column.mean", metric_kwargs_id=None
+    )
+
+    assert key.to_tuple() == ("my_fingerprint", "column.mean", "__")
+    assert BatchMetricIdentifier.from_tuple(key.to_tuple()) == key
+
+
+@pytest.mark.sqlite
+def test_batch_metric_store_with_database_store_backend(tmp_path) -> None:
+    store = BatchMetricStore(
+        store_backend={
+            "class_name": "DatabaseStoreBackend",
+            "url": f"sqlite:///{tmp_path / 'metrics.db'}",
+        }
+    )
+    mean_key = BatchMetricIdentifier(
+        batch_fingerprint="my_fingerprint", metric_name="column.mean", metric_kwargs_id="a"
+    )
+    max_key = BatchMetricIdentifier(
+        batch_fingerprint="my_fingerprint", metric_name="column.max", metric_kwargs_id="a"
+    )
+
+    with pytest.raises(StoreError):
+        store.get(key=mean_key)
+
+    store.set(key=mean_key, value=1.5)
+    store.set(key=max_key, value=3)
+    # Updating one metric of a Batch leaves the others as they were
+    store.set(key=mean_key, value=2.5)
+
+    assert store.get(key=mean_key) == 2.5
+    assert store.get(key=max_key) == 3
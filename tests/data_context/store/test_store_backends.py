@@ -276,6 +276,25 @@ def test_TupleS3StoreBackend_store_backend_id(aws_credentials):
     assert s3_store_backend.store_backend_id == s3_store_backend_duplicate.store_backend_id
 
 
+@pytest.mark.unit
+def test_InMemoryStoreBackend_get_version():
+    my_store = InMemoryStoreBackend()
+
+    my_key = ("A",)
+    assert my_store.get_version(my_key) is None
+
+    my_store.set(my_key, "aaa")
+    version = my_store.get_version(my_key)
+    assert version is not None
+    assert my_store.get_version(my_key) == version
+
+    my_store.set(my_key, "aaa")
+    assert my_store.get_version(my_key) != version
+
+    my_store.remove_key(my_key)
+    assert my_store.get_version(my_key) is None
+
+
 @pytest.mark.unit
 def test_InMemoryStoreBackend():
     my_store = InMemoryStoreBackend()
@@ -418,6 +437,27 @@ def test_TupleFilesystemStoreBackend_get_all(tmp_path_factory):
     assert sorted(all_values) == [value_a, value_b]
 
 
+@pytest.mark.filesystem
+def test_TupleFilesystemStoreBackend_get_version(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend__dir"))
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=project_path,
+        base_directory=project_path,
+        filepath_template="my_file_{0}",
+    )
+
+    assert my_store.get_version(("AAA",)) is None
+
+    my_store.set(("AAA",), "aaa")
+    version = my_store.get_version(("AAA",))
+    assert version is not None
+    assert my_store.get_version(("AAA",)) == version
+
+    my_store.set(("AAA",), "aaaa")
+    assert my_store.get_version(("AAA",)) != version
+
+
 @pytest.mark.filesystem
 def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     tmp_path_factory,
@@ -571,6 +611,27 @@ def test_TupleS3StoreBackend_with_prefix(aws_credentials):
     assert my_new_store.get_public_url_for_key(("BBB",)) == "http://www.test.com/my_file_BBB"
 
 
+@mock_s3
+@pytest.mark.aws_deps
+def test_TupleS3StoreBackend_get_version(aws_credentials):
+    bucket = "leakybucket"
+
+    # create a bucket in Moto's mock AWS environment
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(filepath_template="my_file_{0}", bucket=bucket)
+
+    assert my_store.get_version(("AAA",)) is None
+
+    my_store.set(("AAA",), "aaa")
+    version = my_store.get_version(("AAA",))
+    assert version is not None
+
+    my_store.set(("AAA",), "bbb")
+    assert my_store.get_version(("AAA",)) != version
+
+
 @mock_s3
 @pytest.mark.aws_deps
 def test_TupleS3StoreBackend_get_all(aws_credentials):
@@ -1,20 +1,33 @@
 from __future__ import annotations
 
 import pathlib
+import time
 from contextlib import _GeneratorContextManager, contextmanager
 from typing import TYPE_CHECKING, Any, Callable, Generator, Optional
 
 import pytest
 
 from great_expectations.compatibility.pydantic import ValidationError
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
 from great_expectations.core.partitioners import (
+    ColumnPartitionerMonthly,
     PartitionerConvertedDatetime,
 )
 from great_expectations.datasource.fluent import SqliteDatasource
+from great_expectations.exceptions.exceptions import NoAvailableBatchesError
+from great_expectations.execution_engine.materialized_tables_scope import (
+    materialized_tables_scope,
+)
+from great_expectations.execution_engine.partition_and_sample.sqlalchemy_data_partitioner import (
+    SqlAlchemyDataPartitioner,
+)
 from tests.datasource.fluent.conftest import sqlachemy_execution_engine_mock_cls
 
 if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
     from great_expectations.data_context import AbstractDataContext
+    from great_expectations.datasource.fluent.sql_datasource import TableAsset
 
 
 @pytest.fixture
@@ -181,3 +194,232 @@ def test_create_temp_table(empty_data_context, create_sqlite_source):
         asset = source.add_query_asset(name="query_asset", query="SELECT * from table")
         _ = asset.get_batch(asset.build_batch_request())
         assert source._execution_engine._create_temp_table is False
+
+
+@pytest.fixture
+def sqlite_events_asset(empty_data_context, tmp_path: pathlib.Path) -> TableAsset:
+    connection_string = f"sqlite:///{tmp_path / 'events.db'}"
+    engine = sa.create_engine(connection_string)
+    with engine.begin() as connection:
+        connection.execute(sa.text("CREATE TABLE events (id INTEGER, event_date TEXT)"))
+        connection.execute(
+            sa.text(
+                "INSERT INTO events VALUES (1, '2023-11-05'), (2, '2024-01-15'), "
+                "(3, '2024-02-01'), (4, '2024-02-20'), (5, NULL)"
+            )
+        )
+    engine.dispose()
+    datasource = empty_data_context.data_sources.add_sqlite(
+        name="events_datasource", connection_string=connection_string
+    )
+    return datasource.add_table_asset(name="events", table_name="events")
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("sort_ascending", [True, False])
+@pytest.mark.parametrize("batch_slice", [None, -1, "[-3:]"])
+def test_get_last_batch_does_not_introspect_all_partitions(
+    sqlite_events_asset: TableAsset, mocker: MockerFixture, sort_ascending: bool, batch_slice
+):
+    partitioner = ColumnPartitionerMonthly(column_name="event_date", sort_ascending=sort_ascending)
+    expected_metadata = sqlite_events_asset.get_batch_identifiers_list(
+        sqlite_events_asset.build_batch_request(partitioner=partitioner)
+    )[-1]
+    get_data_for_batch_identifiers = mocker.spy(
+        SqlAlchemyDataPartitioner, "get_data_for_batch_identifiers"
+    )
+
+    batch = sqlite_events_asset.get_batch(
+        sqlite_events_asset.build_batch_request(partitioner=partitioner, batch_slice=batch_slice)
+    )
+
+    get_data_for_batch_identifiers.assert_not_called()
+    assert batch.metadata == expected_metadata
+    assert batch.metadata == (
+        {"year": 2024, "month": 2} if sort_ascending else {"year": None, "month": None}
+    )
+
+
+@pytest.mark.sqlite
+def test_get_fully_specified_batch_does_not_introspect_all_partitions(
+    sqlite_events_asset: TableAsset, mocker: MockerFixture
+):
+    partitioner = ColumnPartitionerMonthly(column_name="event_date")
+    get_data_for_batch_identifiers = mocker.spy(
+        SqlAlchemyDataPartitioner, "get_data_for_batch_identifiers"
+    )
+
+    batch = sqlite_events_asset.get_batch(
+        sqlite_events_asset.build_batch_request(
+            options={"year": 2024, "month": 1}, partitioner=partitioner
+        )
+    )
+    with pytest.raises(NoAvailableBatchesError):
+        sqlite_events_asset.get_batch(
+            sqlite_events_asset.build_batch_request(
+                options={"year": 2030, "month": 1}, partitioner=partitioner
+            )
+        )
+
+    get_data_for_batch_identifiers.assert_not_called()
+    assert batch.metadata == {"year": 2024, "month": 1}
+
+
+@pytest.mark.sqlite
+def test_batch_identifiers_cache_ttl(
+    sqlite_events_asset: TableAsset, mocker: MockerFixture, monkeypatch
+):
+    batch_request = sqlite_events_asset.build_batch_request(
+        partitioner=ColumnPartitionerMonthly(column_name="event_date")
+    )
+    get_data_for_batch_identifiers = mocker.spy(
+        SqlAlchemyDataPartitioner, "get_data_for_batch_identifiers"
+    )
+
+    sqlite_events_asset.get_batch_identifiers_list(batch_request)
+    sqlite_events_asset.get_batch_identifiers_list(batch_request)
+    assert get_data_for_batch_identifiers.call_count == 2
+
+    sqlite_events_asset.datasource.batch_identifiers_cache_ttl = 60
+    batch_identifiers_list = sqlite_events_asset.get_batch_identifiers_list(batch_request)
+    assert sqlite_events_asset.get_batch_identifiers_list(batch_request) == batch_identifiers_list
+    assert get_data_for_batch_identifiers.call_count == 3
+
+    expired = time.monotonic() + 60
+    monkeypatch.setattr(time, "monotonic", lambda: expired)
+    sqlite_events_asset.get_batch_identifiers_list(batch_request)
+    assert get_data_for_batch_identifiers.call_count == 4
+
+
+@pytest.mark.sqlite
+def test_batch_identifiers_cache_ttl_is_datasource_config(empty_data_context, tmp_path):
+    datasource = empty_data_context.data_sources.add_sqlite(
+        name="my_datasource",
+        connection_string=f"sqlite:///{tmp_path / 'my.db'}",
+        batch_identifiers_cache_ttl=60,
+    )
+
+    assert datasource.dict()["batch_identifiers_cache_ttl"] == 60
+    assert empty_data_context.data_sources.all()["my_datasource"].batch_identifiers_cache_ttl == 60
+    # It configures the datasource, not its execution engine.
+    datasource.get_execution_engine()
+
+    with pytest.raises(ValidationError):
+        SqliteDatasource(
+            name="my_datasource",
+            connection_string="sqlite://",
+            batch_identifiers_cache_ttl=-1,
+        )
+
+
+def _temp_table_names(execution_engine) -> list[str]:
+    return [
+        row[0]
+        for row in execution_engine.execute_query(
+            sa.text("SELECT name FROM sqlite_temp_master WHERE type = 'table'")
+        ).fetchall()
+    ]
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "materialization,expected_temp_tables", [("never", 0), ("temp", 2), ("cached_table", 1)]
+)
+def test_query_asset_materialization(
+    sqlite_events_asset: TableAsset, materialization: str, expected_temp_tables: int
+):
+    datasource = sqlite_events_asset.datasource
+    query_asset = datasource.add_query_asset(
+        name="events_query",
+        query="SELECT id, event_date FROM events WHERE id > 1",
+        materialization=materialization,
+    )
+
+    batches = [query_asset.get_batch(query_asset.build_batch_request()) for _ in range(2)]
+
+    execution_engine = datasource.get_execution_engine()
+    assert len(_temp_table_names(execution_engine)) == expected_temp_tables
+    for batch in batches:
+        assert batch.head(fetch_all=True).data["id"].tolist() == [2, 3, 4, 5]
+
+
+@pytest.mark.sqlite
+def test_query_asset_cached_table_is_materialized_again_after_ttl(
+    sqlite_events_asset: TableAsset, monkeypatch
+):
+    datasource = sqlite_events_asset.datasource
+    query_asset = datasource.add_query_asset(
+        name="events_query",
+        query="SELECT id FROM events",
+        materialization="cached_table",
+        materialization_ttl=60,
+    )
+    execution_engine = datasource.get_execution_engine()
+
+    query_asset.get_batch(query_asset.build_batch_request())
+    query_asset.get_batch(query_asset.build_batch_request())
+    (first_table_name,) = _temp_table_names(execution_engine)
+
+    expired = time.monotonic() + 60
+    monkeypatch.setattr(time, "monotonic", lambda: expired)
+    query_asset.get_batch(query_asset.build_batch_request())
+    (second_table_name,) = _temp_table_names(execution_engine)
+
+    assert second_table_name != first_table_name
+
+
+@pytest.mark.sqlite
+def test_query_asset_cached_tables_are_dropped_on_close(sqlite_events_asset: TableAsset):
+    datasource = sqlite_events_asset.datasource
+    query_asset = datasource.add_query_asset(
+        name="events_query", query="SELECT id FROM events", materialization="cached_table"
+    )
+    execution_engine = datasource.get_execution_engine()
+    query_asset.get_batch(query_asset.build_batch_request())
+    assert len(_temp_table_names(execution_engine)) == 1
+
+    # close() also closes the connection holding the temporary tables; look before it does
+    drop_table = execution_engine._drop_materialized_table
+    dropped: list[str] = []
+
+    def _drop_and_record(fingerprint: str) -> None:
+        drop_table(fingerprint=fingerprint)
+        dropped.extend(_temp_table_names(execution_engine))
+
+    execution_engine._drop_materialized_table = _drop_and_record
+    execution_engine.close()
+
+    assert dropped == []
+    assert execution_engine._materialized_tables == {}
+
+
+@pytest.mark.sqlite
+def test_query_asset_cached_tables_are_dropped_as_the_run_ends(sqlite_events_asset: TableAsset):
+    datasource = sqlite_events_asset.datasource
+    query_asset = datasource.add_query_asset(
+        name="events_query", query="SELECT id FROM events", materialization="cached_table"
+    )
+    execution_engine = datasource.get_execution_engine()
+
+    with materialized_tables_scope():
+        query_asset.get_batch(query_asset.build_batch_request())
+        # Nested scopes (e.g., of validation definitions run by a checkpoint) share the run's tables
+        with materialized_tables_scope():
+            query_asset.get_batch(query_asset.build_batch_request())
+        assert len(_temp_table_names(execution_engine)) == 1
+
+    assert _temp_table_names(execution_engine) == []
+    assert execution_engine._materialized_tables == {}
+
+
+@pytest.mark.sqlite
+def test_table_assets_share_reflected_schema_names(
+    sqlite_events_asset: TableAsset, mocker: MockerFixture
+):
+    datasource = sqlite_events_asset.datasource
+    get_schema_names = mocker.spy(sa.engine.reflection.Inspector, "get_schema_names")
+
+    datasource.add_table_asset(name="main_events", table_name="events", schema_name="main")
+    datasource.add_table_asset(name="more_main_events", table_name="events", schema_name="main")
+
+    assert get_schema_names.call_count == 1
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import gc
+import pathlib
+import weakref
+
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+import great_expectations.expectations as gxe
+from great_expectations.compatibility.not_imported import NotImported
+from great_expectations.compatibility.pydantic import ValidationError
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.core.batch_spec import PathBatchSpec, RuntimeDataBatchSpec
+from great_expectations.datasource.fluent import pandas_datasource
+from great_expectations.datasource.fluent.pandas_azure_blob_storage_datasource import (
+    PandasAzureBlobStorageDatasource,
+)
+from great_expectations.datasource.fluent.pandas_datasource import PandasDatasource
+from great_expectations.datasource.fluent.pandas_dbfs_datasource import PandasDBFSDatasource
+from great_expectations.datasource.fluent.pandas_filesystem_datasource import (
+    PandasFilesystemDatasource,
+)
+from great_expectations.datasource.fluent.pandas_google_cloud_storage_datasource import (
+    PandasGoogleCloudStorageDatasource,
+)
+from great_expectations.datasource.fluent.pandas_s3_datasource import PandasS3Datasource
+from great_expectations.execution_engine.duckdb_reader import (
+    DUCKDB_IN_MEMORY_CONNECTION_STRING,
+    build_duckdb_file_selectable,
+)
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+
+
+def _compile(selectable) -> str:
+    return str(selectable.compile(compile_kwargs={"literal_binds": True})).replace("\n", "")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "reader_method,reader_options,path,expected_from",
+    [
+        pytest.param(
+            "read_parquet",
+            {},
+            "data/taxi.parquet",
+            "read_parquet('data/taxi.parquet')",
+            id="parquet",
+        ),
+        pytest.param(
+            "read_csv",
+            {"sep": ";", "header": 0, "na_values": ["NA", ""]},
+            "it's.csv",
+            "read_csv_auto('it''s.csv', delim=';', header=true, nullstr=['NA', ''])",
+            id="csv_options",
+        ),
+        pytest.param(
+            "read_json",
+            {"lines": True},
+            "events.jsonl",
+            "read_json_auto('events.jsonl', format='newline_delimited')",
+            id="json_lines",
+        ),
+        pytest.param(
+            "read_csv",
+            {"filepath_or_buffer": "data.csv.gz", "compression": "gzip"},
+            None,
+            "read_csv_auto('data.csv.gz', compression='gzip')",
+            id="path_from_reader_options",
+        ),
+        pytest.param(
+            "read_parquet",
+            {"path": pathlib.PurePosixPath("data/taxi.parquet")},
+            None,
+            "read_parquet('data/taxi.parquet')",
+            id="path_like",
+        ),
+        pytest.param(
+            "read_parquet",
+            {},
+            "C:\\data\\taxi.parquet",
+            "read_parquet('C:\\data\\taxi.parquet')",
+            id="windows_path",
+        ),
+    ],
+)
+def test_build_duckdb_file_selectable(
+    reader_method: str, reader_options: dict, path: str | None, expected_from: str
+):
+    selectable = build_duckdb_file_selectable(
+        reader_method=reader_method, reader_options=reader_options, path=path
+    )
+
+    assert _compile(selectable) == f"SELECT * FROM {expected_from}"
+
+
+@pytest.mark.unit
+def test_build_duckdb_file_selectable_projects_columns():
+    selectable = build_duckdb_file_selectable(
+        reader_method="read_csv", reader_options={"usecols": ["a", "b c"]}, path="data.csv"
+    )
+
+    assert _compile(selectable) == "SELECT a, \"b c\" FROM read_csv_auto('data.csv')"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "reader_method,reader_options,path",
+    [
+        pytest.param("read_excel", {}, "data.xlsx", id="reader_method"),
+        pytest.param("read_csv", {"dtype": {"a": "int"}}, "data.csv", id="reader_option"),
+        pytest.param("read_csv", {"encoding": "latin-1"}, "data.csv", id="reader_option_value"),
+        pytest.param("read_csv", {"filepath_or_buffer": object()}, None, id="buffer"),
+        pytest.param("read_parquet", {}, "s3a://bucket/data.parquet", id="s3a_url"),
+        pytest.param("read_parquet", {}, "s3://bucket/data.parquet", id="s3_url"),
+        pytest.param("read_csv", {}, "gs://bucket/data.csv", id="gcs_url"),
+        pytest.param(
+            "read_csv", {}, "abfs://container@account.dfs.core.windows.net/data.csv", id="abs_url"
+        ),
+        pytest.param(
+            "read_csv", {"filepath_or_buffer": "https://example.com/data.csv"}, None, id="http_url"
+        ),
+    ],
+)
+def test_build_duckdb_file_selectable_unsupported(
+    reader_method: str, reader_options: dict, path: str | None
+):
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        build_duckdb_file_selectable(
+            reader_method=reader_method, reader_options=reader_options, path=path
+        )
+
+
+@pytest.mark.unit
+def test_duckdb_execution_backend_is_not_passed_to_execution_engine():
+    datasource = PandasDatasource(name="my_pandas", execution_backend="duckdb")
+
+    assert "execution_backend" in datasource._get_exec_engine_excludes()
+
+
+@pytest.mark.unit
+def test_duckdb_execution_backend_requires_duckdb_engine(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(pandas_datasource, "duckdb_engine", NotImported("duckdb not installed"))
+    datasource = PandasDatasource(name="my_pandas", execution_backend="duckdb")
+
+    with pytest.raises(ModuleNotFoundError, match="duckdb not installed"):
+        datasource.get_execution_engine()
+
+
+@pytest.mark.unit
+def test_filesystem_datasources_have_duckdb_execution_backend(tmp_path: pathlib.Path):
+    datasource = PandasFilesystemDatasource(
+        name="my_pandas_filesystem", base_directory=tmp_path, execution_backend="duckdb"
+    )
+
+    assert datasource.execution_backend == "duckdb"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "datasource_class,datasource_kwargs",
+    [
+        pytest.param(PandasS3Datasource, {"bucket": "my_bucket"}, id="s3"),
+        pytest.param(PandasGoogleCloudStorageDatasource, {"bucket_or_name": "my_bucket"}, id="gcs"),
+        pytest.param(
+            PandasAzureBlobStorageDatasource,
+            {"azure_options": {"account_url": "my_account.blob.core.windows.net"}},
+            id="abs",
+        ),
+        pytest.param(PandasDBFSDatasource, {"base_directory": "/dbfs/my_data"}, id="dbfs"),
+    ],
+)
+def test_object_store_datasources_have_no_execution_backend(
+    datasource_class: type, datasource_kwargs: dict
+):
+    assert "execution_backend" not in datasource_class.__fields__
+    assert "execution_backend" not in datasource_class.schema()["properties"]
+
+    with pytest.raises(ValidationError, match="execution_backend"):
+        datasource_class(name="my_datasource", execution_backend="duckdb", **datasource_kwargs)
+
+
+@pytest.mark.duckdb
+def test_validate_csv_and_dataframe_with_duckdb(in_memory_runtime_context, tmp_path):
+    df = pd.DataFrame({"a": [1, 2, 3, None], "b": ["x", "y", "z", "z"]})
+    csv_path = tmp_path / "data.csv"
+    df.to_csv(csv_path, index=False)
+
+    datasource = in_memory_runtime_context.data_sources.add_pandas(
+        name="my_pandas", execution_backend="duckdb"
+    )
+    assert isinstance(datasource.get_execution_engine(), SqlAlchemyExecutionEngine)
+
+    csv_batch = datasource.add_csv_asset(name="csv", filepath_or_buffer=csv_path).get_batch(
+        datasource.get_asset("csv").build_batch_request()
+    )
+    dataframe_asset = datasource.add_dataframe_asset(name="dataframe")
+    dataframe_batch = dataframe_asset.get_batch(
+        dataframe_asset.build_batch_request({"dataframe": df})
+    )
+
+    for batch in (csv_batch, dataframe_batch):
+        assert batch.columns() == ["a", "b"]
+        assert batch.head(fetch_all=True).data.shape == (4, 2)
+        result = batch.validate(gxe.ExpectColumnValuesToNotBeNull(column="a"))
+        assert result.result["unexpected_count"] == 1
+
+
+def _views(execution_engine: SqlAlchemyExecutionEngine) -> set[str]:
+    with execution_engine.get_connection() as connection:
+        return {
+            row[0]
+            for row in connection.execute(
+                sa.text("SELECT view_name FROM duckdb_views() WHERE NOT internal")
+            )
+        }
+
+
+@pytest.mark.duckdb
+def test_views_are_dropped_with_their_batch_data(tmp_path):
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string=DUCKDB_IN_MEMORY_CONNECTION_STRING
+    )
+    df = pd.DataFrame({"a": [1, 2, 3]})
+    df.to_csv(tmp_path / "data.csv", index=False)
+    file_batch_spec = PathBatchSpec(path=str(tmp_path / "data.csv"), reader_method="read_csv")
+
+    file_batch_data, _ = execution_engine.get_batch_data_and_markers(file_batch_spec)
+    batch_data, _ = execution_engine.get_batch_data_and_markers(RuntimeDataBatchSpec(batch_data=df))
+    assert _views(execution_engine) == execution_engine._duckdb_views
+    assert len(execution_engine._duckdb_views) == 2
+
+    dataframe = weakref.ref(df)
+    del df, batch_data
+    gc.collect()
+    assert dataframe() is None
+    assert _views(execution_engine) == execution_engine._duckdb_views
+    assert len(execution_engine._duckdb_views) == 1
+
+    # Views copied into temporary tables are not needed beyond the batch data being built.
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        PathBatchSpec(file_batch_spec, create_temp_table=True)
+    )
+    assert len(execution_engine._duckdb_views) == 1
+    assert (
+        execution_engine.execute_query(
+            sa.select(sa.func.count()).select_from(batch_data.selectable)
+        ).scalar()
+        == 3
+    )
+
+    # Views of batch data still in use are dropped when the execution engine is closed.
+    assert file_batch_data.selectable.name in execution_engine._duckdb_views
+    execution_engine.close()
+    assert not execution_engine._duckdb_views
@@ -0,0 +1,92 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch_spec import RuntimeDataBatchSpec
+from great_expectations.execution_engine.pandas_batch_fingerprint import (
+    FingerprintStrategy,
+    fingerprint_pandas_dataframe,
+    hash_pandas_dataframe,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+
+
+@pytest.fixture
+def test_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=3)
+    return pd.DataFrame(
+        {
+            "a": rng.normal(size=10_000),
+            "b": rng.choice(["x", "y", "z"], size=10_000),
+            "c": pd.date_range("2024-01-01", periods=10_000, freq="min"),
+            "d": [{"key": value} for value in range(10_000)],
+        }
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("strategy", list(FingerprintStrategy))
+def test_fingerprint_is_deterministic(test_df: pd.DataFrame, strategy: FingerprintStrategy):
+    fingerprint = fingerprint_pandas_dataframe(test_df, strategy=strategy)
+
+    assert isinstance(fingerprint, str)
+    assert fingerprint == fingerprint_pandas_dataframe(test_df.copy(), strategy=strategy)
+
+
+@pytest.mark.unit
+def test_full_fingerprint_is_hash_pandas_dataframe(test_df: pd.DataFrame):
+    assert fingerprint_pandas_dataframe(test_df) == hash_pandas_dataframe(test_df)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "strategy,detects_value_change,detects_sampled_value_change",
+    [
+        pytest.param(FingerprintStrategy.FULL, True, True, id="full"),
+        pytest.param(FingerprintStrategy.COLUMNWISE, True, True, id="columnwise"),
+        pytest.param(FingerprintStrategy.SAMPLED, False, True, id="sampled"),
+        pytest.param(FingerprintStrategy.SCHEMA, False, False, id="schema"),
+    ],
+)
+def test_fingerprint_changes(
+    test_df: pd.DataFrame,
+    strategy: FingerprintStrategy,
+    detects_value_change: bool,
+    detects_sampled_value_change: bool,
+):
+    options = {"sample_blocks": 4, "sample_block_rows": 10}
+    fingerprint = fingerprint_pandas_dataframe(test_df, strategy=strategy, **options)
+
+    def fingerprint_with(row: int, column: str, value) -> str:
+        df = test_df.copy()
+        df.loc[row, column] = value
+        return fingerprint_pandas_dataframe(df, strategy=strategy, **options)
+
+    # Row 5000 is outside of every sampled block, while the last row is always sampled.
+    assert (fingerprint_with(5000, "a", 100.0) != fingerprint) is detects_value_change
+    assert (fingerprint_with(9999, "b", "w") != fingerprint) is detects_sampled_value_change
+    assert fingerprint_pandas_dataframe(test_df.iloc[:-1], strategy=strategy) != (
+        fingerprint_pandas_dataframe(test_df, strategy=strategy)
+    )
+    assert fingerprint_pandas_dataframe(test_df.astype({"a": "float32"}), strategy=strategy) != (
+        fingerprint_pandas_dataframe(test_df, strategy=strategy)
+    )
+
+
+@pytest.mark.unit
+def test_execution_engine_fingerprint_strategy(test_df: pd.DataFrame):
+    _, default_batch_markers = PandasExecutionEngine().get_batch_data_and_markers(
+        RuntimeDataBatchSpec(batch_data=test_df)
+    )
+    assert default_batch_markers["pandas_data_fingerprint"] == hash_pandas_dataframe(test_df)
+
+    execution_engine = PandasExecutionEngine(fingerprint_strategy="schema")
+    assert execution_engine.config["fingerprint_strategy"] == "schema"
+    _, batch_markers = execution_engine.get_batch_data_and_markers(
+        RuntimeDataBatchSpec(batch_data=test_df)
+    )
+    assert batch_markers["pandas_data_fingerprint"] == fingerprint_pandas_dataframe(
+        test_df, strategy=FingerprintStrategy.SCHEMA
+    )
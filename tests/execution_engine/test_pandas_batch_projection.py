@@ -0,0 +1,285 @@
+import pathlib
+from typing import List, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch, LegacyBatchDefinition
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.core.id_dict import IDDict
+from great_expectations.execution_engine.pandas_batch_data import (
+    PandasBatchData,
+    ProjectedPandasBatchData,
+)
+from great_expectations.execution_engine.pandas_batch_projection import (
+    get_batch_projection,
+    row_condition_to_filters,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.util import is_library_loadable
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+COLUMNS = ["a", "b", "c", "d"]
+
+requires_pyarrow = pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"), reason="pyarrow is not installed"
+)
+
+
+@pytest.fixture
+def test_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=7)
+    return pd.DataFrame(
+        {
+            "a": rng.normal(loc=5.0, scale=2.0, size=200),
+            "b": rng.choice(["x", "y", "z"], size=200),
+            "c": np.arange(200),
+            "d": rng.integers(low=0, high=10, size=200),
+        }
+    )
+
+
+@pytest.fixture
+def csv_path(tmp_path: pathlib.Path, test_df: pd.DataFrame) -> str:
+    path = tmp_path / "data.csv"
+    test_df.to_csv(path, index=False)
+    return str(path)
+
+
+@pytest.fixture
+def parquet_path(tmp_path: pathlib.Path, test_df: pd.DataFrame) -> str:
+    path = tmp_path / "data.parquet"
+    test_df.to_parquet(path, row_group_size=50)
+    return str(path)
+
+
+def _build_validator(context, path: str, projection_pushdown: bool) -> Validator:
+    execution_engine = PandasExecutionEngine(projection_pushdown=projection_pushdown)
+    batch_spec = PathBatchSpec(path=path)
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+    batch = Batch(
+        data=batch_data,
+        batch_definition=LegacyBatchDefinition(
+            datasource_name="my_datasource",
+            data_connector_name="my_data_connector",
+            data_asset_name="my_asset",
+            batch_identifiers=IDDict({}),
+        ),
+        batch_spec=batch_spec,
+        batch_markers=batch_markers,
+    )
+    return Validator(execution_engine=execution_engine, batches=[batch], data_context=context)
+
+
+def _metric(
+    metric_name: str, metric_value_kwargs: Optional[dict] = None, **metric_domain_kwargs
+) -> MetricConfiguration:
+    return MetricConfiguration(
+        metric_name=metric_name,
+        metric_domain_kwargs=metric_domain_kwargs,
+        metric_value_kwargs=metric_value_kwargs,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "metrics,expected_columns",
+    [
+        pytest.param([_metric("column.max", column="a")], ["a"], id="column"),
+        pytest.param(
+            [_metric("column_pair_values.equal.condition", column_A="d", column_B="b")],
+            ["b", "d"],
+            id="column_pair",
+        ),
+        pytest.param(
+            [_metric("compound_columns.unique.condition", column_list=["c", "a"])],
+            ["a", "c"],
+            id="multicolumn",
+        ),
+        pytest.param(
+            [_metric("column.max", column="a", row_condition='b=="x"', condition_parser="pandas")],
+            ["a", "b"],
+            id="row_condition",
+        ),
+        pytest.param(
+            [
+                _metric(
+                    "column_values.null.unexpected_index_list",
+                    metric_value_kwargs={"result_format": {"unexpected_index_column_names": ["c"]}},
+                    column="a",
+                )
+            ],
+            ["a", "c"],
+            id="unexpected_index_column_names",
+        ),
+        pytest.param(
+            [_metric("table.row_count"), _metric("table.columns")], [], id="no_column_values"
+        ),
+        pytest.param([_metric("table.head")], None, id="whole_table"),
+    ],
+)
+def test_get_batch_projection_columns(
+    metrics: List[MetricConfiguration], expected_columns: Optional[List[str]]
+):
+    projection = get_batch_projection(metric_configurations=metrics, column_names=COLUMNS)
+
+    assert projection.columns == expected_columns
+    assert projection.filters is None
+
+
+@pytest.mark.unit
+def test_get_batch_projection_filters():
+    row_condition = {"row_condition": "d>4", "condition_parser": "pandas"}
+    metrics = [
+        _metric("column.max", column="a", **row_condition),
+        _metric("column_values.nonnull.unexpected_count", column="b", **row_condition),
+    ]
+
+    projection = get_batch_projection(
+        metric_configurations=metrics, column_names=COLUMNS, supports_filters=True
+    )
+    assert projection.columns == ["a", "b", "d"]
+    assert projection.filters == [("d", ">", 4)]
+
+    # Different row conditions, and reported row indices, both require every row.
+    assert (
+        get_batch_projection(
+            metric_configurations=[*metrics, _metric("column.min", column="a")],
+            column_names=COLUMNS,
+            supports_filters=True,
+        ).filters
+        is None
+    )
+    assert (
+        get_batch_projection(
+            metric_configurations=[
+                *metrics,
+                _metric("column_values.null.unexpected_index_list", column="a", **row_condition),
+            ],
+            column_names=COLUMNS,
+            supports_filters=True,
+        ).filters
+        is None
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "row_condition,expected_filters",
+    [
+        pytest.param("a > 1", [("a", ">", 1)], id="comparison"),
+        pytest.param(
+            'a >= 1.5 and b == "x"', [("a", ">=", 1.5), ("b", "==", "x")], id="and_conjunction"
+        ),
+        pytest.param("(a < 1) & (c <= 3)", [("a", "<", 1), ("c", "<=", 3)], id="bitwise_and"),
+        pytest.param("b in ['x', 'y']", [("b", "in", ["x", "y"])], id="in_list"),
+        pytest.param("a > 1 or c < 3", None, id="disjunction"),
+        pytest.param("a != 1", None, id="not_equal"),
+        pytest.param("a > c", None, id="column_comparison"),
+        pytest.param("e > 1", None, id="unknown_column"),
+        pytest.param("b.str.startswith('x')", None, id="method_call"),
+        pytest.param("a >", None, id="syntax_error"),
+    ],
+)
+def test_row_condition_to_filters(row_condition: str, expected_filters: Optional[list]):
+    assert row_condition_to_filters(row_condition=row_condition, column_names=COLUMNS) == (
+        expected_filters
+    )
+
+
+@pytest.mark.unit
+def test_projection_pushdown_is_disabled_by_default(csv_path: str):
+    batch_data = PandasExecutionEngine().get_batch_data(batch_spec=PathBatchSpec(path=csv_path))
+
+    assert type(batch_data) is PandasBatchData
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "file_fixture,expected_loaded_columns",
+    [
+        # The CSV header carries no types, so checking the type of "c" reads its values.
+        pytest.param("csv_path", ["a", "b", "c", "d"], id="csv"),
+        pytest.param("parquet_path", ["a", "b", "d"], id="parquet", marks=requires_pyarrow),
+    ],
+)
+def test_projected_validation_matches_full_read(
+    request, in_memory_runtime_context, file_fixture: str, expected_loaded_columns: List[str]
+):
+    path: str = request.getfixturevalue(file_fixture)
+
+    results = []
+    for projection_pushdown in (False, True):
+        validator = _build_validator(
+            context=in_memory_runtime_context, path=path, projection_pushdown=projection_pushdown
+        )
+        results.append(
+            [
+                validator.expect_table_row_count_to_equal(200).result,
+                validator.expect_table_columns_to_match_ordered_list(COLUMNS).result,
+                validator.expect_column_values_to_be_of_type("c", "int64").result,
+                validator.expect_column_max_to_be_between("a", 0, 20).result,
+                validator.expect_column_values_to_be_in_set(
+                    "b", ["x", "y"], result_format="COMPLETE"
+                ).result,
+                validator.expect_column_values_to_be_between(
+                    "a", 0, 10, row_condition="d>4", condition_parser="pandas"
+                ).result,
+            ]
+        )
+        if projection_pushdown:
+            batch_data = validator.active_batch.data
+            assert isinstance(batch_data, ProjectedPandasBatchData)
+            assert batch_data.loaded_columns == expected_loaded_columns
+
+    full_read_results, projected_results = results
+    assert projected_results == full_read_results
+
+
+@pytest.mark.unit
+def test_columns_are_loaded_incrementally(in_memory_runtime_context, csv_path: str):
+    validator = _build_validator(
+        context=in_memory_runtime_context, path=csv_path, projection_pushdown=True
+    )
+    batch_data = validator.active_batch.data
+    assert isinstance(batch_data, ProjectedPandasBatchData)
+    assert batch_data.loaded_columns is None
+
+    assert validator.expect_table_row_count_to_equal(200).success
+    # Counting rows still reads a single column.
+    assert batch_data.loaded_columns == ["a"]
+
+    assert validator.expect_column_values_to_not_be_null("c").success
+    assert batch_data.loaded_columns == ["a", "c"]
+
+    assert validator.expect_table_columns_to_match_set(COLUMNS).success
+    assert batch_data.loaded_columns == ["a", "c"]
+
+
+@requires_pyarrow
+@pytest.mark.unit
+def test_row_condition_is_pushed_down_to_parquet(in_memory_runtime_context, parquet_path: str):
+    full_read_validator = _build_validator(
+        context=in_memory_runtime_context, path=parquet_path, projection_pushdown=False
+    )
+    validator = _build_validator(
+        context=in_memory_runtime_context, path=parquet_path, projection_pushdown=True
+    )
+
+    kwargs = {"column": "a", "min_value": 0, "max_value": 10, "row_condition": "c>=150"}
+    result = validator.expect_column_values_to_be_between(condition_parser="pandas", **kwargs)
+
+    batch_data = validator.active_batch.data
+    assert isinstance(batch_data, ProjectedPandasBatchData)
+    assert batch_data.loaded_columns == ["a", "c"]
+    assert len(batch_data.dataframe) == 50
+    assert (
+        result.result
+        == full_read_validator.expect_column_values_to_be_between(
+            condition_parser="pandas", **kwargs
+        ).result
+    )
@@ -0,0 +1,286 @@
+import pathlib
+from typing import Callable, List, Optional
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch, LegacyBatchDefinition
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.core.id_dict import IDDict
+from great_expectations.execution_engine.pandas_batch_data import (
+    ChunkedPandasBatchData,
+    PandasBatchData,
+)
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.util import is_library_loadable
+from great_expectations.validator.validator import Validator
+
+CHUNK_SIZE = 37
+
+
+@pytest.fixture
+def test_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=11)
+    df = pd.DataFrame(
+        {
+            "a": rng.normal(loc=5.0, scale=2.0, size=500),
+            "b": rng.choice(["x", "y", "z", None], size=500),
+            "c": np.arange(500),
+            "d": rng.integers(low=0, high=10, size=500),
+        }
+    )
+    df.loc[::13, "a"] = np.nan
+    return df
+
+
+@pytest.fixture
+def csv_path(tmp_path: pathlib.Path, test_df: pd.DataFrame) -> str:
+    path = tmp_path / "data.csv"
+    test_df.to_csv(path, index=False)
+    return str(path)
+
+
+def _build_validator(
+    context,
+    path: str,
+    chunk_size: Optional[int],
+    reader_method: Optional[str] = None,
+    reader_options: Optional[dict] = None,
+) -> Validator:
+    execution_engine = PandasExecutionEngine(chunk_size=chunk_size)
+    batch_spec = PathBatchSpec(
+        path=path, reader_method=reader_method, reader_options=reader_options
+    )
+    batch_data, batch_markers = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+    batch = Batch(
+        data=batch_data,
+        batch_definition=LegacyBatchDefinition(
+            datasource_name="my_datasource",
+            data_connector_name="my_data_connector",
+            data_asset_name="my_asset",
+            batch_identifiers=IDDict({}),
+        ),
+        batch_spec=batch_spec,
+        batch_markers=batch_markers,
+    )
+    return Validator(execution_engine=execution_engine, batches=[batch], data_context=context)
+
+
+def _validate(validator: Validator) -> List[dict]:
+    complete = {"result_format": "COMPLETE", "return_unexpected_index_query": True}
+    return [
+        validator.expect_table_row_count_to_equal(500).result,
+        validator.expect_table_columns_to_match_ordered_list(["a", "b", "c", "d"]).result,
+        validator.expect_column_min_to_be_between("a", -10, 10).result,
+        validator.expect_column_max_to_be_between("a", -10, 10).result,
+        validator.expect_column_mean_to_be_between("a", 0, 10).result,
+        validator.expect_column_median_to_be_between("a", 0, 10).result,
+        validator.expect_column_sum_to_be_between("d", 0, 10_000).result,
+        validator.expect_column_values_to_not_be_null("a", result_format=complete).result,
+        validator.expect_column_values_to_be_in_set("b", ["x", "y"], result_format=complete).result,
+        validator.expect_column_values_to_be_between(
+            "c", 0, 400, result_format={"result_format": "SUMMARY", "partial_unexpected_count": 5}
+        ).result,
+        validator.expect_column_values_to_be_between(
+            "a", 0, 10, mostly=0.9, row_condition="d>4", condition_parser="pandas"
+        ).result,
+        validator.expect_column_value_z_scores_to_be_less_than("a", 2, double_sided=True).result,
+        validator.expect_column_distinct_values_to_be_in_set("d", list(range(10))).result,
+    ]
+
+
+def _assert_results_equal(actual, expected) -> None:
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for key, value in expected.items():
+            _assert_results_equal(actual[key], value)
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for actual_value, expected_value in zip(actual, expected):
+            _assert_results_equal(actual_value, expected_value)
+    elif isinstance(expected, pd.Series):
+        pd.testing.assert_series_equal(actual, expected)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, nan_ok=True)
+    else:
+        assert actual == expected
+
+
+@pytest.mark.unit
+def test_chunked_batch_data_reads_file_in_chunks(csv_path: str, test_df: pd.DataFrame):
+    engine = PandasExecutionEngine(chunk_size=CHUNK_SIZE)
+    batch_data, batch_markers = engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=csv_path)
+    )
+
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    assert "pandas_data_fingerprint" not in batch_markers
+
+    chunks = list(batch_data.iter_chunks())
+    assert len(chunks) == int(np.ceil(len(test_df) / CHUNK_SIZE))
+    assert all(len(chunk) <= CHUNK_SIZE for chunk in chunks)
+    assert not batch_data.is_materialized
+
+    # chunks carry the index the whole file would have been read with
+    pd.testing.assert_frame_equal(pd.concat(chunks), pd.read_csv(csv_path))
+    pd.testing.assert_frame_equal(batch_data.dataframe, pd.read_csv(csv_path))
+    assert batch_data.is_materialized
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "chunk_size,reader_method,batch_spec_kwargs",
+    [
+        pytest.param(None, None, {}, id="chunking_disabled"),
+        pytest.param(CHUNK_SIZE, "read_json", {}, id="json_not_in_lines"),
+        pytest.param(
+            CHUNK_SIZE, None, {"sampling_method": "sample_using_random"}, id="sampling_method"
+        ),
+    ],
+)
+def test_batches_that_cannot_be_chunked_are_read_whole(
+    csv_path: str, chunk_size: Optional[int], reader_method: Optional[str], batch_spec_kwargs: dict
+):
+    engine = PandasExecutionEngine(chunk_size=chunk_size)
+    if reader_method == "read_json":
+        json_path = csv_path.replace(".csv", ".json")
+        pd.read_csv(csv_path).to_json(json_path)
+        batch_spec = PathBatchSpec(path=json_path, reader_method=reader_method)
+    else:
+        batch_spec = PathBatchSpec(path=csv_path, **batch_spec_kwargs)
+
+    batch_data = engine.get_batch_data(batch_spec=batch_spec)
+
+    assert type(batch_data) is PandasBatchData
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "write_fn,file_name",
+    [
+        pytest.param(lambda df, path: df.to_csv(path, index=False), "data.csv", id="csv"),
+        pytest.param(
+            lambda df, path: df.to_json(path, orient="records", lines=True),
+            "data.jsonl",
+            id="json_lines",
+        ),
+        pytest.param(
+            lambda df, path: df.to_parquet(path),
+            "data.parquet",
+            id="parquet",
+            marks=pytest.mark.skipif(
+                not is_library_loadable(library_name="pyarrow"),
+                reason="pyarrow is not installed",
+            ),
+        ),
+    ],
+)
+def test_chunked_validation_matches_in_memory_validation(
+    in_memory_runtime_context,
+    tmp_path: pathlib.Path,
+    test_df: pd.DataFrame,
+    write_fn: Callable,
+    file_name: str,
+):
+    path = str(tmp_path / file_name)
+    write_fn(test_df, path)
+    reader_kwargs: dict = (
+        {"reader_method": "read_json", "reader_options": {"lines": True}}
+        if file_name.endswith(".jsonl")
+        else {}
+    )
+
+    results = []
+    for chunk_size in (None, CHUNK_SIZE):
+        validator = _build_validator(
+            context=in_memory_runtime_context, path=path, chunk_size=chunk_size, **reader_kwargs
+        )
+        results.append(_validate(validator))
+        if chunk_size:
+            batch_data = validator.active_batch.data
+            assert isinstance(batch_data, ChunkedPandasBatchData)
+            assert not batch_data.is_materialized
+
+    in_memory_results, chunked_results = results
+    _assert_results_equal(chunked_results, in_memory_results)
+
+
+@pytest.mark.unit
+def test_metrics_that_are_not_row_local_materialize_the_batch(in_memory_runtime_context, csv_path):
+    in_memory_validator = _build_validator(
+        context=in_memory_runtime_context, path=csv_path, chunk_size=None
+    )
+    chunked_validator = _build_validator(
+        context=in_memory_runtime_context, path=csv_path, chunk_size=CHUNK_SIZE
+    )
+
+    chunked_result = chunked_validator.expect_column_values_to_be_unique(
+        "d", result_format="COMPLETE"
+    )
+    in_memory_result = in_memory_validator.expect_column_values_to_be_unique(
+        "d", result_format="COMPLETE"
+    )
+
+    assert chunked_result.result == in_memory_result.result
+    batch_data = chunked_validator.active_batch.data
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    assert batch_data.is_materialized
+
+    # Chunk-local metrics resolved before materialization are recomputed over the whole batch.
+    assert (
+        chunked_validator.expect_column_values_to_be_in_set(
+            "b", ["x", "y"], result_format="COMPLETE"
+        ).result
+        == in_memory_validator.expect_column_values_to_be_in_set(
+            "b", ["x", "y"], result_format="COMPLETE"
+        ).result
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("quantile_sketch_size", [None, 1_000])
+def test_chunked_quantiles_are_exact_unless_sketched(
+    in_memory_runtime_context, tmp_path: pathlib.Path, quantile_sketch_size: Optional[int]
+):
+    rng = np.random.default_rng(seed=3)
+    path = str(tmp_path / "data.csv")
+    pd.DataFrame({"a": rng.normal(size=120_001)}).to_csv(path, index=False)
+    quantiles = [0.1, 0.25, 0.5, 0.75, 0.9]
+    in_memory_validator = _build_validator(
+        context=in_memory_runtime_context, path=path, chunk_size=None
+    )
+    execution_engine = PandasExecutionEngine(
+        chunk_size=40_000, quantile_sketch_size=quantile_sketch_size
+    )
+    batch_data, _ = execution_engine.get_batch_data_and_markers(batch_spec=PathBatchSpec(path=path))
+    chunked_validator = Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=batch_data)],
+        data_context=in_memory_runtime_context,
+    )
+
+    results = [
+        (
+            validator.expect_column_median_to_be_between("a", -1, 1).result["observed_value"],
+            validator.expect_column_quantile_values_to_be_between(
+                "a",
+                quantile_ranges={"quantiles": quantiles, "value_ranges": [[None, None]] * 5},
+            ).result["observed_value"]["values"],
+        )
+        for validator in (in_memory_validator, chunked_validator)
+    ]
+
+    (in_memory_median, in_memory_quantiles), (chunked_median, chunked_quantiles) = results
+    assert not batch_data.is_materialized
+    if quantile_sketch_size is None:
+        assert chunked_median == in_memory_median
+        assert chunked_quantiles == in_memory_quantiles
+    else:
+        # Estimates are within the rank error of the sketch, but not exact.
+        values = pd.read_csv(path)["a"]
+        assert chunked_median != in_memory_median
+        for quantile, estimate in zip([0.5, *quantiles], [chunked_median, *chunked_quantiles]):
+            assert abs((values <= estimate).mean() - quantile) < 2 / quantile_sketch_size
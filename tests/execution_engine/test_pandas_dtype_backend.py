@@ -0,0 +1,138 @@
+import pathlib
+from typing import List, Optional
+
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.compatibility import pyarrow
+from great_expectations.core.batch import Batch
+from great_expectations.core.batch_spec import PathBatchSpec
+from great_expectations.execution_engine.pandas_batch_data import ChunkedPandasBatchData
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.util import is_library_loadable
+from great_expectations.validator.validator import Validator
+
+pytestmark = pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"), reason="pyarrow is not installed"
+)
+
+
+@pytest.fixture
+def test_df() -> pd.DataFrame:
+    return pd.DataFrame(
+        {
+            "name": ["alice", "bob", "carol", "dave", "bob", None, "émile", "١٢٣", "abc\n"],
+            "code": [101, 102, 103, 104, 105, 106, 107, 108, 109],
+        }
+    )
+
+
+@pytest.fixture
+def csv_path(tmp_path: pathlib.Path, test_df: pd.DataFrame) -> str:
+    path = tmp_path / "data.csv"
+    test_df.to_csv(path, index=False)
+    return str(path)
+
+
+def _build_validator(context, path: str, dtype_backend: Optional[str]) -> Validator:
+    execution_engine = PandasExecutionEngine(dtype_backend=dtype_backend)
+    batch_data, _ = execution_engine.get_batch_data_and_markers(batch_spec=PathBatchSpec(path=path))
+    return Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=batch_data)],
+        data_context=context,
+    )
+
+
+def _validate(validator: Validator) -> List[dict]:
+    complete = {"result_format": "COMPLETE"}
+    return [
+        validator.expect_column_values_to_match_regex("name", "^[a-c]", result_format=complete),
+        validator.expect_column_values_to_not_match_regex("name", "o", result_format=complete),
+        # Lookarounds are not supported by Arrow; the regex is matched by pandas.
+        validator.expect_column_values_to_match_regex("name", "^(?!bob)", result_format=complete),
+        # Character classes are Unicode-aware, and "$" matches before a trailing newline, in
+        # Python only; such regexes are matched by pandas.
+        validator.expect_column_values_to_match_regex("name", r"^\w+$", result_format=complete),
+        validator.expect_column_values_to_match_regex("name", r"^\d+$", result_format=complete),
+        validator.expect_column_values_to_not_match_regex("name", "c$", result_format=complete),
+        validator.expect_column_value_lengths_to_be_between(
+            "name", min_value=4, max_value=5, result_format=complete
+        ),
+        validator.expect_column_value_lengths_to_equal("name", 5, result_format=complete),
+        validator.expect_column_values_to_be_in_set(
+            "name", ["alice", "bob"], result_format=complete
+        ),
+        validator.expect_column_values_to_not_be_in_set(
+            "name", ["alice", "bob"], result_format=complete
+        ),
+        validator.expect_column_values_to_be_in_set("code", [101, 103], result_format=complete),
+        # 101.5 does not convert to the type of the column; it is compared by pandas.
+        validator.expect_column_values_to_be_in_set("code", [101, 101.5], result_format=complete),
+        validator.expect_column_values_to_be_unique("name", result_format=complete),
+        validator.expect_column_values_to_be_unique("code", result_format=complete),
+    ]
+
+
+@pytest.mark.unit
+def test_file_batches_are_read_with_dtype_backend(csv_path: str):
+    execution_engine = PandasExecutionEngine(dtype_backend="pyarrow")
+
+    batch_data, _ = execution_engine.get_batch_data_and_markers(
+        batch_spec=PathBatchSpec(path=csv_path)
+    )
+
+    assert execution_engine.config["dtype_backend"] == "pyarrow"
+    assert all(isinstance(dtype, pd.ArrowDtype) for dtype in batch_data.dataframe.dtypes)
+
+
+@pytest.mark.unit
+def test_chunked_parquet_batches_are_read_with_dtype_backend(
+    tmp_path: pathlib.Path, test_df: pd.DataFrame
+):
+    path = str(tmp_path / "data.parquet")
+    test_df.to_parquet(path)
+    execution_engine = PandasExecutionEngine(chunk_size=3, dtype_backend="pyarrow")
+
+    batch_data, _ = execution_engine.get_batch_data_and_markers(batch_spec=PathBatchSpec(path=path))
+
+    assert isinstance(batch_data, ChunkedPandasBatchData)
+    for chunk in batch_data.iter_chunks():
+        assert all(isinstance(dtype, pd.ArrowDtype) for dtype in chunk.dtypes)
+
+
+@pytest.mark.unit
+def test_unknown_dtype_backend_is_rejected():
+    with pytest.raises(gx_exceptions.ExecutionEngineError):
+        PandasExecutionEngine(dtype_backend="arrow")
+
+
+@pytest.mark.unit
+def test_arrow_backed_batches_validate_like_object_batches(
+    in_memory_runtime_context, csv_path: str, mocker
+):
+    expected = _validate(
+        _build_validator(context=in_memory_runtime_context, path=csv_path, dtype_backend=None)
+    )
+    match_substring_regex = mocker.spy(pyarrow.compute, "match_substring_regex")
+    utf8_length = mocker.spy(pyarrow.compute, "utf8_length")
+    is_in = mocker.spy(pyarrow.compute, "is_in")
+
+    actual = _validate(
+        _build_validator(context=in_memory_runtime_context, path=csv_path, dtype_backend="pyarrow")
+    )
+
+    for actual_result, expected_result in zip(actual, expected):
+        assert actual_result.success == expected_result.success
+        assert actual_result.result["unexpected_list"] == expected_result.result["unexpected_list"]
+        assert (
+            actual_result.result["unexpected_index_list"]
+            == expected_result.result["unexpected_index_list"]
+        )
+    # Columns of the Arrow-backed batch are evaluated on their Arrow buffers
+    assert match_substring_regex.call_count
+    assert utf8_length.call_count
+    assert is_in.call_count
@@ -11,6 +11,7 @@ from great_expectations.core.batch_spec import RuntimeDataBatchSpec, S3BatchSpec
 
 # noinspection PyBroadException
 from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine.pandas_batch_data import ProjectedPandasBatchData
 from great_expectations.execution_engine.pandas_execution_engine import (
     PandasExecutionEngine,
 )
@@ -332,6 +333,25 @@ def test_get_compute_domain_with_row_condition():
     assert accessor_kwargs == {}, "Accessor kwargs have been modified"
 
 
+@pytest.mark.unit
+def test_get_compute_domain_with_great_expectations_row_condition():
+    engine = PandasExecutionEngine()
+    df = pd.DataFrame({"a": [1, 2, 3, 4], "b": [2, 3, 4, None]})
+    expected_df = df[(df["b"] > 2) & ~df["a"].isin([3])]
+
+    # Loading batch data
+    engine.load_batch_data(batch_data=df, batch_id="1234")
+
+    data, _, _ = engine.get_compute_domain(
+        domain_kwargs={
+            "row_condition": 'col("b") > 2 AND NOT col("a").isin([3])',
+            "condition_parser": "great_expectations__experimental__",
+        },
+        domain_type="table",
+    )
+    assert data.equals(expected_df)
+
+
 # What happens when we filter such that no value meets the condition?
 @pytest.mark.unit
 def test_get_compute_domain_with_unmeetable_row_condition():
@@ -489,6 +509,45 @@ def test_get_batch_s3_parquet(test_s3_files_parquet, test_df_small):
     assert df.dataframe.shape == test_df_small.shape
 
 
+@pytest.mark.skipif(
+    not aws.boto3,
+    reason="Unable to load AWS connection object. Please install boto3 and botocore.",
+)
+@pytest.mark.big
+def test_get_batch_s3_streaming_reads(test_s3_files_compressed, test_df_small):
+    bucket, keys = test_s3_files_compressed
+    full_path = f"s3a://{os.path.join(bucket, keys[0])}"  # noqa: PTH118
+
+    batch_spec = S3BatchSpec(path=full_path, reader_method="read_csv")
+    execution_engine = PandasExecutionEngine(
+        streaming_reads=True, streaming_read_options={"block_size": 16, "prefetch_blocks": 2}
+    )
+    df = execution_engine.get_batch_data(batch_spec=batch_spec)
+    pd.testing.assert_frame_equal(df.dataframe, test_df_small)
+
+
+@pytest.mark.skipif(
+    not aws.boto3 or not is_library_loadable(library_name="pyarrow"),
+    reason="boto3 and pyarrow are not installed",
+)
+@pytest.mark.big
+def test_get_batch_s3_streaming_reads_with_projection_pushdown(
+    test_s3_files_parquet, test_df_small
+):
+    bucket, keys = test_s3_files_parquet
+    path = [key for key in keys if key.endswith(".parquet")][0]
+    full_path = f"s3a://{os.path.join(bucket, path)}"  # noqa: PTH118
+
+    batch_spec = S3BatchSpec(path=full_path, reader_method="read_parquet")
+    execution_engine = PandasExecutionEngine(streaming_reads=True, projection_pushdown=True)
+    batch_data = execution_engine.get_batch_data(batch_spec=batch_spec)
+
+    assert isinstance(batch_data, ProjectedPandasBatchData)
+    assert list(batch_data.schema.columns) == ["col1", "col2"]
+    batch_data.project(columns=["col2"])
+    pd.testing.assert_frame_equal(batch_data.dataframe, test_df_small[["col2"]])
+
+
 @pytest.mark.skipif(
     not aws.boto3,
     reason="Unable to load AWS connection object. Please install boto3 and botocore.",
@@ -582,6 +641,39 @@ def test_get_batch_data_with_azure_batch_spec(
     assert df.dataframe.shape == (3, 3)
 
 
+@pytest.mark.skipif(
+    not (azure.storage and azure.BlobServiceClient),
+    reason='Could not import "azure.storage.blob" from Microsoft Azure cloud',
+)
+@mock.patch(
+    "great_expectations.execution_engine.pandas_execution_engine.azure.BlobServiceClient",
+)
+@pytest.mark.big
+def test_get_batch_data_with_azure_batch_spec_streaming_reads(
+    mock_azure_conn,
+    azure_batch_spec,
+):
+    data = b"colA,colB,colC\n1,2,3\n4,5,6\n7,8,9"  # (3,3) CSV for testing
+    mock_blob_client = mock_azure_conn().get_blob_client()
+    mock_blob_client.get_blob_properties().size = len(data)
+
+    class StorageStreamDownloaderFake:
+        def __init__(self, offset: int, length: int) -> None:
+            self._data = data[offset : offset + length]
+
+        def readall(self) -> bytes:
+            return self._data
+
+    mock_blob_client.download_blob.side_effect = StorageStreamDownloaderFake
+
+    df = PandasExecutionEngine(
+        streaming_reads=True, streaming_read_options={"block_size": 8}
+    ).get_batch_data(batch_spec=azure_batch_spec)
+
+    mock_blob_client.download_blob.assert_any_call(offset=0, length=8)
+    assert df.dataframe.shape == (3, 3)
+
+
 @pytest.mark.big
 def test_get_batch_with_no_azure_configured(azure_batch_spec):
     # if Azure BlobServiceClient was not configured
@@ -647,6 +739,34 @@ def test_get_batch_data_with_gcs_batch_spec(
     assert df.dataframe.shape == (3, 3)
 
 
+@pytest.mark.skipif(
+    not google.storage,
+    reason="Could not import 'storage' from google.cloud in pandas_execution_engine.py",
+)
+@mock.patch(
+    "great_expectations.execution_engine.pandas_execution_engine.google.storage.Client",
+)
+@pytest.mark.big
+def test_get_batch_data_with_gcs_batch_spec_streaming_reads(
+    mock_gcs_conn,
+    gcs_batch_spec,
+):
+    data = b"colA,colB,colC\n1,2,3\n4,5,6\n7,8,9"  # (3,3) CSV for testing
+    mock_gcs_blob = mock_gcs_conn().get_bucket().blob()
+    mock_gcs_blob.size = len(data)
+    mock_gcs_blob.download_as_bytes.side_effect = lambda start, end: data[start : end + 1]
+
+    # Necessary to pass kwargs to bypass "os.getenv | gcs_options == {}" check
+    kwargs = {"gcs_options": {"my_option": "my_value"}}
+    df = PandasExecutionEngine(
+        streaming_reads=True, streaming_read_options={"block_size": 8}, **kwargs
+    ).get_batch_data(batch_spec=gcs_batch_spec)
+
+    mock_gcs_blob.reload.assert_called_once()
+    mock_gcs_blob.download_as_bytes.assert_any_call(start=0, end=7)
+    assert df.dataframe.shape == (3, 3)
+
+
 @pytest.mark.skipif(
     not google.storage,
     reason="Could not import 'storage' from google.cloud in pandas_execution_engine.py",
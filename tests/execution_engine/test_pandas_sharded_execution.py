@@ -0,0 +1,236 @@
+import gc
+import os
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine.pandas_execution_engine import (
+    PandasExecutionEngine,
+)
+from great_expectations.util import is_library_loadable
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+pytestmark = pytest.mark.skipif(
+    not is_library_loadable(library_name="pyarrow"), reason="pyarrow is not installed"
+)
+
+SHARD_SIZE = 64
+
+
+@pytest.fixture
+def test_df() -> pd.DataFrame:
+    rng = np.random.default_rng(seed=7)
+    df = pd.DataFrame(
+        {
+            "a": rng.normal(loc=5.0, scale=2.0, size=300),
+            "b": rng.choice(["x", "y", "z", None], size=300),
+            "j": rng.choice(['{"k": 1}', "{", "[]"], size=300),
+            "d": rng.integers(low=0, high=10, size=300),
+        },
+        index=pd.RangeIndex(start=1000, stop=1300),
+    )
+    df.loc[::13, "a"] = np.nan
+    return df
+
+
+@pytest.fixture
+def sharded_engine():
+    execution_engine = PandasExecutionEngine(shard_workers=2, shard_size=SHARD_SIZE)
+    yield execution_engine
+    execution_engine.close()
+
+
+def _build_validator(context, execution_engine: PandasExecutionEngine, df: pd.DataFrame):
+    return Validator(
+        execution_engine=execution_engine, batches=[Batch(data=df)], data_context=context
+    )
+
+
+def _validate(validator: Validator) -> List[dict]:
+    complete = {"result_format": "COMPLETE", "return_unexpected_index_query": True}
+    summary = {"result_format": "SUMMARY", "partial_unexpected_count": 5}
+    return [
+        validator.expect_table_row_count_to_equal(300).result,
+        validator.expect_column_mean_to_be_between("a", 0, 10).result,
+        validator.expect_column_median_to_be_between("a", 0, 10).result,
+        validator.expect_column_max_to_be_between("a", -10, 10).result,
+        validator.expect_column_values_to_not_be_null("a", result_format=complete).result,
+        validator.expect_column_values_to_be_in_set("b", ["x", "y"], result_format=complete).result,
+        validator.expect_column_values_to_be_json_parseable("j", result_format=complete).result,
+        validator.expect_column_values_to_be_json_parseable("j", result_format=summary).result,
+        validator.expect_column_values_to_be_between(
+            "a", 0, 10, mostly=0.9, row_condition="d>4", condition_parser="pandas"
+        ).result,
+        validator.expect_column_values_to_be_unique("d", result_format=summary).result,
+    ]
+
+
+def _assert_results_equal(actual, expected) -> None:
+    if isinstance(expected, dict):
+        assert actual.keys() == expected.keys()
+        for key, value in expected.items():
+            _assert_results_equal(actual[key], value)
+    elif isinstance(expected, list):
+        assert len(actual) == len(expected)
+        for actual_value, expected_value in zip(actual, expected):
+            _assert_results_equal(actual_value, expected_value)
+    elif isinstance(expected, float):
+        assert actual == pytest.approx(expected, nan_ok=True)
+    else:
+        assert actual == expected
+
+
+@pytest.mark.unit
+def test_sharded_validation_matches_in_memory_validation(
+    in_memory_runtime_context, sharded_engine: PandasExecutionEngine, test_df: pd.DataFrame, mocker
+):
+    in_memory_results = _validate(
+        _build_validator(in_memory_runtime_context, PandasExecutionEngine(), test_df)
+    )
+    submit = mocker.spy(ProcessPoolExecutor, "submit")
+
+    sharded_results = _validate(
+        _build_validator(in_memory_runtime_context, sharded_engine, test_df)
+    )
+
+    _assert_results_equal(sharded_results, in_memory_results)
+    (dataframe_ref, sharded_frame) = sharded_engine._sharded_frames[
+        sharded_engine.batch_manager.active_batch_data_id
+    ]
+    assert dataframe_ref() is sharded_engine.batch_manager.active_batch_data.dataframe
+    assert sharded_frame is not None
+    assert sharded_frame.shard_count == 5
+    # Shards are resolved by the worker processes
+    assert submit.call_count
+    assert submit.call_count % sharded_frame.shard_count == 0
+
+
+@pytest.mark.unit
+def test_frames_that_do_not_convert_to_arrow_are_resolved_in_process(
+    in_memory_runtime_context, sharded_engine: PandasExecutionEngine, test_df: pd.DataFrame
+):
+    test_df["b"] = test_df["b"].astype(object)
+    test_df.loc[test_df.index[::7], "b"] = 1
+    in_memory_results = _validate(
+        _build_validator(in_memory_runtime_context, PandasExecutionEngine(), test_df)
+    )
+
+    sharded_results = _validate(
+        _build_validator(in_memory_runtime_context, sharded_engine, test_df)
+    )
+
+    _assert_results_equal(sharded_results, in_memory_results)
+    assert sharded_engine._shard_executor is not None
+    (dataframe_ref, sharded_frame) = sharded_engine._sharded_frames[
+        sharded_engine.batch_manager.active_batch_data_id
+    ]
+    assert dataframe_ref() is sharded_engine.batch_manager.active_batch_data.dataframe
+    assert sharded_frame is None
+
+
+@pytest.mark.unit
+def test_small_batches_are_not_sharded(in_memory_runtime_context, test_df: pd.DataFrame):
+    execution_engine = PandasExecutionEngine(shard_workers=2, shard_size=len(test_df))
+
+    _validate(_build_validator(in_memory_runtime_context, execution_engine, test_df))
+
+    assert execution_engine._shard_executor is None
+    assert not execution_engine._sharded_frames
+
+
+@pytest.mark.unit
+def test_close_removes_shards(
+    in_memory_runtime_context, sharded_engine: PandasExecutionEngine, test_df: pd.DataFrame
+):
+    validator = _build_validator(in_memory_runtime_context, sharded_engine, test_df)
+    validator.expect_column_values_to_be_json_parseable("j")
+    (_dataframe_ref, sharded_frame) = sharded_engine._sharded_frames[validator.active_batch_id]
+    assert os.path.exists(sharded_frame.path)  # noqa: PTH110
+
+    sharded_engine.close()
+
+    assert not os.path.exists(sharded_frame.path)  # noqa: PTH110
+    assert sharded_engine._shard_executor is None
+
+
+@pytest.mark.unit
+def test_sharded_frames_are_rewritten_for_new_frames_of_a_batch(
+    in_memory_runtime_context, sharded_engine: PandasExecutionEngine, test_df: pd.DataFrame
+):
+    batch_id = _build_validator(in_memory_runtime_context, sharded_engine, test_df).active_batch_id
+    first_sharded_frame = sharded_engine._get_sharded_frame(batch_id=batch_id, dataframe=test_df)
+    assert sharded_engine._get_sharded_frame(batch_id=batch_id, dataframe=test_df) is (
+        first_sharded_frame
+    )
+
+    other_sharded_frame = sharded_engine._get_sharded_frame(
+        batch_id=batch_id, dataframe=test_df.copy()
+    )
+
+    assert other_sharded_frame is not first_sharded_frame
+    assert not os.path.exists(first_sharded_frame.path)  # noqa: PTH110
+
+
+@pytest.mark.unit
+def test_shards_are_removed_with_their_dataframe(
+    sharded_engine: PandasExecutionEngine, test_df: pd.DataFrame
+):
+    dataframe = test_df.copy()
+    sharded_frame = sharded_engine._get_sharded_frame(batch_id="batch", dataframe=dataframe)
+    assert os.path.exists(sharded_frame.path)  # noqa: PTH110
+
+    del dataframe
+    gc.collect()
+
+    assert not os.path.exists(sharded_frame.path)  # noqa: PTH110
+    assert "batch" not in sharded_engine._sharded_frames
+
+
+@pytest.mark.unit
+def test_shards_are_removed_as_their_batch_is_unloaded(
+    in_memory_runtime_context, sharded_engine: PandasExecutionEngine, test_df: pd.DataFrame
+):
+    validator = _build_validator(in_memory_runtime_context, sharded_engine, test_df)
+    validator.expect_column_values_to_be_json_parseable("j")
+    batch_id = validator.active_batch_id
+    (_dataframe_ref, sharded_frame) = sharded_engine._sharded_frames[batch_id]
+
+    # Loading the same DataFrame again (e.g., by another validator) keeps its shards
+    sharded_engine.load_batch_data(batch_id=batch_id, batch_data=test_df)
+    assert sharded_engine._sharded_frames[batch_id][1] is sharded_frame
+
+    sharded_engine.load_batch_data(batch_id=batch_id, batch_data=test_df.copy())
+
+    assert not os.path.exists(sharded_frame.path)  # noqa: PTH110
+    assert batch_id not in sharded_engine._sharded_frames
+
+
+@pytest.mark.unit
+def test_worker_failures_raise_metric_resolution_errors(
+    in_memory_runtime_context, sharded_engine: PandasExecutionEngine, test_df: pd.DataFrame, mocker
+):
+    validator = _build_validator(in_memory_runtime_context, sharded_engine, test_df)
+    failed_future: Future = Future()
+    failed_future.set_exception(BrokenProcessPool("A worker process terminated abruptly"))
+    mocker.patch.object(ProcessPoolExecutor, "submit", return_value=failed_future)
+
+    column_max = MetricConfiguration(
+        metric_name="column.max",
+        metric_domain_kwargs={"column": "a", "batch_id": validator.active_batch_id},
+    )
+
+    resolved_metrics, aborted_metrics = validator.metrics_calculator.compute_metrics([column_max])
+
+    assert column_max.id not in resolved_metrics
+    # The shard failed for all metrics resolved by chunk (e.g. the "table.row_count" dependency)
+    assert aborted_metrics
+    for aborted_metric_info in aborted_metrics.values():
+        exception_info = aborted_metric_info["exception_info"]
+        assert exception_info.raised_exception
+        assert "BrokenProcessPool" in exception_info.exception_message
@@ -0,0 +1,93 @@
+import io
+import threading
+from typing import List, Tuple
+
+import pandas as pd
+import pytest
+
+from great_expectations.execution_engine.ranged_object_reader import (
+    RangedObjectReader,
+    open_ranged_object,
+)
+
+BLOCK_SIZE = 16
+
+
+class _RangeFetcher:
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.ranges: List[Tuple[int, int]] = []
+        self._lock = threading.Lock()
+
+    def __call__(self, start: int, stop: int) -> bytes:
+        with self._lock:
+            self.ranges.append((start, stop))
+        return self.data[start:stop]
+
+
+@pytest.fixture
+def data() -> bytes:
+    return bytes(range(256)) * 4
+
+
+@pytest.mark.unit
+def test_ranged_object_reader_reads_whole_object(data: bytes):
+    fetcher = _RangeFetcher(data)
+    with RangedObjectReader(
+        size=len(data), fetch_range_fn=fetcher, block_size=BLOCK_SIZE, prefetch_blocks=2
+    ) as reader:
+        assert reader.readall() == data
+        assert reader.read(10) == b""
+
+    # Every block is fetched exactly once, whether read or prefetched.
+    assert sorted(fetcher.ranges) == [
+        (start, min(start + BLOCK_SIZE, len(data))) for start in range(0, len(data), BLOCK_SIZE)
+    ]
+
+
+@pytest.mark.unit
+def test_ranged_object_reader_seeks_and_fetches_only_blocks_read(data: bytes):
+    fetcher = _RangeFetcher(data)
+    reader = RangedObjectReader(
+        size=len(data), fetch_range_fn=fetcher, block_size=BLOCK_SIZE, prefetch_blocks=2
+    )
+
+    assert reader.seek(-8, io.SEEK_END) == len(data) - 8
+    assert reader.read(100) == data[-8:]
+    assert reader.seek(100) == 100
+    assert reader.read(10) == data[100:110]
+    assert reader.tell() == 110
+
+    # Random access does not prefetch.
+    assert fetcher.ranges == [(1008, 1024), (96, 112)]
+    reader.close()
+
+
+@pytest.mark.unit
+def test_ranged_object_reader_bounds_cached_blocks(data: bytes):
+    fetcher = _RangeFetcher(data)
+    reader = RangedObjectReader(
+        size=len(data), fetch_range_fn=fetcher, block_size=BLOCK_SIZE, prefetch_blocks=0
+    )
+
+    reader.read(BLOCK_SIZE * 3)
+    reader.seek(0)
+    reader.read(BLOCK_SIZE)
+
+    # Only two blocks are cached without prefetching, so the first block is fetched again.
+    assert fetcher.ranges == [(0, 16), (16, 32), (32, 48), (0, 16)]
+    reader.close()
+
+
+@pytest.mark.unit
+def test_open_ranged_object_is_readable_by_pandas(tmp_path):
+    df = pd.DataFrame({"a": range(1000), "b": [f"x{value}" for value in range(1000)]})
+    path = tmp_path / "data.csv"
+    df.to_csv(path, index=False)
+    data = path.read_bytes()
+
+    stream = open_ranged_object(
+        size=len(data), fetch_range_fn=_RangeFetcher(data), block_size=1024, prefetch_blocks=3
+    )
+
+    pd.testing.assert_frame_equal(pd.read_csv(stream), df)
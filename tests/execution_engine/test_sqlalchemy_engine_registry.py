@@ -0,0 +1,208 @@
+from __future__ import annotations
+
+import pathlib
+
+import pytest
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.data_context.store import DatabaseStoreBackend
+from great_expectations.execution_engine.sqlalchemy_engine_registry import (
+    SqlAlchemyEngineRegistry,
+    engine_registry,
+)
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+
+
+@pytest.fixture
+def registry() -> SqlAlchemyEngineRegistry:
+    return SqlAlchemyEngineRegistry()
+
+
+@pytest.fixture
+def sqlite_url(tmp_path: pathlib.Path) -> str:
+    return f"sqlite:///{tmp_path / 'registry.db'}"
+
+
+@pytest.mark.sqlite
+def test_acquire_shares_engines_of_same_connection_parameters(
+    registry: SqlAlchemyEngineRegistry, sqlite_url: str
+):
+    engine = registry.acquire(f"{sqlite_url}?timeout=5&uri=false")
+
+    assert registry.acquire(f"{sqlite_url}?uri=false&timeout=5") is engine
+    assert registry.acquire(f"{sqlite_url}?uri=false&timeout=5", echo=True) is not engine
+
+
+@pytest.mark.sqlite
+def test_release_disposes_of_engine_once_released_by_all_holders(
+    registry: SqlAlchemyEngineRegistry, sqlite_url: str, mocker
+):
+    engine = registry.acquire(sqlite_url)
+    registry.acquire(sqlite_url)
+    dispose = mocker.spy(engine, "dispose")
+
+    registry.release(engine)
+    assert registry.is_registered(engine)
+    dispose.assert_not_called()
+
+    registry.release(engine)
+    assert not registry.is_registered(engine)
+    dispose.assert_called_once()
+    assert registry.acquire(sqlite_url) is not engine
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize("url", ["sqlite://", "sqlite:///:memory:"])
+def test_in_memory_databases_are_not_shared(registry: SqlAlchemyEngineRegistry, url: str):
+    engine = registry.acquire(url)
+
+    assert registry.acquire(url) is not engine
+    assert not registry.is_registered(engine)
+
+
+@pytest.mark.sqlite
+def test_engine_statistics(registry: SqlAlchemyEngineRegistry, sqlite_url: str):
+    engine = registry.acquire(sqlite_url)
+
+    with engine.connect() as connection:
+        connection.execute(sa.text("SELECT 1"))
+        statistics = registry.get_statistics(engine)
+        assert statistics is not None
+        assert statistics.active_connections == 1
+    with engine.connect() as connection:
+        connection.execute(sa.text("SELECT 1"))
+
+    assert statistics.connects == 1
+    assert statistics.checkouts == 2
+    assert statistics.active_connections == 0
+    assert statistics.wait_time > 0
+
+
+@pytest.mark.sqlite
+def test_configure_pool(registry: SqlAlchemyEngineRegistry, sqlite_url: str):
+    registry.configure_pool(pool_size=3, max_overflow=1, pool_pre_ping=True)
+
+    engine = registry.acquire(sqlite_url)
+
+    assert engine.pool.size() == 3
+    assert engine.pool._max_overflow == 1
+    assert engine.pool._pre_ping is True
+    # Pools without a size (e.g. for in-memory SQLite databases) are left alone
+    assert registry.acquire("sqlite://")
+    assert registry.acquire(sqlite_url, poolclass=sa.pool.NullPool)
+
+
+@pytest.mark.sqlite
+def test_execution_engines_share_an_engine_until_closed(sqlite_url: str, mocker):
+    # SQLite execution engines keep a private, persisted connection; treat the database file like
+    # a database server here.
+    mocker.patch(
+        "great_expectations.execution_engine.sqlalchemy_execution_engine._dialect_requires_persisted_connection",
+        return_value=False,
+    )
+    first = SqlAlchemyExecutionEngine(connection_string=sqlite_url)
+    second = SqlAlchemyExecutionEngine(connection_string=sqlite_url)
+    assert first.engine is second.engine
+    dispose = mocker.spy(first.engine, "dispose")
+
+    first.close()
+    first.close()
+    dispose.assert_not_called()
+
+    second.close()
+    dispose.assert_called_once()
+
+
+@pytest.mark.sqlite
+def test_engine_statistics_time_connections_of_disposed_engines(
+    registry: SqlAlchemyEngineRegistry, sqlite_url: str
+):
+    engine = registry.acquire(sqlite_url)
+    statistics = registry.get_statistics(engine)
+    assert statistics is not None
+
+    # Disposing of the engine replaces its pool.
+    engine.dispose()
+    with engine.connect() as connection:
+        connection.execute(sa.text("SELECT 1"))
+
+    assert statistics.connects == 1
+    assert statistics.wait_time > 0
+
+
+@pytest.mark.sqlite
+def test_store_backends_release_their_engine_when_deleted(
+    in_memory_runtime_context, sqlite_url: str, mocker
+):
+    shared_engine = engine_registry.acquire(sqlite_url)
+    dispose = mocker.spy(shared_engine, "dispose")
+    store_config = {
+        "class_name": "ExpectationsStore",
+        "store_backend": {
+            "class_name": "DatabaseStoreBackend",
+            "connection_string": sqlite_url,
+            "table_name": "my_expectations",
+            "key_columns": ["expectation_suite_name"],
+        },
+    }
+    store = in_memory_runtime_context.add_store("my_expectations_store", store_config)
+    assert store.store_backend.engine is shared_engine
+
+    in_memory_runtime_context.delete_store("my_expectations_store")
+    dispose.assert_not_called()
+
+    engine_registry.release(shared_engine)
+    dispose.assert_called_once()
+
+
+@pytest.mark.sqlite
+def test_store_backends_do_not_release_given_engines(sqlite_url: str, mocker):
+    engine = sa.create_engine(sqlite_url)
+    dispose = mocker.spy(engine, "dispose")
+    store_backend = DatabaseStoreBackend(
+        engine=engine, table_name="my_store", key_columns=["my_key"]
+    )
+
+    store_backend.close()
+
+    dispose.assert_not_called()
+
+
+@pytest.mark.sqlite
+def test_sql_datasources_release_their_engine_when_deleted(
+    in_memory_runtime_context, sqlite_url: str, mocker
+):
+    datasources = [
+        in_memory_runtime_context.data_sources.add_sqlite(name, connection_string=sqlite_url)
+        for name in ("my_sqlite", "my_other_sqlite")
+    ]
+    engine = datasources[0].get_engine()
+    assert datasources[1].get_engine() is engine
+    dispose = mocker.spy(engine, "dispose")
+
+    in_memory_runtime_context.data_sources.delete("my_sqlite")
+    dispose.assert_not_called()
+
+    in_memory_runtime_context.delete_datasource("my_other_sqlite")
+    dispose.assert_called_once()
+    assert not engine_registry.is_registered(engine)
+
+
+@pytest.mark.sqlite
+def test_sql_datasources_close_replaced_execution_engines(
+    in_memory_runtime_context, sqlite_url: str, mocker
+):
+    datasource = in_memory_runtime_context.data_sources.add_sqlite(
+        "my_sqlite", connection_string=sqlite_url
+    )
+    execution_engine = datasource.get_execution_engine()
+    close = mocker.spy(execution_engine, "close")
+
+    assert datasource.get_execution_engine() is execution_engine
+    close.assert_not_called()
+
+    datasource.create_temp_table = not datasource.create_temp_table
+    assert datasource.get_execution_engine() is not execution_engine
+    close.assert_called_once()
@@ -28,6 +28,7 @@ from great_expectations.execution_engine.sqlalchemy_dialect import GXSqlDialect
 from great_expectations.execution_engine.sqlalchemy_execution_engine import (
     SqlAlchemyExecutionEngine,
     _dialect_requires_persisted_connection,
+    _select_value_set_values,
 )
 
 # Function to test for spark dataframe equality
@@ -1031,6 +1032,23 @@ def test_get_batch_data_and_markers_using_query(sqlite_view_engine, test_df):
     assert batch_markers.get("ge_load_time") is not None
 
 
+@pytest.mark.duckdb
+@pytest.mark.parametrize("materialization", ["temp", "cached_table"])
+def test_get_batch_data_and_markers_validates_query_as_subquery_without_temp_tables(
+    sa, materialization: str, caplog
+):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string="duckdb:///:memory:")
+    batch_spec = RuntimeQueryBatchSpec(
+        query="SELECT 1 AS id", materialization=materialization, materialization_ttl=None
+    )
+
+    batch_data, _ = execution_engine.get_batch_data_and_markers(batch_spec=batch_spec)
+
+    assert not isinstance(batch_data.selectable, sa.Table)
+    assert execution_engine._materialized_tables == {}
+    assert f'Materialization "{materialization}" is not supported by duckdb' in caplog.text
+
+
 @pytest.mark.sqlite
 def test_sa_batch_unexpected_condition_temp_table(caplog, sa):
     def validate_tmp_tables(execution_engine):
@@ -1257,3 +1275,116 @@ class TestDialectRequiresPersistedConnection:
                 connection_string=connection_string,
                 url=url,
             )
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "value_set",
+    [
+        pytest.param(list(range(10)), id="small"),
+        pytest.param([*range(2000), None], id="null"),
+        pytest.param([*range(2000), True], id="bool"),
+        pytest.param([*range(2000), "a"], id="mixed"),
+        pytest.param(["a" * 5000, *map(str, range(2000))], id="long_strings"),
+    ],
+)
+def test_get_value_set_lookup_binds_value_sets_it_cannot_stage(value_set: list):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string="sqlite://")
+
+    assert execution_engine.get_value_set_lookup(value_set) is None
+
+
+@pytest.mark.sqlite
+def test_get_value_set_lookup_binds_value_sets_of_dialects_without_persisted_connection(mocker):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string="sqlite://")
+    # Temporary tables would not be visible to the other connections of the pool.
+    mocker.patch.object(
+        SqlAlchemyExecutionEngine,
+        "dialect_name",
+        new_callable=mocker.PropertyMock,
+        return_value=GXSqlDialect.ORACLE,
+    )
+
+    assert execution_engine.get_value_set_lookup(list(range(2000))) is None
+
+
+@pytest.mark.duckdb
+@pytest.mark.parametrize("dialect", [GXSqlDialect.POSTGRESQL, GXSqlDialect.SNOWFLAKE])
+@pytest.mark.parametrize(
+    "value_set",
+    [
+        pytest.param([*range(2000), 0.5], id="numbers"),
+        pytest.param([str(value) for value in range(20000)], id="more_values_than_a_values_list"),
+    ],
+)
+def test_get_value_set_lookup_selects_values_list(dialect: GXSqlDialect, value_set: list, mocker):
+    # DuckDB runs the VALUES lists of PostgreSQL and Snowflake as they do.
+    execution_engine = SqlAlchemyExecutionEngine(connection_string="duckdb:///:memory:")
+    dialect_name = mocker.patch.object(
+        SqlAlchemyExecutionEngine,
+        "dialect_name",
+        new_callable=mocker.PropertyMock,
+        return_value=dialect,
+    )
+
+    lookup = execution_engine.get_value_set_lookup(value_set)
+
+    assert lookup is not None
+    mocker.stop(dialect_name)
+    assert execution_engine._value_set_tables == {}
+    assert sorted(row[0] for row in execution_engine.execute_query(lookup).fetchall()) == sorted(
+        value_set
+    )
+
+
+@pytest.mark.unit
+def test_value_set_values_list_is_compiled_with_rows_for_mysql(sa):
+    from sqlalchemy.dialects import mysql
+
+    lookup = _select_value_set_values(column_type=sa.String(length=3), values=["a", "b'c"])
+
+    assert str(lookup.compile(dialect=mysql.dialect())).endswith(
+        "FROM (VALUES ROW('a'), ROW('b''c')) AS value_set (value)"
+    )
+
+
+@pytest.mark.parametrize(
+    "connection_string",
+    [
+        pytest.param("sqlite://", marks=pytest.mark.sqlite, id="sqlite"),
+        pytest.param("duckdb:///:memory:", marks=pytest.mark.duckdb, id="duckdb"),
+    ],
+)
+def test_get_value_set_lookup_stages_numbers_in_double_precision(connection_string: str):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string=connection_string)
+    value_set = [*range(2000), 0.1, 2**40 + 0.5]
+
+    lookup = execution_engine.get_value_set_lookup(value_set)
+
+    assert lookup is not None
+    assert sorted(row[0] for row in execution_engine.execute_query(lookup).fetchall()) == sorted(
+        value_set
+    )
+    execution_engine.close()
+
+
+@pytest.mark.parametrize(
+    "connection_string",
+    [
+        pytest.param("sqlite://", marks=pytest.mark.sqlite, id="sqlite"),
+        pytest.param("duckdb:///:memory:", marks=pytest.mark.duckdb, id="duckdb"),
+    ],
+)
+def test_get_value_set_lookup_stages_value_set_once(connection_string: str):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string=connection_string)
+    value_set = [str(value) for value in range(2000)]
+
+    lookup = execution_engine.get_value_set_lookup(value_set)
+    assert lookup is not None
+    assert execution_engine.get_value_set_lookup(list(reversed(value_set))) is not None
+    assert execution_engine.get_value_set_lookup(value_set) is not None
+    assert len(execution_engine._value_set_tables) == 2
+    assert len(execution_engine.execute_query(lookup).fetchall()) == 2000
+
+    execution_engine.close()
+    assert execution_engine._value_set_tables == {}
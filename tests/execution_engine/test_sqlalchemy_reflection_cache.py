@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import pytest
+
+from great_expectations.compatibility.sqlalchemy import sqlalchemy as sa
+from great_expectations.execution_engine.sqlalchemy_execution_engine import (
+    SqlAlchemyExecutionEngine,
+)
+from great_expectations.execution_engine.sqlalchemy_reflection_cache import (
+    DEFAULT_REFLECTION_CACHE_TTL,
+    ReflectionKey,
+    SqlAlchemyReflectionCache,
+)
+from great_expectations.expectations.metrics.util import get_sqlalchemy_column_metadata
+
+
+class _Reflector:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def __call__(self) -> int:
+        self.calls += 1
+        return self.calls
+
+
+@pytest.mark.unit
+def test_get_or_reflect_reuses_reflection():
+    cache = SqlAlchemyReflectionCache()
+    reflect = _Reflector()
+    key = ReflectionKey.for_table("columns", table_name="my_table", schema_name="my_schema")
+
+    assert cache.get_or_reflect(key=key, reflect=reflect) == 1
+    assert cache.get_or_reflect(key=key, reflect=reflect) == 1
+    assert (
+        cache.get_or_reflect(key=ReflectionKey.for_table("columns", "my_table"), reflect=reflect)
+        == 2
+    )
+
+
+@pytest.mark.unit
+def test_get_or_reflect_reflects_again_after_ttl(monkeypatch: pytest.MonkeyPatch):
+    now = 1000.0
+    monkeypatch.setattr(
+        "great_expectations.execution_engine.sqlalchemy_reflection_cache.time.monotonic",
+        lambda: now,
+    )
+    cache = SqlAlchemyReflectionCache(ttl=10)
+    reflect = _Reflector()
+    key = ReflectionKey.for_query("columns", query="SELECT * FROM my_table")
+
+    assert cache.get_or_reflect(key=key, reflect=reflect) == 1
+    now += 9
+    assert cache.get_or_reflect(key=key, reflect=reflect) == 1
+    now += 1
+    assert cache.get_or_reflect(key=key, reflect=reflect) == 2
+
+
+@pytest.mark.unit
+def test_get_or_reflect_does_not_cache_with_zero_ttl():
+    cache = SqlAlchemyReflectionCache(ttl=0)
+    reflect = _Reflector()
+    key = ReflectionKey(kind="schema_names")
+
+    assert cache.get_or_reflect(key=key, reflect=reflect) == 1
+    assert cache.get_or_reflect(key=key, reflect=reflect) == 2
+    assert len(cache) == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "table_name,schema_name,expected_tables",
+    [
+        pytest.param("a", "s1", {("s1", "b"), ("s2", "a")}, id="table_of_schema"),
+        pytest.param("a", None, {("s1", "b")}, id="table_of_any_schema"),
+        pytest.param(None, "s1", {("s2", "a")}, id="schema"),
+        pytest.param(None, None, set(), id="all"),
+    ],
+)
+def test_invalidate(
+    table_name: str | None, schema_name: str | None, expected_tables: set[tuple[str, str]]
+):
+    cache = SqlAlchemyReflectionCache()
+    keys = [
+        ReflectionKey.for_table("columns", table_name="a", schema_name="s1"),
+        ReflectionKey.for_table("columns", table_name="b", schema_name="s1"),
+        ReflectionKey.for_table("columns", table_name="a", schema_name="s2"),
+        ReflectionKey.for_query("columns", query="SELECT * FROM a"),
+        ReflectionKey(kind="schema_names"),
+    ]
+    for key in keys:
+        cache.get_or_reflect(key=key, reflect=list)
+
+    cache.invalidate(table_name=table_name, schema_name=schema_name)
+
+    reflect = _Reflector()
+    for key in keys:
+        cache.get_or_reflect(key=key, reflect=reflect)
+    # Metadata of queries and of the database as a whole is reflected again, besides tables.
+    assert reflect.calls == len(keys) - len(expected_tables)
+
+
+@pytest.mark.sqlite
+def test_column_metadata_is_reflected_once_per_execution_engine(mocker):
+    execution_engine = SqlAlchemyExecutionEngine(connection_string="sqlite://")
+    execution_engine.execute_query_in_transaction(sa.text("CREATE TABLE my_table (a INTEGER)"))
+    get_columns = mocker.spy(sa.engine.reflection.Inspector, "get_columns")
+
+    for _ in range(3):
+        columns = get_sqlalchemy_column_metadata(
+            execution_engine=execution_engine, table_selectable="my_table"
+        )
+        assert [column["name"] for column in columns] == ["a"]
+    assert get_columns.call_count == 1
+
+    execution_engine.execute_query_in_transaction(
+        sa.text("ALTER TABLE my_table ADD COLUMN b VARCHAR")
+    )
+    execution_engine.invalidate_reflection_cache(table_name="my_table")
+    columns = get_sqlalchemy_column_metadata(
+        execution_engine=execution_engine, table_selectable="my_table"
+    )
+
+    assert [column["name"] for column in columns] == ["a", "b"]
+    assert get_columns.call_count == 2
+
+
+@pytest.mark.sqlite
+def test_reflection_cache_ttl_is_execution_engine_config(mocker):
+    assert (
+        SqlAlchemyExecutionEngine(connection_string="sqlite://").config["reflection_cache_ttl"]
+        == DEFAULT_REFLECTION_CACHE_TTL
+    )
+    execution_engine = SqlAlchemyExecutionEngine(
+        connection_string="sqlite://", reflection_cache_ttl=0
+    )
+    execution_engine.execute_query_in_transaction(sa.text("CREATE TABLE my_table (a INTEGER)"))
+    get_columns = mocker.spy(sa.engine.reflection.Inspector, "get_columns")
+
+    for _ in range(2):
+        get_sqlalchemy_column_metadata(
+            execution_engine=execution_engine, table_selectable="my_table"
+        )
+
+    assert get_columns.call_count == 2
+    assert execution_engine.config["reflection_cache_ttl"] == 0
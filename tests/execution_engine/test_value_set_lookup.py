@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any, List
+
+import pytest
+
+from great_expectations.execution_engine.value_set_lookup import (
+    StagedValueSets,
+    is_stageable_value_set,
+)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "values,expected",
+    [
+        pytest.param(["a", "b"], True, id="strings"),
+        pytest.param([1, 2.5], True, id="numbers"),
+        pytest.param([True, False], False, id="bools"),
+        pytest.param([1, True], False, id="numbers_and_bools"),
+        pytest.param(["a", None], False, id="null"),
+        pytest.param([1, None], False, id="numbers_and_null"),
+        pytest.param([1.5, float("nan")], False, id="nan"),
+        pytest.param([float("nan"), float("nan")], False, id="nans"),
+        pytest.param([1, 10**400], True, id="int_beyond_float_range"),
+        pytest.param(["a", 1], False, id="mixed"),
+    ],
+)
+def test_is_stageable_value_set(values: List[Any], expected: bool):
+    assert is_stageable_value_set(values) is expected
+
+
+@pytest.mark.unit
+def test_get_or_stage_stages_value_set_once():
+    staged_value_sets: StagedValueSets[frozenset] = StagedValueSets()
+    staged: List[List[Any]] = []
+
+    def stage(values: List[Any]) -> frozenset:
+        staged.append(values)
+        return frozenset(values)
+
+    first = staged_value_sets.get_or_stage(values=["b", "a", "b"], stage=stage)
+
+    assert staged_value_sets.get_or_stage(values=["b", "a", "b"], stage=stage) is first
+    # Values are deduplicated, in order, before staging
+    assert staged == [["b", "a"]]
+
+
+@pytest.mark.unit
+def test_get_or_stage_releases_least_recently_used_value_sets():
+    staged_value_sets: StagedValueSets[frozenset] = StagedValueSets(max_size=2)
+
+    first = staged_value_sets.get_or_stage(values=[1], stage=frozenset)
+    staged_value_sets.get_or_stage(values=[2], stage=frozenset)
+    assert staged_value_sets.get_or_stage(values=[1], stage=frozenset) is first
+    staged_value_sets.get_or_stage(values=[3], stage=frozenset)
+
+    assert len(staged_value_sets) == 2
+    assert staged_value_sets.get_or_stage(values=[1], stage=frozenset) is first
+    assert staged_value_sets.get_or_stage(values=[2], stage=frozenset) is not None
+    assert len(staged_value_sets) == 2
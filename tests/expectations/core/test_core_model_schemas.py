@@ -6,7 +6,8 @@ from great_expectations.expectations import core
 from great_expectations.expectations.core import schemas
 from great_expectations.expectations.expectation import MetaExpectation
 
-expectation_dictionary = dict(core.__dict__)
+# Core Expectations are imported lazily, on first access.
+expectation_dictionary = {name: getattr(core, name) for name in core.__all__}
 
 
 @pytest.mark.unit
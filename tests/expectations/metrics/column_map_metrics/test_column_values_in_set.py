@@ -1,9 +1,19 @@
+from decimal import Decimal
 from types import ModuleType
 from typing import List, Optional
 
+import pandas as pd
 import pytest
 
+from great_expectations.core.batch import Batch
+from great_expectations.execution_engine import PandasExecutionEngine, SqlAlchemyExecutionEngine
 from great_expectations.expectations.metrics import ColumnValuesInSet
+from great_expectations.self_check.util import (
+    build_in_memory_runtime_context,
+    build_sa_validator_with_data,
+    build_spark_validator_with_data,
+)
+from great_expectations.validator.validator import Validator
 
 try:
     import sqlalchemy
@@ -81,3 +91,157 @@ def _make_sqlalchemy_kwargs(column_name, dialect):
         "_table": sqlalchemy.Table("my_table", sqlalchemy.MetaData()),
         "_sqlalchemy_engine": "DummySqlalchemyEngine",
     }
+
+
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "expectation_type,expected_unexpected_count",
+    [
+        ("expect_column_values_to_be_in_set", 2),
+        ("expect_column_values_to_not_be_in_set", 3),
+    ],
+)
+def test_large_value_set_is_staged_in_lookup_table(
+    expectation_type: str, expected_unexpected_count: int, mocker
+):
+    validator = build_sa_validator_with_data(
+        df=pd.DataFrame({"a": [1, 2, 3, 5000, 6000]}),
+        sa_engine_name="sqlite",
+        table_name="test_large_value_set",
+    )
+    execution_engine = validator.execution_engine
+    value_set = list(range(execution_engine.value_set_lookup_threshold + 1))
+    execute_query = mocker.spy(execution_engine, "execute_query")
+
+    result = getattr(validator, expectation_type)(column="a", value_set=value_set)
+
+    assert result.result["unexpected_count"] == expected_unexpected_count
+    assert len(execution_engine._value_set_tables) == 1
+    # Values are neither bound as parameters of, nor inlined into, metric queries
+    statements = [
+        str(
+            call.args[0].compile(
+                dialect=execution_engine.engine.dialect,
+                compile_kwargs={"render_postcompile": True},
+            )
+        )
+        for call in execute_query.call_args_list
+    ]
+    assert statements
+    assert all(len(statement) < len(value_set) for statement in statements)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "expectation_type,expected_unexpected_count",
+    [
+        ("expect_column_values_to_be_in_set", 2),
+        ("expect_column_values_to_not_be_in_set", 4),
+    ],
+)
+def test_large_value_set_is_staged_as_pandas_index(
+    expectation_type: str, expected_unexpected_count: int, mocker
+):
+    execution_engine = PandasExecutionEngine()
+    value_set = [str(value) for value in range(execution_engine.value_set_lookup_threshold + 1)]
+    get_or_stage = mocker.spy(execution_engine._staged_value_sets, "get_or_stage")
+
+    for _ in range(2):
+        validator = Validator(
+            execution_engine=execution_engine,
+            batches=[Batch(data=pd.DataFrame({"a": ["1", "2", "3", "x", None, "y", "4"]}))],
+            data_context=build_in_memory_runtime_context(),
+        )
+        result = getattr(validator, expectation_type)(column="a", value_set=value_set)
+
+        assert result.result["unexpected_count"] == expected_unexpected_count
+    # Staged once, for the batches of both validators
+    assert len(execution_engine._staged_value_sets) == 1
+    first_index, *other_indexes = get_or_stage.spy_return_list
+    assert isinstance(first_index, pd.Index)
+    assert all(index is first_index for index in other_indexes)
+
+
+@pytest.mark.unit
+def test_large_value_set_with_nans_is_not_staged_as_pandas_index():
+    execution_engine = PandasExecutionEngine()
+    value_set = [
+        *map(float, range(execution_engine.value_set_lookup_threshold)),
+        float("nan"),
+        float("nan"),
+    ]
+
+    # NaN values make the index non-unique, so that it could not be looked up
+    assert execution_engine.get_value_set_lookup(value_set) is None
+    assert len(execution_engine._staged_value_sets) == 0
+
+
+@pytest.mark.sqlite
+def test_value_set_lookup_threshold_is_execution_engine_config(mocker):
+    validator = build_sa_validator_with_data(
+        df=pd.DataFrame({"a": [1, 2, 3, 5000, 6000]}),
+        sa_engine_name="sqlite",
+        table_name="test_value_set_lookup_threshold",
+    )
+    execution_engine = validator.execution_engine
+    assert execution_engine.config["value_set_lookup_threshold"] == 999
+    execution_engine.value_set_lookup_threshold = 2
+
+    result = validator.expect_column_values_to_be_in_set(column="a", value_set=[1, 2, 3])
+
+    assert result.result["unexpected_count"] == 2
+    assert len(execution_engine._value_set_tables) == 1
+    assert (
+        SqlAlchemyExecutionEngine(
+            connection_string="sqlite://", value_set_lookup_threshold=2
+        ).config["value_set_lookup_threshold"]
+        == 2
+    )
+
+
+@pytest.mark.unit
+def test_pandas_value_set_lookup_threshold_is_execution_engine_config():
+    execution_engine = PandasExecutionEngine(value_set_lookup_threshold=2)
+    validator = Validator(
+        execution_engine=execution_engine,
+        batches=[Batch(data=pd.DataFrame({"a": ["1", "2", "3", "x"]}))],
+        data_context=build_in_memory_runtime_context(),
+    )
+
+    result = validator.expect_column_values_to_be_in_set(column="a", value_set=["1", "2", "3"])
+
+    assert result.result["unexpected_count"] == 1
+    assert len(execution_engine._staged_value_sets) == 1
+    assert execution_engine.config["value_set_lookup_threshold"] == 2
+
+
+@pytest.mark.spark
+@pytest.mark.parametrize(
+    "expectation_type,expected_unexpected_count",
+    [
+        ("expect_column_values_to_be_in_set", 2),
+        ("expect_column_values_to_not_be_in_set", 2),
+    ],
+)
+def test_large_value_set_is_staged_as_spark_array_literal(
+    expectation_type: str, expected_unexpected_count: int, spark_session
+):
+    df = spark_session.createDataFrame(
+        [
+            (Decimal("1.10"),),
+            (Decimal("2.50"),),
+            (Decimal("7.00"),),
+            (Decimal("5000.00"),),
+            (None,),
+        ],
+        "a DECIMAL(10, 2)",
+    )
+    validator = build_spark_validator_with_data(df=df, spark=spark_session)
+    execution_engine = validator.execution_engine
+    # Decimal values compare with mixed integer and float values as with "isin()".
+    value_set = [*range(execution_engine.value_set_lookup_threshold), 1.1]
+
+    result = getattr(validator, expectation_type)(column="a", value_set=value_set)
+
+    assert result.result["unexpected_count"] == expected_unexpected_count
+    assert len(execution_engine._staged_value_sets) == 1
@@ -788,6 +788,175 @@ def test_quantiles_metric_sa(sa):
     assert results == {desired_metric.id: [1.0, 2.0, 3.0]}
 
 
+def _resolve_sa_quantiles(engine, quantiles: list, allow_relative_error=False) -> list:
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    partial_metric = MetricConfiguration(
+        metric_name=f"table.row_count.{MetricPartialFunctionTypes.AGGREGATE_FN.metric_suffix}",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    results = engine.resolve_metrics(metrics_to_resolve=(partial_metric,), metrics=metrics)
+    metrics.update(results)
+
+    table_row_count_metric = MetricConfiguration(
+        metric_name="table.row_count",
+        metric_domain_kwargs={},
+        metric_value_kwargs=None,
+    )
+    table_row_count_metric.metric_dependencies = {
+        "metric_partial_fn": partial_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(table_row_count_metric,), metrics=metrics)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.quantile_values",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={
+            "quantiles": quantiles,
+            "allow_relative_error": allow_relative_error,
+        },
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+        "table.row_count": table_row_count_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+    return results[desired_metric.id]
+
+
+@pytest.mark.sqlite
+def test_quantiles_metric_sa_computes_all_quantiles_in_one_query(sa):
+    values = [7, None, 3, 3, 9, 1, 4, 4, 4, 8, 2, None, 6]
+    engine = build_sa_execution_engine(pd.DataFrame({"a": values}), sa)
+    quantiles = [0.0, 0.1, 0.25, 0.3, 0.5, 0.75, 0.9, 0.99, 1.0]
+
+    executed_queries: list = []
+    execute_query = engine.execute_query
+
+    def counting_execute_query(query):
+        executed_queries.append(query)
+        return execute_query(query)
+
+    engine.execute_query = counting_execute_query  # type: ignore[method-assign]
+    result = _resolve_sa_quantiles(engine=engine, quantiles=quantiles)
+    quantile_queries = [query for query in executed_queries if "row_number" in str(query)]
+
+    # The value at offset "quantile * row_count - 1" of the ascending column (nulls first).
+    sorted_values = [None, None, *sorted(value for value in values if value is not None)]
+    assert result == [
+        sorted_values[max(int(quantile * len(values) - 1), 0)] for quantile in quantiles
+    ]
+    assert len(quantile_queries) == 1
+
+
+def _build_sa_execution_engine_with_rank_error(
+    df: pd.DataFrame, sa, approximate_quantiles_rank_error: float
+) -> SqlAlchemyExecutionEngine:
+    engine = build_sa_execution_engine(df, sa)
+    return SqlAlchemyExecutionEngine(
+        engine=engine.engine,
+        batch_data_dict={
+            engine.batch_manager.active_batch_data_id: engine.batch_manager.active_batch_data
+        },
+        approximate_quantiles_rank_error=approximate_quantiles_rank_error,
+    )
+
+
+@pytest.mark.sqlite
+def test_quantiles_metric_sa_approximate(sa):
+    rng = np.random.default_rng(seed=7)
+    values = rng.permutation(20_000)
+    engine = _build_sa_execution_engine_with_rank_error(
+        pd.DataFrame({"a": values}), sa, approximate_quantiles_rank_error=0.05
+    )
+    quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+    executed_queries: list = []
+    execute_query = engine.execute_query
+
+    def recording_execute_query(query):
+        executed_queries.append(str(query))
+        return execute_query(query)
+
+    engine.execute_query = recording_execute_query  # type: ignore[method-assign]
+    result = _resolve_sa_quantiles(engine=engine, quantiles=quantiles)
+
+    # Values are 0, ..., 19999, so a value is its own rank.
+    for quantile, value in zip(quantiles, result):
+        assert abs(value / len(values) - quantile) <= 0.05
+    assert any("random()" in query for query in executed_queries)
+
+
+@pytest.mark.sqlite
+def test_quantiles_metric_sa_approximate_sample_is_random(sa):
+    # Periodic values defeat samples that take every n-th row in scan order.
+    values = np.arange(100_000) % 10
+    engine = _build_sa_execution_engine_with_rank_error(
+        pd.DataFrame({"a": values}), sa, approximate_quantiles_rank_error=0.05
+    )
+    quantiles = [0.1, 0.5, 0.9]
+
+    result = _resolve_sa_quantiles(engine=engine, quantiles=quantiles)
+
+    # Within the rank error, the value of a quantile is one whose rank interval is within 0.05.
+    for quantile, value in zip(quantiles, result):
+        assert np.mean(values < value) - 0.05 <= quantile <= np.mean(values <= value) + 0.05
+
+
+@pytest.mark.sqlite
+def test_quantiles_metric_sa_is_exact_unless_rank_error_is_configured(sa):
+    rng = np.random.default_rng(seed=7)
+    values = rng.permutation(20_000)
+    engine = build_sa_execution_engine(pd.DataFrame({"a": values}), sa)
+    quantiles = [0.05, 0.25, 0.5, 0.75, 0.95]
+
+    result = _resolve_sa_quantiles(engine=engine, quantiles=quantiles, allow_relative_error=0.05)
+
+    assert result == [int(quantile * len(values)) - 1 for quantile in quantiles]
+
+
+@pytest.mark.unit
+def test_approximate_quantiles_rank_error_must_be_a_fraction(sa):
+    with pytest.raises(ValueError):
+        SqlAlchemyExecutionEngine(
+            engine=sa.create_engine("sqlite://"), approximate_quantiles_rank_error=1.5
+        )
+
+
+@pytest.mark.unit
+def test_quantiles_metric_mysql_ranks_rows_once(sa):
+    from sqlalchemy.dialects import mysql
+
+    from great_expectations.expectations.metrics.column_aggregate_metrics.column_quantile_values import (  # noqa: E501
+        _get_column_quantiles_mysql,
+    )
+
+    queries: list = []
+
+    class Result:
+        def fetchone(self):
+            return (0, 0, 0)
+
+    class ExecutionEngine:
+        def execute_query(self, query):
+            queries.append(query)
+            return Result()
+
+    _get_column_quantiles_mysql(
+        column=sa.column("a"),
+        quantiles=[0.1, 0.5, 0.9],
+        selectable=sa.table("t"),
+        execution_engine=ExecutionEngine(),  # type: ignore[arg-type]
+    )
+
+    (query,) = queries
+    assert str(query.compile(dialect=mysql.dialect())).count("percent_rank()") == 1
+
+
 @pytest.mark.spark
 def test_quantiles_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
@@ -934,6 +1103,55 @@ def test_column_histogram_metric_sa(sa):
     assert results == {desired_metric.id: [10]}
 
 
+@pytest.mark.sqlite
+@pytest.mark.parametrize(
+    "bins",
+    [
+        pytest.param(np.linspace(-3.0, 12.0, 101).tolist(), id="uniform"),
+        pytest.param([0.0, 0.9, 1.8, 2.7, 3.6, 4.5, 5.4, 6.3, 7.2, 8.1, 9.0], id="near_uniform"),
+        pytest.param([-1.0, 0.0, 0.5, 2.0, 2.5, 7.0, 9.0], id="non_uniform"),
+        pytest.param([2.0, 4.0, 6.0], id="range_within_values"),
+        pytest.param([-np.inf, 0.0, 2.5, 5.0, 7.5, 10.0, np.inf], id="infinite_edges"),
+        pytest.param([-np.inf, 3.0, 4.0, 8.0], id="infinite_lower_edge"),
+        pytest.param([-np.inf, 4.5, np.inf], id="single_finite_edge"),
+    ],
+)
+def test_column_histogram_metric_sa_matches_numpy(sa, bins: list):
+    values = [-2, 0, 0.5, 1, 2, 2, 2.5, 3, 4, 4.5, 5, 6, 7, 7.5, 8, 9, 9, 10, 11.999, None]
+    engine = build_sa_execution_engine(pd.DataFrame({"a": values}), sa)
+
+    metrics: Dict[Tuple[str, str, str], MetricValue] = {}
+    table_columns_metric, results = get_table_columns_metric(execution_engine=engine)
+    metrics.update(results)
+
+    desired_metric = MetricConfiguration(
+        metric_name="column.histogram",
+        metric_domain_kwargs={"column": "a"},
+        metric_value_kwargs={"bins": bins},
+    )
+    desired_metric.metric_dependencies = {
+        "table.columns": table_columns_metric,
+    }
+    results = engine.resolve_metrics(metrics_to_resolve=(desired_metric,), metrics=metrics)
+
+    expected, _ = np.histogram([value for value in values if value is not None], bins)
+    assert results[desired_metric.id] == expected.tolist()
+
+
+@pytest.mark.unit
+def test_column_histogram_bucket_expression_size_does_not_grow_with_uniform_bins(sa):
+    from great_expectations.expectations.metrics.column_aggregate_metrics.column_histogram import (
+        _get_bucket_expression,
+    )
+
+    def count_bound_parameters(num_bins: int) -> int:
+        bins = np.linspace(0.0, 1.0, num_bins + 1).tolist()
+        expression = _get_bucket_expression(column=sa.column("a"), bins=bins)
+        return len(expression.compile().params)
+
+    assert count_bound_parameters(num_bins=10) == count_bound_parameters(num_bins=1_000)
+
+
 @pytest.mark.spark
 def test_column_histogram_metric_spark(spark_session):
     engine: SparkDFExecutionEngine = build_spark_engine(
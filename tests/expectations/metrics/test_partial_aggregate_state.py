@@ -0,0 +1,156 @@
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import great_expectations.exceptions as gx_exceptions
+from great_expectations.expectations.metrics import (
+    ColumnHistogram,
+    ColumnMax,
+    ColumnMean,
+    ColumnMedian,
+    ColumnMin,
+    ColumnQuantileValues,
+    ColumnStandardDeviation,
+    ColumnSum,
+    ColumnValueCounts,
+    TableRowCount,
+)
+from great_expectations.expectations.metrics.partial_aggregate_state import (
+    CountState,
+    MinMaxState,
+    MomentsState,
+    QuantileSketchState,
+    ValueCountsState,
+)
+
+
+def _chunks(column: pd.Series, chunk_size: int) -> List[pd.Series]:
+    return [column.iloc[i : i + chunk_size] for i in range(0, len(column), chunk_size)]
+
+
+@pytest.fixture
+def numeric_column() -> pd.Series:
+    rng = np.random.default_rng(seed=42)
+    values = rng.normal(loc=1_000.0, scale=25.0, size=1_003)
+    values[::17] = np.nan
+    return pd.Series(values)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("chunk_size", [1, 7, 100, 2_000])
+@pytest.mark.parametrize(
+    "provider,metric_value_kwargs",
+    [
+        pytest.param(ColumnMin, {}, id="min"),
+        pytest.param(ColumnMax, {}, id="max"),
+        pytest.param(ColumnSum, {}, id="sum"),
+        pytest.param(ColumnMean, {}, id="mean"),
+        pytest.param(ColumnStandardDeviation, {}, id="standard_deviation"),
+        pytest.param(ColumnMedian, {}, id="median"),
+        pytest.param(
+            ColumnQuantileValues,
+            {"quantiles": [0.0, 0.1, 0.5, 0.9, 1.0], "allow_relative_error": "linear"},
+            id="quantile_values",
+        ),
+    ],
+)
+def test_resolve_from_chunks_matches_whole_column(
+    numeric_column: pd.Series, provider, metric_value_kwargs: dict, chunk_size: int
+):
+    expected = provider.resolve_from_chunks([numeric_column], **metric_value_kwargs)
+    actual = provider.resolve_from_chunks(
+        _chunks(numeric_column, chunk_size), **metric_value_kwargs
+    )
+    assert np.allclose(actual, expected, rtol=1e-12, atol=0.0)
+
+
+@pytest.mark.unit
+def test_resolve_from_chunks_matches_pandas(numeric_column: pd.Series):
+    chunks = _chunks(numeric_column, 64)
+    assert ColumnMin.resolve_from_chunks(chunks) == numeric_column.min()
+    assert ColumnMax.resolve_from_chunks(chunks) == numeric_column.max()
+    assert np.isclose(ColumnSum.resolve_from_chunks(chunks), numeric_column.sum())
+    assert np.isclose(ColumnMean.resolve_from_chunks(chunks), numeric_column.mean())
+    assert np.isclose(ColumnStandardDeviation.resolve_from_chunks(chunks), numeric_column.std())
+    assert ColumnMedian.resolve_from_chunks(chunks) == numeric_column.median()
+    assert (
+        ColumnQuantileValues.resolve_from_chunks(
+            chunks, quantiles=[0.25, 0.75], allow_relative_error=False
+        )
+        == numeric_column.quantile([0.25, 0.75], interpolation="nearest").tolist()
+    )
+
+
+@pytest.mark.unit
+def test_value_counts_from_chunks():
+    column = pd.Series(["b", "a", None, "c", "a", "b", "a"])
+    result = ColumnValueCounts.resolve_from_chunks(_chunks(column, 3), sort="value")
+    pd.testing.assert_series_equal(
+        result,
+        pd.Series(
+            [3, 2, 1],
+            index=pd.Index(["a", "b", "c"], name="value"),
+            name="count",
+        ),
+    )
+
+
+@pytest.mark.unit
+def test_table_row_count_from_chunks():
+    df = pd.DataFrame({"a": range(10)})
+    states = [TableRowCount.get_partial_state(df.iloc[i : i + 3]) for i in range(0, 10, 3)]
+    assert TableRowCount.finalize_partial_state(TableRowCount.combine_partial_states(states)) == 10
+
+
+@pytest.mark.unit
+def test_empty_chunks_resolve_to_empty_values():
+    assert np.isnan(ColumnMin.resolve_from_chunks([]))
+    assert np.isnan(ColumnMean.resolve_from_chunks([pd.Series([np.nan])]))
+    assert np.isnan(ColumnStandardDeviation.resolve_from_chunks([pd.Series([1.0])]))
+    assert ColumnSum.resolve_from_chunks([]) == 0
+
+
+@pytest.mark.unit
+def test_unsupported_provider_raises():
+    assert not ColumnHistogram.supports_partial_state()
+    with pytest.raises(gx_exceptions.MetricProviderError):
+        ColumnHistogram.resolve_from_chunks([pd.Series([1, 2, 3])])
+
+
+@pytest.mark.unit
+def test_moments_state_merge_is_welford_exact():
+    values = np.array([1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16])
+    left = MomentsState.from_series(pd.Series(values[:1]))
+    right = MomentsState.from_series(pd.Series(values[1:]))
+    merged = left.merge(right)
+    assert merged.count == 4
+    assert merged.mean == pytest.approx(values.mean())
+    assert merged.variance() == pytest.approx(np.var(values, ddof=1))
+
+
+@pytest.mark.unit
+def test_states_merge_without_mutating_operands():
+    left = ValueCountsState(counts={"a": 1})
+    right = ValueCountsState(counts={"a": 2, "b": 1})
+    assert left.merge(right).counts == {"a": 3, "b": 1}
+    assert left.counts == {"a": 1}
+    assert CountState.combine([CountState(2), CountState(3)]) == CountState(5)
+    assert MinMaxState(min=1, max=3).merge(MinMaxState()) == MinMaxState(min=1, max=3)
+
+
+@pytest.mark.unit
+def test_quantile_sketch_compaction_bounds_rank_error():
+    rng = np.random.default_rng(seed=7)
+    values = rng.uniform(size=50_000)
+    sketch = QuantileSketchState.combine(
+        QuantileSketchState.from_series(pd.Series(chunk), max_size=500)
+        for chunk in np.array_split(values, 20)
+    )
+    assert not sketch.is_exact
+    assert sketch.values.size == 500
+    assert sketch.count == pytest.approx(values.size)
+    estimates = sketch.quantiles([0.1, 0.5, 0.9])
+    for quantile, estimate in zip([0.1, 0.5, 0.9], estimates):
+        assert abs(np.mean(values <= estimate) - quantile) < 0.01
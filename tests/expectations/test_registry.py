@@ -27,3 +27,33 @@ def test_registry_from_configuration():
 def test_registry_raises_error_when_invalid_expectation_requested():
     with pytest.raises(gx_exceptions.ExpectationNotFoundError):
         get_expectation_impl("expect_something_in_beta")
+
+
+def test_register_metric_registers_core_metrics_before_custom_providers(mocker):
+    from great_expectations.execution_engine import PandasExecutionEngine
+    from great_expectations.expectations import registry
+    from great_expectations.expectations.metrics.metric_provider import MetricProvider
+
+    def core_max(*args, **kwargs): ...
+
+    def custom_max(*args, **kwargs): ...
+
+    def register_core_metrics():
+        registry._core_metrics_registration_started = True
+        registry.register_metric(
+            "column.max", ("column",), (), PandasExecutionEngine, MetricProvider, core_max
+        )
+
+    mocker.patch.object(registry, "_core_metrics_registration_started", False)
+    mocker.patch.dict(registry._registered_metrics, clear=True)
+    mocker.patch.object(registry, "register_core_metrics", side_effect=register_core_metrics)
+
+    registry.register_metric(
+        "column.max", ("column",), (), PandasExecutionEngine, MetricProvider, custom_max
+    )
+
+    _, provider = registry.get_metric_provider(
+        "column.max", execution_engine=PandasExecutionEngine()
+    )
+    assert provider is custom_max
+    registry.register_core_metrics.assert_called_once()
@@ -1,61 +1,60 @@
+import pandas as pd
 import pytest
 
 from great_expectations.expectations.row_conditions import (
-    _parse_great_expectations_condition,
+    And,
+    ColumnBetween,
+    ColumnComparison,
+    ColumnIn,
+    ColumnNotNull,
+    ConditionParserError,
+    DateValue,
+    Not,
+    Or,
+    parse_condition_to_pandas,
     parse_condition_to_spark,
     parse_condition_to_sqlalchemy,
+    parse_row_condition,
 )
 
 
 @pytest.mark.unit
 def test_notnull_parser():
-    res = _parse_great_expectations_condition('col("foo").notNull()')
-    assert res["column"] == "foo"
-    assert res["notnull"] is True
-
-    res = _parse_great_expectations_condition('col("foo") > 5')
-    assert res["column"] == "foo"
-    assert "notnull" not in res
-
-
-@pytest.mark.unit
-def test_condition_parser():
-    res = _parse_great_expectations_condition('col("foo") > 5')
-    assert res["column"] == "foo"
-    assert res["op"] == ">"
-    assert res["fnumber"] == "5"
-
-
-@pytest.mark.unit
-def test_condition_parser_with_underscore_in_column_name():
-    res = _parse_great_expectations_condition('col("pk_2") == "Two"')
-    assert res["column"] == "pk_2"
-    assert res["op"] == "=="
-    assert res["condition_value"] == "Two"
-
-
-@pytest.mark.unit
-def test_condition_parser_with_dash_in_column_name():
-    res = _parse_great_expectations_condition('col("pk-2") == "Two"')
-    assert res["column"] == "pk-2"
-    assert res["op"] == "=="
-    assert res["condition_value"] == "Two"
-
-
-@pytest.mark.unit
-def test_condition_parser_with_space_in_condition_value():
-    res = _parse_great_expectations_condition('col("pk_2") == "Two Two"')
-    assert res["column"] == "pk_2"
-    assert res["op"] == "=="
-    assert res["condition_value"] == "Two Two"
+    assert parse_row_condition('col("foo").notNull()') == ColumnNotNull(column="foo")
+    assert parse_row_condition('col("foo") > 5') == ColumnComparison(column="foo", op=">", value=5)
 
 
 @pytest.mark.unit
-def test_condition_parser_with_tab_in_condition_value():
-    res = _parse_great_expectations_condition('col("pk_2") == "Two  Two"')
-    assert res["column"] == "pk_2"
-    assert res["op"] == "=="
-    assert res["condition_value"] == "Two  Two"
+@pytest.mark.parametrize(
+    "row_condition,expected",
+    [
+        pytest.param(
+            'col("foo") > 5', ColumnComparison(column="foo", op=">", value=5), id="number"
+        ),
+        pytest.param(
+            'col("pk_2") == "Two"',
+            ColumnComparison(column="pk_2", op="==", value="Two"),
+            id="underscore_in_column_name",
+        ),
+        pytest.param(
+            'col("pk-2") == "Two"',
+            ColumnComparison(column="pk-2", op="==", value="Two"),
+            id="dash_in_column_name",
+        ),
+        pytest.param(
+            'col("pk_2") == "Two Two"',
+            ColumnComparison(column="pk_2", op="==", value="Two Two"),
+            id="space_in_condition_value",
+        ),
+        pytest.param(
+            'col("pk_2") == "Two  Two"',
+            ColumnComparison(column="pk_2", op="==", value="Two  Two"),
+            id="consecutive_spaces_in_condition_value",
+        ),
+    ],
+)
+def test_condition_parser(row_condition, expected):
+    assert parse_row_condition(row_condition) == expected
 
 
 @pytest.mark.spark
@@ -91,3 +90,73 @@ def test_parse_condition_to_sqlalchemy(sa):
 
     res = parse_condition_to_sqlalchemy('col("foo") <= date("2023-03-13")')
     assert str(res) == "foo <= :foo_1"
+
+
+@pytest.mark.unit
+def test_parse_row_condition_compound():
+    res = parse_row_condition(
+        'col("a") > 1 AND (col("b") == "x" or NOT col("c").isin([1, 2.5, "z"]))'
+        ' and col("d").between(date("2023-01-01"), date("2023-12-31"))'
+    )
+    assert res == And(
+        operands=(
+            ColumnComparison(column="a", op=">", value=1),
+            Or(
+                operands=(
+                    ColumnComparison(column="b", op="==", value="x"),
+                    Not(operand=ColumnIn(column="c", values=(1, 2.5, "z"))),
+                )
+            ),
+            ColumnBetween(
+                column="d",
+                min_value=DateValue("2023-01-01"),
+                max_value=DateValue("2023-12-31"),
+            ),
+        )
+    )
+    assert parse_row_condition('col("foo").notNull()') == ColumnNotNull(column="foo")
+
+
+@pytest.mark.unit
+def test_parse_row_condition_is_cached():
+    row_condition = 'col("cached") > 5 or col("cached") < -5'
+    assert parse_row_condition(row_condition) is parse_row_condition(row_condition)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "row_condition",
+    ['col("foo") > 5 junk', 'col("foo") >', 'col("foo") > 5 AND', 'col("foo").isin([])'],
+)
+def test_parse_row_condition_invalid(row_condition):
+    with pytest.raises(ConditionParserError):
+        parse_row_condition(row_condition)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "row_condition,expected_index",
+    [
+        pytest.param('col("a") > 1', [1, 3, 4], id="comparison"),
+        # As in SQL, conditions on null values are neither true nor false.
+        pytest.param('NOT col("a") > 1', [0], id="not"),
+        pytest.param('col("a").between(1, 4) and col("b") != "y"', [0, 3], id="and"),
+        pytest.param('col("a") > 1 or col("b") == "x"', [0, 1, 3, 4], id="or"),
+        pytest.param('not (col("a") > 1 or col("b") == "x")', [], id="not_or"),
+        pytest.param('not col("b").isin(["x"])', [1, 4], id="not_in"),
+        pytest.param('col("b").notnull()', [0, 1, 3, 4], id="notnull"),
+    ],
+)
+def test_parse_condition_to_pandas(row_condition, expected_index):
+    df = pd.DataFrame({"a": [1, 2, None, 4, 6], "b": ["x", "y", None, "x", "z"]})
+    assert list(df.index[parse_condition_to_pandas(row_condition, df)]) == expected_index
+
+
+@pytest.mark.unit
+def test_parse_compound_condition_to_sqlalchemy(sa):
+    res = parse_condition_to_sqlalchemy(
+        'col("foo") > 5 and (col("bar").isin(["a", "b"]) or not col("baz").between(1, 2))'
+    )
+    assert str(res) == (
+        "foo > :foo_1 AND (bar IN (__[POSTCOMPILE_bar_1]) OR baz NOT BETWEEN :baz_1 AND :baz_2)"
+    )
@@ -0,0 +1,185 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.batch import Batch
+from great_expectations.core.domain import Domain
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.execution_engine import PandasExecutionEngine
+from great_expectations.experimental.rule_based_profiler.helpers import (
+    resolved_metrics_cache as resolved_metrics_cache_module,
+)
+from great_expectations.experimental.rule_based_profiler.helpers.resolved_metrics_cache import (
+    _prune_validation_graph,
+    compute_metrics,
+    get_metric,
+    resolved_metrics_cache,
+)
+from great_expectations.experimental.rule_based_profiler.parameter_builder import (
+    MetricMultiBatchParameterBuilder,
+)
+from great_expectations.experimental.rule_based_profiler.parameter_container import (
+    ParameterContainer,
+)
+from great_expectations.validator.metric_configuration import MetricConfiguration
+from great_expectations.validator.validator import Validator
+
+
+@pytest.fixture
+def validator(in_memory_runtime_context) -> Validator:
+    return Validator(
+        execution_engine=PandasExecutionEngine(),
+        batches=[Batch(data=pd.DataFrame({"a": [1, 2, 3, None]}))],
+        data_context=in_memory_runtime_context,
+    )
+
+
+@pytest.fixture
+def resolved_metric_names(mocker) -> List[str]:
+    """Names of all metrics resolved by any "PandasExecutionEngine", in order of resolution."""
+    names: List[str] = []
+    resolve_metrics = PandasExecutionEngine.resolve_metrics
+
+    def _resolve_metrics(self, metrics_to_resolve, *args, **kwargs):
+        metrics_to_resolve = list(metrics_to_resolve)
+        names.extend(
+            metric_configuration.metric_name for metric_configuration in metrics_to_resolve
+        )
+        return resolve_metrics(self, metrics_to_resolve, *args, **kwargs)
+
+    mocker.patch.object(PandasExecutionEngine, "resolve_metrics", _resolve_metrics)
+    return names
+
+
+def _column_metric(validator: Validator, metric_name: str) -> MetricConfiguration:
+    return MetricConfiguration(
+        metric_name=metric_name,
+        metric_domain_kwargs={"column": "a", "batch_id": validator.active_batch_id},
+        metric_value_kwargs=None,
+    )
+
+
+@pytest.mark.unit
+def test_metrics_are_resolved_once_across_parameter_builders(
+    in_memory_runtime_context, resolved_metric_names: List[str]
+):
+    batch = (
+        in_memory_runtime_context.data_sources.add_pandas("my_datasource")
+        .add_dataframe_asset("my_asset")
+        .add_batch_definition_whole_dataframe("my_batch_definition")
+        .get_batch(batch_parameters={"dataframe": pd.DataFrame({"a": [1, 2, 3, None]})})
+    )
+    domain = Domain(rule_name="my_rule", domain_type=MetricDomainTypes.TABLE)
+    parameters: Dict[str, ParameterContainer] = {
+        domain.id: ParameterContainer(parameter_nodes=None)
+    }
+    builders = [
+        MetricMultiBatchParameterBuilder(
+            name=name,
+            metric_name=metric_name,
+            metric_domain_kwargs={"column": "a"},
+            data_context=in_memory_runtime_context,
+        )
+        for name, metric_name in [
+            ("my_column_mean", "column.mean"),
+            ("my_column_max", "column.max"),
+            ("my_other_column_mean", "column.mean"),
+        ]
+    ]
+
+    with resolved_metrics_cache():
+        for builder in builders:
+            builder.build_parameters(domain=domain, parameters=parameters, batch_list=[batch])
+
+    # Shared table metrics, and "column.mean" requested twice, are resolved once.
+    assert sorted(resolved_metric_names) == [
+        "column.max",
+        "column.mean",
+        "table.column_types",
+        "table.columns",
+        "table.row_count",
+    ]
+
+
+@pytest.mark.unit
+def test_validation_graph_is_pruned_at_resolved_metrics(validator: Validator):
+    with resolved_metrics_cache() as cache:
+        column_mean = _column_metric(validator, "column.mean")
+        get_metric(validator=validator, metric=column_mean)
+
+        column_standard_deviation = _column_metric(validator, "column.standard_deviation")
+        graph, known_metrics = _prune_validation_graph(
+            validator=validator,
+            graph=validator.metrics_calculator.build_metric_dependency_graph(
+                metric_configurations=[column_mean, column_standard_deviation]
+            ),
+            metric_configurations=[column_mean, column_standard_deviation],
+            cache=cache,
+        )
+
+    # Only the edges of the metric not yet resolved are kept; the graph is cut at its
+    # (resolved) dependencies, whose values are handed to it.
+    assert {edge.left.metric_name for edge in graph.edges} == {"column.standard_deviation"}
+    assert {edge.right.metric_name for edge in graph.edges} == {
+        "table.column_types",
+        "table.columns",
+        "table.row_count",
+    }
+    assert {metric_id[0] for metric_id in known_metrics} == {
+        "column.mean",
+        "table.column_types",
+        "table.columns",
+        "table.row_count",
+    }
+    assert known_metrics[column_mean.id] == pytest.approx(2.0)
+
+
+@pytest.mark.unit
+def test_partial_metric_functions_are_not_cached(
+    validator: Validator, resolved_metric_names: List[str]
+):
+    unexpected_count = _column_metric(validator, "column_values.nonnull.unexpected_count")
+
+    with resolved_metrics_cache() as cache:
+        assert get_metric(validator=validator, metric=unexpected_count) == 1
+        assert get_metric(validator=validator, metric=unexpected_count) == 1
+
+    assert resolved_metric_names.count("column_values.nonnull.unexpected_count") == 1
+    assert unexpected_count.id in cache
+    assert all(
+        metric_id[0] != "column_values.nonnull.condition" for metric_id in cache._resolved_metrics
+    )
+
+
+@pytest.mark.unit
+def test_resolved_metrics_are_shared_only_within_their_context(
+    validator: Validator, resolved_metric_names: List[str]
+):
+    column_mean = _column_metric(validator, "column.mean")
+
+    # Outside of any scope, nothing is cached.
+    get_metric(validator=validator, metric=column_mean)
+    assert resolved_metrics_cache_module._active_resolved_metrics_cache.get() is None
+
+    with resolved_metrics_cache() as cache:
+        # Nested scopes share the outermost cache.
+        with resolved_metrics_cache() as nested_cache:
+            assert nested_cache is cache
+            get_metric(validator=validator, metric=column_mean)
+
+        assert column_mean.id in cache
+        # Other threads (e.g., concurrent profiler runs) neither see nor populate it.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            executor.submit(
+                compute_metrics,
+                validator=validator,
+                metric_configurations=[_column_metric(validator, "column.max")],
+            ).result()
+
+        assert len(cache) == 4  # "column.mean" and its table metric dependencies
+
+    assert resolved_metrics_cache_module._active_resolved_metrics_cache.get() is None
+    assert resolved_metric_names.count("column.mean") == 2
+    assert resolved_metric_names.count("column.max") == 1
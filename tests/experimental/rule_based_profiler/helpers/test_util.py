@@ -0,0 +1,258 @@
+import concurrent.futures
+from typing import List
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from great_expectations.experimental.rule_based_profiler.helpers import util
+from great_expectations.experimental.rule_based_profiler.helpers.util import (
+    compute_bootstrap_quantiles_point_estimate,
+    compute_bootstrap_quantiles_point_estimates,
+    compute_kde_quantiles_point_estimate,
+    compute_kde_quantiles_point_estimates,
+)
+
+FALSE_POSITIVE_RATE = np.float64(0.05)
+N_RESAMPLES = 999
+RANDOM_SEED = 7
+
+
+@pytest.fixture
+def metric_values_list() -> List[np.ndarray]:
+    random_state = np.random.default_rng(seed=0)
+    # Vectors of different sizes are grouped, and those of equal size are stacked.
+    return [
+        random_state.normal(loc=idx, scale=idx + 1.0, size=size)
+        for idx, size in enumerate([20, 31, 20, 5, 31, 20])
+    ] + [random_state.integers(low=0, high=100, size=20)]
+
+
+def _bootstrap(metric_values_list: List[np.ndarray], **kwargs) -> List[np.ndarray]:
+    kwargs = {
+        "false_positive_rate": FALSE_POSITIVE_RATE,
+        "n_resamples": N_RESAMPLES,
+        "quantile_statistic_interpolation_method": "linear",
+        "quantile_bias_correction": False,
+        "quantile_bias_std_error_ratio_threshold": 0.25,
+        "random_seed": RANDOM_SEED,
+        **kwargs,
+    }
+    return [
+        result.value_range
+        for result in compute_bootstrap_quantiles_point_estimates(
+            metric_values_list=metric_values_list, **kwargs
+        )
+    ]
+
+
+def _kde(metric_values_list: List[np.ndarray], **kwargs) -> List[np.ndarray]:
+    kwargs = {
+        "false_positive_rate": FALSE_POSITIVE_RATE,
+        "n_resamples": N_RESAMPLES,
+        "quantile_statistic_interpolation_method": "linear",
+        "bw_method": "scott",
+        "random_seed": RANDOM_SEED,
+        **kwargs,
+    }
+    return [
+        result.value_range
+        for result in compute_kde_quantiles_point_estimates(
+            metric_values_list=metric_values_list, **kwargs
+        )
+    ]
+
+
+def _reference_bootstrap_range(
+    metric_values: np.ndarray,
+    quantile_statistic_interpolation_method: str,
+    quantile_bias_correction: bool,
+    quantile_bias_std_error_ratio_threshold: float,
+    random_seed: int,
+) -> np.ndarray:
+    """Bootstrap point estimates, one quantile at a time (as before estimates were batched)."""
+    bootstraps = np.random.Generator(np.random.PCG64(random_seed)).choice(
+        metric_values, size=(N_RESAMPLES, metric_values.size)
+    )
+    point_estimates = []
+    for quantile_pct in [FALSE_POSITIVE_RATE / 2.0, 1.0 - FALSE_POSITIVE_RATE / 2.0]:
+        bootstrap_quantiles = np.quantile(
+            bootstraps, q=quantile_pct, axis=1, method=quantile_statistic_interpolation_method
+        )
+        point_estimate = np.mean(bootstrap_quantiles)
+        standard_error = np.std(bootstrap_quantiles)
+        bias = point_estimate - np.quantile(
+            metric_values, q=quantile_pct, method=quantile_statistic_interpolation_method
+        )
+        if (
+            not quantile_bias_correction
+            and standard_error > 0.0
+            and bias / standard_error <= quantile_bias_std_error_ratio_threshold
+        ):
+            point_estimates.append(point_estimate)
+        else:
+            point_estimates.append(point_estimate - bias)
+
+    return np.asarray(point_estimates)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "quantile_statistic_interpolation_method", ["linear", "nearest", "midpoint"]
+)
+@pytest.mark.parametrize("quantile_bias_correction", [False, True])
+def test_batched_bootstrap_estimates_equal_estimates_of_single_vectors(
+    metric_values_list: List[np.ndarray],
+    quantile_statistic_interpolation_method: str,
+    quantile_bias_correction: bool,
+):
+    kwargs = {
+        "quantile_statistic_interpolation_method": quantile_statistic_interpolation_method,
+        "quantile_bias_correction": quantile_bias_correction,
+        "quantile_bias_std_error_ratio_threshold": 0.25,
+        "random_seed": RANDOM_SEED,
+    }
+
+    batched_ranges = _bootstrap(metric_values_list, **kwargs)
+
+    for metric_values, batched_range in zip(metric_values_list, batched_ranges):
+        single_range = compute_bootstrap_quantiles_point_estimate(
+            metric_values=metric_values,
+            false_positive_rate=FALSE_POSITIVE_RATE,
+            n_resamples=N_RESAMPLES,
+            **kwargs,
+        ).value_range
+        np.testing.assert_array_equal(batched_range, single_range)
+        np.testing.assert_array_equal(
+            batched_range, _reference_bootstrap_range(metric_values=metric_values, **kwargs)
+        )
+
+
+@pytest.mark.unit
+def test_bootstrap_estimates_of_vectors_with_nan_values_are_nan():
+    metric_values = np.asarray([1.0, 2.0, np.nan, 4.0, 5.0])
+
+    ((min_value, max_value),) = util._compute_bootstrap_quantile_ranges(
+        metric_values_list=[metric_values],
+        false_positive_rate=FALSE_POSITIVE_RATE,
+        n_resamples=N_RESAMPLES,
+        quantile_statistic_interpolation_method="linear",
+        quantile_bias_correction=False,
+        quantile_bias_std_error_ratio_threshold=0.25,
+        random_seed=RANDOM_SEED,
+    )
+
+    # As in "np.quantile()", resamples containing the NaN value have NaN quantiles.
+    assert np.isnan(min_value)
+    assert np.isnan(max_value)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("quantile_statistic_interpolation_method", ["linear", "midpoint"])
+def test_range_estimates_do_not_depend_on_chunking(
+    metric_values_list: List[np.ndarray],
+    quantile_statistic_interpolation_method: str,
+    monkeypatch: pytest.MonkeyPatch,
+):
+    method = quantile_statistic_interpolation_method
+    bootstrap_ranges = _bootstrap(
+        metric_values_list, quantile_statistic_interpolation_method=method
+    )
+    kde_ranges = _kde(metric_values_list, quantile_statistic_interpolation_method=method)
+
+    # Vectors are resampled one or two at a time.
+    monkeypatch.setattr(util, "MAX_RESAMPLED_ELEMENTS", 2 * N_RESAMPLES)
+
+    np.testing.assert_array_equal(
+        _bootstrap(metric_values_list, quantile_statistic_interpolation_method=method),
+        bootstrap_ranges,
+    )
+    np.testing.assert_array_equal(
+        _kde(metric_values_list, quantile_statistic_interpolation_method=method), kde_ranges
+    )
+
+
+@pytest.mark.unit
+def test_range_estimates_of_worker_processes_equal_those_of_one_process(
+    metric_values_list: List[np.ndarray], mocker
+):
+    bootstrap_ranges = _bootstrap(metric_values_list)
+    kde_ranges = _kde(metric_values_list)
+    submit = mocker.spy(concurrent.futures.ProcessPoolExecutor, "submit")
+
+    np.testing.assert_array_equal(_bootstrap(metric_values_list, max_workers=3), bootstrap_ranges)
+    np.testing.assert_array_equal(_kde(metric_values_list, max_workers=3), kde_ranges)
+
+    assert submit.call_count == 6
+
+
+@pytest.mark.unit
+def test_unseeded_range_estimates_of_worker_processes_are_returned_in_order():
+    metric_values_list = [np.full(shape=10, fill_value=float(idx)) for idx in range(5)]
+
+    # Constant vectors have constant resamples, whatever the seeds of the workers.
+    for value_range, metric_values in zip(
+        _bootstrap(metric_values_list, random_seed=None, max_workers=2), metric_values_list
+    ):
+        np.testing.assert_array_equal(value_range, metric_values[:2])
+
+
+@pytest.mark.unit
+def test_batched_kde_estimates_equal_estimates_of_single_vectors(
+    metric_values_list: List[np.ndarray],
+):
+    quantile_pcts = np.asarray([FALSE_POSITIVE_RATE / 2.0, 1.0 - FALSE_POSITIVE_RATE / 2.0])
+
+    batched_ranges = _kde(metric_values_list)
+
+    for metric_values, batched_range in zip(metric_values_list, batched_ranges):
+        single_range = compute_kde_quantiles_point_estimate(
+            metric_values=metric_values,
+            false_positive_rate=FALSE_POSITIVE_RATE,
+            n_resamples=N_RESAMPLES,
+            quantile_statistic_interpolation_method="linear",
+            bw_method="scott",
+            random_seed=RANDOM_SEED,
+        ).value_range
+        np.testing.assert_array_equal(batched_range, single_range)
+        # Seeded samples are drawn by "scipy", as before estimates were batched.
+        samples = stats.gaussian_kde(metric_values, bw_method="scott").resample(
+            N_RESAMPLES, seed=RANDOM_SEED
+        )
+        np.testing.assert_array_equal(batched_range, np.quantile(samples, q=quantile_pcts))
+
+
+@pytest.mark.unit
+def test_seeded_range_estimates_are_those_of_earlier_releases():
+    metric_values = np.asarray([7.0, 11.0, 12.5, 9.0, 14.0, 10.0, 13.0, 8.5, 12.0, 10.5])
+    kwargs = {"n_resamples": 9999, "random_seed": 42}
+
+    np.testing.assert_array_equal(
+        _bootstrap([metric_values], **kwargs), [[7.3375, 13.43424217421742]]
+    )
+    np.testing.assert_array_equal(
+        _kde([metric_values], **kwargs), [[5.857078878307776, 15.294828543459888]]
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("random_seed", [RANDOM_SEED, None])
+def test_kde_samples_are_distributed_like_those_of_scipy(random_seed):
+    vectors = np.stack(
+        [
+            np.random.default_rng(seed=0).normal(loc=10.0, scale=3.0, size=50),
+            np.random.default_rng(seed=1).exponential(scale=2.0, size=50),
+        ]
+    )
+    n_resamples = 200_000
+
+    samples = util._resample_kde(
+        vectors=vectors, n_resamples=n_resamples, bw_method="scott", random_seed=random_seed
+    )
+
+    assert samples.shape == (2, n_resamples)
+    for vector, vector_samples in zip(vectors, samples):
+        scipy_samples = stats.gaussian_kde(vector, bw_method="scott").resample(
+            n_resamples, seed=np.random.default_rng(seed=2)
+        )[0]
+        assert stats.ks_2samp(vector_samples, scipy_samples).pvalue > 0.001
@@ -0,0 +1,119 @@
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+from great_expectations.core.domain import Domain
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.experimental.rule_based_profiler.estimators.bootstrap_numeric_range_estimator import (  # noqa: E501
+    BootstrapNumericRangeEstimator,
+)
+from great_expectations.experimental.rule_based_profiler.estimators.kde_numeric_range_estimator import (  # noqa: E501
+    KdeNumericRangeEstimator,
+)
+from great_expectations.experimental.rule_based_profiler.parameter_builder import (
+    NumericMetricRangeMultiBatchParameterBuilder,
+)
+from great_expectations.experimental.rule_based_profiler.parameter_container import (
+    RAW_PARAMETER_KEY,
+    ParameterContainer,
+    build_parameter_container,
+    get_parameter_value_by_fully_qualified_parameter_name,
+)
+
+
+def _get_domains_and_parameters(
+    num_domains: int,
+) -> Tuple[List[Domain], Dict[str, ParameterContainer]]:
+    random_state = np.random.default_rng(seed=0)
+    domains: List[Domain] = []
+    parameters: Dict[str, ParameterContainer] = {}
+    for idx in range(num_domains):
+        domain = Domain(
+            rule_name="my_rule",
+            domain_type=MetricDomainTypes.COLUMN,
+            domain_kwargs={"column": f"column_{idx}"},
+        )
+        domains.append(domain)
+        parameters[domain.id] = ParameterContainer(parameter_nodes=None)
+        # Metric values (one per Batch) of a two-element metric, whose first element is constant.
+        metric_values = np.stack(
+            [np.full(shape=12, fill_value=float(idx)), random_state.normal(loc=idx, size=12)],
+            axis=-1,
+        )
+        build_parameter_container(
+            parameter_container=parameters[domain.id],
+            parameter_values={
+                f"{RAW_PARAMETER_KEY}my_metric": {"value": metric_values, "details": {}},
+            },
+        )
+
+    return domains, parameters
+
+
+def _get_value_ranges(
+    builder: NumericMetricRangeMultiBatchParameterBuilder,
+    domains: List[Domain],
+    parameters: Dict[str, ParameterContainer],
+) -> List[np.ndarray]:
+    return [
+        get_parameter_value_by_fully_qualified_parameter_name(
+            fully_qualified_parameter_name=f"{builder.raw_fully_qualified_parameter_name}.value",
+            domain=domain,
+            parameters=parameters,
+        )
+        for domain in domains
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "estimator,estimator_class",
+    [("bootstrap", BootstrapNumericRangeEstimator), ("kde", KdeNumericRangeEstimator)],
+)
+def test_ranges_of_all_domains_are_estimated_together(estimator, estimator_class, mocker):
+    builder = NumericMetricRangeMultiBatchParameterBuilder(
+        name="my_range",
+        metric_multi_batch_parameter_builder_name="my_metric",
+        estimator=estimator,
+        n_resamples=999,
+        random_seed=42,
+        round_decimals=6,
+    )
+    domains, parameters = _get_domains_and_parameters(num_domains=4)
+    for domain in domains:
+        builder.build_parameters(domain=domain, parameters=parameters)
+    value_ranges = _get_value_ranges(builder=builder, domains=domains, parameters=parameters)
+    compute_numeric_range_estimates = mocker.spy(
+        estimator_class, "_compute_numeric_range_estimates"
+    )
+
+    domains, parameters = _get_domains_and_parameters(num_domains=4)
+    builder.build_parameters_for_domains(domains=domains, parameters=parameters)
+
+    # Non-degenerate vectors of all domains are estimated at once, as they would be one domain at a time.  # noqa: E501
+    compute_numeric_range_estimates.assert_called_once()
+    assert len(compute_numeric_range_estimates.call_args.kwargs["metric_values_list"]) == 4
+    np.testing.assert_array_equal(
+        _get_value_ranges(builder=builder, domains=domains, parameters=parameters), value_ranges
+    )
+
+
+@pytest.mark.unit
+def test_parameters_of_domains_are_not_estimated_again(mocker):
+    builder = NumericMetricRangeMultiBatchParameterBuilder(
+        name="my_range",
+        metric_multi_batch_parameter_builder_name="my_metric",
+        estimator="bootstrap",
+        n_resamples=999,
+        random_seed=42,
+    )
+    domains, parameters = _get_domains_and_parameters(num_domains=3)
+    builder.build_parameters(domain=domains[0], parameters=parameters)
+    compute_numeric_range_estimates = mocker.spy(
+        BootstrapNumericRangeEstimator, "_compute_numeric_range_estimates"
+    )
+
+    builder.build_parameters_for_domains(domains=domains, parameters=parameters)
+
+    assert len(compute_numeric_range_estimates.call_args.kwargs["metric_values_list"]) == 2
@@ -0,0 +1,183 @@
+import pathlib
+from typing import Dict, List
+
+import pandas as pd
+import pytest
+
+from great_expectations.core.domain import Domain
+from great_expectations.core.metric_domain_types import MetricDomainTypes
+from great_expectations.data_context.store.metric_store import BatchMetricStore
+from great_expectations.experimental.rule_based_profiler.parameter_builder import (
+    MetricMultiBatchParameterBuilder,
+    parameter_builder,
+)
+from great_expectations.experimental.rule_based_profiler.parameter_container import (
+    ParameterContainer,
+    get_parameter_value_by_fully_qualified_parameter_name,
+)
+
+
+def _write_month(directory: pathlib.Path, month: int) -> None:
+    pd.DataFrame({"a": [month, month * 2, month * 3]}).to_csv(
+        directory / f"data_2024-{month:02d}.csv", index=False
+    )
+
+
+def _get_batches(batch_definition, months: List[int]) -> list:
+    return [
+        batch_definition.get_batch(batch_parameters={"year": "2024", "month": f"{month:02d}"})
+        for month in months
+    ]
+
+
+def _add_batch_metric_store(context) -> BatchMetricStore:
+    store = context.add_store(
+        "batch_metric_store",
+        {
+            "class_name": "BatchMetricStore",
+            "module_name": "great_expectations.data_context.store",
+            "store_backend": {"class_name": "InMemoryStoreBackend"},
+        },
+    )
+    assert isinstance(store, BatchMetricStore)
+    return store
+
+
+def _add_sqlite_table_asset(context, tmp_path: pathlib.Path):
+    connection_string = f"sqlite:///{tmp_path / 'data.db'}"
+    pd.DataFrame(
+        {
+            "a": [1.0, 2.0, 3.0, 4.0, 5.0, 6.0],
+            "created_at": pd.to_datetime(
+                ["2024-01-05", "2024-01-20", "2024-02-05", "2024-02-20", "2024-03-05", "2024-03-20"]
+            ),
+        }
+    ).to_sql("my_table", con=connection_string, index=False)
+    return context.data_sources.add_sqlite(
+        "my_sqlite", connection_string=connection_string
+    ).add_table_asset("my_table", table_name="my_table")
+
+
+def _get_resolved_batch_ids(compute_metrics) -> List[str]:
+    return [
+        metric_configuration.metric_domain_kwargs["batch_id"]
+        for call in compute_metrics.call_args_list
+        for metric_configuration in call.kwargs["metric_configurations"]
+    ]
+
+
+def _build_parameter_value(context, batches: list) -> dict:
+    domain = Domain(rule_name="my_rule", domain_type=MetricDomainTypes.TABLE)
+    parameters: Dict[str, ParameterContainer] = {
+        domain.id: ParameterContainer(parameter_nodes=None)
+    }
+    builder = MetricMultiBatchParameterBuilder(
+        name="my_column_mean",
+        metric_name="column.mean",
+        metric_domain_kwargs={"column": "a"},
+        data_context=context,
+    )
+    builder.build_parameters(domain=domain, parameters=parameters, batch_list=batches)
+    return get_parameter_value_by_fully_qualified_parameter_name(  # type: ignore[return-value]
+        fully_qualified_parameter_name=builder.raw_fully_qualified_parameter_name,
+        domain=domain,
+        parameters=parameters,
+    )
+
+
+@pytest.mark.unit
+def test_metrics_of_stored_batches_are_not_resolved_again(
+    in_memory_runtime_context, tmp_path: pathlib.Path, mocker
+):
+    store = _add_batch_metric_store(in_memory_runtime_context)
+    for month in (1, 2, 3):
+        _write_month(directory=tmp_path, month=month)
+    batch_definition = (
+        in_memory_runtime_context.data_sources.add_pandas_filesystem(
+            "my_datasource", base_directory=tmp_path
+        )
+        .add_csv_asset("my_asset")
+        .add_batch_definition_monthly(
+            "monthly", regex=r"data_(?P<year>\d{4})-(?P<month>\d{2})\.csv"
+        )
+    )
+    store_set = mocker.spy(store, "set")
+    compute_metrics = mocker.spy(parameter_builder, "compute_metrics")
+
+    first_value = _build_parameter_value(
+        in_memory_runtime_context, batches=_get_batches(batch_definition, months=[1, 2])
+    )
+    assert store_set.call_count == 2
+
+    second_value = _build_parameter_value(
+        in_memory_runtime_context, batches=_get_batches(batch_definition, months=[1, 2, 3])
+    )
+
+    # Only the metric of the new Batch is resolved, and stored.
+    assert store_set.call_count == 3
+    new_batch_id: str
+    (new_batch_id,) = set(second_value["attributed_value"]) - set(first_value["attributed_value"])
+    assert [
+        metric_configuration.metric_domain_kwargs["batch_id"]
+        for metric_configuration in compute_metrics.call_args.kwargs["metric_configurations"]
+    ] == [new_batch_id]
+    assert second_value["value"].tolist() == [*first_value["value"].tolist(), 6.0]
+    assert second_value["attributed_value"] == {
+        **first_value["attributed_value"],
+        new_batch_id: [6.0],
+    }
+
+    # A third run resolves nothing, and returns the same parameter values.
+    compute_metrics.reset_mock()
+    third_value = _build_parameter_value(
+        in_memory_runtime_context, batches=_get_batches(batch_definition, months=[1, 2, 3])
+    )
+
+    compute_metrics.assert_not_called()
+    assert third_value["value"].tolist() == second_value["value"].tolist()
+    assert third_value["attributed_value"] == second_value["attributed_value"]
+
+
+@pytest.mark.sqlite
+def test_metrics_of_historical_partitions_are_reused_without_data_fingerprint(
+    in_memory_runtime_context, tmp_path: pathlib.Path, mocker
+):
+    store = _add_batch_metric_store(in_memory_runtime_context)
+    batch_definition = _add_sqlite_table_asset(
+        in_memory_runtime_context, tmp_path=tmp_path
+    ).add_batch_definition_monthly("monthly", column="created_at")
+    store_set = mocker.spy(store, "set")
+    compute_metrics = mocker.spy(parameter_builder, "compute_metrics")
+
+    batches = _get_batches(batch_definition, months=[1, 2, 3])
+    first_value = _build_parameter_value(in_memory_runtime_context, batches=batches)
+
+    # The latest partition may still be receiving data, so only the historical ones are stored.
+    assert store_set.call_count == 2
+    assert first_value["value"].tolist() == [1.5, 3.5, 5.5]
+
+    compute_metrics.reset_mock()
+    second_value = _build_parameter_value(
+        in_memory_runtime_context, batches=_get_batches(batch_definition, months=[1, 2, 3])
+    )
+
+    assert _get_resolved_batch_ids(compute_metrics) == [batches[-1].id]
+    assert second_value["value"].tolist() == first_value["value"].tolist()
+
+
+@pytest.mark.sqlite
+def test_metrics_of_unpartitioned_batches_without_data_fingerprint_are_not_reused(
+    in_memory_runtime_context, tmp_path: pathlib.Path, mocker
+):
+    store = _add_batch_metric_store(in_memory_runtime_context)
+    batch_definition = _add_sqlite_table_asset(
+        in_memory_runtime_context, tmp_path=tmp_path
+    ).add_batch_definition_whole_table("whole_table")
+    store_set = mocker.spy(store, "set")
+    compute_metrics = mocker.spy(parameter_builder, "compute_metrics")
+
+    for _ in range(2):
+        _build_parameter_value(in_memory_runtime_context, batches=[batch_definition.get_batch()])
+
+    store_set.assert_not_called()
+    assert compute_metrics.call_count == 2
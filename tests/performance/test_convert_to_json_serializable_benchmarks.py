@@ -0,0 +1,76 @@
+"""Benchmarks of convert_to_json_serializable over the shapes of values found in validation results.
+
+Run with:
+    pytest -m performance tests/performance/test_convert_to_json_serializable_benchmarks.py
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from great_expectations.util import convert_to_json_serializable
+
+NUM_VALUES = 1_000_000
+
+
+def _partial_unexpected_list() -> list:
+    values = np.random.default_rng(seed=0).normal(size=NUM_VALUES)
+    values[::100] = np.nan
+    return values.tolist()
+
+
+def _unexpected_index_list() -> list:
+    return [{"pk_1": idx, "pk_2": f"id_{idx}"} for idx in range(NUM_VALUES // 10)]
+
+
+def _partial_unexpected_counts() -> list:
+    return [{"value": f"value_{idx}", "count": idx} for idx in range(NUM_VALUES // 10)]
+
+
+def _float_array() -> np.ndarray:
+    values = np.random.default_rng(seed=0).normal(size=NUM_VALUES)
+    values[::100] = np.nan
+    return values
+
+
+def _int_array() -> np.ndarray:
+    return np.arange(NUM_VALUES)
+
+
+def _series() -> pd.Series:
+    return pd.Series(np.random.default_rng(seed=0).normal(size=NUM_VALUES // 10), name="values")
+
+
+def _complete_result() -> Dict[str, Any]:
+    unexpected_list = _partial_unexpected_list()
+    return {
+        "element_count": np.int64(NUM_VALUES * 2),
+        "unexpected_count": np.int64(NUM_VALUES),
+        "unexpected_percent": np.float64(50.0),
+        "partial_unexpected_list": unexpected_list[:20],
+        "unexpected_list": unexpected_list,
+        "unexpected_index_list": list(range(NUM_VALUES)),
+        "partial_unexpected_counts": _partial_unexpected_counts()[:20],
+    }
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "make_data",
+    [
+        pytest.param(_partial_unexpected_list, id="float_list"),
+        pytest.param(_unexpected_index_list, id="unexpected_index_list"),
+        pytest.param(_partial_unexpected_counts, id="partial_unexpected_counts"),
+        pytest.param(_float_array, id="float_array"),
+        pytest.param(_int_array, id="int_array"),
+        pytest.param(_series, id="series"),
+        pytest.param(_complete_result, id="complete_result"),
+    ],
+)
+def test_convert_to_json_serializable(benchmark, make_data: Callable[[], Any]):
+    data = make_data()
+    benchmark.pedantic(convert_to_json_serializable, args=(data,), rounds=5, iterations=1)
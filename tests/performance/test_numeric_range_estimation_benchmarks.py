@@ -0,0 +1,101 @@
+"""Benchmarks of the bootstrap and kernel density numeric range estimators used by profilers.
+
+Run with:
+    pytest -m performance tests/performance/test_numeric_range_estimation_benchmarks.py
+"""
+
+from __future__ import annotations
+
+from typing import List
+
+import numpy as np
+import pytest
+
+from great_expectations.experimental.rule_based_profiler.helpers.util import (
+    compute_bootstrap_quantiles_point_estimate,
+    compute_bootstrap_quantiles_point_estimates,
+    compute_kde_quantiles_point_estimate,
+    compute_kde_quantiles_point_estimates,
+)
+
+NUM_DOMAINS = 200
+NUM_BATCHES = 60
+NUM_RESAMPLES = 9999
+FALSE_POSITIVE_RATE = np.float64(0.05)
+RANDOM_SEED = 7
+
+
+@pytest.fixture(scope="module")
+def metric_values_list() -> List[np.ndarray]:
+    random_state = np.random.default_rng(seed=0)
+    return [
+        random_state.normal(loc=idx, scale=idx + 1.0, size=NUM_BATCHES)
+        for idx in range(NUM_DOMAINS)
+    ]
+
+
+def _bootstrap_one_by_one(metric_values_list: List[np.ndarray]) -> list:
+    return [
+        compute_bootstrap_quantiles_point_estimate(
+            metric_values=metric_values,
+            false_positive_rate=FALSE_POSITIVE_RATE,
+            n_resamples=NUM_RESAMPLES,
+            quantile_statistic_interpolation_method="linear",
+            quantile_bias_correction=False,
+            quantile_bias_std_error_ratio_threshold=0.25,
+            random_seed=RANDOM_SEED,
+        )
+        for metric_values in metric_values_list
+    ]
+
+
+def _bootstrap_batched(metric_values_list: List[np.ndarray]) -> list:
+    return compute_bootstrap_quantiles_point_estimates(
+        metric_values_list=metric_values_list,
+        false_positive_rate=FALSE_POSITIVE_RATE,
+        n_resamples=NUM_RESAMPLES,
+        quantile_statistic_interpolation_method="linear",
+        quantile_bias_correction=False,
+        quantile_bias_std_error_ratio_threshold=0.25,
+        random_seed=RANDOM_SEED,
+    )
+
+
+def _kde_one_by_one(metric_values_list: List[np.ndarray]) -> list:
+    return [
+        compute_kde_quantiles_point_estimate(
+            metric_values=metric_values,
+            false_positive_rate=FALSE_POSITIVE_RATE,
+            n_resamples=NUM_RESAMPLES,
+            quantile_statistic_interpolation_method="linear",
+            bw_method="scott",
+            random_seed=RANDOM_SEED,
+        )
+        for metric_values in metric_values_list
+    ]
+
+
+def _kde_batched(metric_values_list: List[np.ndarray]) -> list:
+    return compute_kde_quantiles_point_estimates(
+        metric_values_list=metric_values_list,
+        false_positive_rate=FALSE_POSITIVE_RATE,
+        n_resamples=NUM_RESAMPLES,
+        quantile_statistic_interpolation_method="linear",
+        bw_method="scott",
+        random_seed=RANDOM_SEED,
+    )
+
+
+@pytest.mark.performance
+@pytest.mark.parametrize(
+    "estimate",
+    [
+        pytest.param(_bootstrap_one_by_one, id="bootstrap_one_by_one"),
+        pytest.param(_bootstrap_batched, id="bootstrap_batched"),
+        pytest.param(_kde_one_by_one, id="kde_one_by_one"),
+        pytest.param(_kde_batched, id="kde_batched"),
+    ],
+)
+def test_numeric_range_estimation(benchmark, estimate, metric_values_list: List[np.ndarray]):
+    results = benchmark.pedantic(estimate, args=(metric_values_list,), rounds=3, iterations=1)
+    assert len(results) == NUM_DOMAINS
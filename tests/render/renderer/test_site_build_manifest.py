@@ -0,0 +1,67 @@
+import pytest
+
+from great_expectations.render.renderer.site_build_manifest import (
+    SiteBuildManifest,
+    SiteBuildManifestEntry,
+    content_hash,
+)
+
+
+def _entry(batch_identifier: str) -> SiteBuildManifestEntry:
+    return SiteBuildManifestEntry(
+        resource_key=("my_suite", "my_run", "20240101T000000.000000Z", batch_identifier),
+        content_hash=content_hash(batch_identifier),
+        path=f"validations/my_suite/my_run/20240101T000000.000000Z/{batch_identifier}.html",
+        version="1-1",
+        index_info={"validation_success": True, "asset_name": "my_asset"},
+    )
+
+
+@pytest.mark.unit
+def test_site_build_manifest_round_trip():
+    manifest = SiteBuildManifest(static_assets_fingerprint="1.0.0")
+    section = manifest.get_section(section_name="validations", fingerprint="v1")
+    section.add(_entry("batch_1"))
+    section.add(_entry("batch_2"))
+
+    loaded = SiteBuildManifest.from_json(manifest.to_json())
+
+    assert loaded.static_assets_fingerprint == "1.0.0"
+    assert loaded.get_entries("validations") == [_entry("batch_1"), _entry("batch_2")]
+    assert loaded.get_entries("profiling") == []
+
+
+@pytest.mark.unit
+def test_site_build_manifest_section_is_forgotten_when_rendered_differently():
+    manifest = SiteBuildManifest()
+    assert not manifest.has_section(section_name="validations", fingerprint="v1")
+    manifest.get_section(section_name="validations", fingerprint="v1").add(_entry("batch_1"))
+
+    assert manifest.has_section(section_name="validations", fingerprint="v1")
+    assert not manifest.has_section(section_name="validations", fingerprint="v2")
+    assert len(manifest.get_section(section_name="validations", fingerprint="v1")) == 1
+    assert len(manifest.get_section(section_name="validations", fingerprint="v2")) == 0
+
+
+@pytest.mark.unit
+def test_site_build_manifest_section_retain():
+    section = SiteBuildManifest().get_section(section_name="validations", fingerprint="v1")
+    section.add(_entry("batch_1"))
+    section.add(_entry("batch_2"))
+
+    removed = section.retain([_entry("batch_2").resource_key])
+
+    assert removed == [_entry("batch_1")]
+    assert list(section) == [_entry("batch_2")]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "value",
+    [None, "", "not json", '{"manifest_version": 0, "sections": {}}', '{"manifest_version": 1}'],
+)
+def test_site_build_manifest_from_invalid_json_is_empty(value):
+    manifest = SiteBuildManifest.from_json(value)
+
+    assert manifest.get_entries("validations") == []
+    assert manifest.static_assets_fingerprint is None
@@ -1,18 +1,26 @@
+import datetime
 import os
 import shutil
 from typing import Dict
 
 import pytest
 
+from great_expectations.core import ExpectationSuite, ExpectationSuiteValidationResult
+from great_expectations.core.run_identifier import RunIdentifier
 from great_expectations.data_context import get_context
 from great_expectations.data_context.data_context.file_data_context import (
     FileDataContext,
 )
 from great_expectations.data_context.store import ExpectationsStore, ValidationResultsStore
+from great_expectations.data_context.types.resource_identifiers import (
+    ExpectationSuiteIdentifier,
+    ValidationResultIdentifier,
+)
 from great_expectations.data_context.util import (
     file_relative_path,
     instantiate_class_from_config,
 )
+from great_expectations.render.renderer.site_builder import DefaultSiteSectionBuilder
 
 # module level markers
 pytestmark = pytest.mark.filesystem
@@ -125,3 +133,129 @@ def test_site_builder_with_custom_site_section_builders_config(tmp_path_factory)
     profiling_site_section_builder = site_section_builders["profiling"]
     assert isinstance(validations_site_section_builder.source_store, ExpectationsStore)
     assert profiling_site_section_builder.run_name_filter == {"equals": "custom_profiling_filter"}
+
+
+def _add_validation_result(context, idx: int, success: bool) -> ValidationResultIdentifier:
+    key = ValidationResultIdentifier(
+        expectation_suite_identifier=ExpectationSuiteIdentifier("my.suite"),
+        run_id=RunIdentifier(
+            run_name=f"my_run_{idx}",
+            run_time=datetime.datetime(2024, 1, idx + 1, tzinfo=datetime.timezone.utc),
+        ),
+        batch_identifier=f"my_batch_{idx}",
+    )
+    context.validation_results_store.set(
+        key,
+        ExpectationSuiteValidationResult(
+            success=success,
+            results=[],
+            suite_name="my.suite",
+            meta={"run_id": key.run_id, "active_batch_definition": {"data_asset_name": "my_asset"}},
+        ),
+    )
+    return key
+
+
+def _build_site(context, site_config: dict, mocker, **kwargs) -> tuple:
+    """Builds the site, returning the keys of the rendered resources and the index links."""
+    render_resource = mocker.spy(DefaultSiteSectionBuilder, "_render_resource")
+    _, index_links_dict = context._init_site_builder_for_data_docs_site_creation(
+        site_name="incremental_site", site_config=site_config
+    ).build(**kwargs)
+    rendered = [call.kwargs["resource_key"] for call in render_resource.call_args_list]
+    mocker.stop(render_resource)
+    return rendered, index_links_dict
+
+
+def _build_full_index(context, site_config: dict) -> dict:
+    _, index_links_dict = context._init_site_builder_for_data_docs_site_creation(
+        site_name="incremental_site", site_config=dict(site_config, incremental=False)
+    ).build()
+    return index_links_dict
+
+
+@pytest.fixture
+def incremental_site_context(tmp_path):
+    context = get_context(mode="file", project_root_dir=str(tmp_path))
+    site_config = dict(context.variables.data_docs_sites["local_site"], incremental=True)
+    context.add_data_docs_site(site_name="incremental_site", site_config=site_config)
+    context.suites.add(ExpectationSuite(name="my.suite"))
+    return context, site_config
+
+
+def test_incremental_site_builder_renders_only_new_or_changed_resources(
+    incremental_site_context, mocker
+):
+    context, site_config = incremental_site_context
+    keys = [_add_validation_result(context, idx=idx, success=True) for idx in range(3)]
+
+    def build_site(**kwargs) -> tuple:
+        return _build_site(context, site_config, mocker, **kwargs)
+
+    rendered, _ = build_site()
+    assert len(rendered) == 4
+
+    rendered, _ = build_site()
+    assert rendered == []
+
+    new_key = _add_validation_result(context, idx=3, success=False)
+    rendered, _ = build_site(resource_identifiers=[new_key])
+    assert rendered == [new_key]
+
+    _add_validation_result(context, idx=1, success=False)
+    context.validation_results_store.remove_key(keys[0])
+    rendered, index_links_dict = build_site()
+    assert rendered == [keys[1]]
+
+    # The index lists the same pages as one built from the stores
+    assert index_links_dict == _build_full_index(context, site_config)
+    assert [link["run_name"] for link in index_links_dict["validations_links"]] == [
+        "my_run_3",
+        "my_run_2",
+        "my_run_1",
+    ]
+    assert [link["validation_success"] for link in index_links_dict["validations_links"]] == [
+        False,
+        True,
+        False,
+    ]
+
+
+def test_incremental_build_of_resources_without_manifest_builds_whole_site(
+    incremental_site_context, mocker
+):
+    context, site_config = incremental_site_context
+    keys = [_add_validation_result(context, idx=idx, success=True) for idx in range(3)]
+    # Pages built before the site was built incrementally are not recorded in any manifest.
+    _build_full_index(context, site_config)
+
+    new_key = _add_validation_result(context, idx=3, success=False)
+    rendered, index_links_dict = _build_site(
+        context, site_config, mocker, resource_identifiers=[new_key]
+    )
+
+    assert set(rendered) == {ExpectationSuiteIdentifier("my.suite"), *keys, new_key}
+    assert index_links_dict == _build_full_index(context, site_config)
+    assert len(index_links_dict["validations_links"]) == 4
+
+    rendered, _ = _build_site(context, site_config, mocker, resource_identifiers=[new_key])
+    assert rendered == []
+
+
+def test_incremental_build_of_resources_after_version_change_builds_whole_site(
+    incremental_site_context, mocker
+):
+    context, site_config = incremental_site_context
+    keys = [_add_validation_result(context, idx=idx, success=True) for idx in range(3)]
+    _build_site(context, site_config, mocker)
+
+    mocker.patch("great_expectations.render.renderer.site_builder.ge_version", "999.0.0")
+    new_key = _add_validation_result(context, idx=3, success=False)
+    rendered, index_links_dict = _build_site(
+        context, site_config, mocker, resource_identifiers=[new_key]
+    )
+
+    # Pages rendered by the previous version are rendered again, and listed in the index.
+    assert set(rendered) == {ExpectationSuiteIdentifier("my.suite"), *keys, new_key}
+    assert index_links_dict == _build_full_index(context, site_config)
+    assert len(index_links_dict["validations_links"]) == 4
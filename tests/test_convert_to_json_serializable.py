@@ -1,6 +1,8 @@
 import re
+from decimal import Decimal
 
 import numpy as np
+import pandas as pd
 import pytest
 
 from great_expectations.util import convert_to_json_serializable
@@ -63,3 +65,60 @@ def test_serialization_of_pattern():
     pattern_to_test = r"data_(?P<year>\d{4})-(?P<month>\d{2}).csv"
     data = re.compile(pattern_to_test)
     assert convert_to_json_serializable(data) == pattern_to_test
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "data,expected",
+    [
+        pytest.param(
+            [1, 2.5, float("nan"), "a", None, True], [1, 2.5, None, "a", None, True], id="list"
+        ),
+        pytest.param((np.int64(1), np.float64("nan")), [1, None], id="tuple_of_numpy_scalars"),
+        pytest.param(np.array([1, 2, 3]), [1, 2, 3], id="int_array"),
+        pytest.param(np.array([1.5, np.nan, np.inf]), [1.5, None, np.inf], id="float_array"),
+        pytest.param(
+            np.array([[1.0, np.nan], [2.0, 3.0]]), [[1.0, None], [2.0, 3.0]], id="2d_array"
+        ),
+        pytest.param(np.array([1, "a", None], dtype=object), [1, "a", None], id="object_array"),
+        pytest.param(pd.Index([1.0, np.nan]), [1.0, None], id="index"),
+        pytest.param(
+            pd.Series([1.0, np.nan], index=["a", "b"], name="x"),
+            [{"index": "a", "x": 1.0}, {"index": "b", "x": None}],
+            id="series",
+        ),
+        pytest.param(
+            pd.Series(pd.to_datetime(["2020-01-01", None])),
+            [{"index": 0, "value": "2020-01-01T00:00:00"}, {"index": 1, "value": "NaT"}],
+            id="datetime_series",
+        ),
+        pytest.param(
+            {1: [np.nan], "b": {"c": np.int64(2)}}, {"1": [None], "b": {"c": 2}}, id="dict"
+        ),
+    ],
+)
+def test_serialization_of_collections(data, expected):
+    assert convert_to_json_serializable(data) == expected
+
+
+@pytest.mark.unit
+def test_serialization_dispatch_respects_subclasses():
+    class MyDict(dict):
+        pass
+
+    class MyStr(str):
+        pass
+
+    assert convert_to_json_serializable(MyDict(a=np.int64(1))) == {"a": 1}
+    assert convert_to_json_serializable(MyStr("a")) == "a"
+    assert convert_to_json_serializable(Decimal("NaN")) is None
+    assert convert_to_json_serializable(Decimal("1.5")) == 1.5
+
+
+@pytest.mark.unit
+def test_serialization_of_unsupported_type_raises_type_error():
+    class Unserializable:
+        pass
+
+    with pytest.raises(TypeError):
+        convert_to_json_serializable(Unserializable())
@@ -0,0 +1,156 @@
+"""Guards against regressions in the time and scope of "import great_expectations".
+
+Core Expectations and Metrics are imported (and registered) on first use, not at package import;
+as are optional libraries and the pandas asset models.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import pytest
+
+# Measured with "python -X importtime": the cumulative time of "import great_expectations", in
+# seconds (the least of a few runs, so that load from parallel test workers does not inflate it).
+# Override with "GX_IMPORT_TIME_BUDGET_SECONDS" on slow machines.
+DEFAULT_IMPORT_TIME_BUDGET_SECONDS = 3.0
+IMPORT_TIME_RUNS = 3
+
+# Number of great_expectations modules imported along with the package (currently about 260).
+GX_MODULE_BUDGET = 300
+
+_PROBE = """
+import json
+import sys
+
+import great_expectations
+from great_expectations.datasource.fluent.data_asset.path.pandas.generated_assets import (
+    _FILE_PATH_ASSET_MODELS,
+)
+from great_expectations.datasource.fluent.pandas_datasource import _PANDAS_ASSET_MODELS
+from great_expectations.expectations.registry import _registered_expectations, _registered_metrics
+
+print(json.dumps({
+    "modules": sorted(sys.modules),
+    "registered_expectations": len(_registered_expectations),
+    "registered_metrics": len(_registered_metrics),
+    "generated_pandas_asset_models": (
+        _PANDAS_ASSET_MODELS.generated or _FILE_PATH_ASSET_MODELS.generated
+    ),
+}))
+"""
+
+
+def _parse_import_times(stderr: str) -> List[Tuple[str, int, int]]:
+    """(module, self time, cumulative time) in microseconds, of every "-X importtime" entry."""
+    import_times: List[Tuple[str, int, int]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        self_time, cumulative_time, module = line[len("import time:") :].split("|")
+        import_times.append((module.strip(), int(self_time), int(cumulative_time)))
+
+    return import_times
+
+
+@pytest.fixture(scope="module")
+def import_probe() -> dict:
+    env = dict(os.environ, GX_ANALYTICS_ENABLED="false")
+    runs: List[dict] = []
+    for _ in range(IMPORT_TIME_RUNS):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _PROBE],
+            capture_output=True,
+            check=True,
+            env=env,
+            text=True,
+        )
+        probe: dict = json.loads(completed.stdout.strip().splitlines()[-1])
+        probe["import_times"] = _parse_import_times(completed.stderr)
+        runs.append(probe)
+
+    return min(runs, key=lambda probe: _get_cumulative_import_time(probe["import_times"]))
+
+
+def _get_cumulative_import_time(import_times: List[Tuple[str, int, int]]) -> float:
+    return next(
+        cumulative_time / 1e6
+        for module, _, cumulative_time in import_times
+        if module == "great_expectations"
+    )
+
+
+@pytest.mark.unit
+def test_import_does_not_import_core_expectations_or_metrics(import_probe: dict):
+    modules = import_probe["modules"]
+    assert not [
+        module
+        for module in modules
+        if module.startswith("great_expectations.expectations.core.expect_")
+    ]
+    assert "great_expectations.expectations.metrics" not in modules
+    assert "scipy.stats" not in modules
+
+
+@pytest.mark.unit
+def test_import_does_not_register_core_expectations_or_metrics(import_probe: dict):
+    assert import_probe["registered_expectations"] == 0
+    assert import_probe["registered_metrics"] == 0
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "optional_module", ["sqlalchemy", "boto3", "botocore", "pyspark", "pyathena", "duckdb"]
+)
+def test_import_does_not_import_optional_libraries(import_probe: dict, optional_module: str):
+    assert optional_module not in import_probe["modules"]
+
+
+@pytest.mark.unit
+def test_import_does_not_generate_pandas_asset_models(import_probe: dict):
+    assert not import_probe["generated_pandas_asset_models"]
+
+
+@pytest.mark.unit
+def test_import_time_budget(import_probe: dict):
+    budget = float(
+        os.environ.get("GX_IMPORT_TIME_BUDGET_SECONDS", DEFAULT_IMPORT_TIME_BUDGET_SECONDS)
+    )
+    import_times: List[Tuple[str, int, int]] = import_probe["import_times"]
+    self_times: Dict[str, int] = {module: self_time for module, self_time, _ in import_times}
+    slowest = sorted(self_times, key=self_times.__getitem__, reverse=True)[:10]
+
+    assert (
+        _get_cumulative_import_time(import_times) < budget
+    ), f"Slowest imports (self time, us): {[(module, self_times[module]) for module in slowest]}"
+
+
+@pytest.mark.unit
+def test_imported_module_budget(import_probe: dict):
+    gx_modules = [
+        module
+        for module in import_probe["modules"]
+        if module == "great_expectations" or module.startswith("great_expectations.")
+    ]
+    assert len(gx_modules) < GX_MODULE_BUDGET
+
+
+@pytest.mark.unit
+def test_core_expectations_and_metrics_are_registered_on_first_use():
+    from great_expectations.execution_engine import PandasExecutionEngine
+    from great_expectations.expectations.registry import (
+        get_expectation_impl,
+        get_metric_provider,
+    )
+
+    expectation = get_expectation_impl("expect_column_values_to_not_be_null")
+    assert expectation.__name__ == "ExpectColumnValuesToNotBeNull"
+
+    assert get_metric_provider(
+        "column_values.nonnull.unexpected_count", execution_engine=PandasExecutionEngine()
+    )
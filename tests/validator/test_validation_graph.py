@@ -406,6 +406,49 @@ def test_resolve_validation_graph_with_bad_config_catch_exceptions_true(
     )
 
 
+@pytest.mark.unit
+def test_resolve_validation_graph_does_not_compute_previously_resolved_metrics(
+    table_head_metric_config: MetricConfiguration,
+    column_histogram_metric_config: MetricConfiguration,
+    metric_edge: MetricEdge,
+):
+    resolved_metric_names = []
+
+    class PandasExecutionEngineFake:
+        # noinspection PyUnusedLocal
+        @staticmethod
+        def resolve_metrics(
+            metrics_to_resolve: Iterable[MetricConfiguration],
+            metrics: Optional[Dict[Tuple[str, str, str], MetricConfiguration]] = None,
+            runtime_configuration: Optional[dict] = None,
+        ) -> Dict[Tuple[str, str, str], MetricValue]:
+            resolved_metric_names.extend(
+                metric_configuration.metric_name for metric_configuration in metrics_to_resolve
+            )
+            return {
+                metric_configuration.id: "my_value" for metric_configuration in metrics_to_resolve
+            }
+
+    graph = ValidationGraph(
+        execution_engine=cast(ExecutionEngine, PandasExecutionEngineFake()),
+        edges=[metric_edge],
+    )
+    previously_resolved_metrics = {column_histogram_metric_config.id: [1, 2, 3]}
+
+    resolved_metrics, aborted_metrics_info = graph.resolve(
+        show_progress_bars=False,
+        resolved_metrics=previously_resolved_metrics,
+    )
+
+    assert resolved_metric_names == ["table.head"]
+    assert resolved_metrics == {
+        column_histogram_metric_config.id: [1, 2, 3],
+        table_head_metric_config.id: "my_value",
+    }
+    assert aborted_metrics_info == {}
+    assert previously_resolved_metrics == {column_histogram_metric_config.id: [1, 2, 3]}
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     "show_progress_bars, are_progress_bars_disabled, ",